@@ -0,0 +1,176 @@
+#  (C) 2026 GoodData Corporation
+"""
+Caches that live for the whole lifetime of the PostgreSQL backend process.
+
+PostgreSQL creates a new foreign data wrapper instance for each foreign table that the backend process
+accesses; without a shared layer, each instance would create its own SDK and each scan would load the metadata
+and compute the results again - even if the same foreign table is scanned twice in one query.
+
+The caches are shared by all foreign tables of one foreign server. The backend process runs the foreign
+data wrapper code in a single thread, so the caches do not need any locking of their own.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Callable, Optional, TypeVar, cast
+
+from gooddata_sdk import CatalogWorkspaceContent, ExecutionResultCache, GoodDataSdk, Visualization
+
+from gooddata_fdw.options import ServerOptions
+from gooddata_fdw.pg_logging import _log_debug
+
+T = TypeVar("T")
+
+
+class MetadataCache:
+    """
+    Least-recently-used cache of metadata loaded from the server. Entries older than `ttl` seconds are
+    loaded again.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, load: Callable[[], T]) -> T:
+        """
+        Returns the cached value or loads it using `load` and caches it.
+
+        :param key: key of the value
+        :param load: function that loads the value from the server
+        :return: the value
+        """
+        if self._ttl <= 0 or self._max_entries <= 0:
+            return load()
+
+        cached = self._entries.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._ttl:
+            self._entries.move_to_end(key)
+            return cast(T, cached[1])
+
+        value = load()
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class ServerCache:
+    """
+    State shared by all foreign tables of one foreign server:
+
+    -  the SDK, so that the connections to the server are reused
+    -  visualizations and catalogs, reused for `metadata_cache_ttl` seconds
+    -  execution results, reused within the current transaction or for `execution_cache_ttl` seconds; the results
+       are identified by the computed items, filters and sorting
+    """
+
+    def __init__(self, server_options: ServerOptions, user_agent: str) -> None:
+        self._transaction_scoped = server_options.execution_cache_ttl == 0
+        self._result_cache: Optional[ExecutionResultCache] = None
+
+        if server_options.execution_cache_max_entries > 0 and server_options.execution_cache_max_pages > 0:
+            self._result_cache = ExecutionResultCache(
+                max_entries=server_options.execution_cache_max_entries,
+                max_pages=server_options.execution_cache_max_pages,
+                ttl=server_options.execution_cache_ttl or None,
+            )
+
+        self._metadata = MetadataCache(server_options.metadata_cache_ttl, server_options.metadata_cache_max_entries)
+        if self._result_cache is not None:
+            self._sdk = GoodDataSdk.create_with_result_cache(
+                self._result_cache,
+                server_options.host,
+                server_options.token,
+                user_agent,
+                Host=server_options.headers_host,
+            )
+        else:
+            self._sdk = GoodDataSdk.create(
+                server_options.host, server_options.token, user_agent, Host=server_options.headers_host
+            )
+
+    @property
+    def sdk(self) -> GoodDataSdk:
+        return self._sdk
+
+    @property
+    def result_cache(self) -> Optional[ExecutionResultCache]:
+        return self._result_cache
+
+    def get_visualization(self, workspace_id: str, visualization_id: str) -> Visualization:
+        return self._metadata.get(
+            ("visualization", workspace_id, visualization_id),
+            lambda: self._sdk.visualizations.get_visualization(workspace_id, visualization_id),
+        )
+
+    def get_visualizations(self, workspace_id: str) -> list[Visualization]:
+        return self._metadata.get(
+            ("visualizations", workspace_id),
+            lambda: self._sdk.visualizations.get_visualizations(workspace_id),
+        )
+
+    def get_full_catalog(self, workspace_id: str) -> CatalogWorkspaceContent:
+        return self._metadata.get(
+            ("catalog", workspace_id),
+            lambda: self._sdk.catalog_workspace_content.get_full_catalog(workspace_id),
+        )
+
+    def end_transaction(self) -> None:
+        """
+        Called when the transaction ends; drops the execution results that are reused only within a transaction.
+        """
+        if self._transaction_scoped and self._result_cache is not None and len(self._result_cache):
+            _log_debug(f"dropping {len(self._result_cache)} cached execution results at the end of transaction")
+            self._result_cache.invalidate()
+
+
+_SERVER_CACHES: dict[tuple, ServerCache] = {}
+
+
+def server_cache(server_options: ServerOptions, user_agent: str) -> ServerCache:
+    """
+    Returns the cache for the foreign server with the given options; the cache is created on first use.
+
+    :param server_options: options of the foreign server
+    :param user_agent: extra segment of the User-Agent header sent by the SDK
+    :return: the cache
+    """
+    key = (
+        server_options.host,
+        server_options.token,
+        server_options.headers_host,
+        server_options.metadata_cache_ttl,
+        server_options.metadata_cache_max_entries,
+        server_options.execution_cache_ttl,
+        server_options.execution_cache_max_entries,
+        server_options.execution_cache_max_pages,
+        user_agent,
+    )
+    cache = _SERVER_CACHES.get(key)
+
+    if cache is None:
+        cache = ServerCache(server_options, user_agent)
+        _SERVER_CACHES[key] = cache
+
+    return cache
+
+
+def clear_server_caches() -> None:
+    """
+    Drops all the caches; the next access to any foreign table creates new SDK and loads everything again.
+    """
+    _SERVER_CACHES.clear()
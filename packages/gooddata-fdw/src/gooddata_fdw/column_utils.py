@@ -9,6 +9,34 @@ from gooddata_sdk.type_converter import AttributeConverterStore, Converter
 
 from gooddata_fdw.environment import ColumnDefinition
 
+_DEFAULT_COLUMN_WIDTH = 32
+_TYPE_WIDTHS = {
+    "boolean": 1,
+    "smallint": 2,
+    "integer": 4,
+    "int": 4,
+    "real": 4,
+    "date": 4,
+    "bigint": 8,
+    "double precision": 8,
+    "timestamp": 8,
+    "numeric": 16,
+    "decimal": 16,
+}
+_STRING_TYPES = ("varchar", "character varying", "char", "character", "text")
+_SERVER_ORDERED_TYPES = (
+    "smallint",
+    "integer",
+    "int",
+    "bigint",
+    "real",
+    "double precision",
+    "numeric",
+    "decimal",
+    "date",
+    "timestamp",
+)
+
 
 def table_col_as_computable(col: ColumnDefinition) -> Union[Attribute, Metric]:
     item_type, item_id = col.options["id"].split("/")
@@ -26,6 +54,49 @@ def table_col_as_computable(col: ColumnDefinition) -> Union[Attribute, Metric]:
         )
 
 
+def is_attribute_col(col: ColumnDefinition) -> bool:
+    return col.options.get("id", "").startswith("label/")
+
+
+def _split_type_name(col: ColumnDefinition) -> tuple[str, str]:
+    type_name, _, modifier = col.base_type_name.lower().partition("(")
+    return type_name.strip(), modifier
+
+
+def is_server_ordered_col(col: ColumnDefinition) -> bool:
+    """
+    Check whether the computation orders values of the column the same way as PostgreSQL does.
+
+    Metric values and values of numeric and date attributes are ordered the same. Values of text attributes are
+    ordered in the default order of the server, which does not have to match the collation of the column.
+
+    :param col: column definition
+    """
+    if not is_attribute_col(col):
+        return True
+
+    # types such as 'timestamp without time zone' are looked up by their first word
+    type_name, _ = _split_type_name(col)
+    return type_name in _SERVER_ORDERED_TYPES or type_name.split(" ")[0] in _SERVER_ORDERED_TYPES
+
+
+def column_width_estimate(col: ColumnDefinition) -> int:
+    """
+    Estimate average width of values in the column in bytes; used by the planner to cost the scans.
+
+    :param col: column definition
+    """
+    type_name, modifier = _split_type_name(col)
+
+    if type_name in _STRING_TYPES:
+        # attribute values are usually much shorter than the declared maximum length
+        length = modifier.split(")")[0].strip()
+        return min(int(length), _DEFAULT_COLUMN_WIDTH) if length.isdigit() else _DEFAULT_COLUMN_WIDTH
+
+    # types such as 'timestamp without time zone' are looked up by their first word
+    return _TYPE_WIDTHS.get(type_name, _TYPE_WIDTHS.get(type_name.split(" ")[0], _DEFAULT_COLUMN_WIDTH))
+
+
 def column_data_type_for(attribute: Optional[CatalogAttribute]) -> str:
     """
     Determine what postgres type should be used for `attribute`.
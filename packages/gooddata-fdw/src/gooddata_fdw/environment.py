@@ -24,6 +24,7 @@ try:
     TableDefinition = multicorn.TableDefinition
     ColumnDefinition = multicorn.ColumnDefinition
     Qual = multicorn.Qual
+    SortKey = multicorn.SortKey
     log_to_postgres = utils.log_to_postgres
 except ImportError as e:
     # determine if running as part of test suite
@@ -63,6 +64,23 @@ except ImportError as e:
 
     Qual = QualStub
 
+    class SortKeyStub:
+        def __init__(
+            self,
+            attname: str,
+            attnum: int,
+            is_reversed: bool,
+            nulls_first: bool,
+            collate: Optional[str] = None,
+        ) -> None:
+            self.attname = attname
+            self.attnum = attnum
+            self.is_reversed = is_reversed
+            self.nulls_first = nulls_first
+            self.collate = collate
+
+    SortKey = SortKeyStub
+
     class TableDefinitionStub:
         def __init__(
             self,
@@ -93,7 +111,32 @@ except ImportError as e:
         ) -> list[TableDefinition]:
             return NotImplemented
 
-        def execute(self, quals: list[Qual], columns: list[str], sortkeys: Optional[list[Any]] = None):
+        def can_sort(self, sortkeys: list[SortKey]) -> list[SortKey]:
+            return []
+
+        def can_limit(self, limit: Optional[int], offset: Optional[int]) -> bool:
+            return False
+
+        def get_rel_size(self, quals: list[Qual], columns: list[str]) -> tuple[int, int]:
+            return 100000000, len(columns) * 100
+
+        def get_path_keys(self) -> list[tuple[tuple[str, ...], int]]:
+            return []
+
+        def commit(self) -> None:
+            pass
+
+        def rollback(self) -> None:
+            pass
+
+        def execute(
+            self,
+            quals: list[Qual],
+            columns: list[str],
+            sortkeys: Optional[list[SortKey]] = None,
+            limit: Optional[int] = None,
+            offset: Optional[int] = None,
+        ):
             pass
 
     ForeignDataWrapper = ForeignDataWrapperStub
@@ -1,24 +1,38 @@
 # (C) 2022 GoodData Corporation
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Iterator
+from itertools import islice
 from typing import Any, NamedTuple, Optional
 
-from gooddata_sdk import GoodDataSdk
+from gooddata_sdk import GoodDataSdk, SortDirection, TableSortKey
 
 import gooddata_fdw.column_validation as col_val
 from gooddata_fdw import column_utils
-from gooddata_fdw.environment import ColumnDefinition, Qual
+from gooddata_fdw.cache import ServerCache
+from gooddata_fdw.environment import ColumnDefinition, Qual, SortKey
 from gooddata_fdw.filter import extract_filters_from_quals
 from gooddata_fdw.options import ServerOptions, TableOptions
 from gooddata_fdw.result_reader import InsightTableResultReader, TableResultReader
 
+_DEFAULT_ROW_ESTIMATE = 1000
+"""
+Number of rows the planner is told to expect from a scan with attribute columns, until the executor
+observes the actual number.
+"""
+
+_QUAL_SELECTIVITY = 10
+"""
+Each qual on an attribute column is expected to cut the number of rows by this factor.
+"""
+
 
 class InitData(NamedTuple):
     sdk: GoodDataSdk
     server_options: ServerOptions
     table_options: TableOptions
     columns: dict[str, ColumnDefinition]
+    cache: Optional[ServerCache] = None
 
 
 class Executor:
@@ -26,19 +40,57 @@ class Executor:
         self._sdk = inputs.sdk
         self._table_columns = inputs.columns
         self._column_validators = column_validators
+        # number of rows returned by unfiltered executions, keyed by the computed attribute columns
+        self._observed_rows: dict[frozenset[str], int] = {}
 
     @classmethod
     def can_react(cls, inputs: InitData) -> bool:
         return False
 
+    def can_sort(self, sort_keys: list[SortKey]) -> list[SortKey]:
+        """
+        Returns the sort keys that the executor applies when computing the result. Sort keys that are not
+        returned are applied by PostgreSQL.
+        """
+        return []
+
+    def can_limit(self, limit: Optional[int], offset: Optional[int]) -> bool:
+        return False
+
+    def estimate_rel_size(self, quals: list[Qual], columns: list[str]) -> tuple[int, int]:
+        """
+        Returns the expected number of rows and the expected width of a row returned by `execute`.
+        """
+        width = sum(
+            column_utils.column_width_estimate(self._table_columns[col_name])
+            for col_name in columns
+            if col_name in self._table_columns
+        )
+
+        return self._estimate_rows(quals, columns), width
+
+    def _estimate_rows(self, quals: list[Qual], columns: list[str]) -> int:
+        return self._observed_rows.get(frozenset(), _DEFAULT_ROW_ESTIMATE)
+
+    def path_keys(self) -> list[tuple[tuple[str, ...], int]]:
+        """
+        Returns the combinations of columns which, when all compared for equality, yield the given number of rows.
+        """
+        return []
+
     def validate_columns_def(self) -> None:
         for column_name, column_def in self._table_columns.items():
             for validator in self._column_validators:
                 validator.validate(column_name, column_def)
 
     def execute(
-        self, quals: list[Qual], columns: list[str], sort_keys: Optional[list[Any]] = None
-    ) -> Generator[dict[str, Any], None, None]:
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sort_keys: Optional[list[SortKey]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Iterator[dict[str, Any]]:
         raise NotImplementedError()
 
 
@@ -53,22 +105,37 @@ class InsightExecutor(Executor):
         self._insight = inputs.table_options.insight
 
         self._table_columns = inputs.columns
+        self._cache = inputs.cache
 
     @classmethod
     def can_react(cls, inputs: InitData) -> bool:
         return inputs.table_options.insight is not None
 
     def execute(
-        self, quals: list[Qual], columns: list[str], sort_keys: Optional[list[Any]] = None
-    ) -> Generator[dict[str, Any], None, None]:
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sort_keys: Optional[list[SortKey]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Iterator[dict[str, Any]]:
         results_reader = InsightTableResultReader(self._table_columns, columns)
-        insight = self._sdk.visualizations.get_visualization(self._workspace, self._insight)
+        if self._cache is not None:
+            insight = self._cache.get_visualization(self._workspace, self._insight)
+        else:
+            insight = self._sdk.visualizations.get_visualization(self._workspace, self._insight)
         table = self._sdk.tables.for_visualization(self._workspace, insight)
+        self._observed_rows[frozenset()] = len(table)
 
         return results_reader.read_all_rows(table)
 
 
-class ComputeExecutor(Executor):
+class ItemsExecutor(Executor):
+    """
+    Computes the table columns that map to attributes, facts and metrics of the semantic layer. Only the columns
+    requested by the query are computed; sorting and row limits are pushed down to the computation.
+    """
+
     _COLUMN_VALIDATORS: list[col_val.ColumnValidator] = [col_val.IdOptionValidator(mandatory=True)]
 
     def __init__(self, inputs: InitData) -> None:
@@ -76,43 +143,109 @@ class ComputeExecutor(Executor):
         self._workspace = inputs.table_options.workspace
         self._results_reader = TableResultReader(self._table_columns)
 
-    @classmethod
-    def can_react(cls, inputs: InitData) -> bool:
-        return inputs.table_options.compute is not None
+    def can_sort(self, sort_keys: list[SortKey]) -> list[SortKey]:
+        supported = []
+
+        # the rows are sorted by all the keys, so only a prefix of the keys can be pushed down
+        for sort_key in sort_keys:
+            # NULLS FIRST/LAST other than the default and explicit collations cannot be honored; text attributes
+            # are sorted by the server in its own order, not by the collation of the column
+            if (
+                sort_key.attname not in self._table_columns
+                or not column_utils.is_server_ordered_col(self._table_columns[sort_key.attname])
+                or sort_key.nulls_first != sort_key.is_reversed
+                or sort_key.collate is not None
+            ):
+                break
+
+            supported.append(sort_key)
+
+        return supported
+
+    def can_limit(self, limit: Optional[int], offset: Optional[int]) -> bool:
+        return True
+
+    def _query_columns(self, columns: list[str], sort_keys: list[SortKey]) -> list[str]:
+        # columns used for sorting must be computed even if the query does not return them; queries such as
+        # SELECT count(*) do not request any columns - rows then correspond to all the table columns
+        query_columns = list(dict.fromkeys([*columns, *(sort_key.attname for sort_key in sort_keys)]))
+
+        return query_columns or list(self._table_columns)
+
+    def _attribute_columns(self, columns: list[str]) -> frozenset[str]:
+        return frozenset(
+            col_name
+            for col_name in columns
+            if col_name in self._table_columns and column_utils.is_attribute_col(self._table_columns[col_name])
+        )
+
+    def _estimate_rows(self, quals: list[Qual], columns: list[str]) -> int:
+        attribute_columns = self._attribute_columns(self._query_columns(columns, []))
+        if not attribute_columns:
+            # without attributes, there is at most one row with all the metrics
+            return 1
+
+        rows = self._observed_rows.get(attribute_columns, _DEFAULT_ROW_ESTIMATE)
+        for qual in quals:
+            if qual.field_name in attribute_columns:
+                rows = max(rows // _QUAL_SELECTIVITY, 1)
+
+        return rows
+
+    def path_keys(self) -> list[tuple[tuple[str, ...], int]]:
+        # rows are aggregated by the attribute columns - their combination identifies a row
+        attribute_columns = tuple(
+            col_name for col_name, col in self._table_columns.items() if column_utils.is_attribute_col(col)
+        )
+
+        return [(attribute_columns, 1)] if attribute_columns else []
 
     def execute(
-        self, quals: list[Qual], columns: list[str], sort_keys: Optional[list[Any]] = None
-    ) -> Generator[dict[str, Any], None, None]:
-        col_val.validate_columns_in_table_def(self._table_columns, columns)
-        items = [column_utils.table_col_as_computable(self._table_columns[col_name]) for col_name in columns]
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sort_keys: Optional[list[SortKey]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Iterator[dict[str, Any]]:
+        # sort keys are the ones accepted by can_sort, limit & offset are only set if can_limit accepted them
+        sort_keys = sort_keys or []
+        query_columns = self._query_columns(columns, sort_keys)
+        col_val.validate_columns_in_table_def(self._table_columns, query_columns)
+
+        offset = offset or 0
+        row_limit = None if limit is None else limit + offset
+        if row_limit == 0:
+            return iter(())
+
+        items = [column_utils.table_col_as_computable(self._table_columns[col_name]) for col_name in query_columns]
         # TODO: push down more filters that are included in quals
         filters = extract_filters_from_quals(quals, self._table_columns)
-        table = self._sdk.tables.for_items(self._workspace, items, filters)
+        sort_by = [
+            TableSortKey(sort_key.attname, SortDirection.DESC if sort_key.is_reversed else SortDirection.ASC)
+            for sort_key in sort_keys
+        ]
+        table = self._sdk.tables.for_items(self._workspace, items, filters, sort_by=sort_by, limit=row_limit)
 
-        return self._results_reader.read_all_rows(table)
+        attribute_columns = self._attribute_columns(query_columns)
+        if attribute_columns and not filters and row_limit is None:
+            self._observed_rows[attribute_columns] = len(table)
 
+        rows = self._results_reader.read_all_rows(table)
 
-class CustomExecutor(Executor):
-    _COLUMN_VALIDATORS: list[col_val.ColumnValidator] = [col_val.IdOptionValidator(mandatory=True)]
+        return islice(rows, offset, None) if offset else rows
 
-    def __init__(self, inputs: InitData) -> None:
-        super().__init__(inputs, self._COLUMN_VALIDATORS)
-        self._workspace = inputs.table_options.workspace
-        self._results_reader = TableResultReader(self._table_columns)
 
+class ComputeExecutor(ItemsExecutor):
     @classmethod
     def can_react(cls, inputs: InitData) -> bool:
-        return True
+        return inputs.table_options.compute is not None
 
-    def execute(
-        self, quals: list[Qual], columns: list[str], sort_keys: Optional[list[Any]] = None
-    ) -> Generator[dict[str, Any], None, None]:
-        items = [column_utils.table_col_as_computable(col) for col in self._table_columns.values()]
-        # TODO: pushdown more filters that are included in quals
-        filters = extract_filters_from_quals(quals, self._table_columns)
-        table = self._sdk.tables.for_items(self._workspace, items, filters)
 
-        return self._results_reader.read_all_rows(table)
+class CustomExecutor(ItemsExecutor):
+    @classmethod
+    def can_react(cls, inputs: InitData) -> bool:
+        return True
 
 
 class ExecutorFactory:
@@ -2,12 +2,11 @@
 from __future__ import annotations
 
 import traceback
-from typing import Any, Optional
-
-from gooddata_sdk import GoodDataSdk
+from typing import Optional
 
 from gooddata_fdw import __version__
-from gooddata_fdw.environment import ColumnDefinition, ForeignDataWrapper, Qual, TableDefinition
+from gooddata_fdw.cache import server_cache
+from gooddata_fdw.environment import ColumnDefinition, ForeignDataWrapper, Qual, SortKey, TableDefinition
 from gooddata_fdw.executor import ExecutorFactory, InitData
 from gooddata_fdw.import_workspace import ImporterInitData, WorkspaceImportersLocator
 from gooddata_fdw.options import ImportSchemaOptions, ServerOptions, TableOptions
@@ -27,17 +26,40 @@ class GoodDataForeignDataWrapper(ForeignDataWrapper):
         self._table_options = TableOptions(options)
 
         self._columns = columns
-        gd_sdk = GoodDataSdk.create(
-            self._server_options.host, self._server_options.token, USER_AGENT, Host=self._server_options.headers_host
-        )
+        # SDK, metadata and execution results are shared by all foreign tables of the server in this backend
+        self._cache = server_cache(self._server_options, USER_AGENT)
 
-        self._executor = ExecutorFactory.create(InitData(gd_sdk, self._server_options, self._table_options, columns))
+        self._executor = ExecutorFactory.create(
+            InitData(self._cache.sdk, self._server_options, self._table_options, columns, self._cache)
+        )
         self._executor.validate_columns_def()
 
-    def execute(self, quals: list[Qual], columns: list[str], sortkeys: Optional[list[Any]] = None):
-        _log_debug(f"query in fdw with {self._server_options}; {self._table_options}; columns {columns}; quals={quals}")
+    def can_sort(self, sortkeys: list[SortKey]) -> list[SortKey]:
+        return self._executor.can_sort(sortkeys)
+
+    def can_limit(self, limit: Optional[int], offset: Optional[int]) -> bool:
+        return self._executor.can_limit(limit, offset)
+
+    def get_rel_size(self, quals: list[Qual], columns: list[str]) -> tuple[int, int]:
+        return self._executor.estimate_rel_size(quals, columns)
+
+    def get_path_keys(self) -> list[tuple[tuple[str, ...], int]]:
+        return self._executor.path_keys()
+
+    def execute(
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sortkeys: Optional[list[SortKey]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ):
+        _log_debug(
+            f"query in fdw with {self._server_options}; {self._table_options}; columns {columns}; quals={quals}; "
+            f"sortkeys={sortkeys}; limit={limit}; offset={offset}"
+        )
         try:
-            return self._executor.execute(quals, columns, sortkeys)
+            return self._executor.execute(quals, columns, sortkeys, limit, offset)
         except Exception as e:
             _log_error(traceback.format_exc())
             raise e
@@ -62,10 +84,10 @@ class GoodDataForeignDataWrapper(ForeignDataWrapper):
 
             importer_classes = WorkspaceImportersLocator.locate(import_options.object_type)
 
-            _sdk = GoodDataSdk.create(
-                server_options.host, server_options.token, USER_AGENT, Host=server_options.headers_host
+            cache = server_cache(server_options, USER_AGENT)
+            init_data = ImporterInitData(
+                cache.sdk, schema, server_options, import_options, restriction_type, restricts, cache
             )
-            init_data = ImporterInitData(_sdk, schema, server_options, import_options, restriction_type, restricts)
             tables = []
             for importer_class in importer_classes:
                 instance = importer_class(init_data)
@@ -75,6 +97,12 @@ class GoodDataForeignDataWrapper(ForeignDataWrapper):
             _log_error(traceback.format_exc())
             raise e
 
+    def commit(self) -> None:
+        self._cache.end_transaction()
+
+    def rollback(self) -> None:
+        self._cache.end_transaction()
+
     @property
     def rowid_column(self):
         return super().rowid_column
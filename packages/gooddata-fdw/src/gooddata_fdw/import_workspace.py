@@ -14,6 +14,7 @@ from gooddata_sdk import (
 )
 
 from gooddata_fdw import column_utils, options
+from gooddata_fdw.cache import ServerCache
 from gooddata_fdw.environment import ColumnDefinition, TableDefinition
 from gooddata_fdw.naming import (
     DefaultCatalogNamingStrategy,
@@ -41,6 +42,7 @@ class ImporterInitData(NamedTuple):
     import_options: options.ImportSchemaOptions
     restriction_type: Optional[str]
     restricts: list[str]
+    cache: Optional[ServerCache] = None
 
 
 class WorkspaceImporter:
@@ -53,11 +55,24 @@ class WorkspaceImporter:
         self._import_options = data.import_options
         self._restriction_type = data.restriction_type
         self._restricts = data.restricts
+        self._cache = data.cache
 
     @classmethod
     def support_object_type(cls, object_type: str) -> bool:
         return object_type in cls._SUPPORTED_TYPES
 
+    def _get_full_catalog(self) -> CatalogWorkspaceContent:
+        if self._cache is not None:
+            return self._cache.get_full_catalog(self._workspace)
+
+        return self._sdk.catalog_workspace_content.get_full_catalog(self._workspace)
+
+    def _get_visualizations(self) -> list[Visualization]:
+        if self._cache is not None:
+            return self._cache.get_visualizations(self._workspace)
+
+        return self._sdk.visualizations.get_visualizations(self._workspace)
+
     def import_tables(self) -> list[TableDefinition]:
         raise NotImplementedError()
 
@@ -90,9 +105,9 @@ class InsightsWorkspaceImporter(WorkspaceImporter):
             f"headers_host={self._server_options.headers_host}"
         )
         _log_debug("loading full catalog")
-        catalog = self._sdk.catalog_workspace_content.get_full_catalog(self._workspace)
+        catalog = self._get_full_catalog()
         _log_debug("loading all insights")
-        insights = self._sdk.visualizations.get_visualizations(self._workspace)
+        insights = self._get_visualizations()
 
         tables = []
         for insight in insights:
@@ -190,7 +205,7 @@ class SemanticLayerWorkspaceImporter(WorkspaceImporter):
             f"headers_host={self._server_options.headers_host}"
         )
 
-        catalog = self._sdk.catalog_workspace_content.get_full_catalog(self._workspace)
+        catalog = self._get_full_catalog()
         naming = DefaultCatalogNamingStrategy()
         columns = []
 
@@ -28,6 +28,9 @@ class BaseOptions:
                 # if it is callable, it is an option getter which must be able to call without parameters
                 attribute_value = attribute_value()
             return attribute_value
+        except ValueError:
+            # the value is defined, but it is not valid
+            raise
         except Exception:
             raise ValueError(self._no_mandatory_value_msg(attribute))
 
@@ -48,7 +51,26 @@ class BaseOptions:
         return f"{self.__class__.__name__}({str(attr_to_value)})"
 
 
+def _non_negative_number(options: dict[str, str], key: str, default: str) -> float:
+    value = options.get(key, default)
+    try:
+        number = float(value)
+    except ValueError:
+        raise ValueError(f"FOREIGN SERVER option '{key}' must be a number. Instead got '{value}'")
+
+    if number < 0:
+        raise ValueError(f"FOREIGN SERVER option '{key}' must not be negative. Instead got '{value}'")
+
+    return number
+
+
 class ServerOptions(BaseOptions):
+    METADATA_CACHE_TTL_DEFAULT = "300"
+    METADATA_CACHE_MAX_ENTRIES_DEFAULT = "256"
+    EXECUTION_CACHE_TTL_DEFAULT = "0"
+    EXECUTION_CACHE_MAX_ENTRIES_DEFAULT = "16"
+    EXECUTION_CACHE_MAX_PAGES_DEFAULT = "1024"
+
     def __init__(self, options: dict[str, str]) -> None:
         self._options = options
         super().__init__()
@@ -75,6 +97,46 @@ class ServerOptions(BaseOptions):
     def headers_host(self) -> Union[str, None]:
         return self._options.get("headers_host")
 
+    @property
+    def metadata_cache_ttl(self) -> float:
+        """
+        Number of seconds for which visualizations and catalogs loaded from the server are reused; 0 disables
+        the caching.
+        """
+        return _non_negative_number(self._options, "metadata_cache_ttl", self.METADATA_CACHE_TTL_DEFAULT)
+
+    @property
+    def metadata_cache_max_entries(self) -> int:
+        return int(
+            _non_negative_number(self._options, "metadata_cache_max_entries", self.METADATA_CACHE_MAX_ENTRIES_DEFAULT)
+        )
+
+    @property
+    def execution_cache_ttl(self) -> float:
+        """
+        Number of seconds for which results of executions are reused. With 0, the results are reused only within
+        the current transaction.
+        """
+        return _non_negative_number(self._options, "execution_cache_ttl", self.EXECUTION_CACHE_TTL_DEFAULT)
+
+    @property
+    def execution_cache_max_entries(self) -> int:
+        """
+        Maximum number of execution results held in memory; 0 disables the caching.
+        """
+        return int(
+            _non_negative_number(self._options, "execution_cache_max_entries", self.EXECUTION_CACHE_MAX_ENTRIES_DEFAULT)
+        )
+
+    @property
+    def execution_cache_max_pages(self) -> int:
+        """
+        Maximum number of result pages held in memory; each page holds up to 512 rows.
+        """
+        return int(
+            _non_negative_number(self._options, "execution_cache_max_pages", self.EXECUTION_CACHE_MAX_PAGES_DEFAULT)
+        )
+
 
 class TableOptions(BaseOptions):
     def __init__(self, options: dict[str, str]) -> None:
@@ -0,0 +1,87 @@
+# (C) 2026 GoodData Corporation
+import time
+from unittest import mock
+
+import pytest
+from gooddata_fdw import cache, options
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    yield
+    cache.clear_server_caches()
+
+
+def test_metadata_cache():
+    metadata = cache.MetadataCache(ttl=0.05, max_entries=2)
+    load = mock.Mock(side_effect=lambda: object())
+
+    first = metadata.get("a", load)
+    assert metadata.get("a", load) is first
+    assert load.call_count == 1
+
+    metadata.get("b", load)
+    metadata.get("c", load)
+    # the least recently used entry was evicted
+    assert len(metadata) == 2
+    assert metadata.get("a", load) is not first
+
+    time.sleep(0.1)
+    metadata.get("c", load)
+    assert load.call_count == 5
+
+
+def test_metadata_cache_disabled():
+    metadata = cache.MetadataCache(ttl=0, max_entries=2)
+    load = mock.Mock(side_effect=lambda: object())
+
+    assert metadata.get("a", load) is not metadata.get("a", load)
+    assert len(metadata) == 0
+
+
+def test_server_cache_per_server():
+    so = options.ServerOptions(dict(host="https://abc", token="123"))
+
+    server_cache = cache.server_cache(so, "test")
+    assert cache.server_cache(options.ServerOptions(dict(host="https://abc", token="123")), "test") is server_cache
+    assert cache.server_cache(options.ServerOptions(dict(host="https://abc", token="456")), "test") is not server_cache
+
+    assert server_cache.result_cache is not None
+    assert server_cache.sdk.tables._compute.result_cache is server_cache.result_cache
+
+
+@pytest.mark.parametrize("execution_cache_ttl, expected_entries", [("0", 0), ("60", 1)])
+def test_server_cache_end_transaction(execution_cache_ttl, expected_entries):
+    so = options.ServerOptions(dict(host="https://abc", token="123", execution_cache_ttl=execution_cache_ttl))
+    server_cache = cache.server_cache(so, "test")
+    assert server_cache.result_cache is not None
+    server_cache.result_cache.store("key", "ws", "result", mock.Mock())
+
+    server_cache.end_transaction()
+
+    assert len(server_cache.result_cache) == expected_entries
+
+
+def test_server_cache_metadata():
+    server_cache = cache.server_cache(options.ServerOptions(dict(host="https://abc", token="123")), "test")
+
+    with mock.patch.object(server_cache.sdk.visualizations, "get_visualization") as get_visualization:
+        server_cache.get_visualization("ws", "vis")
+        server_cache.get_visualization("ws", "vis")
+        server_cache.get_visualization("ws", "other")
+
+    assert get_visualization.call_count == 2
+
+
+def test_execution_cache_disabled():
+    so = options.ServerOptions(dict(host="https://abc", token="123", execution_cache_max_entries="0"))
+
+    assert cache.server_cache(so, "test").result_cache is None
+
+
+def test_invalid_cache_options():
+    with pytest.raises(ValueError, match="metadata_cache_ttl"):
+        options.ServerOptions(dict(host="https://abc", token="123", metadata_cache_ttl="abc"))
+
+    with pytest.raises(ValueError, match="execution_cache_max_pages"):
+        options.ServerOptions(dict(host="https://abc", token="123", execution_cache_max_pages="-1"))
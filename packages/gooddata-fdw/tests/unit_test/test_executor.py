@@ -1,9 +1,12 @@
 # (C) 2022 GoodData Corporation
 
+from collections import OrderedDict
 from unittest import mock
 
 import pytest
 from gooddata_fdw import executor, options
+from gooddata_fdw.environment import ColumnDefinition, Qual, SortKey
+from gooddata_sdk import SortDirection, TableSortKey
 
 
 @pytest.mark.parametrize(
@@ -25,3 +28,86 @@ def test_executor_factory(test_config, table_options, expected_executor):
     )
 
     assert isinstance(executor.ExecutorFactory.create(inputs), expected_executor)
+
+
+@pytest.fixture
+def table_columns():
+    columns = OrderedDict()
+    columns["claim_amount"] = ColumnDefinition(
+        column_name="claim_amount",
+        type_name="DECIMAL(15,5)",
+        options=dict(id="metric/claim-amount"),
+    )
+    columns["car_make"] = ColumnDefinition(
+        column_name="car_make",
+        type_name="VARCHAR(255)",
+        options=dict(id="label/car.car_make"),
+    )
+    columns["datetime"] = ColumnDefinition(
+        column_name="datetime",
+        type_name="DATE",
+        options=dict(id="label/datetime.day"),
+    )
+
+    return columns
+
+
+@pytest.fixture
+def custom_executor(test_config, table_columns):
+    sdk = mock.Mock(name="sdk")
+    sdk.tables.for_items.return_value.read_all.return_value = iter(
+        [{"car_make": f"make{i}", "claim_amount": float(i)} for i in range(5)]
+    )
+    sdk.tables.for_items.return_value.__len__ = mock.Mock(return_value=5)
+    inputs = executor.InitData(
+        sdk,
+        options.ServerOptions(dict(host=test_config["host"], token=test_config["token"])),
+        options.TableOptions(dict(workspace="123")),
+        table_columns,
+    )
+
+    return executor.ExecutorFactory.create(inputs)
+
+
+def test_executor_can_sort(custom_executor):
+    sort_keys = [
+        SortKey("claim_amount", 1, is_reversed=True, nulls_first=True),
+        SortKey("datetime", 3, is_reversed=False, nulls_first=False),
+        SortKey("datetime", 3, is_reversed=False, nulls_first=True),
+        SortKey("claim_amount", 1, is_reversed=False, nulls_first=False),
+    ]
+
+    # keys after the first unsupported one cannot be pushed down
+    assert custom_executor.can_sort(sort_keys) == sort_keys[:2]
+    assert custom_executor.can_sort([SortKey("unknown", 9, is_reversed=False, nulls_first=False)]) == []
+
+    # the server does not sort text attributes by the collation of the column
+    text_sort_key = SortKey("car_make", 2, is_reversed=False, nulls_first=False)
+    assert custom_executor.can_sort([text_sort_key]) == []
+    assert custom_executor.can_sort([sort_keys[0], text_sort_key]) == sort_keys[:1]
+    assert custom_executor.can_limit(10, None)
+
+
+def test_executor_pushdown(custom_executor):
+    sort_keys = [SortKey("claim_amount", 1, is_reversed=True, nulls_first=True)]
+
+    rows = list(custom_executor.execute([], ["car_make"], sort_keys, limit=3, offset=2))
+
+    assert [row["car_make"] for row in rows] == ["make2", "make3", "make4"]
+    args, kwargs = custom_executor._sdk.tables.for_items.call_args
+    # only the requested columns & columns used for sorting are computed
+    assert [item.local_id for item in args[1]] == ["car_make", "claim_amount"]
+    assert kwargs["sort_by"] == [TableSortKey("claim_amount", SortDirection.DESC)]
+    assert kwargs["limit"] == 5
+
+
+def test_executor_estimates(custom_executor):
+    assert custom_executor.path_keys() == [(("car_make", "datetime"), 1)]
+    assert custom_executor.estimate_rel_size([], ["claim_amount"]) == (1, 16)
+    assert custom_executor.estimate_rel_size([], ["car_make", "claim_amount"]) == (1000, 48)
+    assert custom_executor.estimate_rel_size([Qual("car_make", "=", "bmw")], ["car_make"]) == (100, 32)
+
+    list(custom_executor.execute([], ["car_make"]))
+
+    # unfiltered execution reveals the actual number of rows
+    assert custom_executor.estimate_rel_size([], ["car_make"]) == (5, 32)
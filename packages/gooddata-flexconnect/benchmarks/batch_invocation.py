@@ -0,0 +1,191 @@
+# (C) 2026 GoodData Corporation
+"""
+Load benchmark of batch invocation (DoExchange) compared to the GetFlightInfo + DoGet flow.
+
+The benchmark starts a FlexConnect server on localhost with a function that simulates work by sleeping.
+Each of the concurrent clients repeatedly calls the function for a number of different parameter sets - either
+one GetFlightInfo + DoGet per parameter set (with parameter sets called from a client-side thread pool, as a
+dashboard would) or all parameter sets in a single DoExchange. The benchmark prints latency of one round
+of calls and the number of RPCs each round needed.
+
+Run with:
+
+    python benchmarks/batch_invocation.py --invocations 30 --clients 4 --rounds 10 --latency-ms 0 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Callable, Optional
+
+import orjson
+import pyarrow.flight
+from gooddata_flexconnect import BATCH_INVOCATION_COMMAND, batch_invocation_payload, read_batch_results
+from gooddata_flexconnect.function.flight_methods import _FlexConnectServerMethods
+from gooddata_flexconnect.function.function import FlexConnectFunction
+from gooddata_flexconnect.function.function_registry import FlexConnectFunctionRegistry
+from gooddata_flight_server import (
+    ArrowData,
+    FlightServerMethods,
+    ServerContext,
+    create_server,
+    flight_server_methods,
+)
+
+_LATENCY = 0.0
+
+
+class _BenchFun(FlexConnectFunction):
+    Name = "BenchFun"
+    Schema = pyarrow.schema(
+        fields=[
+            pyarrow.field("param", pyarrow.int64()),
+            pyarrow.field("value", pyarrow.float64()),
+        ]
+    )
+
+    def call(
+        self,
+        parameters: dict,
+        columns: Optional[tuple[str, ...]],
+        headers: dict[str, list[str]],
+    ) -> ArrowData:
+        time.sleep(_LATENCY)
+        param = parameters["param"]
+
+        return pyarrow.table(
+            data={"param": [param] * 100, "value": [float(i) for i in range(100)]},
+            schema=self.Schema,
+        )
+
+
+@flight_server_methods
+def _create_methods(ctx: ServerContext) -> FlightServerMethods:
+    registry = FlexConnectFunctionRegistry().register(ctx, _BenchFun)
+
+    return _FlexConnectServerMethods(ctx, registry, call_deadline_ms=60_000, poll_interval_ms=2_000)
+
+
+def _find_free_port() -> int:
+    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _get_flight_info_round(
+    client: pyarrow.flight.FlightClient, pool: ThreadPoolExecutor, invocations: int
+) -> tuple[int, int]:
+    def _call(param: int) -> int:
+        descriptor = pyarrow.flight.FlightDescriptor.for_command(
+            orjson.dumps({"functionName": "BenchFun", "parameters": {"param": param}})
+        )
+        info = client.get_flight_info(descriptor)
+
+        return client.do_get(info.endpoints[0].ticket).read_all().num_rows
+
+    rows = sum(pool.map(_call, range(invocations)))
+
+    return rows, 2 * invocations
+
+
+def _batch_round(client: pyarrow.flight.FlightClient, pool: ThreadPoolExecutor, invocations: int) -> tuple[int, int]:
+    writer, reader = client.do_exchange(pyarrow.flight.FlightDescriptor.for_command(BATCH_INVOCATION_COMMAND))
+
+    for param in range(invocations):
+        writer.write_metadata(batch_invocation_payload(str(param), "BenchFun", {"param": param}))
+    writer.done_writing()
+
+    rows = 0
+    for result in read_batch_results(reader):
+        assert result.data is not None, result.error
+        rows += result.data.num_rows
+    writer.close()
+
+    return rows, 1
+
+
+def _run(
+    location: pyarrow.flight.Location,
+    round_fun: Callable[[pyarrow.flight.FlightClient, ThreadPoolExecutor, int], tuple[int, int]],
+    clients: int,
+    rounds: int,
+    invocations: int,
+) -> tuple[list[float], int]:
+    def _client() -> tuple[list[float], int]:
+        client = pyarrow.flight.FlightClient(location)
+        durations = []
+        rpcs = 0
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(rounds):
+                started = time.perf_counter()
+                rows, round_rpcs = round_fun(client, pool, invocations)
+                durations.append(time.perf_counter() - started)
+                rpcs = round_rpcs
+
+                assert rows == invocations * 100
+
+        client.close()
+        return durations, rpcs
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        results = list(pool.map(lambda _: _client(), range(clients)))
+
+    return [d for durations, _ in results for d in durations], results[0][1]
+
+
+def main() -> None:
+    global _LATENCY
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--invocations", type=int, default=30, help="parameter sets per round")
+    parser.add_argument("--clients", type=int, default=4, help="concurrent clients")
+    parser.add_argument("--rounds", type=int, default=10, help="rounds per client")
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[0, 20], help="simulated function latency")
+    parser.add_argument("--task-threads", type=int, default=32, help="size of the server's task thread pool")
+    args = parser.parse_args()
+
+    port = _find_free_port()
+    os.environ["GOODDATA_FLIGHT_SERVER__LISTEN_PORT"] = str(port)
+    os.environ["GOODDATA_FLIGHT_SERVER__ADVERTISE_HOST"] = "localhost"
+    os.environ["GOODDATA_FLIGHT_SERVER__TASK_THREADS"] = str(args.task_threads)
+
+    server = create_server(_create_methods)
+    server.start()
+    if not server.wait_for_start():
+        raise RuntimeError(f"Unable to start server on port {port}.")
+
+    try:
+        print(f"{'latency ms':>10} {'flow':>22} {'rpcs/round':>10} {'p50 ms':>8} {'p95 ms':>8} {'rounds/s':>9}")
+
+        for latency_ms in args.latency_ms:
+            _LATENCY = latency_ms / 1000
+
+            for name, round_fun in (
+                ("GetFlightInfo + DoGet", _get_flight_info_round),
+                ("DoExchange batch", _batch_round),
+            ):
+                started = time.perf_counter()
+                durations, rpcs = _run(server.location, round_fun, args.clients, args.rounds, args.invocations)
+                elapsed = time.perf_counter() - started
+                durations.sort()
+
+                print(
+                    f"{latency_ms:>10.0f} {name:>22} {rpcs:>10} "
+                    f"{statistics.median(durations) * 1000:>8.1f} "
+                    f"{durations[int(len(durations) * 0.95) - 1] * 1000:>8.1f} "
+                    f"{len(durations) / elapsed:>9.1f}"
+                )
+    finally:
+        server.stop()
+        server.wait_for_stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# (C) 2026 GoodData Corporation
+"""
+Benchmark of per-call overhead of FlexConnect functions with and without instance pooling.
+
+The benchmarked function parses a reference table in its constructor - something that a function would
+otherwise do on each call. Each call goes through the same path as on the server: the instance is checked
+out from the registry, the function task runs and completes, which releases the instance. Calls are made
+from a thread pool to simulate concurrent invocations.
+
+Run with:
+
+    python benchmarks/function_pool.py --calls 2000 --threads 1 8 --reference-rows 1000 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import pyarrow
+import pyarrow.csv
+import pyarrow.flight
+from gooddata_flexconnect import FunctionPoolConfig
+from gooddata_flexconnect.function.function import FlexConnectFunction
+from gooddata_flexconnect.function.function_registry import FlexConnectFunctionRegistry
+from gooddata_flexconnect.function.function_task import FlexConnectFunctionTask
+from gooddata_flight_server import ArrowData, ServerContext, TaskExecutionResult
+
+_SCHEMA = pyarrow.schema([pyarrow.field("key", pyarrow.string()), pyarrow.field("value", pyarrow.float64())])
+_REFERENCE_CSV = b""
+
+
+class _UnpooledFun(FlexConnectFunction):
+    Name = "Unpooled"
+    Schema = _SCHEMA
+
+    def __init__(self) -> None:
+        # expensive, per-instance initialization
+        reference = pyarrow.csv.read_csv(pyarrow.py_buffer(_REFERENCE_CSV))
+        self._lookup = dict(zip(reference.column("key").to_pylist(), reference.column("value").to_pylist()))
+
+    def call(
+        self,
+        parameters: dict,
+        columns: Optional[tuple[str, ...]],
+        headers: dict[str, list[str]],
+    ) -> ArrowData:
+        keys = parameters["keys"]
+
+        return pyarrow.table({"key": keys, "value": [self._lookup[key] for key in keys]}, schema=_SCHEMA)
+
+
+class _PooledFun(_UnpooledFun):
+    Name = "Pooled"
+    Pool = FunctionPoolConfig(max_size=64)
+
+
+def _call(registry: FlexConnectFunctionRegistry, name: str) -> None:
+    lease = registry.checkout_function(name)
+    task = FlexConnectFunctionTask(
+        fun=lease.fun, parameters={"keys": ["k1", "k2", "k3"]}, columns=None, headers={}, cmd=b"", lease=lease
+    )
+    result = task.run()
+    task.on_task_completed(
+        TaskExecutionResult(task_id=task.task_id, cmd=b"", result=result, error=None, cancelled=False)  # type: ignore[arg-type]
+    )
+
+
+def _bench(registry: FlexConnectFunctionRegistry, name: str, calls: int, threads: int) -> float:
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        # warm up
+        list(pool.map(lambda _: _call(registry, name), range(threads)))
+
+        started = time.perf_counter()
+        list(pool.map(lambda _: _call(registry, name), range(calls)))
+
+        return (time.perf_counter() - started) / calls
+
+
+def main() -> None:
+    global _REFERENCE_CSV
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000, help="number of calls per measurement")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8], help="number of calling threads")
+    parser.add_argument("--reference-rows", type=int, nargs="+", default=[1000, 50000], help="size of reference data")
+    args = parser.parse_args()
+
+    ctx = ServerContext(
+        config=None,  # type: ignore[arg-type]
+        location=pyarrow.flight.Location.for_grpc_tcp("localhost", 0),
+        settings=None,  # type: ignore[arg-type]
+        task_executor=None,  # type: ignore[arg-type]
+        health=None,  # type: ignore[arg-type]
+    )
+    registry = FlexConnectFunctionRegistry().register(ctx, _UnpooledFun, _PooledFun)
+
+    print(f"{'ref rows':>9} {'threads':>8} {'unpooled us/call':>17} {'pooled us/call':>15} {'speedup':>8}")
+
+    for rows in args.reference_rows:
+        _REFERENCE_CSV = b"key,value\n" + b"".join(f"k{i},{i}.5\n".encode() for i in range(rows))
+
+        for threads in args.threads:
+            # instances pooled for the previous reference data must not be reused
+            registry.close()
+            registry = FlexConnectFunctionRegistry().register(ctx, _UnpooledFun, _PooledFun)
+
+            unpooled = _bench(registry, _UnpooledFun.Name, args.calls, threads)
+            pooled = _bench(registry, _PooledFun.Name, args.calls, threads)
+
+            print(f"{rows:>9} {threads:>8} {unpooled * 1e6:>17.1f} {pooled * 1e6:>15.1f} {unpooled / pooled:>7.1f}x")
+
+    registry.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
 # (C) 2024 GoodData Corporation
 
+from gooddata_flexconnect.function.batch_invocation import (
+    BATCH_INVOCATION_COMMAND,
+    BatchInvocationResult,
+    batch_invocation_payload,
+    read_batch_results,
+)
 from gooddata_flexconnect.function.data_source_messages import (
     DataSourceMessage,
     add_data_source_messages_metadata,
@@ -20,4 +26,6 @@ from gooddata_flexconnect.function.execution_context import (
     ReportExecutionRequest,
 )
 from gooddata_flexconnect.function.flight_methods import create_flexconnect_flight_methods
-from gooddata_flexconnect.function.function import FlexConnectFunction
+from gooddata_flexconnect.function.function import FlexConnectFunction, FunctionPoolConfig
+from gooddata_flexconnect.function.function_task import TASK_PRIORITY_METADATA_KEY
+from gooddata_flexconnect.function.invocation_cache import INVOCATION_CACHE_METADATA_KEY, FlexConnectInvocationCache
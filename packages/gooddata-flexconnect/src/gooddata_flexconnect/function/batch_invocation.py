@@ -0,0 +1,138 @@
+#  (C) 2026 GoodData Corporation
+from collections.abc import Generator
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import orjson
+import pyarrow.flight
+import pyarrow.ipc
+from gooddata_flight_server import ErrorInfo
+
+BATCH_INVOCATION_COMMAND = b"flexconnect:batch"
+"""
+Command of the flight descriptor that starts DoExchange with a batch of FlexConnect function invocations.
+
+The client sends each invocation as a metadata-only message (see `batch_invocation_payload`) and then
+indicates that it is done writing. The server runs the invocations concurrently and sends back one record
+batch in the `BATCH_RESULT_SCHEMA` for each invocation - in the order in which the invocations complete.
+"""
+
+BATCH_RESULT_SCHEMA = pyarrow.schema(
+    fields=[
+        pyarrow.field("invocationId", pyarrow.string(), nullable=False),
+        pyarrow.field("error", pyarrow.binary()),
+        pyarrow.field("data", pyarrow.large_binary()),
+    ]
+)
+"""
+Schema of the data that the server sends back during batch invocation.
+
+- `invocationId` - identifier of the invocation, as sent by the client
+- `error` - serialized ErrorInfo if the invocation failed; null otherwise
+- `data` - result of the invocation serialized in the Arrow IPC streaming format; null if the invocation failed
+"""
+
+
+@dataclass(frozen=True)
+class BatchInvocationResult:
+    """
+    Result of one invocation from a batch.
+    """
+
+    invocation_id: str
+
+    data: Optional[pyarrow.Table]
+    """
+    Result of the invocation; None if the invocation failed.
+    """
+
+    error: Optional[ErrorInfo]
+    """
+    Detail about the failure; None if the invocation succeeded.
+    """
+
+
+def batch_invocation_payload(invocation_id: str, function_name: str, parameters: Optional[dict] = None) -> bytes:
+    """
+    Creates payload of one invocation to send during batch invocation.
+
+    :param invocation_id: identifier of the invocation, must be unique within the batch
+    :param function_name: name of the function to invoke
+    :param parameters: parameters to pass to the function
+    :return: payload to send as metadata-only message
+    """
+    return orjson.dumps(
+        {
+            "invocationId": invocation_id,
+            "functionName": function_name,
+            "parameters": parameters or {},
+        }
+    )
+
+
+def _serialize_data(data: Union[pyarrow.Table, pyarrow.RecordBatchReader]) -> pyarrow.Buffer:
+    sink = pyarrow.BufferOutputStream()
+
+    with pyarrow.ipc.new_stream(sink, data.schema) as writer:
+        if isinstance(data, pyarrow.Table):
+            writer.write_table(data)
+        else:
+            for batch in data:
+                writer.write_batch(batch)
+
+    return sink.getvalue()
+
+
+def encode_batch_result(
+    invocation_id: str,
+    data: Optional[Union[pyarrow.Table, pyarrow.RecordBatchReader]] = None,
+    error: Optional[ErrorInfo] = None,
+) -> pyarrow.RecordBatch:
+    """
+    Encodes result of one invocation into a record batch to send back to the client.
+
+    :param invocation_id: identifier of the invocation
+    :param data: result of the invocation
+    :param error: detail about failure of the invocation
+    :return: record batch in the BATCH_RESULT_SCHEMA
+    """
+    return pyarrow.record_batch(
+        [
+            pyarrow.array([invocation_id], pyarrow.string()),
+            pyarrow.array([error.to_bytes() if error is not None else None], pyarrow.binary()),
+            pyarrow.array(
+                [memoryview(_serialize_data(data)) if data is not None else None],
+                pyarrow.large_binary(),
+            ),
+        ],
+        schema=BATCH_RESULT_SCHEMA,
+    )
+
+
+def read_batch_results(
+    reader: pyarrow.flight.FlightStreamReader,
+) -> Generator[BatchInvocationResult, None, None]:
+    """
+    Reads results of the batch invocation as the server sends them.
+
+    :param reader: reader obtained from DoExchange
+    :return: generator of invocation results
+    """
+    for chunk in reader:
+        if chunk.data is None:
+            continue
+
+        invocation_ids = chunk.data.column("invocationId")
+        errors = chunk.data.column("error")
+        data = chunk.data.column("data")
+
+        for i in range(chunk.data.num_rows):
+            error = errors[i].as_py()
+            # the result data is read without copying it out of the received message
+            buffer = data[i].as_buffer()
+
+            yield BatchInvocationResult(
+                invocation_id=invocation_ids[i].as_py(),
+                data=pyarrow.ipc.open_stream(buffer).read_all() if buffer is not None else None,
+                error=ErrorInfo.from_bytes(error) if error is not None else None,
+            )
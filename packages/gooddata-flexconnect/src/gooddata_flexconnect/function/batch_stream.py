@@ -0,0 +1,196 @@
+#  (C) 2026 GoodData Corporation
+import queue
+import threading
+from collections.abc import Generator, Iterator
+from typing import Callable, Optional, Union
+
+import pyarrow.flight
+import structlog
+from gooddata_flight_server import ErrorCode, ErrorInfo
+
+_LOGGER = structlog.get_logger("gooddata_flexconnect.batch_stream")
+
+DEFAULT_STREAM_QUEUE_SIZE = 4
+"""
+Default number of record batches that the producer may generate ahead of the consumer.
+"""
+
+_PUT_TIMEOUT = 0.1
+"""
+How often (in seconds) the producer blocked on full queue checks whether the stream got closed.
+"""
+
+
+class _StreamEnd:
+    pass
+
+
+class _StreamFailure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+_END = _StreamEnd()
+
+
+class BatchStream:
+    """
+    Streams record batches from an iterator (typically a generator returned by a FlexConnect function)
+    to a RecordBatchReader.
+
+    The iterator is drained by a dedicated producer thread which puts the batches into a bounded
+    queue; the reader takes the batches from the queue as the client consumes them. When the queue
+    is full, the producer waits - so a slow client throttles the function instead of the whole result
+    piling up in memory.
+
+    The first batch is obtained eagerly in `start` so that the schema of the stream is known and
+    so that errors which happen as the function starts are raised to the caller right away.
+
+    The stream can only be read once. Closing the stream stops the producer; if the iterator was
+    not exhausted yet, the `on_abort` callback is invoked as well. The `on_done` callback is invoked
+    by the producer once it is done with the iterator - whether it was exhausted, failed or the stream
+    was closed.
+    """
+
+    def __init__(
+        self,
+        batches: Iterator[pyarrow.RecordBatch],
+        schema: pyarrow.Schema,
+        max_queued_batches: int = DEFAULT_STREAM_QUEUE_SIZE,
+        on_abort: Optional[Callable[[], object]] = None,
+        on_done: Optional[Callable[[], object]] = None,
+    ) -> None:
+        self._batches = batches
+        self._schema = schema
+        self._queue: queue.Queue[Union[pyarrow.RecordBatch, _StreamEnd, _StreamFailure]] = queue.Queue(
+            maxsize=max(1, max_queued_batches)
+        )
+        self._on_abort = on_abort
+        self._on_done = on_done
+        self._closed = threading.Event()
+        self._finished = threading.Event()
+        self._producer: Optional[threading.Thread] = None
+
+    @staticmethod
+    def start(
+        batches: Iterator[pyarrow.RecordBatch],
+        fallback_schema: Optional[pyarrow.Schema],
+        max_queued_batches: int = DEFAULT_STREAM_QUEUE_SIZE,
+        on_abort: Optional[Callable[[], object]] = None,
+        on_done: Optional[Callable[[], object]] = None,
+    ) -> "BatchStream":
+        """
+        Obtains the first batch and starts producing the rest in the background.
+
+        :param batches: iterator of record batches
+        :param fallback_schema: schema to use if the iterator produces no batches at all
+        :param max_queued_batches: maximum number of batches produced ahead of the consumer
+        :param on_abort: callback to call when the stream is closed before the iterator is exhausted
+        :param on_done: callback to call once the producer is done with the iterator
+        :return: new, running stream
+        """
+        first = next(batches, None)
+
+        if first is None:
+            if fallback_schema is None:
+                raise ValueError("Stream produced no data and there is no schema to describe it.")
+
+            stream = BatchStream(iter(()), fallback_schema, max_queued_batches, on_abort, on_done)
+        else:
+            stream = BatchStream(batches, first.schema, max_queued_batches, on_abort, on_done)
+            stream._queue.put(first)
+
+        stream._producer = threading.Thread(
+            target=stream._produce,
+            name="gooddata_flexconnect.stream_producer",
+            daemon=True,
+        )
+        stream._producer.start()
+
+        return stream
+
+    @property
+    def schema(self) -> pyarrow.Schema:
+        return self._schema
+
+    def _try_put(self, item: Union[pyarrow.RecordBatch, _StreamEnd, _StreamFailure]) -> bool:
+        try:
+            self._queue.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            return False
+
+    def _put(self, item: Union[pyarrow.RecordBatch, _StreamEnd, _StreamFailure]) -> bool:
+        while not self._closed.is_set():
+            if self._try_put(item):
+                return True
+
+        return False
+
+    def _produce(self) -> None:
+        try:
+            for batch in self._batches:
+                if not self._put(batch):
+                    return
+
+            self._put(_END)
+        except Exception as e:
+            _LOGGER.warning("stream_producer_failed", exc_info=True)
+            self._put(_StreamFailure(e))
+        finally:
+            self._finished.set()
+
+            try:
+                close = getattr(self._batches, "close", None)
+                if close is not None:
+                    close()
+            finally:
+                if self._on_done is not None:
+                    self._on_done()
+
+    def _consume(self) -> Generator[pyarrow.RecordBatch, None, None]:
+        while True:
+            item = self._queue.get()
+
+            if isinstance(item, _StreamEnd):
+                return
+            elif isinstance(item, _StreamFailure):
+                if isinstance(item.error, pyarrow.flight.FlightError):
+                    raise item.error
+
+                raise ErrorInfo.for_reason(
+                    ErrorCode.INTERNAL_ERROR,
+                    f"Data stream failed: {item.error.__class__.__name__}: {item.error}",
+                ).to_internal_error()
+
+            yield item
+
+    def reader(self) -> pyarrow.RecordBatchReader:
+        """
+        :return: reader which returns the streamed batches as they are produced
+        """
+        return pyarrow.RecordBatchReader.from_batches(self._schema, self._consume())
+
+    def close(self) -> None:
+        """
+        Stops the stream. Batches that are not consumed yet are thrown away.
+
+        :return: nothing
+        """
+        if self._closed.is_set():
+            return
+
+        self._closed.set()
+
+        if not self._finished.is_set() and self._on_abort is not None:
+            try:
+                self._on_abort()
+            except Exception:
+                _LOGGER.warning("stream_abort_failed", exc_info=True)
+
+        # unblock the producer right away and free the batches
+        with self._queue.mutex:
+            self._queue.queue.clear()
+            self._queue.not_full.notify_all()
@@ -1,7 +1,8 @@
 #  (C) 2024 GoodData Corporation
 import time
+import uuid
 from collections.abc import Generator
-from typing import Optional
+from typing import Optional, Union
 
 import orjson
 import pyarrow.flight
@@ -15,18 +16,28 @@ from gooddata_flight_server import (
     TaskExecutionResult,
     TaskWaitTimeoutError,
     flight_server_methods,
+    task_tenant,
 )
 
+from gooddata_flexconnect.function.batch_invocation import (
+    BATCH_INVOCATION_COMMAND,
+    BATCH_RESULT_SCHEMA,
+    encode_batch_result,
+)
+from gooddata_flexconnect.function.batch_stream import DEFAULT_STREAM_QUEUE_SIZE
 from gooddata_flexconnect.function.function import FlexConnectFunction
 from gooddata_flexconnect.function.function_invocation import (
     CancelInvocation,
     RetryInvocation,
     SubmitInvocation,
+    extract_batch_submit_invocation,
+    extract_invocation_id,
     extract_pollable_invocation_from_descriptor,
     extract_submit_invocation_from_descriptor,
 )
 from gooddata_flexconnect.function.function_registry import FlexConnectFunctionRegistry
-from gooddata_flexconnect.function.function_task import FlexConnectFunctionTask
+from gooddata_flexconnect.function.function_task import TASK_PRIORITY_METADATA_KEY, FlexConnectFunctionTask
+from gooddata_flexconnect.function.invocation_cache import CachedInvocationTask, FlexConnectInvocationCache
 
 _LOGGER = structlog.get_logger("gooddata_flexconnect.rpc")
 
@@ -37,6 +48,13 @@ Otherwise the basic do get will be used.
 """
 
 
+_BATCH_WAIT_SLICE = 0.05
+"""
+During batch invocation, the server waits for the oldest pending invocation at most this long (in seconds)
+before it checks whether any other invocation completed.
+"""
+
+
 def _prepare_poll_error(task_id: str) -> pyarrow.flight.FlightError:
     return ErrorInfo.poll(
         flight_info=None,
@@ -52,11 +70,15 @@ class _FlexConnectServerMethods(FlightServerMethods):
         registry: FlexConnectFunctionRegistry,
         call_deadline_ms: float,
         poll_interval_ms: float,
+        invocation_cache: Optional[FlexConnectInvocationCache] = None,
+        stream_queue_size: int = DEFAULT_STREAM_QUEUE_SIZE,
     ) -> None:
         self._ctx = ctx
         self._registry = registry
         self._call_deadline = call_deadline_ms / 1000
         self._poll_interval = poll_interval_ms / 1000
+        self._invocation_cache = invocation_cache
+        self._stream_queue_size = stream_queue_size
 
     @staticmethod
     def _create_descriptor(fun_name: str, metadata: Optional[dict]) -> pyarrow.flight.FlightDescriptor:
@@ -85,9 +107,13 @@ class _FlexConnectServerMethods(FlightServerMethods):
         self,
         context: pyarrow.flight.ServerCallContext,
         submit_invocation: SubmitInvocation,
+        invocation_key: Optional[str] = None,
+        task_id: Optional[str] = None,
     ) -> FlexConnectFunctionTask:
         headers = self.call_info_middleware(context).headers
-        fun = self._registry.create_function(submit_invocation.function_name)
+        lease = self._registry.checkout_function(submit_invocation.function_name)
+        fun = lease.fun
+        priority = (fun.Metadata or {}).get(TASK_PRIORITY_METADATA_KEY, 0)
 
         return FlexConnectFunctionTask(
             fun=fun,
@@ -95,8 +121,85 @@ class _FlexConnectServerMethods(FlightServerMethods):
             columns=submit_invocation.columns,
             headers=headers,
             cmd=submit_invocation.command,
+            task_id=task_id,
+            invocation_cache=self._invocation_cache if invocation_key is not None else None,
+            invocation_key=invocation_key,
+            tenant=task_tenant(self._ctx.config, headers),
+            priority=priority if isinstance(priority, int) else 0,
+            stream_queue_size=self._stream_queue_size,
+            lease=lease,
         )
 
+    def _submit_task(
+        self,
+        context: pyarrow.flight.ServerCallContext,
+        submit_invocation: SubmitInvocation,
+    ) -> tuple[str, Optional[str]]:
+        """
+        Submits task that realizes the invocation.
+
+        When the invocation cache is enabled, the invocation may be served from a cached result or
+        it may join an identical invocation which is already running - the returned task id then
+        belongs to that invocation.
+
+        :return: tuple of (id of task to wait for, function name)
+        """
+        cache = self._invocation_cache
+        fun = self._registry.get_function(submit_invocation.function_name)
+
+        if cache is None or fun is None or not cache.is_cacheable(fun):
+            task = self._prepare_task(context, submit_invocation)
+
+            try:
+                self._ctx.task_executor.submit(task)
+            except Exception:
+                task.release_function()
+                raise
+
+            return task.task_id, task.fun_name
+
+        headers = self.call_info_middleware(context).headers
+        invocation_key = cache.invocation_key(submit_invocation, cache.invocation_scope(self._ctx.config, headers))
+        table = cache.get(invocation_key)
+
+        if table is not None:
+            cached_task = CachedInvocationTask(table, submit_invocation.function_name, submit_invocation.command)
+            self._ctx.task_executor.submit(cached_task)
+
+            return cached_task.task_id, cached_task.fun_name
+
+        # join the running invocation before the task is built so that callers which only wait for the
+        # result of another call do not check out function instances
+        task_id = uuid.uuid4().hex
+        running_task_id = cache.begin_or_join(invocation_key, task_id)
+
+        if running_task_id is not None:
+            _LOGGER.info("flexconnect_fun_call_shared", task_id=running_task_id, fun=fun.Name)
+            return running_task_id, fun.Name
+
+        try:
+            task = self._prepare_task(context, submit_invocation, invocation_key, task_id)
+        except Exception:
+            cache.end_flight(task_id)
+            raise
+
+        try:
+            self._ctx.task_executor.submit(task)
+        except Exception:
+            cache.end_flight(task.task_id)
+            task.release_function()
+            raise
+
+        return task.task_id, task.fun_name
+
+    def _release_task(self, task_id: str) -> bool:
+        """
+        Indicates that the caller is no longer interested in the result of the task.
+
+        :return: True if the task may be cancelled, False if other callers share the task and wait for its result
+        """
+        return self._invocation_cache is None or self._invocation_cache.leave(task_id)
+
     def _prepare_flight_info(
         self, task_id: str, task_result: Optional[TaskExecutionResult]
     ) -> pyarrow.flight.FlightInfo:
@@ -142,22 +245,20 @@ class _FlexConnectServerMethods(FlightServerMethods):
         structlog.contextvars.bind_contextvars(peer=context.peer())
         invocation = extract_submit_invocation_from_descriptor(descriptor)
 
-        task: Optional[FlexConnectFunctionTask] = None
+        task_id: Optional[str] = None
+        fun_name: Optional[str] = None
 
         try:
-            task = self._prepare_task(context, invocation)
-            self._ctx.task_executor.submit(task)
+            task_id, fun_name = self._submit_task(context, invocation)
 
             try:
-                task_result = self._ctx.task_executor.wait_for_result(task.task_id, self._call_deadline)
+                task_result = self._ctx.task_executor.wait_for_result(task_id, self._call_deadline)
             except TaskWaitTimeoutError:
-                cancelled = self._ctx.task_executor.cancel(task.task_id)
-                _LOGGER.warning(
-                    "flexconnect_fun_call_timeout", task_id=task.task_id, fun=task.fun_name, cancelled=cancelled
-                )
+                cancelled = self._release_task(task_id) and self._ctx.task_executor.cancel(task_id)
+                _LOGGER.warning("flexconnect_fun_call_timeout", task_id=task_id, fun=fun_name, cancelled=cancelled)
 
                 raise ErrorInfo.for_reason(
-                    ErrorCode.TIMEOUT, f"GetFlightInfo timed out while waiting for task {task.task_id}."
+                    ErrorCode.TIMEOUT, f"GetFlightInfo timed out while waiting for task {task_id}."
                 ).to_timeout_error()
 
             # if this bombs then there must be something really wrong because the task
@@ -167,12 +268,10 @@ class _FlexConnectServerMethods(FlightServerMethods):
             # particular task id finished
             assert task_result is not None
 
-            return self._prepare_flight_info(task_id=task.task_id, task_result=task_result)
+            return self._prepare_flight_info(task_id=task_id, task_result=task_result)
         except Exception:
-            if task is not None:
-                _LOGGER.error(
-                    "get_flight_info_failed", task_id=task.task_id, fun=task.fun_name, exc_info=True, polling=False
-                )
+            if task_id is not None:
+                _LOGGER.error("get_flight_info_failed", task_id=task_id, fun=fun_name, exc_info=True, polling=False)
             else:
                 _LOGGER.error("flexconnect_fun_submit_failed", exc_info=True, polling=False)
             raise
@@ -195,8 +294,9 @@ class _FlexConnectServerMethods(FlightServerMethods):
         fun_name: Optional[str] = None
 
         if isinstance(invocation, CancelInvocation):
-            # cancel the given task and raise cancellation exception
-            if self._ctx.task_executor.cancel(invocation.task_id):
+            # cancel the given task and raise cancellation exception; task shared with other
+            # callers keeps running, only this caller stops waiting for it
+            if not self._release_task(invocation.task_id) or self._ctx.task_executor.cancel(invocation.task_id):
                 raise ErrorInfo.for_reason(
                     ErrorCode.COMMAND_CANCELLED, "FlexConnect function invocation was cancelled."
                 ).to_cancelled_error()
@@ -210,10 +310,7 @@ class _FlexConnectServerMethods(FlightServerMethods):
             # basic first-time submit: submit the task and do one polling iteration.
             # do not check call deadline to give it a chance to wait for the result at least once
             try:
-                task = self._prepare_task(context, invocation)
-                self._ctx.task_executor.submit(task)
-                task_id = task.task_id
-                fun_name = task.fun_name
+                task_id, fun_name = self._submit_task(context, invocation)
             except Exception:
                 _LOGGER.error("flexconnect_fun_submit_failed", exc_info=True, polling=True)
                 raise
@@ -228,7 +325,8 @@ class _FlexConnectServerMethods(FlightServerMethods):
             # first, check the call deadline for the whole call duration
             task_timestamp = self._ctx.task_executor.get_task_submitted_timestamp(task_id)
             if task_timestamp is not None and time.perf_counter() - task_timestamp > self._call_deadline:
-                self._ctx.task_executor.cancel(task_id)
+                if self._release_task(task_id):
+                    self._ctx.task_executor.cancel(task_id)
                 raise ErrorInfo.for_reason(
                     ErrorCode.TIMEOUT, f"GetFlightInfo timed out while waiting for task {task_id}."
                 ).to_timeout_error()
@@ -240,6 +338,158 @@ class _FlexConnectServerMethods(FlightServerMethods):
             _LOGGER.error("get_flight_info_failed", task_id=task_id, fun=fun_name, exc_info=True, polling=True)
             raise
 
+    def _submit_batch_invocation(
+        self,
+        context: pyarrow.flight.ServerCallContext,
+        payload: bytes,
+        pending: dict[str, str],
+        writer: pyarrow.flight.MetadataRecordBatchWriter,
+    ) -> None:
+        """
+        Submits task for one invocation from a batch. If the invocation is invalid or cannot be submitted, the
+        error is sent to the client right away; only invalid payload that does not identify the invocation
+        fails the entire exchange.
+        """
+        invocation_id, parsed = extract_invocation_id(payload)
+
+        if invocation_id in pending:
+            raise ErrorInfo.bad_argument(
+                f"Incorrect FlexConnect batch invocation. Invocation id '{invocation_id}' is not unique."
+            )
+
+        try:
+            task_id, _ = self._submit_task(context, extract_batch_submit_invocation(parsed))
+        except pyarrow.flight.FlightError as e:
+            _LOGGER.info("flexconnect_batch_submit_failed", invocation_id=invocation_id, exc_info=True)
+            writer.write_batch(encode_batch_result(invocation_id, error=ErrorInfo.from_pyarrow_error(e)))
+            return
+
+        pending[invocation_id] = task_id
+
+    def _poll_task(self, task_id: str, timeout: float) -> tuple[bool, Optional[TaskExecutionResult]]:
+        """
+        :return: tuple of (whether the task completed, the result of the task)
+        """
+        try:
+            return True, self._ctx.task_executor.wait_for_result(task_id, timeout)
+        except TaskWaitTimeoutError:
+            return False, None
+
+    def _wait_for_any(
+        self, pending: dict[str, str], timeout: float
+    ) -> Optional[tuple[str, Optional[TaskExecutionResult]]]:
+        """
+        Waits until any of the pending invocations completes. The oldest invocation is waited for, the
+        others are checked without blocking.
+
+        :return: tuple of (invocation id, task result) or None if no invocation completed in time
+        """
+        oldest = True
+
+        for invocation_id, task_id in pending.items():
+            completed, task_result = self._poll_task(task_id, timeout if oldest else 0)
+            oldest = False
+
+            if completed:
+                return invocation_id, task_result
+
+        return None
+
+    def _batch_task_result(
+        self, task_id: str, task_result: Optional[TaskExecutionResult]
+    ) -> Union[FlightDataTaskResult, ErrorInfo]:
+        if task_result is None:
+            return ErrorInfo.for_reason(ErrorCode.INTERNAL_ERROR, f"Result of task '{task_id}' is not present.")
+
+        if task_result.error is not None:
+            return task_result.error.error_info
+
+        if task_result.cancelled:
+            return ErrorInfo.for_reason(
+                ErrorCode.COMMAND_CANCELLED,
+                f"FlexConnect function invocation was cancelled. Invocation task was: '{task_id}'.",
+            )
+
+        result = task_result.result
+        assert isinstance(result, FlightDataTaskResult)
+
+        return result
+
+    def _send_batch_result(
+        self,
+        invocation_id: str,
+        task_id: str,
+        task_result: Optional[TaskExecutionResult],
+        writer: pyarrow.flight.MetadataRecordBatchWriter,
+    ) -> None:
+        result = self._batch_task_result(task_id, task_result)
+
+        if isinstance(result, ErrorInfo):
+            writer.write_batch(encode_batch_result(invocation_id, error=result))
+            return
+
+        try:
+            rlock, data = result.acquire_data()
+            try:
+                if not isinstance(data, (pyarrow.Table, pyarrow.RecordBatchReader)):
+                    raise ValueError(f"Unexpected type of function result: {type(data).__name__}.")
+
+                batch = encode_batch_result(invocation_id, data=data)
+            finally:
+                rlock.release()
+        except Exception as e:
+            _LOGGER.warning("flexconnect_batch_result_failed", invocation_id=invocation_id, task_id=task_id)
+            if isinstance(e, pyarrow.flight.FlightError):
+                error = ErrorInfo.from_pyarrow_error(e)
+            else:
+                error = ErrorInfo.for_exc(ErrorCode.INTERNAL_ERROR, e)
+            batch = encode_batch_result(invocation_id, error=error)
+
+        if result.single_use_data:
+            # single-use data was consumed and cannot be read again
+            self._ctx.task_executor.close_result(task_id)
+
+        writer.write_batch(batch)
+
+    def _send_batch_results(
+        self,
+        pending: dict[str, str],
+        started: float,
+        writer: pyarrow.flight.MetadataRecordBatchWriter,
+    ) -> None:
+        """
+        Sends results of the pending invocations in the order in which they complete. Invocations that do not
+        complete before the call deadline are cancelled and the timeout is reported for each of them.
+        """
+        while pending:
+            remaining = started + self._call_deadline - time.perf_counter()
+
+            if remaining <= 0:
+                for invocation_id, task_id in list(pending.items()):
+                    cancelled = self._release_task(task_id) and self._ctx.task_executor.cancel(task_id)
+                    _LOGGER.warning(
+                        "flexconnect_batch_call_timeout",
+                        invocation_id=invocation_id,
+                        task_id=task_id,
+                        cancelled=cancelled,
+                    )
+
+                    del pending[invocation_id]
+                    error = ErrorInfo.for_reason(
+                        ErrorCode.TIMEOUT, f"DoExchange timed out while waiting for task {task_id}."
+                    )
+                    writer.write_batch(encode_batch_result(invocation_id, error=error))
+
+                return
+
+            completed = self._wait_for_any(pending, min(remaining, _BATCH_WAIT_SLICE))
+            if completed is None:
+                continue
+
+            invocation_id, task_result = completed
+            task_id = pending.pop(invocation_id)
+            self._send_batch_result(invocation_id, task_id, task_result, writer)
+
     ###################################################################
     # Implementation of Flight RPC methods
     ###################################################################
@@ -289,11 +539,61 @@ class _FlexConnectServerMethods(FlightServerMethods):
             _LOGGER.error("do_get_failed", exc_info=True)
             raise
 
+    def do_exchange(
+        self,
+        context: pyarrow.flight.ServerCallContext,
+        descriptor: pyarrow.flight.FlightDescriptor,
+        reader: pyarrow.flight.MetadataRecordBatchReader,
+        writer: pyarrow.flight.MetadataRecordBatchWriter,
+    ) -> None:
+        """
+        Batch invocation of FlexConnect functions. See BATCH_INVOCATION_COMMAND for description of the exchange.
+
+        All the invocations in the batch run concurrently on the task executor; the whole batch is subject
+        to the call deadline.
+        """
+        structlog.contextvars.bind_contextvars(peer=context.peer())
+
+        if descriptor.command != BATCH_INVOCATION_COMMAND:
+            raise ErrorInfo.bad_argument(
+                f"Unsupported exchange. The flight descriptor command must be '{BATCH_INVOCATION_COMMAND.decode()}'."
+            )
+
+        started = time.perf_counter()
+        pending: dict[str, str] = {}
+        invocations = 0
+
+        try:
+            writer.begin(BATCH_RESULT_SCHEMA)
+
+            for chunk in reader:
+                if chunk.app_metadata is None:
+                    raise ErrorInfo.bad_argument(
+                        "Incorrect FlexConnect batch invocation. Invocations must be sent as metadata-only messages."
+                    )
+
+                invocations += 1
+                self._submit_batch_invocation(context, chunk.app_metadata.to_pybytes(), pending, writer)
+
+            self._send_batch_results(pending, started, writer)
+            _LOGGER.info("do_exchange_batch", invocations=invocations, duration=time.perf_counter() - started)
+        except Exception:
+            # the client went away or sent invalid batch; stop the invocations that are still running
+            for task_id in pending.values():
+                if self._release_task(task_id):
+                    self._ctx.task_executor.cancel(task_id)
+
+            _LOGGER.error("do_exchange_failed", exc_info=True)
+            raise
+
 
 _FLEX_CONNECT_CONFIG_SECTION = "flexconnect"
 _FLEX_CONNECT_FUNCTION_LIST = "functions"
 _FLEX_CONNECT_CALL_DEADLINE_MS = "call_deadline_ms"
 _FLEX_CONNECT_POLLING_INTERVAL_MS = "polling_interval_ms"
+_FLEX_CONNECT_INVOCATION_CACHE_BYTES = "invocation_cache_bytes"
+_FLEX_CONNECT_INVOCATION_CACHE_TTL_MS = "invocation_cache_ttl_ms"
+_FLEX_CONNECT_STREAM_QUEUE_SIZE = "stream_queue_size"
 _DEFAULT_FLEX_CONNECT_CALL_DEADLINE_MS = 180_000
 _DEFAULT_FLEX_CONNECT_POLLING_INTERVAL_MS = 2000
 
@@ -335,6 +635,59 @@ def _read_polling_interval_ms(ctx: ServerContext) -> int:
         )
 
 
+def _read_invocation_cache(ctx: ServerContext) -> Optional[FlexConnectInvocationCache]:
+    cache_bytes = ctx.settings.get(f"{_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_INVOCATION_CACHE_BYTES}")
+    if cache_bytes is None:
+        return None
+
+    cache_ttl = ctx.settings.get(f"{_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_INVOCATION_CACHE_TTL_MS}")
+
+    try:
+        max_bytes = int(cache_bytes)
+        if max_bytes < 0:
+            raise ValueError()
+    except ValueError:
+        raise ValueError(
+            f"Value of {_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_INVOCATION_CACHE_BYTES} must "
+            f"be a non-negative number - maximum size, in bytes, of FlexConnect function results "
+            f"kept in the invocation cache. Use 0 to disable the cache."
+        )
+
+    try:
+        ttl_ms = int(cache_ttl) if cache_ttl is not None else None
+        if ttl_ms is not None and ttl_ms <= 0:
+            raise ValueError()
+    except ValueError:
+        raise ValueError(
+            f"Value of {_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_INVOCATION_CACHE_TTL_MS} must "
+            f"be a positive number - duration, in milliseconds, for which the results of FlexConnect "
+            f"function invocations are served from the invocation cache."
+        )
+
+    if max_bytes == 0:
+        return None
+
+    return FlexConnectInvocationCache(max_bytes=max_bytes, ttl_sec=ttl_ms / 1000 if ttl_ms is not None else None)
+
+
+def _read_stream_queue_size(ctx: ServerContext) -> int:
+    queue_size = ctx.settings.get(f"{_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_STREAM_QUEUE_SIZE}")
+    if queue_size is None:
+        return DEFAULT_STREAM_QUEUE_SIZE
+
+    try:
+        queue_size = int(queue_size)
+        if queue_size <= 0:
+            raise ValueError()
+        return queue_size
+    except ValueError:
+        raise ValueError(
+            f"Value of {_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_STREAM_QUEUE_SIZE} must "
+            f"be a positive number - maximum number of record batches that FlexConnect functions "
+            f"which stream their results may produce ahead of the client."
+        )
+
+
 @flight_server_methods
 def create_flexconnect_flight_methods(ctx: ServerContext) -> FlightServerMethods:
     """
@@ -343,14 +696,28 @@ def create_flexconnect_flight_methods(ctx: ServerContext) -> FlightServerMethods
     FlexConnect Server hosts one or more functions developed externally, and linked to the server
     at runtime - during startup.
 
+    The invocation cache is opt-in: set `invocation_cache_bytes` (and optionally `invocation_cache_ttl_ms`)
+    in the `flexconnect` section of the settings to enable it.
+
+    Functions which return an iterator of record batches have their results streamed; the
+    `stream_queue_size` setting bounds how many batches they may produce ahead of the client.
+
     :param ctx: server's context
     :return: new instance of Flight RPC server methods to integrate into the server
     """
     modules = list(ctx.settings.get(f"{_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_FUNCTION_LIST}") or [])
     call_deadline_ms = _read_call_deadline_ms(ctx)
     polling_interval_ms = _read_polling_interval_ms(ctx)
+    invocation_cache = _read_invocation_cache(ctx)
+    stream_queue_size = _read_stream_queue_size(ctx)
 
-    _LOGGER.info("flexconnect_init", modules=modules)
+    _LOGGER.info(
+        "flexconnect_init",
+        modules=modules,
+        invocation_cache_bytes=invocation_cache.max_bytes if invocation_cache is not None else 0,
+    )
     registry = FlexConnectFunctionRegistry().load(ctx, modules)
 
-    return _FlexConnectServerMethods(ctx, registry, call_deadline_ms, polling_interval_ms)
+    return _FlexConnectServerMethods(
+        ctx, registry, call_deadline_ms, polling_interval_ms, invocation_cache, stream_queue_size
+    )
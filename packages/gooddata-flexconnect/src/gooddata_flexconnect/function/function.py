@@ -1,11 +1,31 @@
 #  (C) 2024 GoodData Corporation
 import abc
-from typing import Optional
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Optional, Union
 
 import pyarrow
 from gooddata_flight_server import ArrowData, ServerContext
 
 
+@dataclass(frozen=True)
+class FunctionPoolConfig:
+    """
+    Configuration of the pool of reusable function instances. See `FlexConnectFunction.Pool`.
+    """
+
+    max_size: int
+    """
+    Maximum number of idle instances kept in the pool. When all pooled instances are in use,
+    the server creates additional instances; these are disposed after the call if the pool is full.
+    """
+
+    idle_timeout: float = 300.0
+    """
+    Instances which stay idle in the pool for longer than this many seconds are disposed.
+    """
+
+
 class FlexConnectFunction(abc.ABC):
     """
     Interface for pluggable functions which can generate flights based on a
@@ -34,7 +54,8 @@ class FlexConnectFunction(abc.ABC):
       is interested in.
 
     Programming detail: a new instance of the FlexConnectFunction class will be created
-    for every call using the `create` method.
+    for every call using the `create` method - unless the function opts into instance pooling
+    by setting `Pool`. Pooled instances are reused by subsequent calls, one call at a time.
     """
 
     Name: Optional[str] = None
@@ -53,6 +74,16 @@ class FlexConnectFunction(abc.ABC):
     influence how the function is used by and called from GoodData Cloud & FlexQuery.
     """
 
+    Pool: Optional[FunctionPoolConfig] = None
+    """
+    Function MAY opt into reusing its instances across calls. This is useful for functions that
+    do expensive, per-instance initialization - for example load a model or open a connection pool.
+
+    Pooled instances SHOULD reset any per-call state at the start of the `call`. The server checks
+    the `is_healthy` of an idle instance before reusing it and calls `on_dispose` of instances which
+    are removed from the pool.
+    """
+
     @classmethod
     def create(cls) -> "FlexConnectFunction":
         """
@@ -69,7 +100,9 @@ class FlexConnectFunction(abc.ABC):
         IMPORTANT: this method should be fast and non-blocking. It needs to avoid any
         expensive initialization and any one-off initialization. One-off initialization
         should be done in `on_load` method; all expensive operations should be done
-        within the `call` itself.
+        within the `call` itself. Functions that use instance pooling (see `Pool`) are the
+        exception: their instances are reused, so the expensive per-instance initialization
+        may happen here.
 
         :return: an instance of concrete function
         """
@@ -81,16 +114,22 @@ class FlexConnectFunction(abc.ABC):
         parameters: dict,
         columns: Optional[tuple[str, ...]],
         headers: dict[str, list[str]],
-    ) -> ArrowData:
+    ) -> Union[ArrowData, Iterator[pyarrow.RecordBatch]]:
         """
         Function call.
 
+        Instead of returning all data at once, the function may return an iterator (e.g. be a generator)
+        of record batches. The server then streams the batches to the client as the function produces
+        them: the call completes as soon as the first batch is available and the function is throttled
+        when it gets too far ahead of the client. Such result can only be read once and the function
+        MUST return batches with the same schema.
+
         :param parameters: parameters sent from the GoodData Cloud / FlexQuery.
         :param columns: hints which columns _should_ be returned; the function may decide to ignore
          this and always return all columns. The extraneous columns will be trimmed when received
          by FlexQuery. See comments of `FlexConnectFunction` class to learn more.
         :param headers: Flight RPC headers
-        :return: result of the call
+        :return: result of the call; Arrow Table, RecordBatchReader or iterator of record batches
         """
         raise NotImplementedError
 
@@ -108,6 +147,29 @@ class FlexConnectFunction(abc.ABC):
         """
         return False
 
+    def is_healthy(self) -> bool:
+        """
+        Called by FlexConnect server before a pooled instance is reused for another call. Unhealthy
+        instances are disposed and a new instance is created instead.
+
+        This method is only called for functions that use instance pooling; it should be fast.
+
+        :return: True if the instance can be reused, False otherwise
+        """
+        return True
+
+    def on_dispose(self) -> None:
+        """
+        Called by FlexConnect server when a pooled instance is removed from the pool - it was idle for
+        too long, it is unhealthy or the pool is already full. The instance should release any resources
+        it holds.
+
+        This method is only called for functions that use instance pooling.
+
+        :return: nothing
+        """
+        return
+
     @staticmethod
     def on_load(ctx: ServerContext) -> None:
         """
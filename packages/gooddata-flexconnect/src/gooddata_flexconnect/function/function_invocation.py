@@ -53,6 +53,19 @@ class SubmitInvocation:
     """
 
 
+def _submit_invocation_from_payload(command: bytes, payload: dict) -> SubmitInvocation:
+    function_name = payload.get("functionName")
+    if function_name is None or not len(function_name):
+        raise ErrorInfo.bad_argument(
+            "Incorrect FlexConnect function invocation. The invocation payload does not specify 'functionName'."
+        )
+
+    parameters = payload.get("parameters") or {}
+    columns = parameters.get("columns")
+
+    return SubmitInvocation(function_name=function_name, parameters=parameters, columns=columns, command=command)
+
+
 def extract_submit_invocation_from_descriptor(descriptor: pyarrow.flight.FlightDescriptor) -> SubmitInvocation:
     """
     Given a flight descriptor, extract the invocation information from it.
@@ -65,18 +78,39 @@ def extract_submit_invocation_from_descriptor(descriptor: pyarrow.flight.FlightD
             "Incorrect FlexConnect function invocation. The invocation payload is not a valid JSON."
         )
 
-    function_name = payload.get("functionName")
-    if function_name is None or not len(function_name):
+    return _submit_invocation_from_payload(descriptor.command, payload)
+
+
+def extract_invocation_id(payload: bytes) -> tuple[str, dict]:
+    """
+    Given payload of one invocation from a batch, extract the invocation id from it.
+
+    :return: tuple of (invocation id, parsed payload)
+    """
+    try:
+        parsed = orjson.loads(payload)
+    except Exception:
         raise ErrorInfo.bad_argument(
-            "Incorrect FlexConnect function invocation. The invocation payload does not specify 'functionName'."
+            "Incorrect FlexConnect batch invocation. The invocation payload is not a valid JSON."
         )
 
-    parameters = payload.get("parameters") or {}
-    columns = parameters.get("columns")
+    invocation_id = parsed.get("invocationId") if isinstance(parsed, dict) else None
+    if not isinstance(invocation_id, str) or not len(invocation_id):
+        raise ErrorInfo.bad_argument(
+            "Incorrect FlexConnect batch invocation. The invocation payload does not specify 'invocationId'."
+        )
+
+    return invocation_id, parsed
+
+
+def extract_batch_submit_invocation(parsed: dict) -> SubmitInvocation:
+    """
+    Given parsed payload of one invocation from a batch, extract the invocation information from it.
+    The payload is the same as the payload of the flight descriptor with additional 'invocationId'.
+    """
+    invocation = {key: value for key, value in parsed.items() if key != "invocationId"}
 
-    return SubmitInvocation(
-        function_name=function_name, parameters=parameters, columns=columns, command=descriptor.command
-    )
+    return _submit_invocation_from_payload(orjson.dumps(invocation), invocation)
 
 
 def extract_pollable_invocation_from_descriptor(
@@ -0,0 +1,189 @@
+#  (C) 2026 GoodData Corporation
+import threading
+import time
+from typing import Optional
+
+import structlog
+
+from gooddata_flexconnect.function.function import FlexConnectFunction, FunctionPoolConfig
+
+_LOGGER = structlog.get_logger("gooddata_flexconnect.function_pool")
+
+
+def _dispose(fun: FlexConnectFunction) -> None:
+    try:
+        fun.on_dispose()
+    except Exception:
+        _LOGGER.warning("function_dispose_failed", fun=fun.Name, exc_info=True)
+
+
+def _is_healthy(fun: FlexConnectFunction) -> bool:
+    try:
+        return fun.is_healthy()
+    except Exception:
+        _LOGGER.warning("function_health_check_failed", fun=fun.Name, exc_info=True)
+        return False
+
+
+class FunctionLease:
+    """
+    Function instance checked out for one call. Once the call is done with the instance, the lease
+    must be released - the instance then goes back to the pool (if any).
+
+    After the release, the lease no longer forwards cancellation to the instance: the instance may
+    already be servicing another call.
+    """
+
+    __slots__ = ("_fun", "_pool", "_lock", "_released")
+
+    def __init__(self, fun: FlexConnectFunction, pool: Optional["FunctionInstancePool"] = None) -> None:
+        self._fun = fun
+        self._pool = pool
+        self._lock = threading.Lock()
+        self._released = False
+
+    @property
+    def fun(self) -> FlexConnectFunction:
+        return self._fun
+
+    @property
+    def released(self) -> bool:
+        return self._released
+
+    def cancel(self) -> bool:
+        """
+        Cancels the call that uses the instance.
+
+        :return: True if the call was cancelled, False otherwise
+        """
+        with self._lock:
+            if self._released:
+                return False
+
+            return self._fun.cancel()
+
+    def release(self) -> None:
+        """
+        Returns the instance to the pool. Subsequent calls do nothing.
+
+        :return: nothing
+        """
+        with self._lock:
+            if self._released:
+                return
+
+            self._released = True
+
+        if self._pool is not None:
+            self._pool.checkin(self._fun)
+
+
+class FunctionInstancePool:
+    """
+    Pool of reusable instances of one FlexConnect function.
+
+    Checkout never blocks: it reuses the most recently returned healthy instance or creates a new one.
+    At most `max_size` idle instances are kept; instances returned to a full pool and instances that
+    stay idle for longer than `idle_timeout` are disposed.
+    """
+
+    def __init__(self, fun: type[FlexConnectFunction], config: FunctionPoolConfig) -> None:
+        self._fun = fun
+        self._config = config
+        self._lock = threading.Lock()
+        # idle instances with the time they were returned; most recently returned last
+        self._idle: list[tuple[FlexConnectFunction, float]] = []
+        self._in_use = 0
+
+    @property
+    def config(self) -> FunctionPoolConfig:
+        return self._config
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    @property
+    def in_use_count(self) -> int:
+        with self._lock:
+            return self._in_use
+
+    def checkout(self) -> FunctionLease:
+        """
+        :return: lease of an instance that is ready to service a call
+        """
+        while True:
+            with self._lock:
+                self._in_use += 1
+                fun = self._idle.pop()[0] if self._idle else None
+
+            if fun is None:
+                break
+
+            if _is_healthy(fun):
+                return FunctionLease(fun, self)
+
+            _LOGGER.info("function_instance_unhealthy", fun=self._fun.Name)
+            with self._lock:
+                self._in_use -= 1
+            _dispose(fun)
+
+        try:
+            return FunctionLease(self._fun.create(), self)
+        except BaseException:
+            with self._lock:
+                self._in_use -= 1
+            raise
+
+    def checkin(self, fun: FlexConnectFunction) -> None:
+        """
+        Returns instance to the pool. Use `FunctionLease.release` instead of calling this directly.
+
+        :param fun: instance that was previously checked out
+        :return: nothing
+        """
+        with self._lock:
+            self._in_use -= 1
+            keep = len(self._idle) < self._config.max_size
+
+            if keep:
+                self._idle.append((fun, time.monotonic()))
+
+        if not keep:
+            _dispose(fun)
+
+    def evict_idle(self) -> int:
+        """
+        Disposes instances that were idle for longer than the idle timeout.
+
+        :return: number of disposed instances
+        """
+        deadline = time.monotonic() - self._config.idle_timeout
+
+        with self._lock:
+            expired = [fun for fun, returned in self._idle if returned < deadline]
+            self._idle = [(fun, returned) for fun, returned in self._idle if returned >= deadline]
+
+        for fun in expired:
+            _dispose(fun)
+
+        if expired:
+            _LOGGER.debug("function_instances_evicted", fun=self._fun.Name, count=len(expired))
+
+        return len(expired)
+
+    def close(self) -> None:
+        """
+        Disposes all idle instances. Instances that are in use are disposed when they are returned.
+
+        :return: nothing
+        """
+        with self._lock:
+            idle = self._idle
+            self._idle = []
+            # instances returned from now on will not fit
+            self._config = FunctionPoolConfig(max_size=0, idle_timeout=self._config.idle_timeout)
+
+        for fun, _ in idle:
+            _dispose(fun)
@@ -1,16 +1,25 @@
 #  (C) 2024 GoodData Corporation
 import importlib
+import threading
 from collections.abc import Iterable
+from typing import Optional
 
 import structlog
 from gooddata_flight_server import ErrorInfo, ServerContext
 
 from gooddata_flexconnect.function.function import FlexConnectFunction
+from gooddata_flexconnect.function.function_pool import FunctionInstancePool, FunctionLease
+
+_MIN_EVICTION_INTERVAL = 1.0
+_MAX_EVICTION_INTERVAL = 60.0
 
 
 class FlexConnectFunctionRegistry:
     """
     Registry for supported FlexConnect functions.
+
+    The registry also maintains instance pools of functions that opt into pooling. Idle instances
+    are evicted by a background thread which starts when the first pooled function is registered.
     """
 
     def __init__(self) -> None:
@@ -18,6 +27,10 @@ class FlexConnectFunctionRegistry:
         self._fun_by_name: dict[str, type[FlexConnectFunction]] = {}
         self._fun_names: tuple[str, ...] = ()
         self._loaded_modules: list[str] = []
+        self._pools: dict[str, FunctionInstancePool] = {}
+        self._eviction_interval = _MAX_EVICTION_INTERVAL
+        self._eviction_thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
 
     @property
     def function_names(self) -> tuple[str, ...]:
@@ -58,6 +71,12 @@ class FlexConnectFunctionRegistry:
                 f"FlexConnect function '{fun.Name}' implemented in class {fun.__name__} does not specify schema."
             )
 
+        if fun.Pool is not None and (fun.Pool.max_size <= 0 or fun.Pool.idle_timeout <= 0):
+            raise ValueError(
+                f"FlexConnect function '{fun.Name}' implemented in class {fun.__name__} specifies invalid "
+                f"instance pool; both the pool size and idle timeout must be positive."
+            )
+
         return fun.Name
 
     def _initialize_and_register(self, ctx: ServerContext, fun: type[FlexConnectFunction]) -> None:
@@ -68,6 +87,25 @@ class FlexConnectFunctionRegistry:
         self._fun_by_name[fun.Name] = fun
         self._fun_names = tuple(self._fun_by_name.keys())
 
+        if fun.Pool is not None:
+            self._pools[fun.Name] = FunctionInstancePool(fun, fun.Pool)
+            self._start_eviction(fun.Pool.idle_timeout)
+
+    def _start_eviction(self, idle_timeout: float) -> None:
+        interval = min(max(idle_timeout / 2, _MIN_EVICTION_INTERVAL), _MAX_EVICTION_INTERVAL)
+        self._eviction_interval = min(self._eviction_interval, interval)
+
+        if self._eviction_thread is None:
+            self._eviction_thread = threading.Thread(
+                target=self._evict_idle, name="gooddata_flexconnect.pool_eviction", daemon=True
+            )
+            self._eviction_thread.start()
+
+    def _evict_idle(self) -> None:
+        while not self._stopped.wait(self._eviction_interval):
+            for pool in list(self._pools.values()):
+                pool.evict_idle()
+
     def register(self, ctx: ServerContext, *funs: type[FlexConnectFunction]) -> "FlexConnectFunctionRegistry":
         """
         Register one or more FlexConnect functions.
@@ -132,6 +170,12 @@ class FlexConnectFunctionRegistry:
 
         return self
 
+    def get_function(self, name: str) -> Optional[type[FlexConnectFunction]]:
+        """
+        :return: class of the FlexConnect function with the provided name or None if there is no such function
+        """
+        return self._fun_by_name.get(name)
+
     def create_function(self, name: str) -> FlexConnectFunction:
         """
         Creates a new instance of FlexConnect function with the provided name.
@@ -145,3 +189,37 @@ class FlexConnectFunctionRegistry:
             raise ErrorInfo.bad_argument(f"Unsupported FlexConnect function '{name}'.")
 
         return fun.create()
+
+    def checkout_function(self, name: str) -> FunctionLease:
+        """
+        Obtains an instance of FlexConnect function with the provided name for one call. If the function uses
+        instance pooling, the instance comes from the pool; otherwise, a new instance is created.
+
+        The caller must release the lease once the call is done with the instance.
+        If there is no function matching the name, this method will raise error containing ErrorInfo.bad_argument.
+
+        :return: lease of the instance of FlexConnect function, ready to be called
+        """
+        pool = self._pools.get(name)
+
+        if pool is None:
+            return FunctionLease(self.create_function(name))
+
+        return pool.checkout()
+
+    def get_pool(self, name: str) -> Optional[FunctionInstancePool]:
+        """
+        :return: instance pool of the function with the provided name or None if the function does not use pooling
+        """
+        return self._pools.get(name)
+
+    def close(self) -> None:
+        """
+        Stops eviction of idle instances and disposes instances in all pools.
+
+        :return: nothing
+        """
+        self._stopped.set()
+
+        for pool in self._pools.values():
+            pool.close()
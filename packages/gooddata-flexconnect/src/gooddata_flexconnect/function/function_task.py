@@ -1,16 +1,40 @@
 #  (C) 2024 GoodData Corporation
-from typing import Optional, Union
+from collections.abc import Iterator
+from typing import Any, Optional, Union
 
+import pyarrow
 import structlog
-from gooddata_flight_server import FlightDataTaskResult, Task, TaskError, TaskResult
+from gooddata_flight_server import FlightDataTaskResult, Task, TaskError, TaskExecutionResult, TaskResult
 
+from gooddata_flexconnect.function.batch_stream import DEFAULT_STREAM_QUEUE_SIZE, BatchStream
 from gooddata_flexconnect.function.function import FlexConnectFunction
+from gooddata_flexconnect.function.function_pool import FunctionLease
+from gooddata_flexconnect.function.invocation_cache import FlexConnectInvocationCache
 
 _LOGGER = structlog.get_logger("gooddata_flexconnect.task")
 
+TASK_PRIORITY_METADATA_KEY = "taskPriority"
+"""
+Functions may set integer under this key in their `Metadata` to influence the order in which the server
+runs their invocations when it uses fair task scheduling. Invocations of functions with higher priority run
+first. The default priority is 0.
+"""
+
 
 class FlexConnectFunctionTask(Task):
-    __slots__ = ("_fun", "_parameters", "_columns", "_headers")
+    __slots__ = (
+        "_fun",
+        "_parameters",
+        "_columns",
+        "_headers",
+        "_invocation_cache",
+        "_invocation_key",
+        "_tenant",
+        "_priority",
+        "_stream_queue_size",
+        "_lease",
+        "_stream_owns_lease",
+    )
 
     def __init__(
         self,
@@ -21,6 +45,12 @@ class FlexConnectFunctionTask(Task):
         cmd: bytes,
         cancellable: bool = True,
         task_id: Optional[str] = None,
+        invocation_cache: Optional[FlexConnectInvocationCache] = None,
+        invocation_key: Optional[str] = None,
+        tenant: Optional[str] = None,
+        priority: int = 0,
+        stream_queue_size: int = DEFAULT_STREAM_QUEUE_SIZE,
+        lease: Optional[FunctionLease] = None,
     ):
         super().__init__(cmd, cancellable, task_id)
 
@@ -28,6 +58,13 @@ class FlexConnectFunctionTask(Task):
         self._parameters = parameters
         self._columns = columns
         self._headers = headers
+        self._invocation_cache = invocation_cache
+        self._invocation_key = invocation_key
+        self._tenant = tenant
+        self._priority = priority
+        self._stream_queue_size = stream_queue_size
+        self._lease = lease
+        self._stream_owns_lease = False
 
         _LOGGER.info("flexconnect_task_created", fun=fun.Name, task_id=self._task_id)
 
@@ -35,6 +72,46 @@ class FlexConnectFunctionTask(Task):
     def fun_name(self) -> Optional[str]:
         return self._fun.Name
 
+    @property
+    def tenant(self) -> Optional[str]:
+        return self._tenant
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    @property
+    def concurrency_group(self) -> Optional[str]:
+        return self._fun.Name
+
+    @property
+    def metric_label(self) -> str:
+        return self._fun.Name or super().metric_label
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        # the invocation cache lives in the server process; when the task runs in a worker
+        # process, the server updates the cache once the task completes
+        state["_invocation_cache"] = None
+        # the lease is released by the server process as well
+        state["_lease"] = None
+
+        return state
+
+    def _cancel_fun(self) -> bool:
+        if self._lease is not None:
+            return self._lease.cancel()
+
+        return self._fun.cancel()
+
+    def release_function(self) -> None:
+        """
+        Releases the function instance used by this task. This is done automatically once the task
+        completes; call this only if the task is not going to be submitted.
+        """
+        if self._lease is not None:
+            self._lease.release()
+
     def run(self) -> Union[TaskResult, TaskError]:
         structlog.contextvars.bind_contextvars(fun=self._fun.Name, task_id=self._task_id)
         _LOGGER.info("flexconnect_task_run")
@@ -45,6 +122,9 @@ class FlexConnectFunctionTask(Task):
             headers=self._headers,
         )
 
+        if not isinstance(result, (pyarrow.Table, pyarrow.RecordBatchReader)):
+            return self._stream_result(iter(result))
+
         # switch task to non-cancellable state; once the code creates
         # and returns the result, the task successfully executed and there
         # is nothing to cancel.
@@ -53,9 +133,72 @@ class FlexConnectFunctionTask(Task):
         # bails and raises error.
         self.switch_non_cancellable()
 
-        return FlightDataTaskResult.for_data(result)
+        if self._invocation_key is None:
+            return FlightDataTaskResult.for_data(result)
+
+        # result of cached invocation may be read by multiple callers; it has
+        # to be materialized so that the reads are repeatable
+        table = result if isinstance(result, pyarrow.Table) else result.read_all()
+
+        return FlightDataTaskResult.for_table(table)
+
+    def _stream_result(self, batches: Iterator[pyarrow.RecordBatch]) -> Union[TaskResult, TaskError]:
+        """
+        Function returned iterator of record batches. The task completes as soon as the first batch
+        is available; the rest is produced in the background while the client reads the result.
+        """
+        # the function instance is used until the producer is done with the batches
+        self._stream_owns_lease = True
+
+        try:
+            stream = BatchStream.start(
+                batches,
+                fallback_schema=self._fun.Schema,
+                max_queued_batches=self._stream_queue_size,
+                on_abort=self._cancel_fun,
+                on_done=self.release_function,
+            )
+        except BaseException:
+            self._stream_owns_lease = False
+            raise
+
+        try:
+            self.switch_non_cancellable()
+        except BaseException:
+            stream.close()
+            raise
+
+        if self._invocation_key is None:
+            return FlightDataTaskResult.for_reader(stream.reader(), on_close=stream.close)
+
+        # result of cached invocation has to be materialized, see `run`
+        try:
+            table = stream.reader().read_all()
+        finally:
+            stream.close()
+
+        return FlightDataTaskResult.for_table(table)
+
+    def on_task_completed(self, execution_result: TaskExecutionResult) -> None:
+        if not self._stream_owns_lease:
+            self.release_function()
+
+        if self._invocation_cache is None:
+            return
+
+        try:
+            result = execution_result.result
+            if self._invocation_key is not None and isinstance(result, FlightDataTaskResult):
+                rlock, data = result.acquire_data()
+                try:
+                    if isinstance(data, pyarrow.Table):
+                        self._invocation_cache.put(self._invocation_key, data)
+                finally:
+                    rlock.release()
+        finally:
+            self._invocation_cache.end_flight(self._task_id)
 
     def on_task_cancel(self) -> None:
         _LOGGER.info("flexconnect_task_cancel", fun=self._fun.Name, task_id=self._task_id)
 
-        self._fun.cancel()
+        self._cancel_fun()
@@ -0,0 +1,367 @@
+#  (C) 2026 GoodData Corporation
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar, Union
+
+import orjson
+import pyarrow
+import structlog
+from gooddata_flight_server import FlightDataTaskResult, ServerConfig, Task, TaskError, TaskResult, task_tenant
+from prometheus_client import Counter, Gauge
+from prometheus_client.metrics import MetricWrapperBase
+
+from gooddata_flexconnect.function.function import FlexConnectFunction
+from gooddata_flexconnect.function.function_invocation import SubmitInvocation
+
+_LOGGER = structlog.get_logger("gooddata_flexconnect.invocation_cache")
+
+INVOCATION_CACHE_METADATA_KEY = "invocationCache"
+"""
+FlexConnect function can opt out of the invocation cache by including this key with value `False`
+in its `Metadata`. Results of such function are never cached and its invocations are never shared.
+"""
+
+_TMetric = TypeVar("_TMetric", bound=MetricWrapperBase)
+
+
+class InvocationCacheMetrics:
+    """
+    Facade to access prometheus metrics that the invocation cache maintains.
+
+    Same as with the task executor metrics, the instances are kept in a static mapping
+    (prefix -> actual instance) so that multiple caches created in the same process (e.g. during
+    tests) do not register the same metrics twice.
+    """
+
+    _Hits: dict[str, Counter] = {}
+    _Misses: dict[str, Counter] = {}
+    _Shared: dict[str, Counter] = {}
+    _Evictions: dict[str, Counter] = {}
+    _Bytes: dict[str, Gauge] = {}
+    _Entries: dict[str, Gauge] = {}
+    _MapLock = threading.Lock()
+
+    @staticmethod
+    def _get_or_create(d: dict[str, _TMetric], prefix: str, create_fun: Callable[[], _TMetric]) -> _TMetric:
+        with InvocationCacheMetrics._MapLock:
+            existing = d.get(prefix)
+            if existing is not None:
+                return existing
+
+            new = create_fun()
+            d[prefix] = new
+            return new
+
+    def __init__(self, prefix: str) -> None:
+        self.hits = self._get_or_create(
+            InvocationCacheMetrics._Hits,
+            prefix,
+            lambda: Counter(f"{prefix}_hits", "Number of invocations served from cached results."),
+        )
+
+        self.misses = self._get_or_create(
+            InvocationCacheMetrics._Misses,
+            prefix,
+            lambda: Counter(f"{prefix}_misses", "Number of invocations whose result was not cached."),
+        )
+
+        self.shared = self._get_or_create(
+            InvocationCacheMetrics._Shared,
+            prefix,
+            lambda: Counter(
+                f"{prefix}_shared",
+                "Number of invocations that joined an identical invocation which was already running.",
+            ),
+        )
+
+        self.evictions = self._get_or_create(
+            InvocationCacheMetrics._Evictions,
+            prefix,
+            lambda: Counter(f"{prefix}_evictions", "Number of cached results evicted due to size limit or age."),
+        )
+
+        self.bytes = self._get_or_create(
+            InvocationCacheMetrics._Bytes,
+            prefix,
+            lambda: Gauge(f"{prefix}_bytes", "Size of all cached results in bytes."),
+        )
+
+        self.entries = self._get_or_create(
+            InvocationCacheMetrics._Entries,
+            prefix,
+            lambda: Gauge(f"{prefix}_entries", "Number of cached results."),
+        )
+
+
+@dataclass
+class _CacheEntry:
+    table: pyarrow.Table
+    nbytes: int
+    created: float
+
+
+@dataclass
+class _InFlight:
+    key: str
+    task_id: str
+    waiters: int = 1
+
+
+class FlexConnectInvocationCache:
+    """
+    Cache of FlexConnect function invocation results.
+
+    Invocations are identified by a canonical hash of the function name and the invocation
+    parameters (which include the requested columns). The cache does two things:
+
+    - it keeps results of completed invocations as Arrow tables, within the `max_bytes` budget;
+      the least recently used results are evicted first and results older than `ttl_sec` are
+      never served
+
+    - it tracks invocations that are running; identical invocations that arrive in the meantime
+      are pointed to the running task instead of calling the function again (single-flight)
+
+    Functions may opt out using `INVOCATION_CACHE_METADATA_KEY` in their metadata.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_sec: Optional[float] = None,
+        metric_prefix: str = "gdfs_flexconnect_invocation_cache",
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"Invocation cache size must be a positive number of bytes, got {max_bytes}.")
+
+        self._max_bytes = max_bytes
+        self._ttl_sec = ttl_sec
+        self._metrics = InvocationCacheMetrics(metric_prefix)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._in_flight: dict[str, _InFlight] = {}
+        self._in_flight_by_task: dict[str, _InFlight] = {}
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def ttl_sec(self) -> Optional[float]:
+        return self._ttl_sec
+
+    @property
+    def size_bytes(self) -> int:
+        """
+        :return: size of all cached results in bytes
+        """
+        with self._lock:
+            return self._bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def is_cacheable(fun: type[FlexConnectFunction]) -> bool:
+        """
+        :param fun: function class
+        :return: True if the function did not opt out of the invocation cache
+        """
+        return (fun.Metadata or {}).get(INVOCATION_CACHE_METADATA_KEY, True) is not False
+
+    @staticmethod
+    def invocation_scope(config: ServerConfig, headers: dict[str, list[str]]) -> str:
+        """
+        Identifies callers that may share results of invocations: callers of the same tenant which
+        authenticate using the same token. Results computed for one caller are never served to another.
+
+        :param config: server's configuration
+        :param headers: headers of the Flight RPC call
+        :return: scope of the invocation
+        """
+        token_header = (config.token_header_name or "authorization").lower()
+        tokens = headers.get(token_header)
+        token_digest = hashlib.sha256(tokens[0].encode("utf-8")).hexdigest() if tokens else None
+
+        return f"{task_tenant(config, headers)}:{token_digest}"
+
+    @staticmethod
+    def invocation_key(invocation: SubmitInvocation, scope: Optional[str] = None) -> str:
+        """
+        Computes key that identifies the invocation. Two invocations have the same key when they call
+        the same function with the same parameters within the same scope, regardless of the order of keys
+        in the payload.
+
+        :param invocation: function invocation
+        :param scope: scope of the invocation, see `invocation_scope`
+        :return: hex digest of the key
+        """
+        canonical = orjson.dumps(
+            [scope, invocation.function_name, invocation.parameters],
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+
+        return hashlib.sha256(canonical).hexdigest()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.nbytes
+        self._metrics.evictions.inc()
+
+    def _update_gauges(self) -> None:
+        self._metrics.bytes.set(self._bytes)
+        self._metrics.entries.set(len(self._entries))
+
+    def get(self, key: str) -> Optional[pyarrow.Table]:
+        """
+        Gets cached result of an invocation. Counts towards the hit or miss metrics.
+
+        :param key: invocation key
+        :return: the result or None if it is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and self._ttl_sec is not None and time.monotonic() - entry.created > self._ttl_sec:
+                self._remove(key)
+                self._update_gauges()
+                entry = None
+
+            if entry is None:
+                self._metrics.misses.inc()
+                return None
+
+            self._entries.move_to_end(key)
+            self._metrics.hits.inc()
+
+            return entry.table
+
+    def put(self, key: str, table: pyarrow.Table) -> None:
+        """
+        Caches result of an invocation. Results that do not fit into the budget on their own are not cached.
+
+        :param key: invocation key
+        :param table: the result
+        :return: nothing
+        """
+        nbytes = table.nbytes
+        if nbytes > self._max_bytes:
+            _LOGGER.debug("invocation_result_too_large", nbytes=nbytes, max_bytes=self._max_bytes)
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key).nbytes
+
+            self._entries[key] = _CacheEntry(table=table, nbytes=nbytes, created=time.monotonic())
+            self._bytes += nbytes
+
+            while self._bytes > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+
+            self._update_gauges()
+
+    def begin_or_join(self, key: str, task_id: str) -> Optional[str]:
+        """
+        Registers invocation whose task is about to be submitted so that identical invocations can join it.
+        If an identical invocation is already running, joins that one instead; the caller then must not
+        submit its own task.
+
+        :param key: invocation key
+        :param task_id: id of the task that the caller is about to submit
+        :return: id of the running task that was joined or None if the caller's task was registered
+        """
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                in_flight.waiters += 1
+                self._metrics.shared.inc()
+
+                return in_flight.task_id
+
+            in_flight = _InFlight(key=key, task_id=task_id)
+            self._in_flight[key] = in_flight
+            self._in_flight_by_task[task_id] = in_flight
+
+            return None
+
+    def _end_flight(self, in_flight: _InFlight) -> None:
+        if self._in_flight.get(in_flight.key) is in_flight:
+            del self._in_flight[in_flight.key]
+        self._in_flight_by_task.pop(in_flight.task_id, None)
+
+    def end_flight(self, task_id: str) -> None:
+        """
+        Forgets invocation whose task finished. Invocations arriving later are served from the
+        cached result (if any).
+
+        :param task_id: id of the task
+        :return: nothing
+        """
+        with self._lock:
+            in_flight = self._in_flight_by_task.get(task_id)
+            if in_flight is not None:
+                self._end_flight(in_flight)
+
+    def leave(self, task_id: str) -> bool:
+        """
+        Called when a caller is no longer interested in the result of the task - it cancelled the
+        invocation or timed out waiting for it.
+
+        :param task_id: id of the task
+        :return: True if no other caller waits for the task and it can be cancelled, False otherwise
+        """
+        with self._lock:
+            in_flight = self._in_flight_by_task.get(task_id)
+            if in_flight is None:
+                return True
+
+            in_flight.waiters -= 1
+            if in_flight.waiters > 0:
+                return False
+
+            self._end_flight(in_flight)
+            return True
+
+    def clear(self) -> None:
+        """
+        Drops all cached results.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+            self._update_gauges()
+
+
+class CachedInvocationTask(Task):
+    """
+    Task that serves invocation result straight from the invocation cache. It is submitted to the
+    task executor in place of the function task so that the rest of the flow is the same for
+    cached and computed results.
+    """
+
+    __slots__ = ("_table", "_fun_name")
+
+    def __init__(self, table: pyarrow.Table, fun_name: str, cmd: bytes) -> None:
+        super().__init__(cmd, cancellable=False)
+
+        self._table = table
+        self._fun_name = fun_name
+
+    @property
+    def fun_name(self) -> Optional[str]:
+        return self._fun_name
+
+    @property
+    def metric_label(self) -> str:
+        return self._fun_name
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        _LOGGER.info("flexconnect_cached_result", fun=self._fun_name, task_id=self._task_id)
+
+        return FlightDataTaskResult.for_table(self._table)
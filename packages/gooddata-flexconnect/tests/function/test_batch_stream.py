@@ -0,0 +1,92 @@
+#  (C) 2026 GoodData Corporation
+import threading
+import time
+
+import pyarrow
+import pyarrow.flight
+import pytest
+from gooddata_flexconnect.function.batch_stream import BatchStream
+
+_SCHEMA = pyarrow.schema([pyarrow.field("col1", pyarrow.int64())])
+
+
+def _batches(produced: list[int], count: int = 100):
+    for i in range(count):
+        produced.append(i)
+        yield pyarrow.record_batch({"col1": [i]}, schema=_SCHEMA)
+
+
+def _wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not met in time.")
+        time.sleep(0.01)
+
+
+def test_stream_all_batches():
+    produced: list[int] = []
+    stream = BatchStream.start(_batches(produced), fallback_schema=None, max_queued_batches=2)
+
+    table = stream.reader().read_all()
+
+    assert table.schema == _SCHEMA
+    assert table.column("col1").to_pylist() == list(range(100))
+
+
+def test_producer_waits_for_consumer():
+    produced: list[int] = []
+    stream = BatchStream.start(_batches(produced), fallback_schema=None, max_queued_batches=2)
+
+    # first batch is taken eagerly, then the producer fills the queue and blocks
+    _wait_until(lambda: len(produced) >= 3)
+    time.sleep(0.2)
+    assert len(produced) <= 4
+
+    reader = stream.reader()
+    reader.read_next_batch()
+    reader.read_next_batch()
+
+    _wait_until(lambda: len(produced) >= 5)
+    time.sleep(0.2)
+    assert len(produced) <= 6
+
+    stream.close()
+
+
+def test_close_stops_producer():
+    produced: list[int] = []
+    aborted = threading.Event()
+    stream = BatchStream.start(
+        _batches(produced), fallback_schema=None, max_queued_batches=1, on_abort=lambda: aborted.set()
+    )
+
+    _wait_until(lambda: len(produced) >= 2)
+    stream.close()
+    assert aborted.is_set()
+
+    time.sleep(0.3)
+    assert len(produced) <= 3
+
+
+def test_empty_stream_uses_fallback_schema():
+    stream = BatchStream.start(iter(()), fallback_schema=_SCHEMA)
+
+    table = stream.reader().read_all()
+
+    assert table.schema == _SCHEMA
+    assert table.num_rows == 0
+
+    with pytest.raises(ValueError):
+        BatchStream.start(iter(()), fallback_schema=None)
+
+
+def test_producer_error_reaches_reader():
+    def _failing():
+        yield pyarrow.record_batch({"col1": [1]}, schema=_SCHEMA)
+        raise ValueError("producer failed")
+
+    stream = BatchStream.start(_failing(), fallback_schema=None)
+
+    with pytest.raises(pyarrow.flight.FlightInternalError, match="producer failed"):
+        stream.reader().read_all()
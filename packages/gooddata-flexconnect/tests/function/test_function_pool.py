@@ -0,0 +1,162 @@
+#  (C) 2026 GoodData Corporation
+import time
+from collections.abc import Iterator
+from typing import Optional
+
+import pyarrow
+import pyarrow.flight
+import pytest
+from gooddata_flexconnect import FunctionPoolConfig
+from gooddata_flexconnect.function.function import FlexConnectFunction
+from gooddata_flexconnect.function.function_pool import FunctionInstancePool
+from gooddata_flexconnect.function.function_registry import FlexConnectFunctionRegistry
+from gooddata_flexconnect.function.function_task import FlexConnectFunctionTask
+from gooddata_flight_server import FlightDataTaskResult, ServerContext, TaskExecutionResult
+
+_SCHEMA = pyarrow.schema([pyarrow.field("col1", pyarrow.int64())])
+
+
+class _PooledFun(FlexConnectFunction):
+    Name = "pooled"
+    Schema = _SCHEMA
+    Pool = FunctionPoolConfig(max_size=2, idle_timeout=0.1)
+
+    def __init__(self) -> None:
+        self.healthy = True
+        self.disposed = False
+        self.cancelled = 0
+
+    def call(
+        self,
+        parameters: dict,
+        columns: Optional[tuple[str, ...]],
+        headers: dict[str, list[str]],
+    ) -> Iterator[pyarrow.RecordBatch]:
+        yield pyarrow.record_batch([pyarrow.array([1, 2, 3])], schema=_SCHEMA)
+
+    def cancel(self) -> bool:
+        self.cancelled += 1
+        return True
+
+    def is_healthy(self) -> bool:
+        return self.healthy
+
+    def on_dispose(self) -> None:
+        self.disposed = True
+
+
+@pytest.fixture(scope="module")
+def fake_ctx():
+    return ServerContext(
+        config=None,  # type: ignore[arg-type]
+        location=pyarrow.flight.Location.for_grpc_tcp("localhost", 6666),
+        settings=None,  # type: ignore[arg-type]
+        task_executor=None,  # type: ignore[arg-type]
+        health=None,  # type: ignore[arg-type]
+    )
+
+
+def test_pool_reuses_instances():
+    pool = FunctionInstancePool(_PooledFun, FunctionPoolConfig(max_size=2))
+    leases = [pool.checkout() for _ in range(3)]
+    funs = [lease.fun for lease in leases]
+    assert len({id(fun) for fun in funs}) == 3
+    assert pool.in_use_count == 3
+
+    for lease in leases:
+        lease.release()
+    leases[0].release()
+
+    # pool keeps only two idle instances; the extra one is disposed
+    assert pool.idle_count == 2
+    assert pool.in_use_count == 0
+    assert [fun.disposed for fun in funs] == [False, False, True]
+
+    # most recently returned instance is reused first
+    assert pool.checkout().fun is funs[1]
+
+
+def test_pool_health_check_and_cancel():
+    pool = FunctionInstancePool(_PooledFun, FunctionPoolConfig(max_size=2))
+    lease = pool.checkout()
+    fun = lease.fun
+    assert isinstance(fun, _PooledFun)
+
+    assert lease.cancel() is True
+    lease.release()
+
+    # once released, the lease must not cancel calls of the instance's next user
+    assert lease.cancel() is False
+    assert fun.cancelled == 1
+
+    fun.healthy = False
+    replacement = pool.checkout()
+
+    assert replacement.fun is not fun
+    assert fun.disposed is True
+    assert pool.idle_count == 0
+
+
+def test_pool_idle_eviction():
+    pool = FunctionInstancePool(_PooledFun, FunctionPoolConfig(max_size=2, idle_timeout=0.05))
+    lease = pool.checkout()
+    lease.release()
+
+    assert pool.evict_idle() == 0
+    time.sleep(0.1)
+    assert pool.evict_idle() == 1
+    assert pool.idle_count == 0
+    assert getattr(lease.fun, "disposed") is True
+
+
+def test_registry_pooled_function(fake_ctx):
+    registry = FlexConnectFunctionRegistry().register(fake_ctx, _PooledFun)
+    pool = registry.get_pool("pooled")
+    assert pool is not None
+
+    lease = registry.checkout_function("pooled")
+    task = FlexConnectFunctionTask(fun=lease.fun, parameters={}, columns=None, headers={}, cmd=b"", lease=lease)
+    result = task.run()
+    assert isinstance(result, FlightDataTaskResult)
+
+    task.on_task_completed(
+        TaskExecutionResult(task_id=task.task_id, cmd=b"", result=result, error=None, cancelled=False)
+    )
+
+    # streamed result: the instance returns to the pool once the function is done producing batches
+    rlock, data = result.acquire_data()
+    assert isinstance(data, pyarrow.RecordBatchReader)
+    assert data.read_all().num_rows == 3
+    rlock.release()
+    result.close()
+
+    for _ in range(100):
+        if pool.idle_count == 1:
+            break
+        time.sleep(0.01)
+
+    assert pool.idle_count == 1
+    assert registry.checkout_function("pooled").fun is lease.fun
+
+    # idle instances are evicted in the background
+    registry.checkout_function("pooled").release()
+    for _ in range(300):
+        if pool.idle_count == 0:
+            break
+        time.sleep(0.01)
+
+    assert pool.idle_count == 0
+    registry.close()
+
+
+def test_unpooled_function(fake_ctx):
+    class _Unpooled(_PooledFun):
+        Name = "unpooled"
+        Pool = None
+
+    registry = FlexConnectFunctionRegistry().register(fake_ctx, _Unpooled)
+    first = registry.checkout_function("unpooled")
+    first.release()
+
+    assert registry.get_pool("unpooled") is None
+    assert registry.checkout_function("unpooled").fun is not first.fun
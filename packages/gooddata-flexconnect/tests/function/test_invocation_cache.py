@@ -0,0 +1,112 @@
+#  (C) 2026 GoodData Corporation
+import pickle
+import time
+
+import pyarrow
+import pytest
+from gooddata_flexconnect import INVOCATION_CACHE_METADATA_KEY, FlexConnectInvocationCache
+from gooddata_flexconnect.function.function_invocation import SubmitInvocation
+from gooddata_flexconnect.function.function_task import FlexConnectFunctionTask
+from gooddata_flight_server import FlightDataTaskResult, TaskExecutionResult
+
+from tests.function.testing_funs import Fun1
+
+
+def _invocation(parameters: dict, function_name: str = "fun1") -> SubmitInvocation:
+    return SubmitInvocation(
+        command=b"", function_name=function_name, parameters=parameters, columns=parameters.get("columns")
+    )
+
+
+def _table(rows: int) -> pyarrow.Table:
+    return pyarrow.table({"col": list(range(rows))})
+
+
+def test_invocation_key_is_canonical():
+    key = FlexConnectInvocationCache.invocation_key
+
+    assert key(_invocation({"a": 1, "b": {"x": 1, "y": 2}})) == key(_invocation({"b": {"y": 2, "x": 1}, "a": 1}))
+    assert key(_invocation({"a": 1})) != key(_invocation({"a": 2}))
+    assert key(_invocation({"a": 1})) != key(_invocation({"a": 1}, function_name="fun2"))
+    assert key(_invocation({"columns": ["a"]})) != key(_invocation({"columns": ["b"]}))
+
+
+def test_cacheable_opt_out():
+    class _NotCached(Fun1):
+        Metadata = {INVOCATION_CACHE_METADATA_KEY: False}
+
+    assert FlexConnectInvocationCache.is_cacheable(Fun1)
+    assert not FlexConnectInvocationCache.is_cacheable(_NotCached)
+
+
+def test_byte_budget_evicts_least_recently_used():
+    table = _table(100)
+    cache = FlexConnectInvocationCache(max_bytes=table.nbytes * 2)
+
+    cache.put("a", table)
+    cache.put("b", table)
+    assert cache.get("a") is table
+    cache.put("c", table)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is table
+    assert cache.get("c") is table
+    assert cache.size_bytes == table.nbytes * 2
+
+
+def test_too_large_result_is_not_cached():
+    cache = FlexConnectInvocationCache(max_bytes=10)
+    cache.put("a", _table(100))
+
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+def test_expired_result_is_not_served():
+    cache = FlexConnectInvocationCache(max_bytes=1_000_000, ttl_sec=0.05)
+    cache.put("a", _table(10))
+    time.sleep(0.1)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_single_flight():
+    cache = FlexConnectInvocationCache(max_bytes=1_000_000)
+
+    assert cache.begin_or_join("a", "task1") is None
+    assert cache.begin_or_join("a", "task2") == "task1"
+    assert cache.begin_or_join("b", "task3") is None
+
+    # the first caller leaves; the task must keep running for the second one
+    assert cache.leave("task1") is False
+    assert cache.leave("task1") is True
+
+    cache.end_flight("task3")
+    assert cache.begin_or_join("b", "task4") is None
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        FlexConnectInvocationCache(max_bytes=0)
+
+
+def test_task_completion_updates_cache():
+    cache = FlexConnectInvocationCache(max_bytes=1_000_000)
+    task = FlexConnectFunctionTask(
+        fun=Fun1(), parameters={}, columns=None, headers={}, cmd=b"", invocation_cache=cache, invocation_key="a"
+    )
+    assert cache.begin_or_join("a", task.task_id) is None
+
+    # the task sent to a worker process does not carry the cache
+    assert pickle.loads(pickle.dumps(task))._invocation_cache is None
+
+    table = _table(10)
+    task.on_task_completed(
+        TaskExecutionResult(
+            task_id=task.task_id, cmd=b"", result=FlightDataTaskResult.for_table(table), error=None, cancelled=False
+        )
+    )
+
+    assert cache.get("a") is table
+    assert cache.begin_or_join("a", "task2") is None
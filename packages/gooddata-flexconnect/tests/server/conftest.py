@@ -5,7 +5,7 @@ import socket
 from collections.abc import Iterable
 from contextlib import closing
 from pathlib import Path
-from typing import Iterator, Union
+from typing import Iterator, Optional, Union
 
 import pytest
 from gooddata_flexconnect.function.flight_methods import (
@@ -75,6 +75,7 @@ def flexconnect_server(
     modules: Iterable[str],
     tls: bool = False,
     mtls: bool = False,
+    invocation_cache_bytes: Optional[int] = None,
 ) -> Iterator[GoodDataFlightServer]:
     funs = ", ".join([f'"{module}"' for module in modules])
     funs = f"[{funs}]"
@@ -83,6 +84,9 @@ def flexconnect_server(
     os.environ["GOODDATA_FLIGHT_FLEXCONNECT__CALL_DEADLINE_MS"] = "1200"
     os.environ["GOODDATA_FLIGHT_FLEXCONNECT__POLLING_INTERVAL_MS"] = "500"
 
+    if invocation_cache_bytes is not None:
+        os.environ["GOODDATA_FLIGHT_FLEXCONNECT__INVOCATION_CACHE_BYTES"] = str(invocation_cache_bytes)
+
     with server(create_flexconnect_flight_methods, tls, mtls) as s:
         yield s
 
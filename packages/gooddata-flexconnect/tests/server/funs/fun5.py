@@ -0,0 +1,67 @@
+#  (C) 2026 GoodData Corporation
+import threading
+import time
+from typing import Optional
+
+import pyarrow
+from gooddata_flexconnect import INVOCATION_CACHE_METADATA_KEY
+from gooddata_flexconnect.function.function import FlexConnectFunction
+from gooddata_flight_server import ArrowData
+
+_CALLS_LOCK = threading.Lock()
+CALLS: dict[str, int] = {}
+
+
+def _record_call(name: str) -> None:
+    with _CALLS_LOCK:
+        CALLS[name] = CALLS.get(name, 0) + 1
+
+
+_SCHEMA = pyarrow.schema(
+    fields=[
+        pyarrow.field("col1", pyarrow.int64()),
+        pyarrow.field("col2", pyarrow.string()),
+    ]
+)
+
+
+class _CountingFun(FlexConnectFunction):
+    Name = "CountingFun"
+    Schema = _SCHEMA
+
+    @classmethod
+    def create(cls) -> FlexConnectFunction:
+        _record_call(f"{cls.Name}.create")
+
+        return cls()
+
+    def call(
+        self,
+        parameters: dict,
+        columns: Optional[tuple[str, ...]],
+        headers: dict[str, list[str]],
+    ) -> ArrowData:
+        _record_call(self.Name)
+        # give concurrent identical invocations the time to arrive while this one runs
+        time.sleep(0.3)
+
+        return pyarrow.RecordBatchReader.from_batches(
+            self.Schema,
+            pyarrow.table({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}, schema=self.Schema).to_batches(),
+        )
+
+
+class _NotCachedFun(FlexConnectFunction):
+    Name = "NotCachedFun"
+    Schema = _SCHEMA
+    Metadata = {INVOCATION_CACHE_METADATA_KEY: False}
+
+    def call(
+        self,
+        parameters: dict,
+        columns: Optional[tuple[str, ...]],
+        headers: dict[str, list[str]],
+    ) -> ArrowData:
+        _record_call(self.Name)
+
+        return pyarrow.table({"col1": [1], "col2": ["a"]}, schema=self.Schema)
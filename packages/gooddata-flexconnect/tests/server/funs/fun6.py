@@ -0,0 +1,31 @@
+#  (C) 2026 GoodData Corporation
+import time
+from collections.abc import Iterator
+from typing import Optional
+
+import pyarrow
+from gooddata_flexconnect.function.function import FlexConnectFunction
+
+
+class _StreamingFun(FlexConnectFunction):
+    Name = "StreamingFun"
+    Schema = pyarrow.schema(
+        fields=[
+            pyarrow.field("col1", pyarrow.int64()),
+        ]
+    )
+
+    def call(
+        self,
+        parameters: dict,
+        columns: Optional[tuple[str, ...]],
+        headers: dict[str, list[str]],
+    ) -> Iterator[pyarrow.RecordBatch]:
+        # all batches together take longer than the deadline for the function
+        # invocation (see conftest.py // flexconnect_server fixture); the call must
+        # complete once the first batch is ready
+        for i in range(5):
+            if i > 0:
+                time.sleep(0.4)
+
+            yield pyarrow.record_batch({"col1": [i * 10 + j for j in range(10)]}, schema=self.Schema)
@@ -0,0 +1,93 @@
+#  (C) 2026 GoodData Corporation
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import orjson
+import pyarrow.flight
+
+from tests.server.conftest import flexconnect_server
+from tests.server.funs import fun5
+
+
+def _descriptor(fun_name: str, parameters: dict) -> pyarrow.flight.FlightDescriptor:
+    return pyarrow.flight.FlightDescriptor.for_command(
+        orjson.dumps({"functionName": fun_name, "parameters": parameters})
+    )
+
+
+def _invoke(
+    location: pyarrow.flight.Location,
+    descriptor: pyarrow.flight.FlightDescriptor,
+    token: Optional[str] = None,
+) -> pyarrow.Table:
+    c = pyarrow.flight.FlightClient(location)
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token is not None else []
+    options = pyarrow.flight.FlightCallOptions(headers=headers)
+    info = c.get_flight_info(descriptor, options)
+
+    return c.do_get(info.endpoints[0].ticket, options).read_all()
+
+
+def test_identical_invocations_call_function_once():
+    fun5.CALLS.clear()
+
+    with flexconnect_server(["tests.server.funs.fun5"], invocation_cache_bytes=1_000_000) as s:
+        descriptor = _descriptor("CountingFun", {"test1": 1, "test2": 2})
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            tables = list(executor.map(lambda _: _invoke(s.location, descriptor), range(4)))
+
+        # the invocation is served from the cache once completed
+        tables.append(_invoke(s.location, _descriptor("CountingFun", {"test2": 2, "test1": 1})))
+
+        assert fun5.CALLS["CountingFun"] == 1
+        # invocations that joined the running one did not create function instances
+        assert fun5.CALLS["CountingFun.create"] == 1
+        assert all(table.column("col1").to_pylist() == [1, 2, 3] for table in tables)
+
+        # different parameters mean different invocation
+        _invoke(s.location, _descriptor("CountingFun", {"test1": 2}))
+        assert fun5.CALLS["CountingFun"] == 2
+
+
+def test_callers_with_different_tokens_do_not_share_results():
+    fun5.CALLS.clear()
+
+    with flexconnect_server(["tests.server.funs.fun5"], invocation_cache_bytes=1_000_000) as s:
+        descriptor = _descriptor("CountingFun", {"test1": 1})
+
+        # concurrent invocations of different callers do not join each other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda token: _invoke(s.location, descriptor, token), ["tenant1", "tenant2"]))
+
+        assert fun5.CALLS["CountingFun"] == 2
+
+        # completed invocations are served from the cache only to the same caller
+        _invoke(s.location, descriptor, "tenant1")
+        _invoke(s.location, descriptor, "tenant2")
+        assert fun5.CALLS["CountingFun"] == 2
+
+        _invoke(s.location, descriptor, "tenant3")
+        assert fun5.CALLS["CountingFun"] == 3
+
+
+def test_function_opted_out_of_cache():
+    fun5.CALLS.clear()
+
+    with flexconnect_server(["tests.server.funs.fun5"], invocation_cache_bytes=1_000_000) as s:
+        descriptor = _descriptor("NotCachedFun", {"test1": 1})
+        _invoke(s.location, descriptor)
+        _invoke(s.location, descriptor)
+
+        assert fun5.CALLS["NotCachedFun"] == 2
+
+
+def test_cache_disabled_by_default():
+    fun5.CALLS.clear()
+
+    with flexconnect_server(["tests.server.funs.fun5"]) as s:
+        descriptor = _descriptor("CountingFun", {"test1": 1})
+        _invoke(s.location, descriptor)
+        _invoke(s.location, descriptor)
+
+        assert fun5.CALLS["CountingFun"] == 2
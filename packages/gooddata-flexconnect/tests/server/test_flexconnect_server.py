@@ -3,6 +3,7 @@
 import orjson
 import pyarrow.flight
 import pytest
+from gooddata_flexconnect import BATCH_INVOCATION_COMMAND, batch_invocation_payload, read_batch_results
 from gooddata_flexconnect.function.flight_methods import POLLING_HEADER_NAME
 from gooddata_flight_server import ErrorCode, ErrorInfo, RetryInfo
 
@@ -290,3 +291,83 @@ def test_cancellable_function_with_cancellation(call_options_with_polling):
 
         assert e.value is not None
         assert_error_code(ErrorCode.COMMAND_CANCELLED, e.value)
+
+
+def test_streaming_function():
+    """
+    Function that yields record batches completes GetFlightInfo as soon as the first batch
+    is ready; the rest of the batches is streamed via DoGet.
+    """
+    with flexconnect_server(["tests.server.funs.fun6"]) as s:
+        c = pyarrow.flight.FlightClient(s.location)
+        descriptor = pyarrow.flight.FlightDescriptor.for_command(
+            orjson.dumps(
+                {
+                    "functionName": "StreamingFun",
+                    "parameters": {},
+                }
+            )
+        )
+
+        info = c.get_flight_info(descriptor)
+        assert info.schema.names == ["col1"]
+
+        data: pyarrow.Table = c.do_get(info.endpoints[0].ticket).read_all()
+        assert data.column("col1").to_pylist() == list(range(50))
+
+        # the result is single-use
+        with pytest.raises(pyarrow.flight.FlightServerError) as e:
+            c.do_get(info.endpoints[0].ticket).read_all()
+
+        assert_error_code(ErrorCode.COMMAND_RESULT_CONSUMED, e.value)
+
+
+def test_batch_invocation():
+    """
+    Invocations sent via DoExchange run concurrently; their results come back over one stream in the
+    order in which they complete. Failed invocations do not fail the whole batch.
+    """
+    with flexconnect_server(["tests.server.funs.fun1", "tests.server.funs.fun3", "tests.server.funs.fun4"]) as s:
+        c = pyarrow.flight.FlightClient(s.location)
+        writer, reader = c.do_exchange(pyarrow.flight.FlightDescriptor.for_command(BATCH_INVOCATION_COMMAND))
+
+        writer.write_metadata(batch_invocation_payload("long", "LongRunningFun"))
+        writer.write_metadata(batch_invocation_payload("poll1", "PollableFun"))
+        writer.write_metadata(batch_invocation_payload("poll2", "PollableFun"))
+        writer.write_metadata(batch_invocation_payload("simple", "SimpleFun1", {"test1": 1}))
+        writer.write_metadata(batch_invocation_payload("unknown", "NoSuchFun"))
+        writer.done_writing()
+
+        results = list(read_batch_results(reader))
+        writer.close()
+
+        assert [result.invocation_id for result in results[:2]] == ["unknown", "simple"]
+        assert sorted(result.invocation_id for result in results[2:4]) == ["poll1", "poll2"]
+        assert results[4].invocation_id == "long"
+
+        assert results[0].data is None
+        assert results[0].error is not None
+        assert results[0].error.code == ErrorCode.BAD_ARGUMENT
+
+        for result in results[1:4]:
+            assert result.error is None
+            assert result.data is not None
+            assert result.data.column_names == ["col1", "col2", "col3"]
+            assert len(result.data) == 3
+
+        # the long-running function does not complete within the call deadline
+        assert results[4].data is None
+        assert results[4].error is not None
+        assert results[4].error.code == ErrorCode.TIMEOUT
+
+
+def test_batch_invocation_unsupported_exchange():
+    with flexconnect_server(["tests.server.funs.fun1"]) as s:
+        c = pyarrow.flight.FlightClient(s.location)
+        writer, reader = c.do_exchange(pyarrow.flight.FlightDescriptor.for_command(b"unknown"))
+
+        with pytest.raises(pyarrow.flight.FlightServerError) as e:
+            writer.done_writing()
+            reader.read_all()
+
+        assert_error_code(ErrorCode.BAD_ARGUMENT, e.value)
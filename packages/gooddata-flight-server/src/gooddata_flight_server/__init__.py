@@ -1,6 +1,13 @@
 # (C) 2024 GoodData Corporation
 
-from gooddata_flight_server.config.config import AuthenticationMethod, OtelConfig, OtelExporterType, ServerConfig
+from gooddata_flight_server.config.config import (
+    AuthenticationMethod,
+    OtelConfig,
+    OtelExporterType,
+    ServerConfig,
+    TaskExecutorType,
+    TaskProfilerMode,
+)
 from gooddata_flight_server.errors.error_code import ErrorCode
 from gooddata_flight_server.errors.error_info import ErrorInfo, RetryInfo
 from gooddata_flight_server.health.server_health_monitor import ModuleHealthStatus, ServerHealthMonitor
@@ -14,10 +21,12 @@ from gooddata_flight_server.tasks.base import ArrowData, TaskWaitTimeoutError
 from gooddata_flight_server.tasks.task import Task
 from gooddata_flight_server.tasks.task_error import TaskError
 from gooddata_flight_server.tasks.task_executor import TaskExecutor
+from gooddata_flight_server.tasks.task_profiler import SlowTaskProfiler
 from gooddata_flight_server.tasks.task_result import (
     FlightDataTaskResult,
     ListFlightsTaskResult,
     TaskExecutionResult,
     TaskResult,
 )
+from gooddata_flight_server.tasks.task_scheduler import FairTaskScheduler, TaskScheduler, task_tenant
 from gooddata_flight_server.utils.methods_discovery import flight_server_methods
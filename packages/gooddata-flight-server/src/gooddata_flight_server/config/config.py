@@ -32,6 +32,33 @@ class AuthenticationMethod(enum.Enum):
     Token = "token"
 
 
+class TaskExecutorType(enum.Enum):
+    """
+    Task executor type specifies where the server runs tasks.
+    """
+
+    Thread = "thread"
+    Process = "process"
+
+
+class TaskProfilerMode(enum.Enum):
+    """
+    Specifies how the SlowTaskProfiler profiles the tasks.
+    """
+
+    Stack = "stack"
+    """
+    Periodically samples stack of the thread that runs a task once the task runs longer than the threshold.
+    Cheap; tasks that finish under the threshold are not affected at all.
+    """
+
+    CProfile = "cprofile"
+    """
+    Runs every task under cProfile and keeps the profile of tasks that ran longer than the threshold.
+    Gives exact call counts and timings, but slows down all tasks.
+    """
+
+
 @dataclass(frozen=True)
 class OtelConfig:
     exporter_type: Optional[OtelExporterType]
@@ -57,9 +84,20 @@ class ServerConfig:
     token_header_name: Optional[str]
     token_verification: Optional[str]
 
+    task_executor: TaskExecutorType
     task_threads: int
+    task_processes: int
     task_close_threads: int
     task_result_ttl_sec: int
+    task_result_memory_budget: int
+    task_result_spill_dir: Optional[str]
+    task_profile_threshold_ms: int
+    task_profile_mode: TaskProfilerMode
+    task_fair_scheduling: bool
+    task_tenant_header: Optional[str]
+    task_max_queue_size: int
+    task_max_tenant_queue_size: int
+    task_max_function_concurrency: int
 
     metrics_host: Optional[str]
     metrics_port: int
@@ -109,9 +147,20 @@ class _Settings:
     AuthenticationMethod = "authentication_method"
     TokenHeaderName = "token_header_name"
     TokenVerification = "token_verification"
+    TaskExecutor = "task_executor"
     TaskThreads = "task_threads"
+    TaskProcesses = "task_processes"
     TaskCloseThreads = "task_close_threads"
     TaskResultTtlSec = "task_result_ttl_sec"
+    TaskResultMemoryBudget = "task_result_memory_budget"
+    TaskResultSpillDir = "task_result_spill_dir"
+    TaskProfileThresholdMs = "task_profile_threshold_ms"
+    TaskProfileMode = "task_profile_mode"
+    TaskFairScheduling = "task_fair_scheduling"
+    TaskTenantHeader = "task_tenant_header"
+    TaskMaxQueueSize = "task_max_queue_size"
+    TaskMaxTenantQueueSize = "task_max_tenant_queue_size"
+    TaskMaxFunctionConcurrency = "task_max_function_concurrency"
     MetricsHost = "metrics_host"
     MetricsPort = "metrics_port"
     HealthcheckHost = "health_check_host"
@@ -130,6 +179,7 @@ _LOCALHOST = "127.0.0.1"
 _DEFAULT_ADVERTISE_HOST = socket.gethostbyaddr("127.0.0.1")[0] if platform.system() == "Darwin" else socket.getfqdn()
 _DEFAULT_LISTEN_PORT = 17001
 _DEFAULT_TASK_THREADS = 32
+_DEFAULT_TASK_PROCESSES = os.cpu_count() or 1
 _DEFAULT_TASK_CLOSE_THREADS = 2
 _DEFAULT_TASK_RESULT_TTL_SEC = 60
 _DEFAULT_MALLOC_TRIM_INTERVAL_SEC = 30
@@ -151,6 +201,13 @@ _SUPPORTED_AUTH_METHOD = [
     AuthenticationMethod.Token.value,
 ]
 
+_SUPPORTED_TASK_EXECUTORS = [
+    TaskExecutorType.Thread.value,
+    TaskExecutorType.Process.value,
+]
+
+_SUPPORTED_TASK_PROFILE_MODES = [mode.value for mode in TaskProfilerMode]
+
 
 def _fqsn(name: str) -> str:
     """
@@ -174,6 +231,13 @@ def _validate_non_negative_number(val: Any) -> bool:
         return False
 
 
+def _validate_zero_or_positive_number(val: Any) -> bool:
+    try:
+        return int(val) >= 0
+    except ValueError:
+        return False
+
+
 def _validate_supported_otel_exporter(val: Any) -> bool:
     return val in _SUPPORTED_EXPORTERS
 
@@ -182,6 +246,14 @@ def _validate_supported_auth(val: Any) -> bool:
     return val in _SUPPORTED_AUTH_METHOD
 
 
+def _validate_supported_task_executor(val: Any) -> bool:
+    return val in _SUPPORTED_TASK_EXECUTORS
+
+
+def _validate_supported_task_profile_mode(val: Any) -> bool:
+    return val in _SUPPORTED_TASK_PROFILE_MODES
+
+
 def _validate_mapping(val: Any) -> bool:
     return isinstance(val, dict)
 
@@ -293,6 +365,15 @@ _VALIDATORS = [
             "condition": f"{_Settings.TokenVerification} must be a non-empty string.",
         },
     ),
+    Validator(
+        _fqsn(_Settings.TaskExecutor),
+        condition=_validate_supported_task_executor,
+        default=TaskExecutorType.Thread.value,
+        cast=str,
+        messages={
+            "condition": f"{_Settings.TaskExecutor} must be one of {', '.join(_SUPPORTED_TASK_EXECUTORS)}.",
+        },
+    ),
     Validator(
         _fqsn(_Settings.TaskThreads),
         default=_DEFAULT_TASK_THREADS,
@@ -302,6 +383,15 @@ _VALIDATORS = [
             "condition": f"{_Settings.TaskThreads} must be a positive number.",
         },
     ),
+    Validator(
+        _fqsn(_Settings.TaskProcesses),
+        default=_DEFAULT_TASK_PROCESSES,
+        condition=_validate_non_negative_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.TaskProcesses} must be a positive number.",
+        },
+    ),
     Validator(
         _fqsn(_Settings.TaskCloseThreads),
         default=_DEFAULT_TASK_CLOSE_THREADS,
@@ -320,6 +410,86 @@ _VALIDATORS = [
             "condition": f"{_Settings.TaskResultTtlSec} must be a positive number (number of seconds).",
         },
     ),
+    Validator(
+        _fqsn(_Settings.TaskResultMemoryBudget),
+        default=0,
+        condition=_validate_zero_or_positive_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.TaskResultMemoryBudget} must be zero (no limit) or a positive number (bytes).",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.TaskResultSpillDir),
+        condition=_validate_non_empty_string,
+        cast=str,
+        messages={
+            "condition": f"{_Settings.TaskResultSpillDir} must be a non-empty string.",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.TaskProfileThresholdMs),
+        default=0,
+        condition=_validate_zero_or_positive_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.TaskProfileThresholdMs} must be zero (disabled) or a positive number "
+            f"(milliseconds).",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.TaskProfileMode),
+        condition=_validate_supported_task_profile_mode,
+        default=TaskProfilerMode.Stack.value,
+        cast=str,
+        messages={
+            "condition": f"{_Settings.TaskProfileMode} must be one of {', '.join(_SUPPORTED_TASK_PROFILE_MODES)}.",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.TaskFairScheduling),
+        cast=bool,
+        default=False,
+        condition=_validate_boolean,
+        messages={
+            "condition": f"{_Settings.TaskFairScheduling} must be a boolean value.",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.TaskTenantHeader),
+        condition=_validate_non_empty_string,
+        cast=str,
+        messages={
+            "condition": f"{_Settings.TaskTenantHeader} must be a non-empty string.",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.TaskMaxQueueSize),
+        default=0,
+        condition=_validate_zero_or_positive_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.TaskMaxQueueSize} must be zero (no limit) or a positive number.",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.TaskMaxTenantQueueSize),
+        default=0,
+        condition=_validate_zero_or_positive_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.TaskMaxTenantQueueSize} must be zero (no limit) or a positive number.",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.TaskMaxFunctionConcurrency),
+        default=0,
+        condition=_validate_zero_or_positive_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.TaskMaxFunctionConcurrency} must be zero (no limit) or a positive number.",
+        },
+    ),
     Validator(
         _fqsn(_Settings.MetricsHost),
         condition=_validate_non_empty_string,
@@ -487,9 +657,20 @@ def _create_server_config(settings: Dynaconf) -> ServerConfig:
         authentication_method=_auth_method,
         token_header_name=server_settings.get(_Settings.TokenHeaderName),
         token_verification=_token_verification,
+        task_executor=TaskExecutorType(server_settings.get(_Settings.TaskExecutor)),
         task_threads=server_settings.get(_Settings.TaskThreads),
+        task_processes=server_settings.get(_Settings.TaskProcesses),
         task_close_threads=server_settings.get(_Settings.TaskCloseThreads),
         task_result_ttl_sec=server_settings.get(_Settings.TaskResultTtlSec),
+        task_result_memory_budget=server_settings.get(_Settings.TaskResultMemoryBudget),
+        task_result_spill_dir=server_settings.get(_Settings.TaskResultSpillDir),
+        task_profile_threshold_ms=server_settings.get(_Settings.TaskProfileThresholdMs),
+        task_profile_mode=TaskProfilerMode(server_settings.get(_Settings.TaskProfileMode)),
+        task_fair_scheduling=server_settings.get(_Settings.TaskFairScheduling),
+        task_tenant_header=server_settings.get(_Settings.TaskTenantHeader),
+        task_max_queue_size=server_settings.get(_Settings.TaskMaxQueueSize),
+        task_max_tenant_queue_size=server_settings.get(_Settings.TaskMaxTenantQueueSize),
+        task_max_function_concurrency=server_settings.get(_Settings.TaskMaxFunctionConcurrency),
         metrics_host=server_settings.get(_Settings.MetricsHost),
         metrics_port=server_settings.get(_Settings.MetricsPort),
         health_check_host=server_settings.get(_Settings.HealthcheckHost),
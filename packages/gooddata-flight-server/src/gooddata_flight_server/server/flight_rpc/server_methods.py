@@ -1,6 +1,7 @@
 # (C) 2024 GoodData Corporation
-from collections.abc import Generator
-from typing import Optional
+import time
+from collections.abc import Generator, Iterable
+from typing import Any, Optional, Union
 
 import pyarrow.flight
 import structlog
@@ -16,6 +17,38 @@ from gooddata_flight_server.tasks.task_result import FlightDataTaskResult
 _LOGGER = structlog.get_logger("gooddata_flight_server.rpc")
 
 
+class _SentData:
+    """
+    Counts rows and bytes of data streamed out by DoGet.
+    """
+
+    __slots__ = ("rows", "nbytes")
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.nbytes = 0
+
+    def add(self, data: Union[pyarrow.Table, pyarrow.RecordBatch]) -> None:
+        self.rows += data.num_rows
+        self.nbytes += data.nbytes
+
+    def _count_batches(self, reader: pyarrow.RecordBatchReader) -> Generator[pyarrow.RecordBatch, None, None]:
+        for batch in reader:
+            self.add(batch)
+            yield batch
+
+    def reader(self, reader: pyarrow.RecordBatchReader) -> pyarrow.RecordBatchReader:
+        return pyarrow.RecordBatchReader.from_batches(reader.schema, self._count_batches(reader))
+
+    def generator(self, data: Iterable[Any]) -> Generator[Any, None, None]:
+        for item in data:
+            if isinstance(item, pyarrow.RecordBatchReader):
+                yield self.reader(item)
+            else:
+                self.add(item)
+                yield item
+
+
 class FlightServerMethods:
     """
     Base class for implementations of Flight RPC server methods. This class contains a couple of utility
@@ -103,6 +136,8 @@ class FlightServerMethods:
                 ).to_internal_error()
 
             rlock, data = result.acquire_data()
+            sent = _SentData()
+            started = time.perf_counter()
 
             def _on_end(_: Optional[pyarrow.ArrowException]) -> None:
                 """
@@ -112,6 +147,11 @@ class FlightServerMethods:
                 """
                 rlock.release()
 
+                try:
+                    task_executor.record_result_sent(task_result, time.perf_counter() - started, sent.rows, sent.nbytes)
+                except Exception:
+                    _LOGGER.warning("do_get_record_failed", exc_info=True)
+
                 if result.single_use_data:
                     # note: results with single-use data can only ever have one active
                     #  reader (e.g. this one). since the rlock is now released the
@@ -127,15 +167,16 @@ class FlightServerMethods:
 
             if isinstance(data, pyarrow.Table):
                 _LOGGER.info("do_get_table", task_id=task_id, num_rows=data.num_rows)
+                sent.add(data)
 
                 return pyarrow.flight.RecordBatchStream(data)
             elif isinstance(data, pyarrow.RecordBatchReader):
                 _LOGGER.info("do_get_reader", task_id=task_id)
 
-                return pyarrow.flight.RecordBatchStream(data)
+                return pyarrow.flight.RecordBatchStream(sent.reader(data))
 
             _LOGGER.info("do_get_generator", task_id=task_id)
-            return pyarrow.flight.GeneratorStream(data)
+            return pyarrow.flight.GeneratorStream(sent.generator(data))
         except Exception:
             _LOGGER.error("do_get_failed", exc_info=True)
             raise
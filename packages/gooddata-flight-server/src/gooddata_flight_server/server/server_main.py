@@ -1,16 +1,20 @@
 #  (C) 2024 GoodData Corporation
-from typing import Union
+import functools
+from typing import Optional, Union
 
 import pyarrow.flight
 from dynaconf import Dynaconf
 
-from gooddata_flight_server.config.config import ServerConfig, read_config
+from gooddata_flight_server.config.config import ServerConfig, TaskExecutorType, read_config
 from gooddata_flight_server.exceptions import FlightMethodsModuleError
 from gooddata_flight_server.server.base import FlightServerMethodsFactory, ServerContext
 from gooddata_flight_server.server.flight_rpc.flight_service import FlightRpcService
 from gooddata_flight_server.server.flight_rpc.server_methods import FlightServerMethods
 from gooddata_flight_server.server.server_base import DEFAULT_LOGGING_INI, ServerBase
+from gooddata_flight_server.tasks.process_task_executor import ProcessTaskExecutor
 from gooddata_flight_server.tasks.task_executor import TaskExecutor
+from gooddata_flight_server.tasks.task_profiler import SlowTaskProfiler
+from gooddata_flight_server.tasks.task_scheduler import FairTaskScheduler, TaskScheduler
 from gooddata_flight_server.tasks.thread_task_executor import ThreadTaskExecutor
 from gooddata_flight_server.utils.logging import init_logging
 from gooddata_flight_server.utils.otel_tracing import initialize_otel_tracing
@@ -32,13 +36,46 @@ class GoodDataFlightServer(ServerBase):
         self._flight_service = FlightRpcService(config=config)
         self._location = pyarrow.flight.Location(self._flight_service.client_url)
 
+        scheduler: Optional[TaskScheduler] = None
+        if config.task_fair_scheduling:
+            scheduler = FairTaskScheduler(
+                max_queue_size=config.task_max_queue_size,
+                max_tenant_queue_size=config.task_max_tenant_queue_size,
+                max_group_concurrency=config.task_max_function_concurrency,
+            )
+
+        profiler: Optional[SlowTaskProfiler] = None
+        if config.task_profile_threshold_ms > 0:
+            profiler = SlowTaskProfiler(
+                threshold=config.task_profile_threshold_ms / 1000,
+                mode=config.task_profile_mode,
+            )
+
         # TODO: make metric prefix configurable
-        self._task_executor = ThreadTaskExecutor(
-            metric_prefix="gdfs",
-            task_threads=config.task_threads,
-            result_close_threads=config.task_close_threads,
-            keep_results_for=config.task_result_ttl_sec,
-        )
+        self._task_executor: ThreadTaskExecutor
+        if config.task_executor == TaskExecutorType.Process:
+            self._task_executor = ProcessTaskExecutor(
+                metric_prefix="gdfs",
+                task_processes=config.task_processes,
+                result_close_threads=config.task_close_threads,
+                keep_results_for=config.task_result_ttl_sec,
+                worker_initializer=functools.partial(initialize_otel_tracing, config.otel_config),
+                scheduler=scheduler,
+                result_memory_budget=config.task_result_memory_budget,
+                result_spill_dir=config.task_result_spill_dir,
+                profiler=profiler,
+            )
+        else:
+            self._task_executor = ThreadTaskExecutor(
+                metric_prefix="gdfs",
+                task_threads=config.task_threads,
+                result_close_threads=config.task_close_threads,
+                keep_results_for=config.task_result_ttl_sec,
+                scheduler=scheduler,
+                result_memory_budget=config.task_result_memory_budget,
+                result_spill_dir=config.task_result_spill_dir,
+                profiler=profiler,
+            )
 
     @property
     def location(self) -> pyarrow.flight.Location:
@@ -91,6 +128,10 @@ class GoodDataFlightServer(ServerBase):
         self._flight_service.stop()
         self._flight_service.wait_for_stop()
 
+        # no more requests can come at this point; release the threads or
+        # worker processes of the task executor
+        self._task_executor.stop()
+
     def _abort_services(self) -> None:
         self._flight_service.stop()
 
@@ -2,11 +2,30 @@
 import threading
 from typing import Callable, TypeVar
 
-from prometheus_client import Counter, Gauge, Summary
+from prometheus_client import Counter, Gauge, Histogram, Summary
 from prometheus_client.metrics import MetricWrapperBase
 
 _TMetric = TypeVar("_TMetric", bound=MetricWrapperBase)
 
+_TASK_LABEL = "task"
+"""
+Histograms are labelled by the task's `metric_label` (e.g. name of the function that the task invokes).
+"""
+
+_DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, float("inf"))
+_ROWS_BUCKETS = (0, 10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000, float("inf"))
+_BYTES_BUCKETS = (
+    1024,
+    16 * 1024,
+    256 * 1024,
+    1024**2,
+    16 * 1024**2,
+    128 * 1024**2,
+    1024**3,
+    8 * 1024**3,
+    float("inf"),
+)
+
 
 class TaskExecutorMetrics:
     """
@@ -33,6 +52,17 @@ class TaskExecutorMetrics:
     _TaskErrors: dict[str, Counter] = {}
     _TaskCancelled: dict[str, Counter] = {}
     _TaskCompleted: dict[str, Counter] = {}
+    _TaskRejected: dict[str, Counter] = {}
+    _ResultResidentBytes: dict[str, Gauge] = {}
+    _ResultSpilledBytes: dict[str, Gauge] = {}
+    _ResultSpilled: dict[str, Counter] = {}
+    _WaitHistogram: dict[str, Histogram] = {}
+    _RunHistogram: dict[str, Histogram] = {}
+    _SerializationHistogram: dict[str, Histogram] = {}
+    _StreamHistogram: dict[str, Histogram] = {}
+    _ResultRows: dict[str, Histogram] = {}
+    _ResultBytes: dict[str, Histogram] = {}
+    _SlowTasks: dict[str, Counter] = {}
     _MapLock = threading.Lock()
 
     @staticmethod
@@ -113,3 +143,116 @@ class TaskExecutorMetrics:
                 "of how their execution completed (success, failure, cancel).",
             ),
         )
+
+        self.task_rejected = self._get_or_create(
+            TaskExecutorMetrics._TaskRejected,
+            prefix,
+            lambda: Counter(
+                f"{prefix}_task_rejected",
+                "Number of tasks rejected by admission control because too many tasks were waiting in the queue.",
+            ),
+        )
+
+        self.result_resident_bytes = self._get_or_create(
+            TaskExecutorMetrics._ResultResidentBytes,
+            prefix,
+            lambda: Gauge(
+                f"{prefix}_result_resident_bytes",
+                "Size of task results (in bytes) that are held in memory.",
+            ),
+        )
+
+        self.result_spilled_bytes = self._get_or_create(
+            TaskExecutorMetrics._ResultSpilledBytes,
+            prefix,
+            lambda: Gauge(
+                f"{prefix}_result_spilled_bytes",
+                "Size of task results (in bytes) that were spilled to disk and are served from memory-mapped files.",
+            ),
+        )
+
+        self.result_spilled = self._get_or_create(
+            TaskExecutorMetrics._ResultSpilled,
+            prefix,
+            lambda: Counter(
+                f"{prefix}_result_spilled",
+                "Number of task results that were spilled to disk because the results exceeded the memory budget.",
+            ),
+        )
+
+        self.wait_histogram = self._get_or_create(
+            TaskExecutorMetrics._WaitHistogram,
+            prefix,
+            lambda: Histogram(
+                f"{prefix}_task_wait_seconds",
+                "Time a task spends waiting in queue before it is executed.",
+                labelnames=(_TASK_LABEL,),
+                buckets=_DURATION_BUCKETS,
+            ),
+        )
+
+        self.run_histogram = self._get_or_create(
+            TaskExecutorMetrics._RunHistogram,
+            prefix,
+            lambda: Histogram(
+                f"{prefix}_task_run_seconds",
+                "Duration of task run itself.",
+                labelnames=(_TASK_LABEL,),
+                buckets=_DURATION_BUCKETS,
+            ),
+        )
+
+        self.serialization_histogram = self._get_or_create(
+            TaskExecutorMetrics._SerializationHistogram,
+            prefix,
+            lambda: Histogram(
+                f"{prefix}_result_serialization_seconds",
+                "Time spent writing task results into Arrow IPC files (results of tasks "
+                "that run in worker processes and results spilled to disk).",
+                labelnames=(_TASK_LABEL,),
+                buckets=_DURATION_BUCKETS,
+            ),
+        )
+
+        self.stream_histogram = self._get_or_create(
+            TaskExecutorMetrics._StreamHistogram,
+            prefix,
+            lambda: Histogram(
+                f"{prefix}_do_get_stream_seconds",
+                "Time spent streaming task result to a client via DoGet.",
+                labelnames=(_TASK_LABEL,),
+                buckets=_DURATION_BUCKETS,
+            ),
+        )
+
+        self.result_rows = self._get_or_create(
+            TaskExecutorMetrics._ResultRows,
+            prefix,
+            lambda: Histogram(
+                f"{prefix}_result_rows",
+                "Number of rows sent to a client via DoGet.",
+                labelnames=(_TASK_LABEL,),
+                buckets=_ROWS_BUCKETS,
+            ),
+        )
+
+        self.result_bytes = self._get_or_create(
+            TaskExecutorMetrics._ResultBytes,
+            prefix,
+            lambda: Histogram(
+                f"{prefix}_result_bytes",
+                "Size of Arrow data (in bytes) sent to a client via DoGet.",
+                labelnames=(_TASK_LABEL,),
+                buckets=_BYTES_BUCKETS,
+            ),
+        )
+
+        self.slow_tasks = self._get_or_create(
+            TaskExecutorMetrics._SlowTasks,
+            prefix,
+            lambda: Counter(
+                f"{prefix}_task_slow",
+                "Number of tasks whose run took longer than the slow task threshold and were profiled.",
+                labelnames=(_TASK_LABEL,),
+            ),
+        )
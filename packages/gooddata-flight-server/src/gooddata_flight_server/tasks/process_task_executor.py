@@ -0,0 +1,412 @@
+#  (C) 2026 GoodData Corporation
+import functools
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+import opentelemetry.context as otelctx
+import pyarrow.ipc
+import structlog
+from opentelemetry import propagate
+
+from gooddata_flight_server.config.config import TaskProfilerMode
+from gooddata_flight_server.tasks.task import Task
+from gooddata_flight_server.tasks.task_error import TaskError
+from gooddata_flight_server.tasks.task_executor import TaskAttributes
+from gooddata_flight_server.tasks.task_profiler import SlowTaskProfiler, TaskProfile
+from gooddata_flight_server.tasks.task_result import (
+    FlightDataTaskResult,
+    TaskExecutionResult,
+    TaskResult,
+    _TableTaskResult,
+)
+from gooddata_flight_server.tasks.task_scheduler import TaskScheduler
+from gooddata_flight_server.tasks.thread_task_executor import (
+    ThreadTaskExecutor,
+    _create_task_error,
+    _TaskExecution,
+)
+from gooddata_flight_server.utils.otel_tracing import SERVER_TRACER
+
+_CANCEL_POLL_INTERVAL = 0.05
+"""
+How often (in seconds) the worker process checks whether its running task got cancelled.
+"""
+
+_LOGGER = structlog.get_logger("gooddata_flight_server.task_worker")
+
+
+@dataclass(frozen=True)
+class _WorkerTaskRun:
+    """
+    Everything that the worker process needs to run a task.
+    """
+
+    task: Task
+    result_file: str
+    cancel_file: str
+    logging_ctx: dict[str, Any]
+    otel_carrier: dict[str, str]
+    profile_threshold: Optional[float] = None
+    profile_mode: TaskProfilerMode = TaskProfilerMode.Stack
+
+
+@dataclass(frozen=True)
+class _WorkerTaskOutcome:
+    """
+    Outcome of the task run that the worker process sends back to the server.
+
+    When the task produced Arrow data, the data is not part of the outcome; it is written into
+    the Arrow IPC file instead and the result is None. Profile of a slow run is sent back so
+    that the server process attaches it to the task's execution span.
+    """
+
+    result: Optional[Union[TaskResult, TaskError]]
+    has_data: bool
+    run_duration: float
+    serialization_duration: float = 0.0
+    profile: Optional[TaskProfile] = None
+
+
+def _write_result_file(task_result: FlightDataTaskResult, path: str) -> None:
+    schema = task_result.get_schema()
+    rlock, data = task_result.acquire_data()
+
+    try:
+        parts = (data,) if isinstance(data, (pyarrow.Table, pyarrow.RecordBatchReader, pyarrow.RecordBatch)) else data
+
+        with pyarrow.OSFile(path, "wb") as sink, pyarrow.ipc.new_file(sink, schema) as writer:
+            for part in parts:
+                if isinstance(part, pyarrow.Table):
+                    writer.write_table(part)
+                elif isinstance(part, pyarrow.RecordBatch):
+                    writer.write_batch(part)
+                else:
+                    for batch in part:
+                        writer.write_batch(batch)
+    finally:
+        rlock.release()
+        task_result.close()
+
+
+def _watch_cancel(task: Task, cancel_file: str, finished: threading.Event) -> None:
+    while not finished.wait(_CANCEL_POLL_INTERVAL):
+        if os.path.exists(cancel_file):
+            task.cancel()
+            return
+
+
+@functools.cache
+def _worker_profiler(threshold: float, mode: TaskProfilerMode) -> SlowTaskProfiler:
+    # one profiler per worker process, so that all the runs share the stack sampler thread
+    return SlowTaskProfiler(threshold=threshold, mode=mode)
+
+
+def _run_task(task: Task, run: _WorkerTaskRun, profiles: list[TaskProfile]) -> Union[TaskResult, TaskError]:
+    if run.profile_threshold is None:
+        return task.run()
+
+    with _worker_profiler(run.profile_threshold, run.profile_mode).collect(profiles):
+        return task.run()
+
+
+def _run_in_worker(run: _WorkerTaskRun) -> _WorkerTaskOutcome:
+    """
+    Runs the task in the worker process. Arrow data produced by the task is written into
+    an Arrow IPC file so that the server process can memory-map it instead of receiving
+    the data through a pipe.
+    """
+    task = run.task
+    started = time.perf_counter()
+
+    structlog.contextvars.clear_contextvars()
+    structlog.contextvars.bind_contextvars(**run.logging_ctx)
+
+    finished = threading.Event()
+    watcher = threading.Thread(
+        target=_watch_cancel,
+        args=(task, run.cancel_file, finished),
+        name="gooddata_flight_server.task_cancel_watch",
+        daemon=True,
+    )
+    watcher.start()
+
+    otel_token = otelctx.attach(propagate.extract(run.otel_carrier))
+    try:
+        with SERVER_TRACER.start_as_current_span(
+            "task_run", attributes={TaskAttributes.TaskId: task.task_id, "process.pid": os.getpid()}
+        ):
+            _LOGGER.info("task_run", task_id=task.task_id, pid=os.getpid())
+
+            profiles: list[TaskProfile] = []
+            try:
+                result = _run_task(task, run, profiles)
+            except CancelledError:
+                raise
+            except Exception as e:
+                result = _create_task_error(e)
+
+            profile = profiles[0] if profiles else None
+            if isinstance(result, FlightDataTaskResult):
+                run_completed = time.perf_counter()
+                _write_result_file(result, run.result_file)
+
+                return _WorkerTaskOutcome(
+                    result=None,
+                    has_data=True,
+                    run_duration=run_completed - started,
+                    serialization_duration=time.perf_counter() - run_completed,
+                    profile=profile,
+                )
+
+            return _WorkerTaskOutcome(
+                result=result, has_data=False, run_duration=time.perf_counter() - started, profile=profile
+            )
+    finally:
+        finished.set()
+        otelctx.detach(otel_token)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _default_result_dir_base() -> Optional[str]:
+    # shared memory filesystem keeps the result files off the disk; the data
+    # is memory-mapped by the server process so it is never copied again
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+
+    return None
+
+
+class ProcessTaskExecutor(ThreadTaskExecutor):
+    """
+    Implementation of TaskExecutor interface that runs tasks in a pool of worker processes.
+
+    This executor is suitable for CPU-bound tasks which would otherwise contend for the GIL
+    of the server process. It keeps the same bookkeeping as the ThreadTaskExecutor - only
+    the `run` of each task happens in a worker process:
+
+    - the task is pickled and sent to the worker; the task and everything it references must
+      therefore be picklable and its class must be importable in the worker
+
+    - when the task produces Arrow data (FlightDataTaskResult), the worker writes the data into
+      an Arrow IPC file which the server process memory-maps and reads without copying; the
+      result files are placed in shared memory (/dev/shm) when available. The result is always
+      materialized as a table - so the data can be read repeatedly even if the task returned
+      a single-use reader. Other results (including TaskError) are pickled.
+
+    - exceptions raised by the task are converted to TaskError in the worker
+
+    - cancelling a running task cancels the task in the server process and signals the worker
+      which then cancels its copy of the task
+
+    - the OpenTelemetry context of the task execution is propagated to the worker; the
+      `task_run` span is created in the worker process
+
+    - with a SlowTaskProfiler, the worker profiles the run and sends the profile of a slow run
+      back; the profile is attached to the task's execution span in the server process
+
+    Note that worker processes do not share any state with the server process: anything that
+    the server initializes after startup is not available to the tasks unless they carry it
+    with them. Use `worker_initializer` to initialize the worker processes (e.g. set up tracing).
+    The `on_task_completed` callback of the tasks is always called in the server process.
+    """
+
+    def __init__(
+        self,
+        metric_prefix: str,
+        task_processes: Optional[int] = None,
+        result_close_threads: int = 2,
+        keep_results_for: int = 15,
+        result_dir: Optional[str] = None,
+        worker_initializer: Optional[Callable[[], None]] = None,
+        mp_context: str = "spawn",
+        scheduler: Optional[TaskScheduler] = None,
+        result_memory_budget: int = 0,
+        result_spill_dir: Optional[str] = None,
+        profiler: Optional[SlowTaskProfiler] = None,
+    ) -> None:
+        task_processes = task_processes or os.cpu_count() or 1
+
+        # the thread pool inherited from the ThreadTaskExecutor is not used to run tasks
+        super().__init__(
+            metric_prefix=metric_prefix,
+            task_threads=1,
+            result_close_threads=result_close_threads,
+            keep_results_for=keep_results_for,
+            scheduler=scheduler,
+            result_memory_budget=result_memory_budget,
+            result_spill_dir=result_spill_dir,
+            profiler=profiler,
+        )
+        self._max_running = task_processes
+
+        self._result_dir = tempfile.mkdtemp(prefix="gdfs-tasks-", dir=result_dir or _default_result_dir_base())
+        self._processes = ProcessPoolExecutor(
+            max_workers=task_processes,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=worker_initializer,
+        )
+
+    @property
+    def result_dir(self) -> str:
+        """
+        :return: directory where worker processes place results and cancellation markers
+        """
+        return self._result_dir
+
+    def _result_file(self, task_id: str) -> str:
+        return os.path.join(self._result_dir, f"{task_id}.arrow")
+
+    def _cancel_file(self, task_id: str) -> str:
+        return os.path.join(self._result_dir, f"{task_id}.cancel")
+
+    def _submit_run(self, task_execution: _TaskExecution) -> Future:
+        task = task_execution.task
+        carrier: dict[str, str] = {}
+
+        with task_execution.use_execution_span(), SERVER_TRACER.start_as_current_span("task_run_submit"):
+            propagate.inject(carrier)
+            if task_execution.stats.run_submitted is None:
+                task_execution.stats.run_submitted = time.perf_counter()
+
+            return self._processes.submit(
+                _run_in_worker,
+                _WorkerTaskRun(
+                    task=task,
+                    result_file=self._result_file(task.task_id),
+                    cancel_file=self._cancel_file(task.task_id),
+                    logging_ctx=task_execution.logging_ctx,
+                    otel_carrier=carrier,
+                    profile_threshold=self._profiler.threshold if self._profiler is not None else None,
+                    profile_mode=self._profiler.mode if self._profiler is not None else TaskProfilerMode.Stack,
+                ),
+            )
+
+    def _read_worker_outcome(self, task_execution: _TaskExecution, future: Future) -> Future:
+        """
+        Converts future with the outcome of the worker run into a future with the task's result.
+        """
+        task = task_execution.task
+        converted: Future = Future()
+
+        try:
+            outcome: _WorkerTaskOutcome = future.result()
+        except BaseException as e:
+            converted.set_exception(e)
+            return converted
+
+        stats = task_execution.stats
+        stats.run_completed = time.perf_counter()
+        stats.run_started = max(stats.run_completed - outcome.run_duration, stats.run_submitted or stats.created)
+        stats.completed = stats.run_completed
+
+        label = task.metric_label
+        self._metrics.wait_time.observe(stats.run_waited_duration)
+        self._metrics.task_duration.observe(stats.run_duration)
+        self._metrics.task_e2e_duration.observe(stats.duration)
+        self._metrics.wait_histogram.labels(label).observe(stats.run_waited_duration)
+        self._metrics.run_histogram.labels(label).observe(stats.run_duration)
+
+        if self._profiler is not None and stats.run_duration >= self._profiler.threshold:
+            self._metrics.slow_tasks.labels(label).inc()
+        if self._profiler is not None and outcome.profile is not None:
+            with task_execution.use_execution_span() as execution_span:
+                self._profiler.attach(execution_span, outcome.profile)
+
+        result: Optional[Union[TaskResult, TaskError]] = outcome.result
+        if outcome.has_data:
+            result_file = self._result_file(task.task_id)
+            # the table's buffers point directly into the memory-mapped file; the mapping
+            # stays valid after the file is closed (and even after it is removed)
+            with pyarrow.memory_map(result_file, "r") as source:
+                table = pyarrow.ipc.open_file(source).read_all()
+
+            result = _TableTaskResult(table, on_close=functools.partial(_remove_file, result_file), memory_mapped=True)
+            self._metrics.serialization_histogram.labels(label).observe(outcome.serialization_duration)
+
+        if task.cancelled and not isinstance(result, TaskError):
+            # the task got cancelled in the server process while the worker was already
+            # completing it; honor the cancellation and throw the result away
+            if isinstance(result, FlightDataTaskResult):
+                result.close()
+
+            converted.set_exception(CancelledError())
+            return converted
+
+        converted.set_result(result)
+        return converted
+
+    def process_task_result(
+        self,
+        task_execution: _TaskExecution,
+        future: Future,
+    ) -> TaskExecutionResult:
+        try:
+            converted = self._read_worker_outcome(task_execution, future)
+        except Exception as e:
+            converted = Future()
+            converted.set_exception(e)
+        finally:
+            _remove_file(self._cancel_file(task_execution.task_id))
+
+        return super().process_task_result(task_execution, converted)
+
+    def cancel(self, task_id: str) -> bool:
+        with self._task_lock:
+            running = task_id in self._executions
+
+        cancelled = super().cancel(task_id)
+
+        if cancelled and running:
+            # let the worker know; it will cancel its copy of the task. if the task
+            # completed in the meantime, the marker is removed right away
+            with open(self._cancel_file(task_id), "wb"):
+                pass
+
+            with self._task_lock:
+                running = task_id in self._executions
+
+            if not running:
+                _remove_file(self._cancel_file(task_id))
+
+        return cancelled
+
+    def stop(self, cancel_running: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stops the service. Any pending tasks will be immediately cancelled. Tasks that are already executing
+        are allowed to complete unless `cancel_running` is True.
+
+        :param cancel_running: whether to cancel already running tasks
+        :param timeout: time to way for all running tasks to finish
+        :return: nothing
+        """
+        self._processes.shutdown(wait=False, cancel_futures=True)
+
+        if cancel_running:
+            with self._task_lock:
+                running = list(self._executions)
+
+            for task_id in running:
+                self.cancel(task_id)
+
+        def _shutdown_processes() -> None:
+            self._processes.shutdown(wait=True, cancel_futures=True)
+
+        shutdown_thd = threading.Thread(target=_shutdown_processes)
+        shutdown_thd.start()
+        shutdown_thd.join(timeout=timeout)
+
+        super().stop(cancel_running=False, timeout=timeout)
+        shutil.rmtree(self._result_dir, ignore_errors=True)
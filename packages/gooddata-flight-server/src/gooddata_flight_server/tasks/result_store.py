@@ -0,0 +1,222 @@
+#  (C) 2026 GoodData Corporation
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Optional
+
+import structlog
+
+from gooddata_flight_server.tasks.metrics import TaskExecutorMetrics
+from gooddata_flight_server.tasks.task_result import TaskExecutionResult, _TableTaskResult
+
+
+@dataclass
+class _StoredResult:
+    task_id: str
+    result: _TableTaskResult
+    nbytes: int
+    metric_label: str
+    added: float = field(default_factory=time.monotonic)
+
+
+class ResultSpillStore:
+    """
+    Keeps track of memory occupied by results of finished tasks and enforces a memory budget.
+
+    When the results held in memory exceed the budget, the store picks results to spill to disk:
+    each result's table is written into an Arrow IPC file in the spill directory and the result then
+    serves its data from the memory-mapped file - reads stay zero-copy and the operating system can
+    page the data out as needed.
+
+    The results to spill are picked based on both their age and their size - the older and the larger
+    the result, the sooner it is spilled; fresh results are likely to be read soon and are kept in memory
+    unless they are large.
+
+    Only results with repeatable, table data are spilled. Single-use results (streams) are not
+    accounted for; their data is typically produced as it is read.
+
+    The store does not own the results - the TaskExecutor still closes them when they expire; the store
+    only has to be told when a result is gone using `remove`.
+    """
+
+    def __init__(
+        self,
+        metrics: TaskExecutorMetrics,
+        max_resident_bytes: int,
+        spill_executor: Executor,
+        spill_dir: Optional[str] = None,
+    ) -> None:
+        """
+        :param metrics: executor metrics to report resident and spilled bytes to
+        :param max_resident_bytes: memory budget for task results
+        :param spill_executor: executor in which to perform the spilling
+        :param spill_dir: directory in which to create a directory for the spill files; defaults to system's
+         temporary directory
+        """
+        self._logger = structlog.get_logger("gooddata_flight_server.result_store")
+        self._metrics = metrics
+        self._max_resident_bytes = max_resident_bytes
+        self._spill_executor = spill_executor
+        self._spill_dir = tempfile.mkdtemp(prefix="gdfs-results-", dir=spill_dir)
+
+        self._lock = threading.Lock()
+        self._resident: dict[str, _StoredResult] = {}
+        self._resident_bytes = 0
+        self._spilling: dict[str, _StoredResult] = {}
+        self._spilled: dict[str, int] = {}
+        self._spilled_bytes = 0
+
+    @property
+    def spill_dir(self) -> str:
+        return self._spill_dir
+
+    @property
+    def resident_bytes(self) -> int:
+        """
+        :return: size of results held in memory (including results that are being spilled)
+        """
+        with self._lock:
+            return self._resident_bytes + sum(stored.nbytes for stored in self._spilling.values())
+
+    @property
+    def spilled_bytes(self) -> int:
+        """
+        :return: size of results that are served from spill files
+        """
+        with self._lock:
+            return self._spilled_bytes
+
+    def _update_metrics(self) -> None:
+        self._metrics.result_resident_bytes.set(
+            self._resident_bytes + sum(stored.nbytes for stored in self._spilling.values())
+        )
+        self._metrics.result_spilled_bytes.set(self._spilled_bytes)
+
+    def add(self, execution_result: TaskExecutionResult) -> None:
+        """
+        Starts tracking result of a finished task. If the results held in memory exceed the budget,
+        this will trigger asynchronous spilling.
+
+        :param execution_result: result of the task execution
+        :return: nothing
+        """
+        result = execution_result.result
+        if not isinstance(result, _TableTaskResult) or result.memory_mapped:
+            return
+
+        stored = _StoredResult(
+            task_id=execution_result.task_id,
+            result=result,
+            nbytes=result.nbytes,
+            metric_label=execution_result.metric_label,
+        )
+
+        with self._lock:
+            self._resident[stored.task_id] = stored
+            self._resident_bytes += stored.nbytes
+            to_spill = self._pick_to_spill()
+            self._update_metrics()
+
+        for victim in to_spill:
+            self._spill_executor.submit(self._spill, victim)
+
+    def _pick_to_spill(self) -> list[_StoredResult]:
+        """
+        Picks results to spill so that the resident results fit into the budget. Must be called
+        while holding the lock.
+        """
+        if self._resident_bytes <= self._max_resident_bytes:
+            return []
+
+        now = time.monotonic()
+        # the score grows with both size and age; the +1 makes sure that even brand new
+        # results are ordered by size
+        candidates = sorted(
+            self._resident.values(),
+            key=lambda stored: stored.nbytes * (now - stored.added + 1),
+            reverse=True,
+        )
+
+        to_spill = []
+        for stored in candidates:
+            if self._resident_bytes <= self._max_resident_bytes:
+                break
+
+            del self._resident[stored.task_id]
+            self._resident_bytes -= stored.nbytes
+            self._spilling[stored.task_id] = stored
+            to_spill.append(stored)
+
+        return to_spill
+
+    def _spill(self, stored: _StoredResult) -> None:
+        path = os.path.join(self._spill_dir, f"{stored.task_id}.arrow")
+        started = time.perf_counter()
+
+        try:
+            spilled = stored.result.spill(path)
+        except Exception:
+            self._logger.warning("result_spill_failed", task_id=stored.task_id, exc_info=True)
+            spilled = False
+
+        if spilled:
+            self._metrics.serialization_histogram.labels(stored.metric_label).observe(time.perf_counter() - started)
+
+        with self._lock:
+            if self._spilling.pop(stored.task_id, None) is None:
+                # result was removed while it was being spilled
+                return
+
+            if spilled:
+                self._spilled[stored.task_id] = stored.nbytes
+                self._spilled_bytes += stored.nbytes
+                self._metrics.result_spilled.inc()
+            else:
+                # the result remains in memory
+                self._resident[stored.task_id] = stored
+                self._resident_bytes += stored.nbytes
+
+            self._update_metrics()
+
+        if spilled:
+            self._logger.debug("result_spilled", task_id=stored.task_id, nbytes=stored.nbytes)
+
+    def remove(self, task_id: str) -> None:
+        """
+        Stops tracking result of a task. Call this when the result gets evicted and closed.
+
+        :param task_id: id of the task whose result is gone
+        :return: nothing
+        """
+        with self._lock:
+            stored = self._resident.pop(task_id, None)
+            if stored is not None:
+                self._resident_bytes -= stored.nbytes
+
+            self._spilling.pop(task_id, None)
+
+            spilled_bytes = self._spilled.pop(task_id, None)
+            if spilled_bytes is not None:
+                self._spilled_bytes -= spilled_bytes
+
+            self._update_metrics()
+
+    def close(self) -> None:
+        """
+        Removes the spill directory. Call this after all results were closed.
+
+        :return: nothing
+        """
+        with self._lock:
+            self._resident.clear()
+            self._spilling.clear()
+            self._spilled.clear()
+            self._resident_bytes = 0
+            self._spilled_bytes = 0
+            self._update_metrics()
+
+        shutil.rmtree(self._spill_dir, ignore_errors=True)
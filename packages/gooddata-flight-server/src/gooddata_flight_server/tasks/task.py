@@ -3,10 +3,10 @@ import abc
 import threading
 import uuid
 from concurrent.futures import CancelledError
-from typing import Optional, Union, final
+from typing import Any, Optional, Union, final
 
 from gooddata_flight_server.tasks.task_error import TaskError
-from gooddata_flight_server.tasks.task_result import TaskResult
+from gooddata_flight_server.tasks.task_result import TaskExecutionResult, TaskResult
 
 
 class Task(abc.ABC):
@@ -31,6 +31,11 @@ class Task(abc.ABC):
     no longer feasible), then it must first switch the task to be non-cancellable
     using the `switch_non_cancellable` - this may raise CancelledError if the `run`
     was raced and someone cancelled the task.
+
+    Tasks can be pickled so that executors may run them in worker processes (see
+    ProcessTaskExecutor). The cancellation lock is not part of the pickled state; a fresh
+    lock is created when the task is unpickled. Subclasses that hold state which cannot
+    or should not leave the server process should override `__getstate__` and drop it.
     """
 
     __slots__ = (
@@ -54,6 +59,25 @@ class Task(abc.ABC):
         self._cancelled = False
         self._cancellable = cancellable
 
+    def __getstate__(self) -> dict[str, Any]:
+        state = dict(getattr(self, "__dict__", {}))
+
+        for cls in type(self).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name in ("__dict__", "__weakref__", "_cancel_lock") or not hasattr(self, name):
+                    continue
+
+                state[name] = getattr(self, name)
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+        self._cancel_lock = threading.Lock()
+
     @final
     @property
     def task_id(self) -> str:
@@ -64,6 +88,47 @@ class Task(abc.ABC):
     def cmd(self) -> bytes:
         return self._cmd
 
+    @property
+    def tenant(self) -> Optional[str]:
+        """
+        Tenant on whose behalf the task runs. Task executor that uses fair scheduling shares
+        the available threads fairly between tenants.
+
+        :return: tenant identifier; None if the task does not belong to any particular tenant
+        """
+        return None
+
+    @property
+    def priority(self) -> int:
+        """
+        Task executor that uses fair scheduling runs tasks with higher priority first.
+
+        :return: priority of the task; default is 0
+        """
+        return 0
+
+    @property
+    def concurrency_group(self) -> Optional[str]:
+        """
+        Task executor that uses fair scheduling may limit how many tasks of the same concurrency
+        group run at the same time. For example, tasks that invoke the same function may be in the
+        same group.
+
+        :return: name of concurrency group; None if the task is not subject to the limit
+        """
+        return None
+
+    @property
+    def metric_label(self) -> str:
+        """
+        Label under which the task executor reports metrics (e.g. histograms of wait and run duration)
+        of this task. Tasks of the same kind should use the same label - for example name of the function
+        that the task invokes. Avoid labels with high cardinality such as the task id or the whole command.
+
+        :return: metric label; defaults to the name of the task's class
+        """
+        return type(self).__name__
+
     @final
     @property
     def cancelled(self) -> bool:
@@ -165,6 +230,24 @@ class Task(abc.ABC):
         """
         return error
 
+    def on_task_completed(self, execution_result: TaskExecutionResult) -> None:
+        """
+        This method will be called by the executor once the task execution completes -
+        regardless of whether the task succeeded, failed or was cancelled. It is called
+        before the result becomes available to the callers waiting for it.
+
+        Unlike `run`, this method is always called in the server process - even if the
+        task itself ran in a worker process. The concrete implementation may optionally
+        override this method to update state that the server keeps about the task, such
+        as caches of results.
+
+        Important: this method should not block.
+
+        :param execution_result: result of the task execution
+        :return: nothing
+        """
+        return
+
     @abc.abstractmethod
     def run(self) -> Union[TaskResult, TaskError]:
         """
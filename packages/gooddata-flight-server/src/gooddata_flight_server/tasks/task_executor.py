@@ -13,6 +13,11 @@ class TaskAttributes:
     TaskErrorCode = "gooddata_flight_server.task_error.code"
     TaskErrorMsg = "gooddata_flight_server.task_error.msg"
     TaskErrorDetail = "gooddata_flight_server.task_error.detail"
+    TaskProfile = "gooddata_flight_server.task_profile"
+    TaskProfileMode = "gooddata_flight_server.task_profile.mode"
+    TaskProfileDuration = "gooddata_flight_server.task_profile.duration"
+    TaskProfileSamples = "gooddata_flight_server.task_profile.samples"
+    TaskProfileData = "gooddata_flight_server.task_profile.data"
 
 
 class TaskExecutor(abc.ABC):
@@ -54,6 +59,21 @@ class TaskExecutor(abc.ABC):
         """
         raise NotImplementedError
 
+    def record_result_sent(
+        self, execution_result: TaskExecutionResult, duration: float, rows: int, nbytes: int
+    ) -> None:
+        """
+        Records that result of a task was sent out to a client. Task executors may use this to
+        maintain metrics. The default implementation does nothing.
+
+        :param execution_result: result whose data was sent
+        :param duration: duration, in seconds, of the streaming
+        :param rows: number of rows sent
+        :param nbytes: number of bytes (size of the Arrow buffers) sent
+        :return: nothing
+        """
+        return
+
     @abc.abstractmethod
     def get_task_submitted_timestamp(self, task_id: str) -> Optional[float]:
         """
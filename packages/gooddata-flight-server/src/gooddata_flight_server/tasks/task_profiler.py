@@ -0,0 +1,256 @@
+#  (C) 2026 GoodData Corporation
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Optional
+
+import structlog
+from opentelemetry import trace
+
+from gooddata_flight_server.config.config import TaskProfilerMode
+from gooddata_flight_server.tasks.task_executor import TaskAttributes
+
+_StackKey = tuple[tuple[str, int, str], ...]
+
+_MAX_PROFILE_CHARS = 32 * 1024
+"""
+Profiles attached to spans are truncated to this many characters.
+"""
+
+_MAX_STACK_DEPTH = 64
+
+
+@dataclass(frozen=True)
+class TaskProfile:
+    """
+    Profile of a slow task run. The profile is picklable, so that the process task executor can send
+    profiles of the runs in worker processes to the server process.
+    """
+
+    duration: float
+    data: str
+    samples: int
+
+
+@dataclass
+class _SampledRun:
+    started: float
+    samples: Counter = field(default_factory=Counter)
+
+
+def _stack_key(frame: Optional[FrameType]) -> _StackKey:
+    entries = []
+    while frame is not None and len(entries) < _MAX_STACK_DEPTH:
+        code = frame.f_code
+        entries.append((code.co_filename, frame.f_lineno, code.co_name))
+        frame = frame.f_back
+
+    return tuple(reversed(entries))
+
+
+def _format_samples(samples: Counter, max_stacks: int) -> str:
+    total = sum(samples.values())
+    out = io.StringIO()
+
+    for stack, count in samples.most_common(max_stacks):
+        out.write(f"{count}/{total} samples:\n")
+        for filename, lineno, name in stack:
+            out.write(f'  File "{filename}", line {lineno}, in {name}\n')
+
+    return out.getvalue()
+
+
+class _StackSampler:
+    """
+    Single background thread that samples stacks of all registered threads which run for longer
+    than the threshold.
+    """
+
+    def __init__(self, threshold: float, interval: float) -> None:
+        self._threshold = threshold
+        self._interval = interval
+        self._cond = threading.Condition()
+        self._runs: dict[int, _SampledRun] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, thread_id: int) -> None:
+        with self._cond:
+            self._runs[thread_id] = _SampledRun(started=time.perf_counter())
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._sample, name="gooddata_flight_server.task_profiler", daemon=True
+                )
+                self._thread.start()
+
+            self._cond.notify()
+
+    def unregister(self, thread_id: int) -> Counter:
+        with self._cond:
+            run = self._runs.pop(thread_id, None)
+
+        return run.samples if run is not None else Counter()
+
+    def _sample(self) -> None:
+        while True:
+            with self._cond:
+                while not self._runs:
+                    self._cond.wait()
+
+            time.sleep(self._interval)
+            now = time.perf_counter()
+
+            with self._cond:
+                due = [
+                    (thread_id, run) for thread_id, run in self._runs.items() if now - run.started >= self._threshold
+                ]
+
+                if not due:
+                    continue
+
+                frames = sys._current_frames()
+                for thread_id, run in due:
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        run.samples[_stack_key(frame)] += 1
+
+                # do not keep the frames (and everything they reference) alive
+                del frames
+
+
+class SlowTaskProfiler:
+    """
+    Opt-in profiler for tasks that run for too long.
+
+    The task executor runs each task within `profile`; when the run takes longer than `threshold` seconds,
+    the profile is attached as an event to the task's execution span so that it can be inspected
+    alongside the rest of the trace.
+
+    See TaskProfilerMode for the supported modes.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        mode: TaskProfilerMode = TaskProfilerMode.Stack,
+        sample_interval: float = 0.01,
+        max_stacks: int = 10,
+    ) -> None:
+        """
+        :param threshold: duration (in seconds) of task run after which the task is considered slow
+        :param mode: profiling mode
+        :param sample_interval: how often (in seconds) to sample stacks of slow tasks; stack mode only
+        :param max_stacks: how many most frequent stacks to include in the profile; stack mode only
+        """
+        self._logger = structlog.get_logger("gooddata_flight_server.task_profiler")
+        self._threshold = threshold
+        self._mode = mode
+        self._max_stacks = max_stacks
+        self._sampler = _StackSampler(threshold, sample_interval) if mode == TaskProfilerMode.Stack else None
+
+    @property
+    def threshold(self) -> float:
+        return self._threshold
+
+    @property
+    def mode(self) -> TaskProfilerMode:
+        return self._mode
+
+    def attach(self, span: trace.Span, profile: TaskProfile) -> None:
+        """
+        Attaches the profile as an event to the span.
+
+        :param span: span to attach the profile to
+        :param profile: profile of a slow run
+        """
+        data = profile.data
+        if len(data) > _MAX_PROFILE_CHARS:
+            data = data[:_MAX_PROFILE_CHARS] + "\n...truncated"
+
+        span.add_event(
+            TaskAttributes.TaskProfile,
+            attributes={
+                TaskAttributes.TaskProfileMode: self._mode.value,
+                TaskAttributes.TaskProfileDuration: profile.duration,
+                TaskAttributes.TaskProfileSamples: profile.samples,
+                TaskAttributes.TaskProfileData: data,
+            },
+        )
+
+    def _enable(self, profiler: cProfile.Profile) -> bool:
+        try:
+            profiler.enable()
+            return True
+        except ValueError:
+            # another profiler is already active in this thread
+            self._logger.debug("task_profile_unavailable", exc_info=True)
+            return False
+
+    @contextmanager
+    def collect(self, profiles: list[TaskProfile]) -> Generator[None, None, None]:
+        """
+        Profiles code that runs within the context. The code must run in the current thread. If the code
+        turns out to be slow, its profile is appended to `profiles` when the context exits.
+
+        :param profiles: list to append the profile of slow code to
+        """
+        started = time.perf_counter()
+
+        if self._sampler is not None:
+            thread_id = threading.get_ident()
+            self._sampler.register(thread_id)
+
+            try:
+                yield
+            finally:
+                samples = self._sampler.unregister(thread_id)
+                duration = time.perf_counter() - started
+
+                if duration >= self._threshold and samples:
+                    profiles.append(
+                        TaskProfile(duration, _format_samples(samples, self._max_stacks), sum(samples.values()))
+                    )
+
+            return
+
+        profiler = cProfile.Profile()
+        if not self._enable(profiler):
+            yield
+            return
+
+        try:
+            yield
+        finally:
+            profiler.disable()
+            duration = time.perf_counter() - started
+
+            if duration >= self._threshold:
+                out = io.StringIO()
+                stats = pstats.Stats(profiler, stream=out)
+                stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(_MAX_STACK_DEPTH)
+                # total_calls is set by pstats at runtime, it is not part of the typed interface
+                total_calls: int = getattr(stats, "total_calls", 0)
+                profiles.append(TaskProfile(duration, out.getvalue(), total_calls))
+
+    @contextmanager
+    def profile(self, span: trace.Span) -> Generator[None, None, None]:
+        """
+        Profiles code that runs within the context. The code must run in the current thread.
+
+        :param span: span to attach the profile to if the code turns out to be slow
+        """
+        profiles: list[TaskProfile] = []
+        try:
+            with self.collect(profiles):
+                yield
+        finally:
+            for profile in profiles:
+                self.attach(span, profile)
@@ -1,11 +1,13 @@
 #  (C) 2024 GoodData Corporation
 import abc
+import os
 import threading
 from collections.abc import Generator, Iterable
 from dataclasses import dataclass
 from typing import Callable, Optional, Union, final
 
 import pyarrow.flight
+import pyarrow.ipc
 import structlog
 from readerwriterlock import rwlock
 from typing_extensions import TypeAlias
@@ -256,7 +258,7 @@ class TaskExecutionResult:
     whether the task finished successfully or not or whether it was cancelled.
     """
 
-    __slots__ = ("_task_id", "_cmd", "_result", "_cancelled", "_error")
+    __slots__ = ("_task_id", "_cmd", "_result", "_cancelled", "_error", "_metric_label")
 
     def __init__(
         self,
@@ -265,12 +267,14 @@ class TaskExecutionResult:
         result: Optional[TaskResult],
         cancelled: bool,
         error: Optional[TaskError],
+        metric_label: str = "",
     ):
         self._task_id = task_id
         self._cmd = cmd
         self._result = result
         self._cancelled = cancelled
         self._error = error
+        self._metric_label = metric_label
 
     @property
     def task_id(self) -> str:
@@ -308,16 +312,81 @@ class TaskExecutionResult:
         """
         return self._error
 
+    @property
+    def metric_label(self) -> str:
+        """
+        :return: metric label of the task that created this result; see `Task.metric_label`
+        """
+        return self._metric_label
+
 
 _LOGGER = structlog.get_logger("gooddata_flight_server.task_executor")
 
 
 class _TableTaskResult(FlightDataTaskResult):
-    def __init__(self, table: pyarrow.Table, on_close: Optional[OnCloseCallback] = None) -> None:
+    def __init__(
+        self,
+        table: pyarrow.Table,
+        on_close: Optional[OnCloseCallback] = None,
+        memory_mapped: bool = False,
+    ) -> None:
         super().__init__(single_use_data=False)
 
         self._table: pyarrow.Table = table
         self._on_close = on_close
+        self._memory_mapped = memory_mapped
+        self._spill_file: Optional[str] = None
+
+    @property
+    def memory_mapped(self) -> bool:
+        """
+        :return: True if the table's data lives in a memory-mapped file rather than in process memory
+        """
+        return self._memory_mapped
+
+    @property
+    def nbytes(self) -> int:
+        """
+        :return: size of the buffers that hold the table's data
+        """
+        return self._table.get_total_buffer_size()
+
+    def spill(self, path: str) -> bool:
+        """
+        Writes the table into an Arrow IPC file and replaces the in-memory table with a table that
+        is memory-mapped from the file. The file is removed when the result is closed.
+
+        Readers that acquired the data before the spill keep reading the original in-memory table.
+
+        :param path: path of the file to create
+        :return: True if the table was spilled, False if the result is closed or already memory-mapped
+        """
+        rlock = self._data_lock.gen_rlock()
+        if not rlock.acquire(blocking=False):
+            return False
+
+        try:
+            if self._closed or self._memory_mapped:
+                return False
+
+            try:
+                with pyarrow.OSFile(path, "wb") as sink, pyarrow.ipc.new_file(sink, self._table.schema) as writer:
+                    writer.write_table(self._table)
+
+                # the mapping stays valid after the file is closed; the table's buffers point into it
+                with pyarrow.memory_map(path, "r") as source:
+                    table = pyarrow.ipc.open_file(source).read_all()
+            except BaseException:
+                _remove_file(path)
+                raise
+
+            self._table = table
+            self._memory_mapped = True
+            self._spill_file = path
+
+            return True
+        finally:
+            rlock.release()
 
     def get_schema(self) -> pyarrow.Schema:
         return self._table.schema
@@ -328,6 +397,9 @@ class _TableTaskResult(FlightDataTaskResult):
     def _close(self) -> None:
         del self._table
 
+        if self._spill_file is not None:
+            _remove_file(self._spill_file)
+
         try:
             if self._on_close is not None:
                 self._on_close()
@@ -335,6 +407,15 @@ class _TableTaskResult(FlightDataTaskResult):
             _LOGGER.warning("reader_on_close_failed", exc_info=True)
 
 
+def _remove_file(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        _LOGGER.warning("spill_file_remove_failed", path=path, exc_info=True)
+
+
 class _ReaderTaskResult(FlightDataTaskResult):
     def __init__(self, reader: pyarrow.RecordBatchReader, on_close: Optional[OnCloseCallback] = None) -> None:
         super().__init__(single_use_data=True)
@@ -0,0 +1,266 @@
+#  (C) 2026 GoodData Corporation
+import abc
+import bisect
+import hashlib
+import itertools
+from typing import Optional
+
+from gooddata_flight_server.config.config import ServerConfig
+from gooddata_flight_server.errors.error_code import ErrorCode
+from gooddata_flight_server.errors.error_info import ErrorInfo
+from gooddata_flight_server.tasks.task import Task
+
+_DEFAULT_TENANT = ""
+
+
+def task_tenant(config: ServerConfig, headers: dict[str, list[str]]) -> Optional[str]:
+    """
+    Derives tenant to which a task submitted by a Flight RPC call belongs.
+
+    If the server is configured with `task_tenant_header` and the call includes this header, its
+    value is the tenant. Otherwise, when the server uses token authentication, the tenant is identified
+    by a digest of the token. Otherwise, the tenant cannot be determined.
+
+    :param config: server's configuration
+    :param headers: headers of the Flight RPC call
+    :return: tenant identifier or None if it cannot be determined
+    """
+    if config.task_tenant_header is not None:
+        values = headers.get(config.task_tenant_header.lower())
+        if values:
+            return values[0]
+
+    token_header = (config.token_header_name or "authorization").lower()
+    values = headers.get(token_header)
+    if values:
+        return "token:" + hashlib.sha256(values[0].encode("utf-8")).hexdigest()[:16]
+
+    return None
+
+
+class TaskScheduler(abc.ABC):
+    """
+    Scheduler decides the order in which the ThreadTaskExecutor runs the submitted tasks and whether
+    new tasks can be submitted at all.
+
+    The executor calls the scheduler while holding its own lock - the implementations do not need to
+    be thread-safe and must not block.
+    """
+
+    @abc.abstractmethod
+    def admit(self, task: Task) -> None:
+        """
+        Decides whether the task can be submitted. If it can, the scheduler reserves place for the task
+        in its queue and the executor will `push` the task shortly after.
+
+        :param task: task about to be submitted
+        :return: nothing
+        :raises: pyarrow.flight.FlightUnavailableError if the task cannot be submitted right now
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def push(self, task: Task) -> None:
+        """
+        Adds admitted task into the queue.
+
+        :param task: task to add
+        :return: nothing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def pop(self) -> Optional[Task]:
+        """
+        Takes the next task to run out of the queue. The task is considered running until
+        the executor calls `done`.
+
+        :return: task to run or None if there is no task that can run right now
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def remove(self, task: Task) -> bool:
+        """
+        Removes a task that was cancelled while waiting in the queue.
+
+        :param task: task to remove
+        :return: True if the task was in the queue, False otherwise
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def done(self, task: Task) -> None:
+        """
+        Called when task returned by `pop` finished running.
+
+        :param task: task that finished
+        :return: nothing
+        """
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def queue_size(self) -> int:
+        """
+        :return: number of tasks waiting in the queue
+        """
+        raise NotImplementedError
+
+
+class FairTaskScheduler(TaskScheduler):
+    """
+    Scheduler that shares the executor fairly between tenants:
+
+    - each tenant (see `Task.tenant`) has its own queue; the tenants take turns - the next task
+      comes from the tenant that was served longest ago - so that one tenant submitting many
+      tasks cannot starve the others
+
+    - tasks with higher priority (see `Task.priority`) run before tasks with lower priority; within
+      one tenant, tasks of the same priority run in the order in which they were submitted
+
+    - at most `max_group_concurrency` tasks of the same concurrency group (see `Task.concurrency_group`;
+      e.g. name of the function that the task invokes) run at the same time
+
+    - admission control: submission of a new task is rejected with FlightUnavailableError when there
+      are already `max_queue_size` tasks waiting or when the tenant has already `max_tenant_queue_size`
+      tasks waiting
+
+    Limits set to 0 are not enforced.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 0,
+        max_tenant_queue_size: int = 0,
+        max_group_concurrency: int = 0,
+    ) -> None:
+        self._max_queue_size = max_queue_size
+        self._max_tenant_queue_size = max_tenant_queue_size
+        self._max_group_concurrency = max_group_concurrency
+
+        # tenant -> queued tasks sorted by (-priority, sequence)
+        self._queues: dict[str, list[tuple[int, int, Task]]] = {}
+        self._queue_keys: dict[str, tuple[str, int, int]] = {}
+        self._reserved: dict[str, int] = {}
+        self._queue_size = 0
+        self._running_groups: dict[str, int] = {}
+        self._running_tenants: dict[str, int] = {}
+        # tenant -> when it was served last; tenants served longer ago go first. the
+        # record is kept while the tenant has any tasks queued or running
+        self._served: dict[str, int] = {}
+        self._sequence = itertools.count()
+
+    @staticmethod
+    def _tenant(task: Task) -> str:
+        return task.tenant or _DEFAULT_TENANT
+
+    @staticmethod
+    def _increment(d: dict[str, int], key: str, delta: int) -> None:
+        value = d.get(key, 0) + delta
+        if value > 0:
+            d[key] = value
+        else:
+            d.pop(key, None)
+
+    def _forget_idle_tenant(self, tenant: str) -> None:
+        if tenant not in self._reserved and tenant not in self._running_tenants:
+            self._served.pop(tenant, None)
+
+    def admit(self, task: Task) -> None:
+        tenant = self._tenant(task)
+        tenant_size = self._reserved.get(tenant, 0)
+
+        if self._max_queue_size and self._queue_size >= self._max_queue_size:
+            raise ErrorInfo.for_reason(
+                ErrorCode.BACKPRESSURE,
+                f"Server is busy, there are already {self._queue_size} tasks waiting in the queue.",
+            ).to_unavailable_error()
+
+        if self._max_tenant_queue_size and tenant_size >= self._max_tenant_queue_size:
+            raise ErrorInfo.for_reason(
+                ErrorCode.BACKPRESSURE,
+                f"There are already {tenant_size} tasks of the same tenant waiting in the queue.",
+            ).to_unavailable_error()
+
+        self._reserved[tenant] = tenant_size + 1
+        self._queue_size += 1
+
+    def push(self, task: Task) -> None:
+        tenant = self._tenant(task)
+        neg_priority, sequence = -task.priority, next(self._sequence)
+
+        bisect.insort(self._queues.setdefault(tenant, []), (neg_priority, sequence, task), key=lambda e: e[:2])
+        self._queue_keys[task.task_id] = (tenant, neg_priority, sequence)
+
+    def _can_run(self, task: Task) -> bool:
+        group = task.concurrency_group
+        if not self._max_group_concurrency or group is None:
+            return True
+
+        return self._running_groups.get(group, 0) < self._max_group_concurrency
+
+    def _take(self, tenant: str, index: int) -> Task:
+        queue = self._queues[tenant]
+        _, _, task = queue.pop(index)
+        del self._queue_keys[task.task_id]
+
+        if not queue:
+            del self._queues[tenant]
+
+        self._increment(self._reserved, tenant, -1)
+        self._queue_size -= 1
+
+        return task
+
+    def pop(self) -> Optional[Task]:
+        best: Optional[tuple[tuple[int, int], str, int]] = None
+
+        for tenant, queue in self._queues.items():
+            for index, (neg_priority, _, task) in enumerate(queue):
+                if not self._can_run(task):
+                    continue
+
+                # higher priority wins; on same priority, the tenant served longer ago wins
+                order = (neg_priority, self._served.get(tenant, -1))
+                if best is None or order < best[0]:
+                    best = (order, tenant, index)
+                break
+
+        if best is None:
+            return None
+
+        _, tenant, index = best
+        task = self._take(tenant, index)
+
+        self._served[tenant] = next(self._sequence)
+        self._increment(self._running_tenants, tenant, 1)
+        if task.concurrency_group is not None:
+            self._increment(self._running_groups, task.concurrency_group, 1)
+
+        return task
+
+    def remove(self, task: Task) -> bool:
+        queue_key = self._queue_keys.get(task.task_id)
+        if queue_key is None:
+            return False
+
+        tenant, neg_priority, sequence = queue_key
+        index = bisect.bisect_left(self._queues[tenant], (neg_priority, sequence), key=lambda e: e[:2])
+        self._take(tenant, index)
+        self._forget_idle_tenant(tenant)
+
+        return True
+
+    def done(self, task: Task) -> None:
+        tenant = self._tenant(task)
+
+        self._increment(self._running_tenants, tenant, -1)
+        if task.concurrency_group is not None:
+            self._increment(self._running_groups, task.concurrency_group, -1)
+
+        self._forget_idle_tenant(tenant)
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue_size
@@ -1,5 +1,6 @@
 #  (C) 2024 GoodData Corporation
 import abc
+import functools
 import threading
 import time
 from collections.abc import Generator
@@ -17,17 +18,20 @@ from gooddata_flight_server.errors.error_code import ErrorCode
 from gooddata_flight_server.errors.error_info import ErrorInfo
 from gooddata_flight_server.tasks.base import TaskWaitTimeoutError
 from gooddata_flight_server.tasks.metrics import TaskExecutorMetrics
+from gooddata_flight_server.tasks.result_store import ResultSpillStore
 from gooddata_flight_server.tasks.task import Task
 from gooddata_flight_server.tasks.task_error import TaskError
 from gooddata_flight_server.tasks.task_executor import (
     TaskAttributes,
     TaskExecutor,
 )
+from gooddata_flight_server.tasks.task_profiler import SlowTaskProfiler
 from gooddata_flight_server.tasks.task_result import (
     FlightDataTaskResult,
     TaskExecutionResult,
     TaskResult,
 )
+from gooddata_flight_server.tasks.task_scheduler import TaskScheduler
 from gooddata_flight_server.tasks.temporal_container import TemporalContainer
 from gooddata_flight_server.utils.otel_tracing import SERVER_TRACER
 
@@ -158,6 +162,7 @@ class _TaskExecution:
         "_result_future",
         "_lock",
         "_completed",
+        "_done",
         "_stats",
     )
 
@@ -189,6 +194,7 @@ class _TaskExecution:
         # all these are protected using the lock
         self._result_future: Optional[Future[Union[TaskResult, TaskError]]] = None
         self._completed: threading.Condition = threading.Condition(self._lock)
+        self._done = False
 
     @property
     def task(self) -> Task:
@@ -235,6 +241,7 @@ class _TaskExecution:
 
         with self._lock:
             execution_result = self._cb.process_task_result(self, self._result_future)
+            self._done = True
             self._completed.notify_all()
 
         self._complete_execution_span(execution_result)
@@ -291,7 +298,8 @@ class _TaskExecution:
 
     def wait_for_completion(self, timeout: Optional[float] = None) -> None:
         with self._lock:
-            completed = self._completed.wait(timeout=timeout)
+            # the execution may complete before the caller gets to wait
+            completed = self._completed.wait_for(lambda: self._done, timeout=timeout)
 
         if not completed:
             raise TaskWaitTimeoutError(task_id=self._task.task_id, cmd=self._task.cmd)
@@ -333,6 +341,18 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
     """
     Implementation of TaskExecutor interface that uses a pluggable TaskFactory
     to create tasks to run and then submits those into a ThreadPoolExecutor.
+
+    By default, the tasks run in the order in which they were submitted. When the executor is
+    created with a TaskScheduler, the submitted tasks wait in the scheduler's queue and the
+    scheduler decides which task runs next whenever a thread becomes available. The scheduler
+    may also reject submission of new tasks (admission control).
+
+    Results of finished tasks are kept in memory until they expire. When the executor is created
+    with a `result_memory_budget`, results that would not fit into the budget are spilled to Arrow IPC
+    files in `result_spill_dir` and served from memory-mapped files - see ResultSpillStore.
+
+    Optionally, the executor runs the tasks under a SlowTaskProfiler which attaches profiles of slow
+    tasks to their execution spans.
     """
 
     def __init__(
@@ -341,11 +361,16 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
         task_threads: int = 4,
         result_close_threads: int = 2,
         keep_results_for: int = 15,
+        scheduler: Optional[TaskScheduler] = None,
+        result_memory_budget: int = 0,
+        result_spill_dir: Optional[str] = None,
+        profiler: Optional[SlowTaskProfiler] = None,
     ) -> None:
         self._logger = structlog.get_logger("gooddata_flight_server.task_executor")
         self._metric_prefix = metric_prefix
 
         self._metrics = TaskExecutorMetrics(prefix=metric_prefix)
+        self._profiler = profiler
         self._executor = ThreadPoolExecutor(
             max_workers=task_threads,
             thread_name_prefix="gooddata_flight_server.task",
@@ -359,11 +384,28 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
         self._queue_size: int = 0
         self._executions: dict[str, _TaskExecution] = {}
 
+        # all these are protected using the schedule lock
+        self._scheduler = scheduler
+        self._schedule_lock = threading.Lock()
+        self._max_running = task_threads
+        self._running = 0
+        self._scheduled: dict[str, tuple[_TaskExecution, Future]] = {}
+
         self._results: TemporalContainer[TaskExecutionResult] = TemporalContainer(
             logger_name="gooddata_flight_server.result_container",
             grace_period=keep_results_for,
             entry_evict_fun=self._on_finished_task_evicted,
         )
+        self._result_store: Optional[ResultSpillStore] = (
+            ResultSpillStore(
+                metrics=self._metrics,
+                max_resident_bytes=result_memory_budget,
+                spill_executor=self._close_executor,
+                spill_dir=result_spill_dir,
+            )
+            if result_memory_budget > 0
+            else None
+        )
 
     def _async_close_result(self, task_id: str, task_result: FlightDataTaskResult) -> None:
         self._metrics.close_queue_size.dec()
@@ -383,6 +425,9 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
             task_id=result.task_id,
         )
 
+        if self._result_store is not None:
+            self._result_store.remove(result.task_id)
+
         task_result = result.result
         if isinstance(task_result, FlightDataTaskResult):
             self._metrics.close_queue_size.inc()
@@ -416,6 +461,7 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
                 return TaskExecutionResult(
                     task_id=task.task_id,
                     cmd=task.cmd,
+                    metric_label=task.metric_label,
                     result=None,
                     error=task_error,
                     cancelled=False,
@@ -426,6 +472,7 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
             return TaskExecutionResult(
                 task_id=task.task_id,
                 cmd=task.cmd,
+                metric_label=task.metric_label,
                 result=r,
                 error=None,
                 cancelled=False,
@@ -438,6 +485,7 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
             return TaskExecutionResult(
                 task_id=task.task_id,
                 cmd=task.cmd,
+                metric_label=task.metric_label,
                 result=None,
                 error=None,
                 cancelled=True,
@@ -487,6 +535,7 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
             return TaskExecutionResult(
                 task_id=task.task_id,
                 cmd=task.cmd,
+                metric_label=task.metric_label,
                 result=None,
                 cancelled=False,
                 error=task_error,
@@ -496,13 +545,14 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
         task = task_execution.task
         logging_ctx = task_execution.logging_ctx
         stats = task_execution.stats
+        label = task.metric_label
 
         stats.run_started = time.perf_counter()
         structlog.contextvars.clear_contextvars()
         structlog.contextvars.bind_contextvars(**logging_ctx)
 
         with (
-            task_execution.use_execution_span(),
+            task_execution.use_execution_span() as execution_span,
             SERVER_TRACER.start_as_current_span("task_run", attributes={TaskAttributes.TaskId: task.task_id}),
         ):
             self._logger.info(
@@ -511,15 +561,24 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
                 waited=stats.run_waited_duration,
             )
             self._metrics.wait_time.observe(stats.run_waited_duration)
+            self._metrics.wait_histogram.labels(label).observe(stats.run_waited_duration)
 
             try:
-                return task.run()
+                if self._profiler is None:
+                    return task.run()
+
+                with self._profiler.profile(execution_span):
+                    return task.run()
             finally:
                 stats.run_completed = time.perf_counter()
                 stats.completed = stats.run_completed
 
                 self._metrics.task_duration.observe(stats.run_duration)
                 self._metrics.task_e2e_duration.observe(stats.duration)
+                self._metrics.run_histogram.labels(label).observe(stats.run_duration)
+
+                if self._profiler is not None and stats.run_duration >= self._profiler.threshold:
+                    self._metrics.slow_tasks.labels(label).inc()
 
     def _finish_task_with_result(self, task_execution: "_TaskExecution", result: TaskExecutionResult) -> None:
         task = task_execution.task
@@ -528,26 +587,114 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
             self._results[task.task_id] = result
             self._queue_size -= 1
 
+            if self._result_store is not None:
+                self._result_store.add(result)
+
             if self._queue_size < 0:
                 self._logger.warning("queue_size_corrupt", queue_size=self._queue_size)
 
         self._metrics.queue_size.set(self._queue_size)
 
+    def _submit_run(self, task_execution: _TaskExecution) -> Future:
+        """
+        Submits the task's run into the pool.
+
+        :param task_execution: task execution whose task should run
+        :return: future result of the task run
+        """
+        with task_execution.use_execution_span(), SERVER_TRACER.start_as_current_span("task_run_submit"):
+            if task_execution.stats.run_submitted is None:
+                task_execution.stats.run_submitted = time.perf_counter()
+
+            return self._executor.submit(self._task_run_wrapper, task_execution)
+
+    def _release_run(self, task: Task) -> None:
+        assert self._scheduler is not None
+
+        with self._schedule_lock:
+            self._running -= 1
+            self._scheduler.done(task)
+
+    def _on_run_done(self, task: Task, future: Future, run_future: Future) -> None:
+        self._release_run(task)
+        self._dispatch()
+
+        if run_future.cancelled():
+            future.set_exception(CancelledError())
+        elif run_future.exception() is not None:
+            future.set_exception(run_future.exception())
+        else:
+            future.set_result(run_future.result())
+
+    def _dispatch(self) -> None:
+        """
+        Starts runs of the tasks that the scheduler picks until all threads are busy or there is no
+        task that can run.
+        """
+        assert self._scheduler is not None
+
+        while True:
+            with self._schedule_lock:
+                if self._running >= self._max_running:
+                    return
+
+                task = self._scheduler.pop()
+                if task is None:
+                    return
+
+                task_execution, future = self._scheduled.pop(task.task_id)
+                self._running += 1
+
+            if not future.set_running_or_notify_cancel():
+                # task got cancelled right after the scheduler picked it
+                self._release_run(task)
+                continue
+
+            try:
+                run_future = self._submit_run(task_execution)
+            except BaseException as e:
+                self._release_run(task)
+                future.set_exception(e)
+                continue
+
+            run_future.add_done_callback(functools.partial(self._on_run_done, task, future))
+
     def run_task(
         self,
         task_execution: _TaskExecution,
     ) -> Future:
-        with task_execution.use_execution_span(), SERVER_TRACER.start_as_current_span("task_run_submit"):
-            task_execution.stats.run_submitted = time.perf_counter()
+        if self._scheduler is None:
+            return self._submit_run(task_execution)
 
-            return self._executor.submit(self._task_run_wrapper, task_execution)
+        task_execution.stats.run_submitted = time.perf_counter()
+        future: Future = Future()
+
+        with self._schedule_lock:
+            self._scheduled[task_execution.task_id] = (task_execution, future)
+            self._scheduler.push(task_execution.task)
+
+        self._dispatch()
+
+        return future
 
     def process_task_result(
         self,
         task_execution: "_TaskExecution",
         future: Future,
     ) -> TaskExecutionResult:
+        if self._scheduler is not None:
+            # the task may have been cancelled while it was waiting in the queue
+            with self._schedule_lock:
+                if self._scheduler.remove(task_execution.task):
+                    self._scheduled.pop(task_execution.task_id, None)
+
         result = self._create_task_exec_result(task_execution, future)
+
+        try:
+            task_execution.task.on_task_completed(result)
+        except Exception:
+            self._logger.warning("task_completed_callback_failed", task_id=task_execution.task_id, exc_info=True)
+
         self._finish_task_with_result(task_execution, result)
 
         return result
@@ -556,6 +703,15 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
         self,
         task: Task,
     ) -> None:
+        if self._scheduler is not None:
+            try:
+                with self._schedule_lock:
+                    self._scheduler.admit(task)
+            except pyarrow.flight.FlightUnavailableError:
+                self._metrics.task_rejected.inc()
+                self._logger.info("task_rejected", task_id=task.task_id, tenant=task.tenant)
+                raise
+
         # note: task execution constructor will snapshot current logging and tracing context
         execution = _TaskExecution(task=task, cb=self)
 
@@ -566,6 +722,15 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
         execution.start()
         self._metrics.queue_size.set(self._queue_size)
 
+    def record_result_sent(
+        self, execution_result: TaskExecutionResult, duration: float, rows: int, nbytes: int
+    ) -> None:
+        label = execution_result.metric_label
+
+        self._metrics.stream_histogram.labels(label).observe(duration)
+        self._metrics.result_rows.labels(label).observe(rows)
+        self._metrics.result_bytes.labels(label).observe(nbytes)
+
     def get_task_submitted_timestamp(self, task_id: str) -> Optional[float]:
         with self._task_lock:
             execution = self._executions.get(task_id)
@@ -646,3 +811,6 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
         shutdown_thd.join(timeout=timeout)
 
         self._results.close()
+
+        if self._result_store is not None:
+            self._result_store.close()
@@ -5,6 +5,8 @@ from pathlib import Path
 from gooddata_flight_server.config.config import (
     AuthenticationMethod,
     OtelExporterType,
+    TaskExecutorType,
+    TaskProfilerMode,
     read_config,
 )
 
@@ -22,6 +24,17 @@ def test_read_valid():
     assert server_config.listen_port == 17001
     assert server_config.advertise_port == 17001
     assert server_config.task_threads == 32
+    assert server_config.task_executor == TaskExecutorType.Process
+    assert server_config.task_processes == 2
+    assert server_config.task_fair_scheduling is True
+    assert server_config.task_tenant_header == "x-tenant-id"
+    assert server_config.task_max_queue_size == 100
+    assert server_config.task_max_tenant_queue_size == 10
+    assert server_config.task_max_function_concurrency == 4
+    assert server_config.task_result_memory_budget == 1073741824
+    assert server_config.task_result_spill_dir == "/tmp"
+    assert server_config.task_profile_threshold_ms == 5000
+    assert server_config.task_profile_mode == TaskProfilerMode.CProfile
     assert server_config.metrics_host == "0.0.0.0"
     assert server_config.metrics_port == 17101
     assert server_config.health_check_host == "0.0.0.0"
@@ -41,6 +54,15 @@ def test_read_empty():
     assert server_config.listen_port == 17001
     assert server_config.advertise_port == 17001
     assert server_config.task_threads == 32
+    assert server_config.task_executor == TaskExecutorType.Thread
+    assert server_config.task_processes > 0
+    assert server_config.task_fair_scheduling is False
+    assert server_config.task_tenant_header is None
+    assert server_config.task_max_queue_size == 0
+    assert server_config.task_result_memory_budget == 0
+    assert server_config.task_result_spill_dir is None
+    assert server_config.task_profile_threshold_ms == 0
+    assert server_config.task_profile_mode == TaskProfilerMode.Stack
     assert server_config.metrics_host is None
     assert server_config.metrics_port == 17101
     assert server_config.health_check_host is None
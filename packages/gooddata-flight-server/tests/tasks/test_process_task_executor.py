@@ -0,0 +1,228 @@
+#  (C) 2026 GoodData Corporation
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+import pyarrow.flight
+import pytest
+from gooddata_flight_server import (
+    ErrorCode,
+    FlightDataTaskResult,
+    SlowTaskProfiler,
+    Task,
+    TaskError,
+    TaskExecutionResult,
+    TaskProfilerMode,
+    TaskResult,
+)
+from gooddata_flight_server.tasks.base import TaskWaitTimeoutError
+from gooddata_flight_server.tasks.process_task_executor import ProcessTaskExecutor
+from gooddata_flight_server.tasks.task_profiler import TaskProfile
+from opentelemetry import trace
+from prometheus_client import REGISTRY
+
+_TEST_TABLE = pyarrow.table({"col1": list(range(100))})
+
+# tasks run in spawned worker processes; they must be defined at module level so that
+# the workers can import them
+
+
+class _PidTask(Task):
+    def __init__(self) -> None:
+        super().__init__(cmd=b"pid", cancellable=True, task_id=None)
+        self.completed_with: Optional[TaskExecutionResult] = None
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        pid = pyarrow.array([os.getpid()] * 10, pyarrow.int64())
+
+        return FlightDataTaskResult.for_data(pyarrow.table({"pid": pid}).to_reader(max_chunksize=3))
+
+    def on_task_completed(self, execution_result: TaskExecutionResult) -> None:
+        self.completed_with = execution_result
+
+
+class _FailWithRaiseTask(Task):
+    def __init__(self, error: Exception) -> None:
+        super().__init__(cmd=b"", cancellable=True, task_id=None)
+        self.error = error
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        raise self.error
+
+
+class _GatedTask(Task):
+    """
+    Runs until the gate file appears; checks for cancellation in the meantime.
+    """
+
+    def __init__(self, gate: str) -> None:
+        super().__init__(cmd=b"", cancellable=True, task_id=None)
+        self.gate = gate
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        while not os.path.exists(self.gate):
+            self.check_cancelled()
+            time.sleep(0.01)
+
+        return FlightDataTaskResult.for_table(_TEST_TABLE)
+
+
+class _SlowTask(Task):
+    def __init__(self, duration: float) -> None:
+        super().__init__(cmd=b"", cancellable=True, task_id=None)
+        self.duration = duration
+
+    @property
+    def metric_label(self) -> str:
+        return "slow_fun"
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        until = time.perf_counter() + self.duration
+        while time.perf_counter() < until:
+            sum(range(1000))
+
+        return FlightDataTaskResult.for_table(_TEST_TABLE)
+
+
+class _RecordingProfiler(SlowTaskProfiler):
+    def __init__(self, threshold: float, mode: TaskProfilerMode) -> None:
+        super().__init__(threshold=threshold, mode=mode)
+        self.attached: list[TaskProfile] = []
+
+    def attach(self, span: trace.Span, profile: TaskProfile) -> None:
+        self.attached.append(profile)
+        super().attach(span, profile)
+
+
+@pytest.fixture(scope="module")
+def pte_fixture():
+    executor = ProcessTaskExecutor(metric_prefix="test_process", task_processes=1, keep_results_for=30)
+
+    yield executor
+
+    executor.stop()
+    assert not os.path.exists(executor.result_dir)
+
+
+def test_task_is_picklable():
+    task = _FailWithRaiseTask(ValueError("test error"))
+    task.cancel()
+
+    copy = pickle.loads(pickle.dumps(task))
+
+    assert copy.task_id == task.task_id
+    assert copy.cmd == task.cmd
+    assert copy.cancelled is True
+    assert str(copy.error) == "test error"
+
+
+def test_task_runs_in_worker_process(pte_fixture):
+    task = _PidTask()
+    pte_fixture.submit(task)
+
+    exec_result = pte_fixture.wait_for_result(task.task_id, timeout=60)
+
+    assert exec_result.error is None
+    assert exec_result.cancelled is False
+    assert task.completed_with is exec_result
+
+    # single-use reader in the worker is materialized into a table that may be read repeatedly
+    for _ in range(2):
+        rlock, data = exec_result.result.acquire_data()
+        try:
+            assert isinstance(data, pyarrow.Table)
+            assert data.num_rows == 10
+            assert data.column("pid")[0].as_py() != os.getpid()
+        finally:
+            rlock.release()
+
+    result_file = os.path.join(pte_fixture.result_dir, f"{task.task_id}.arrow")
+    assert os.path.exists(result_file)
+    assert pte_fixture.close_result(task.task_id) is True
+
+    # closing the result happens asynchronously
+    for _ in range(100):
+        if not os.path.exists(result_file):
+            break
+        time.sleep(0.01)
+
+    assert not os.path.exists(result_file)
+
+
+def test_task_error_propagated(pte_fixture):
+    task = _FailWithRaiseTask(ValueError("bad argument"))
+    pte_fixture.submit(task)
+
+    exec_result = pte_fixture.wait_for_result(task.task_id, timeout=60)
+
+    assert exec_result.result is None
+    assert exec_result.error is not None
+    assert exec_result.error.error_info.code == ErrorCode.BAD_ARGUMENT
+    assert exec_result.error.error_info.msg == "bad argument"
+
+
+def test_task_cancel_while_running(pte_fixture, tmp_path: Path):
+    gate = tmp_path / "gate"
+    task = _GatedTask(str(gate))
+    pte_fixture.submit(task)
+
+    with pytest.raises(TaskWaitTimeoutError):
+        pte_fixture.wait_for_result(task_id=task.task_id, timeout=0.5)
+
+    assert pte_fixture.cancel(task_id=task.task_id) is True
+
+    exec_result = pte_fixture.wait_for_result(task_id=task.task_id, timeout=60)
+    assert exec_result.cancelled is True
+    assert exec_result.result is None
+    assert exec_result.error is None
+    assert not os.path.exists(os.path.join(pte_fixture.result_dir, f"{task.task_id}.cancel"))
+
+
+def test_task_cancel_while_pending(pte_fixture, tmp_path: Path):
+    gate = tmp_path / "gate"
+    blocking_task = _GatedTask(str(gate))
+    pte_fixture.submit(blocking_task)
+
+    try:
+        # the single worker is busy; ProcessPoolExecutor moves up to two items into its call
+        # queue (where they can no longer be cancelled) so the last task surely waits in the
+        # pending queue
+        tasks = [_PidTask(), _PidTask(), _PidTask()]
+        for task in tasks:
+            pte_fixture.submit(task)
+
+        assert pte_fixture.cancel(task_id=tasks[-1].task_id) is True
+
+        exec_result = pte_fixture.wait_for_result(task_id=tasks[-1].task_id, timeout=60)
+        assert exec_result.cancelled is True
+    finally:
+        gate.touch()
+
+    exec_result = pte_fixture.wait_for_result(task_id=blocking_task.task_id, timeout=60)
+    assert exec_result.cancelled is False
+    assert exec_result.result is not None
+
+
+@pytest.mark.parametrize("mode", list(TaskProfilerMode))
+def test_slow_task_in_worker_profiled(mode: TaskProfilerMode):
+    profiler = _RecordingProfiler(threshold=0.1, mode=mode)
+    executor = ProcessTaskExecutor(
+        metric_prefix=f"test_process_profiled_{mode.value}", task_processes=1, profiler=profiler
+    )
+
+    try:
+        tasks = [_SlowTask(0.01), _SlowTask(0.5)]
+        for task in tasks:
+            executor.submit(task)
+            assert executor.wait_for_result(task.task_id, timeout=60) is not None
+
+        # only the slow run in the worker process is profiled; the profile is attached in the server process
+        assert len(profiler.attached) == 1
+        assert profiler.attached[0].duration >= 0.5
+        assert "run" in profiler.attached[0].data
+        labels = {"task": "slow_fun"}
+        assert REGISTRY.get_sample_value(f"test_process_profiled_{mode.value}_task_slow_total", labels) == 1
+    finally:
+        executor.stop()
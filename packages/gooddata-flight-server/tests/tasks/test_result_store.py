@@ -0,0 +1,167 @@
+#  (C) 2026 GoodData Corporation
+import os
+import time
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from typing import Union
+
+import pyarrow
+from gooddata_flight_server import FlightDataTaskResult, Task, TaskError, TaskExecutionResult, TaskResult
+from gooddata_flight_server.tasks.metrics import TaskExecutorMetrics
+from gooddata_flight_server.tasks.result_store import ResultSpillStore
+from gooddata_flight_server.tasks.thread_task_executor import ThreadTaskExecutor
+
+
+class _InlineExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+
+        return future
+
+
+class _DeferredExecutor(Executor):
+    def __init__(self) -> None:
+        self.pending: list = []
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        self.pending.append((fn, args, kwargs))
+        return Future()
+
+    def run_all(self) -> None:
+        for fn, args, kwargs in self.pending:
+            fn(*args, **kwargs)
+
+
+def _table(rows: int) -> pyarrow.Table:
+    return pyarrow.table({"col1": pyarrow.array(range(rows), pyarrow.int64())})
+
+
+def _exec_result(task_id: str, table: pyarrow.Table) -> TaskExecutionResult:
+    return TaskExecutionResult(
+        task_id=task_id,
+        cmd=b"",
+        result=FlightDataTaskResult.for_table(table),
+        cancelled=False,
+        error=None,
+    )
+
+
+def _read(result: TaskExecutionResult) -> pyarrow.Table:
+    assert isinstance(result.result, FlightDataTaskResult)
+    rlock, data = result.result.acquire_data()
+    try:
+        assert isinstance(data, pyarrow.Table)
+        return data
+    finally:
+        rlock.release()
+
+
+def test_spill_over_budget(tmp_path: Path):
+    store = ResultSpillStore(
+        metrics=TaskExecutorMetrics("test_spill"),
+        max_resident_bytes=2 * 8000,
+        spill_executor=_InlineExecutor(),
+        spill_dir=str(tmp_path),
+    )
+    small = _exec_result("small", _table(500))
+    old = _exec_result("old", _table(1000))
+    new = _exec_result("new", _table(1000))
+
+    store.add(old)
+    store.add(small)
+    assert store.spilled_bytes == 0
+
+    time.sleep(0.1)
+    store.add(new)
+
+    # over budget - the older of the two large results goes to disk
+    assert store.resident_bytes == 4000 + 8000
+    assert store.spilled_bytes == 8000
+
+    spill_file = os.path.join(store.spill_dir, "old.arrow")
+    assert os.path.exists(spill_file)
+    assert not os.path.exists(os.path.join(store.spill_dir, "new.arrow"))
+
+    # data is served from the spill file and reads stay repeatable
+    for _ in range(2):
+        assert _read(old).equals(_table(1000))
+    assert getattr(old.result, "memory_mapped", False) is True
+    assert getattr(new.result, "memory_mapped", True) is False
+
+    assert old.result is not None
+    old.result.close()
+    store.remove("old")
+
+    assert not os.path.exists(spill_file)
+    assert store.spilled_bytes == 0
+
+    store.close()
+    assert not os.path.exists(store.spill_dir)
+
+
+def test_removed_result_not_spilled(tmp_path: Path):
+    deferred = _DeferredExecutor()
+    store = ResultSpillStore(
+        metrics=TaskExecutorMetrics("test_spill"),
+        max_resident_bytes=100,
+        spill_executor=deferred,
+        spill_dir=str(tmp_path),
+    )
+    result = _exec_result("closed", _table(1000))
+    store.add(result)
+    assert store.resident_bytes == 8000
+
+    # result expires before the spill gets to run
+    assert result.result is not None
+    result.result.close()
+    store.remove("closed")
+    deferred.run_all()
+
+    assert store.resident_bytes == 0
+    assert store.spilled_bytes == 0
+    assert not os.listdir(store.spill_dir)
+
+    store.close()
+
+
+class _TableTask(Task):
+    def __init__(self, rows: int) -> None:
+        super().__init__(cmd=b"", cancellable=True, task_id=None)
+        self.rows = rows
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        return FlightDataTaskResult.for_table(_table(self.rows))
+
+
+def test_executor_spills_results(tmp_path: Path):
+    executor = ThreadTaskExecutor(
+        metric_prefix="test_spill_exec",
+        task_threads=1,
+        keep_results_for=30,
+        result_memory_budget=10_000,
+        result_spill_dir=str(tmp_path),
+    )
+
+    try:
+        tasks = [_TableTask(1000) for _ in range(4)]
+        for task in tasks:
+            executor.submit(task)
+
+        results = [executor.wait_for_result(task.task_id, timeout=10) for task in tasks]
+
+        spill_dir = next(tmp_path.iterdir())
+        for _ in range(100):
+            if len(list(spill_dir.iterdir())) == 3:
+                break
+            time.sleep(0.01)
+
+        assert len(list(spill_dir.iterdir())) == 3
+
+        for result in results:
+            assert result is not None
+            assert _read(result).equals(_table(1000))
+
+        assert executor.close_result(tasks[0].task_id) is True
+    finally:
+        executor.stop()
@@ -0,0 +1,107 @@
+#  (C) 2026 GoodData Corporation
+import time
+from typing import Any, Union
+
+import pyarrow
+from gooddata_flight_server import FlightDataTaskResult, SlowTaskProfiler, Task, TaskError, TaskProfilerMode, TaskResult
+from gooddata_flight_server.tasks.task_executor import TaskAttributes
+from gooddata_flight_server.tasks.thread_task_executor import ThreadTaskExecutor
+from prometheus_client import REGISTRY
+
+
+class _RecordingSpan:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, Any]]] = []
+
+    def add_event(self, name: str, attributes: dict[str, Any]) -> None:
+        self.events.append((name, attributes))
+
+
+def _slow_function(duration: float) -> None:
+    until = time.perf_counter() + duration
+    while time.perf_counter() < until:
+        sum(range(1000))
+
+
+def test_stack_profile_of_slow_code():
+    profiler = SlowTaskProfiler(threshold=0.05, mode=TaskProfilerMode.Stack, sample_interval=0.005)
+    span = _RecordingSpan()
+
+    with profiler.profile(span):  # type: ignore[arg-type]
+        _slow_function(0.3)
+
+    assert len(span.events) == 1
+    name, attributes = span.events[0]
+    assert name == TaskAttributes.TaskProfile
+    assert attributes[TaskAttributes.TaskProfileMode] == "stack"
+    assert attributes[TaskAttributes.TaskProfileDuration] >= 0.3
+    assert attributes[TaskAttributes.TaskProfileSamples] > 0
+    assert "_slow_function" in attributes[TaskAttributes.TaskProfileData]
+
+
+def test_fast_code_not_profiled():
+    for mode in TaskProfilerMode:
+        profiler = SlowTaskProfiler(threshold=1, mode=mode)
+        span = _RecordingSpan()
+
+        with profiler.profile(span):  # type: ignore[arg-type]
+            _slow_function(0.01)
+
+        assert span.events == []
+
+
+def test_cprofile_of_slow_code():
+    profiler = SlowTaskProfiler(threshold=0.05, mode=TaskProfilerMode.CProfile)
+    span = _RecordingSpan()
+
+    with profiler.profile(span):  # type: ignore[arg-type]
+        _slow_function(0.1)
+
+    assert len(span.events) == 1
+    _, attributes = span.events[0]
+    assert attributes[TaskAttributes.TaskProfileMode] == "cprofile"
+    assert "_slow_function" in attributes[TaskAttributes.TaskProfileData]
+
+
+class _SlowTask(Task):
+    def __init__(self, duration: float) -> None:
+        super().__init__(cmd=b"", cancellable=True, task_id=None)
+        self.duration = duration
+
+    @property
+    def metric_label(self) -> str:
+        return "slow_fun"
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        _slow_function(self.duration)
+
+        return FlightDataTaskResult.for_table(pyarrow.table({"col1": [1, 2, 3]}))
+
+
+def test_executor_metrics_and_profiling():
+    executor = ThreadTaskExecutor(
+        metric_prefix="test_profiled",
+        task_threads=1,
+        profiler=SlowTaskProfiler(threshold=0.05),
+    )
+
+    try:
+        tasks = [_SlowTask(0.01), _SlowTask(0.1)]
+        for task in tasks:
+            executor.submit(task)
+
+        results = [executor.wait_for_result(task.task_id, timeout=10) for task in tasks]
+        assert all(result is not None and result.metric_label == "slow_fun" for result in results)
+
+        labels = {"task": "slow_fun"}
+        assert REGISTRY.get_sample_value("test_profiled_task_run_seconds_count", labels) == 2
+        assert REGISTRY.get_sample_value("test_profiled_task_wait_seconds_count", labels) == 2
+        assert REGISTRY.get_sample_value("test_profiled_task_slow_total", labels) == 1
+
+        assert results[0] is not None
+        executor.record_result_sent(results[0], duration=0.5, rows=3, nbytes=24)
+        assert REGISTRY.get_sample_value("test_profiled_result_rows_sum", labels) == 3
+        assert REGISTRY.get_sample_value("test_profiled_result_bytes_sum", labels) == 24
+        assert REGISTRY.get_sample_value("test_profiled_do_get_stream_seconds_sum", labels) == 0.5
+    finally:
+        executor.stop()
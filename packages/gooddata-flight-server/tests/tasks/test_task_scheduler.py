@@ -0,0 +1,206 @@
+#  (C) 2026 GoodData Corporation
+import threading
+from typing import Optional, Union
+
+import pyarrow.flight
+import pytest
+from gooddata_flight_server import (
+    ErrorCode,
+    ErrorInfo,
+    FairTaskScheduler,
+    FlightDataTaskResult,
+    Task,
+    TaskError,
+    TaskResult,
+    task_tenant,
+)
+from gooddata_flight_server.config.config import read_config
+from gooddata_flight_server.tasks.thread_task_executor import ThreadTaskExecutor
+
+from tests.config.test_config import _config_file
+
+_TEST_TABLE = pyarrow.table({"col1": list(range(10))})
+
+
+class _SchedTask(Task):
+    def __init__(
+        self,
+        name: str,
+        tenant: Optional[str] = None,
+        priority: int = 0,
+        group: Optional[str] = None,
+        ran: Optional[list[str]] = None,
+        gate: Optional[threading.Event] = None,
+    ) -> None:
+        super().__init__(cmd=name.encode(), cancellable=True, task_id=None)
+        self.name = name
+        self._tenant = tenant
+        self._priority = priority
+        self._group = group
+        self.ran = ran
+        self.gate = gate
+
+    @property
+    def tenant(self) -> Optional[str]:
+        return self._tenant
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    @property
+    def concurrency_group(self) -> Optional[str]:
+        return self._group
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        if self.gate is not None:
+            self.gate.wait()
+        if self.ran is not None:
+            self.ran.append(self.name)
+
+        return FlightDataTaskResult.for_table(_TEST_TABLE)
+
+
+def _drain(scheduler: FairTaskScheduler, *tasks: _SchedTask) -> list[str]:
+    for task in tasks:
+        scheduler.admit(task)
+        scheduler.push(task)
+
+    order = []
+    while (task := scheduler.pop()) is not None:
+        order.append(task.name)
+        scheduler.done(task)
+
+    return order
+
+
+def test_tenants_take_turns():
+    scheduler = FairTaskScheduler()
+
+    order = _drain(
+        scheduler,
+        _SchedTask("a1", tenant="a"),
+        _SchedTask("a2", tenant="a"),
+        _SchedTask("a3", tenant="a"),
+        _SchedTask("b1", tenant="b"),
+        _SchedTask("c1", tenant="c"),
+        _SchedTask("b2", tenant="b"),
+    )
+
+    assert order == ["a1", "b1", "c1", "a2", "b2", "a3"]
+    assert scheduler.queue_size == 0
+
+
+def test_higher_priority_first():
+    scheduler = FairTaskScheduler()
+
+    order = _drain(
+        scheduler,
+        _SchedTask("a1", tenant="a"),
+        _SchedTask("a2", tenant="a", priority=5),
+        _SchedTask("b1", tenant="b", priority=1),
+        _SchedTask("a3", tenant="a", priority=5),
+    )
+
+    assert order == ["a2", "a3", "b1", "a1"]
+
+
+def test_group_concurrency_limit():
+    scheduler = FairTaskScheduler(max_group_concurrency=1)
+    tasks = [_SchedTask("f1", group="f"), _SchedTask("f2", group="f"), _SchedTask("g1", group="g")]
+    for task in tasks:
+        scheduler.admit(task)
+        scheduler.push(task)
+
+    assert scheduler.pop() is tasks[0]
+    # f2 must wait until f1 finishes; g1 may run meanwhile
+    assert scheduler.pop() is tasks[2]
+    assert scheduler.pop() is None
+
+    scheduler.done(tasks[0])
+    assert scheduler.pop() is tasks[1]
+
+
+def test_admission_control():
+    scheduler = FairTaskScheduler(max_queue_size=3, max_tenant_queue_size=2)
+    scheduler.admit(_SchedTask("a1", tenant="a"))
+    scheduler.admit(_SchedTask("a2", tenant="a"))
+
+    with pytest.raises(pyarrow.flight.FlightUnavailableError) as e:
+        scheduler.admit(_SchedTask("a3", tenant="a"))
+    assert ErrorInfo.from_pyarrow_error(e.value).code == ErrorCode.BACKPRESSURE
+
+    scheduler.admit(_SchedTask("b1", tenant="b"))
+    with pytest.raises(pyarrow.flight.FlightUnavailableError):
+        scheduler.admit(_SchedTask("c1", tenant="c"))
+
+
+def test_remove_queued():
+    scheduler = FairTaskScheduler(max_queue_size=2)
+    tasks = [_SchedTask("a1", tenant="a"), _SchedTask("a2", tenant="a", priority=1)]
+    for task in tasks:
+        scheduler.admit(task)
+        scheduler.push(task)
+
+    assert scheduler.remove(tasks[0]) is True
+    assert scheduler.remove(tasks[0]) is False
+    assert scheduler.queue_size == 1
+
+    # removed task frees its place in the queue
+    scheduler.admit(_SchedTask("b1", tenant="b"))
+    assert scheduler.pop() is tasks[1]
+
+
+def test_task_tenant():
+    _, config = read_config((_config_file("sample-config.toml"),))
+
+    assert task_tenant(config, {"x-tenant-id": ["t1"], "authorization": ["Bearer abc"]}) == "t1"
+    assert task_tenant(config, {"authorization": ["Bearer abc"]}) == task_tenant(
+        config, {"authorization": ["Bearer abc"]}
+    )
+    assert task_tenant(config, {"authorization": ["Bearer abc"]}) != task_tenant(
+        config, {"authorization": ["Bearer xyz"]}
+    )
+    assert "abc" not in task_tenant(config, {"authorization": ["Bearer abc"]})
+    assert task_tenant(config, {}) is None
+
+
+def test_executor_with_fair_scheduler():
+    executor = ThreadTaskExecutor(
+        metric_prefix="test_sched",
+        task_threads=1,
+        scheduler=FairTaskScheduler(max_tenant_queue_size=3),
+    )
+    gate = threading.Event()
+    ran: list[str] = []
+
+    try:
+        blocking = _SchedTask("block", tenant="a", gate=gate, ran=ran)
+        executor.submit(blocking)
+
+        busy = [_SchedTask(f"a{i}", tenant="a", ran=ran) for i in range(3)]
+        for task in busy:
+            executor.submit(task)
+
+        # the tenant has too many tasks waiting
+        with pytest.raises(pyarrow.flight.FlightUnavailableError):
+            executor.submit(_SchedTask("a3", tenant="a", ran=ran))
+
+        other = _SchedTask("b0", tenant="b", ran=ran)
+        executor.submit(other)
+
+        # cancelled task leaves the queue and never runs
+        assert executor.cancel(busy[1].task_id) is True
+        assert executor.wait_for_result(busy[1].task_id, timeout=10).cancelled is True
+    finally:
+        gate.set()
+
+    for task in [blocking, busy[0], busy[2], other]:
+        result = executor.wait_for_result(task.task_id, timeout=10)
+        assert result.error is None
+        assert result.cancelled is False
+
+    # tenant 'a' already had its turn with the blocking task
+    assert ran == ["block", "b0", "a0", "a2"]
+
+    executor.stop()
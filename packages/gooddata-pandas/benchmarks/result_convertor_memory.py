@@ -0,0 +1,156 @@
+# (C) 2026 GoodData Corporation
+"""
+Memory and throughput benchmark of convert_execution_response_to_dataframe accumulators.
+
+Compares the default list-based accumulator (optimized=False), the header-deduplicating accumulator
+(optimized=True) and the streaming accumulator (streaming=True) that preallocates the result and writes pages
+into it by offset. The execution response is a local stub that serves a pivot-like result: two attributes in rows,
+one attribute and the measure group in columns.
+
+Throughput is measured in a plain run; peak memory is measured in a separate run under tracemalloc (which slows
+the code down considerably). The peak includes the transient page payloads produced by the stub, which are the
+same for all the accumulators.
+
+Run with:
+
+    python benchmarks/result_convertor_memory.py --rows 50000 --col-values 4 --metrics 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Optional, Union
+
+from gooddata_pandas.result_convertor import convert_execution_response_to_dataframe
+from gooddata_sdk import ExecutionResult
+
+
+class _StubResultCacheMetadata:
+    def check_bytes_size_limit(self, result_size_bytes_limit: Optional[int] = None) -> None:
+        pass
+
+
+class _StubExecutionResponse:
+    def __init__(self, rows: int, col_values: int, metrics: int) -> None:
+        self._rows = rows
+        self._col_values = col_values
+        self._metrics = metrics
+        self.dimensions = [
+            {
+                "localIdentifier": "dim_0",
+                "headers": [
+                    {"attributeHeader": {"labelName": "Row A", "localIdentifier": "a"}},
+                    {"attributeHeader": {"labelName": "Row B", "localIdentifier": "b"}},
+                ],
+            },
+            {
+                "localIdentifier": "dim_1",
+                "headers": [
+                    {"attributeHeader": {"labelName": "Col C", "localIdentifier": "c"}},
+                    {
+                        "measureGroupHeaders": [
+                            {"localIdentifier": f"m{idx}", "name": f"Metric {idx}"} for idx in range(metrics)
+                        ]
+                    },
+                ],
+            },
+        ]
+
+    @staticmethod
+    def _attribute_header(value: str) -> dict[str, Any]:
+        return {"attributeHeader": {"labelValue": value, "primaryLabelValue": value}}
+
+    def read_result(
+        self,
+        limit: Union[int, list[int]],
+        offset: Union[None, int, list[int]] = None,
+        timeout: Optional[Union[int, float, tuple]] = None,
+    ) -> ExecutionResult:
+        assert isinstance(offset, list) and isinstance(limit, list)
+        total_cols = self._col_values * self._metrics
+        rows = range(offset[0], min(offset[0] + limit[0], self._rows))
+        cols = range(offset[1], min(offset[1] + limit[1], total_cols))
+
+        return ExecutionResult(
+            {
+                "data": [[float(row * total_cols + col) for col in cols] for row in rows],
+                "dimension_headers": [
+                    {
+                        "headerGroups": [
+                            {"headers": [self._attribute_header(f"a{row // 100}") for row in rows]},
+                            {"headers": [self._attribute_header(f"b{row % 100}") for row in rows]},
+                        ]
+                    },
+                    {
+                        "headerGroups": [
+                            {"headers": [self._attribute_header(f"c{col // self._metrics}") for col in cols]},
+                            {"headers": [{"measureHeader": {"measureIndex": col % self._metrics}} for col in cols]},
+                        ]
+                    },
+                ],
+                "grand_totals": [],
+                "paging": {
+                    "count": [len(rows), len(cols)],
+                    "offset": offset,
+                    "total": [self._rows, total_cols],
+                },
+                "metadata": {},
+            }
+        )
+
+
+_MODES = {
+    "optimized=False": dict(optimized=False),
+    "optimized=True": dict(optimized=True),
+    "streaming=True": dict(streaming=True),
+}
+
+
+def _convert(args: argparse.Namespace, mode: dict[str, bool]) -> tuple[int, int]:
+    df, _ = convert_execution_response_to_dataframe(
+        execution_response=_StubExecutionResponse(args.rows, args.col_values, args.metrics),  # type: ignore[arg-type]
+        result_cache_metadata=_StubResultCacheMetadata(),  # type: ignore[arg-type]
+        label_overrides={},
+        result_size_dimensions_limits=(),
+        page_size=args.page_size,
+        **mode,
+    )
+
+    return df.shape
+
+
+def _run(args: argparse.Namespace, mode: dict[str, bool]) -> tuple[float, int, tuple[int, int]]:
+    gc.collect()
+    start = time.perf_counter()
+    shape = _convert(args, mode)
+    duration = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    _convert(args, mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return duration, peak, shape
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--col-values", type=int, default=4)
+    parser.add_argument("--metrics", type=int, default=5)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'mode':>16} {'shape':>14} {'seconds':>9} {'cells/s':>12} {'peak MiB':>9}")
+    for name, mode in _MODES.items():
+        duration, peak, shape = _run(args, mode)
+        cells = shape[0] * shape[1]
+        print(f"{name:>16} {str(shape):>14} {duration:>9.3f} {cells / duration:>12,.0f} {peak / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
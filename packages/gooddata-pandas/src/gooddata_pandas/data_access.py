@@ -14,9 +14,10 @@ from gooddata_sdk import (
     Metric,
     MetricValueFilter,
     ObjId,
+    PagingPolicy,
     TableDimension,
 )
-from gooddata_sdk.utils import IdObjType
+from gooddata_sdk.utils import IdObjType, id_obj_to_key
 
 from gooddata_pandas.utils import (
     ColumnsDef,
@@ -329,26 +330,45 @@ def _extract_for_metrics_only(execution: Execution, cols: list, col_to_metric_id
     return {col: [result.data[col_to_metric_idx[col]]] for col in cols}
 
 
-def _find_attribute(attributes: list[CatalogAttribute], id_obj: IdObjType) -> Union[CatalogAttribute, None]:
+def _label_attribute_index(attributes: list[CatalogAttribute]) -> dict[str, CatalogAttribute]:
+    """
+    Internal function that maps keys of labels to the catalog attributes they belong to.
+
+    Args:
+        attributes (list[CatalogAttribute]): The catalog of attributes.
+
+    Returns:
+        dict[str, CatalogAttribute]: Mapping of label keys ('label/some.label.id') to attributes.
+    """
+    index: dict[str, CatalogAttribute] = {}
     for attribute in attributes:
-        if attribute.find_label(id_obj) is not None:
-            return attribute
-    return None
+        for label in attribute.labels:
+            # first attribute wins, the same way as when searching the catalog
+            index.setdefault(str(label.obj_id), attribute)
+    return index
+
+
+def _find_attribute(
+    attributes_by_label: dict[str, CatalogAttribute], id_obj: IdObjType
+) -> Union[CatalogAttribute, None]:
+    return attributes_by_label.get(id_obj_to_key(id_obj))
 
 
-def _typed_result(attributes: list[CatalogAttribute], attribute: Attribute, result_values: list[Any]) -> list[Any]:
+def _typed_result(
+    attributes_by_label: dict[str, CatalogAttribute], attribute: Attribute, result_values: list[Any]
+) -> list[Any]:
     """
     Internal function to convert result_values to proper data types.
 
     Args:
-        attributes (list[CatalogAttribute]): The catalog of attributes.
+        attributes_by_label (dict[str, CatalogAttribute]): The catalog of attributes indexed by label keys.
         attribute (Attribute): The attribute for which the typed result will be computed.
         result_values (list[Any]): A list of raw values.
 
     Returns:
         list[Any]: A list of converted values with proper data types.
     """
-    catalog_attribute = _find_attribute(attributes, attribute.label)
+    catalog_attribute = _find_attribute(attributes_by_label, attribute.label)
     if catalog_attribute is None:
         raise ValueError(f"Unable to find attribute {attribute.label} in catalog")
     return [_typed_attribute_value(catalog_attribute, value) for value in result_values]
@@ -362,6 +382,7 @@ def _extract_from_attributes_and_maybe_metrics(
     col_to_metric_idx: dict[str, int],
     index_to_attr_idx: Optional[dict[str, int]] = None,
     result_page_len: Optional[int] = None,
+    paging: Optional[PagingPolicy] = None,
 ) -> tuple[dict, dict]:
     """
     Internal function that extracts data from execution response with attributes columns and
@@ -377,6 +398,8 @@ def _extract_from_attributes_and_maybe_metrics(
             An optional mapping of pandas index names to attribute dimension indices.
         result_page_len (Optional[int]): Optional page size for result pagination.
             Defaults to _RESULT_PAGE_LEN (1000). Larger values can improve performance for large result sets.
+        paging (Optional[PagingPolicy]): Optional policy adapting the page size to observed latency and
+            payload size of the pages. Takes precedence over `result_page_len`.
 
     Returns:
         tuple: A tuple containing the following dictionaries:
@@ -385,16 +408,19 @@ def _extract_from_attributes_and_maybe_metrics(
     """
     exec_def = execution.exec_def
     offset = [0 for _ in exec_def.dimensions]
-    page_len = result_page_len if result_page_len is not None else _RESULT_PAGE_LEN
-    limit = [len(exec_def.metrics), page_len] if exec_def.has_metrics() else [page_len]
+    if paging is None:
+        paging = PagingPolicy.fixed(result_page_len if result_page_len is not None else _RESULT_PAGE_LEN)
+    limit = [len(exec_def.metrics), paging.limit] if exec_def.has_metrics() else [paging.limit]
     attribute_dim = 1 if exec_def.has_metrics() else 0
-    result = execution.read_result(limit=limit, offset=offset)
+    result = paging.read(execution.read_result, offset=offset, limit=limit, dim=attribute_dim)
     safe_index_to_attr_idx = index_to_attr_idx if index_to_attr_idx is not None else dict()
 
     # mappings from column name to Attribute
     index_to_attribute = {index_name: exec_def.attributes[i] for index_name, i in safe_index_to_attr_idx.items()}
     col_to_attribute = {col: exec_def.attributes[i] for col, i in col_to_attr_idx.items()}
 
+    attributes_by_label = _label_attribute_index(attributes)
+
     # datastructures to return
     index: dict[str, list[Any]] = {idx_name: [] for idx_name in safe_index_to_attr_idx}
     data: dict[str, list[Any]] = {col: [] for col in cols}
@@ -403,19 +429,20 @@ def _extract_from_attributes_and_maybe_metrics(
         for idx_name in index:
             rs = result.get_all_header_values(attribute_dim, safe_index_to_attr_idx[idx_name])
             attribute = index_to_attribute[idx_name]
-            index[idx_name] += _typed_result(attributes, attribute, rs)
+            index[idx_name] += _typed_result(attributes_by_label, attribute, rs)
         for col in cols:
             if col in col_to_attr_idx:
                 rs = result.get_all_header_values(attribute_dim, col_to_attr_idx[col])
                 attribute = col_to_attribute[col]
-                data[col] += _typed_result(attributes, attribute, rs)
+                data[col] += _typed_result(attributes_by_label, attribute, rs)
             elif col_to_metric_idx[col] < len(result.data):
                 data[col] += result.data[col_to_metric_idx[col]]
         if result.is_complete(attribute_dim):
             break
 
         offset[attribute_dim] = result.next_page_start(attribute_dim)
-        result = execution.read_result(limit=limit, offset=offset)
+        limit[attribute_dim] = paging.limit
+        result = paging.read(execution.read_result, offset=offset, limit=limit, dim=attribute_dim)
 
     return data, index
 
@@ -429,6 +456,7 @@ def compute_and_extract(
     on_execution_submitted: Optional[Callable[[Execution], None]] = None,
     is_cancellable: bool = False,
     result_page_len: Optional[int] = None,
+    paging: Optional[PagingPolicy] = None,
 ) -> tuple[dict, dict]:
     """
     Convenience function that computes and extracts data from the execution response.
@@ -445,6 +473,8 @@ def compute_and_extract(
             the connection is interrupted.
         result_page_len (Optional[int]): Optional page size for result pagination.
             Defaults to 1000. Larger values can improve performance for large result sets.
+        paging (Optional[PagingPolicy]): Optional policy adapting the page size to observed latency and
+            payload size of the pages. Takes precedence over `result_page_len`.
 
     Returns:
         tuple: A tuple containing the following dictionaries:
@@ -483,4 +513,5 @@ def compute_and_extract(
             col_to_metric_idx,
             index_to_attr_idx,
             result_page_len=result_page_len,
+            paging=paging,
         )
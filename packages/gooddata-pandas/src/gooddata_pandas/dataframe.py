@@ -12,6 +12,7 @@ from gooddata_sdk import (
     ExecutionDefinition,
     Filter,
     GoodDataSdk,
+    PagingPolicy,
     ResultCacheMetadata,
     ResultSizeDimensions,
 )
@@ -51,6 +52,8 @@ class DataFrameFactory:
         - for_exec_def(self, exec_def: ExecutionDefinition, label_overrides: Optional[LabelOverrides] = None,
             result_size_dimensions_limits: ResultSizeDimensions = (), result_size_bytes_limit: Optional[int] = None,
             page_size: int = _DEFAULT_PAGE_SIZE,) -> Tuple[pandas.DataFrame, DataFrameMetadata]:
+        - for_exec_defs(self, exec_defs: list[ExecutionDefinition], max_concurrency: int = 4, ...)
+            -> list[Tuple[pandas.DataFrame, DataFrameMetadata]]:
         - for_exec_result_id(self, result_id: str, label_overrides: Optional[LabelOverrides] = None,
             result_cache_metadata: Optional[ResultCacheMetadata] = None,
             result_size_dimensions_limits: ResultSizeDimensions = (),
@@ -76,6 +79,7 @@ class DataFrameFactory:
         on_execution_submitted: Optional[Callable[[Execution], None]] = None,
         is_cancellable: bool = False,
         result_page_len: Optional[int] = None,
+        paging: Optional[PagingPolicy] = None,
     ) -> pandas.DataFrame:
         """
         Creates a data frame indexed by values of the label. The data frame columns will be created from either
@@ -93,6 +97,8 @@ class DataFrameFactory:
             is_cancellable (bool, optional): Whether the execution should be cancelled when the connection is interrupted.
             result_page_len (Optional[int]): Optional page size for result pagination.
                 Defaults to 1000. Larger values can improve performance for large result sets.
+            paging (Optional[PagingPolicy]): Optional policy adapting the page size to observed latency and
+                payload size of the pages. Takes precedence over `result_page_len`.
 
         Returns:
             pandas.DataFrame: A DataFrame instance.
@@ -106,6 +112,7 @@ class DataFrameFactory:
             on_execution_submitted=on_execution_submitted,
             is_cancellable=is_cancellable,
             result_page_len=result_page_len,
+            paging=paging,
         )
 
         _idx = make_pandas_index(index)
@@ -119,6 +126,7 @@ class DataFrameFactory:
         on_execution_submitted: Optional[Callable[[Execution], None]] = None,
         is_cancellable: bool = False,
         result_page_len: Optional[int] = None,
+        paging: Optional[PagingPolicy] = None,
     ) -> pandas.DataFrame:
         """
         Creates a data frame with columns created from metrics and or labels.
@@ -132,6 +140,8 @@ class DataFrameFactory:
             is_cancellable (bool, optional): Whether the execution should be cancelled when the connection is interrupted.
             result_page_len (Optional[int]): Optional page size for result pagination.
                 Defaults to 1000. Larger values can improve performance for large result sets.
+            paging (Optional[PagingPolicy]): Optional policy adapting the page size to observed latency and
+                payload size of the pages. Takes precedence over `result_page_len`.
 
         Returns:
             pandas.DataFrame: A DataFrame instance.
@@ -145,6 +155,7 @@ class DataFrameFactory:
             on_execution_submitted=on_execution_submitted,
             is_cancellable=is_cancellable,
             result_page_len=result_page_len,
+            paging=paging,
         )
 
         return pandas.DataFrame(data=data)
@@ -157,6 +168,7 @@ class DataFrameFactory:
         on_execution_submitted: Optional[Callable[[Execution], None]] = None,
         is_cancellable: bool = False,
         result_page_len: Optional[int] = None,
+        paging: Optional[PagingPolicy] = None,
     ) -> pandas.DataFrame:
         """
         Creates a data frame for named items. This is a convenience method that will create DataFrame with or
@@ -173,6 +185,8 @@ class DataFrameFactory:
             is_cancellable (bool, optional): Whether the execution should be cancelled when the connection is interrupted.
             result_page_len (Optional[int]): Optional page size for result pagination.
                 Defaults to 1000. Larger values can improve performance for large result sets.
+            paging (Optional[PagingPolicy]): Optional policy adapting the page size to observed latency and
+                payload size of the pages. Takes precedence over `result_page_len`.
 
         Returns:
             pandas.DataFrame: A DataFrame instance.
@@ -199,6 +213,7 @@ class DataFrameFactory:
                 columns=columns,
                 filter_by=filter_by,
                 result_page_len=result_page_len,
+                paging=paging,
             )
 
         return self.indexed(
@@ -208,6 +223,7 @@ class DataFrameFactory:
             on_execution_submitted=on_execution_submitted,
             is_cancellable=is_cancellable,
             result_page_len=result_page_len,
+            paging=paging,
         )
 
     def for_visualization(
@@ -217,6 +233,7 @@ class DataFrameFactory:
         on_execution_submitted: Optional[Callable[[Execution], None]] = None,
         is_cancellable: bool = False,
         result_page_len: Optional[int] = None,
+        paging: Optional[PagingPolicy] = None,
     ) -> pandas.DataFrame:
         """
         Creates a data frame with columns based on the content of the visualization with the provided identifier.
@@ -230,6 +247,8 @@ class DataFrameFactory:
             is_cancellable (bool, optional): Whether the execution should be cancelled when the connection is interrupted.
             result_page_len (Optional[int]): Optional page size for result pagination.
                 Defaults to 1000. Larger values can improve performance for large result sets.
+            paging (Optional[PagingPolicy]): Optional policy adapting the page size to observed latency and
+                payload size of the pages. Takes precedence over `result_page_len`.
 
         Returns:
             pandas.DataFrame: A DataFrame instance.
@@ -251,6 +270,7 @@ class DataFrameFactory:
             on_execution_submitted=on_execution_submitted,
             is_cancellable=is_cancellable,
             result_page_len=result_page_len,
+            paging=paging,
         )
 
     def for_created_visualization(
@@ -260,6 +280,7 @@ class DataFrameFactory:
         is_cancellable: bool = False,
         optimized: bool = False,
         grand_totals_position: Optional[Literal["pinnedBottom", "pinnedTop", "bottom", "top"]] = "bottom",
+        streaming: bool = False,
     ) -> tuple[pandas.DataFrame, DataFrameMetadata]:
         """
         Creates a data frame using a created visualization.
@@ -276,6 +297,9 @@ class DataFrameFactory:
             grand_totals_position (Literal["pinnedBottom", "pinnedTop", "bottom", "top"], optional):
                 Position where grand totals should be placed. "pinnedBottom" and "bottom" append totals,
                 "pinnedTop" and "top" prepend totals. Defaults to "bottom".
+            streaming (bool, default=False): Use streaming accumulator if True; the result is written page by page
+                into a preallocated float64 block and headers are kept as integer codes, so the peak memory stays
+                close to the size of the resulting DataFrame. All metric columns are float64 in this mode.
 
         Returns:
             pandas.DataFrame: A DataFrame instance.
@@ -288,6 +312,7 @@ class DataFrameFactory:
             on_execution_submitted=on_execution_submitted,
             optimized=optimized,
             grand_totals_position=grand_totals_position,
+            streaming=streaming,
         )
 
     def result_cache_metadata_for_exec_result_id(self, result_id: str) -> ResultCacheMetadata:
@@ -308,10 +333,13 @@ class DataFrameFactory:
         label_overrides: Optional[LabelOverrides] = None,
         result_size_dimensions_limits: ResultSizeDimensions = (),
         result_size_bytes_limit: Optional[int] = None,
-        page_size: int = _DEFAULT_PAGE_SIZE,
+        page_size: Optional[int] = _DEFAULT_PAGE_SIZE,
         on_execution_submitted: Optional[Callable[[Execution], None]] = None,
         optimized: bool = False,
         grand_totals_position: Optional[Literal["pinnedBottom", "pinnedTop", "bottom", "top"]] = "bottom",
+        streaming: bool = False,
+        fetch_parallelism: int = 1,
+        paging: Optional[PagingPolicy] = None,
     ) -> tuple[pandas.DataFrame, DataFrameMetadata]:
         """
         Creates a data frame using an execution definition.
@@ -341,7 +369,8 @@ class DataFrameFactory:
             label_overrides (Optional[LabelOverrides]): Label overrides for metrics and attributes.
             result_size_dimensions_limits (ResultSizeDimensions): A tuple containing maximum size of result dimensions.
             result_size_bytes_limit (Optional[int]): Maximum size of result in bytes.
-            page_size (int): Number of records per page.
+            page_size (Optional[int]): Number of records per page in all dimensions. If None, shape of the pages
+                is derived from the size of the result in bytes.
             on_execution_submitted (Optional[Callable[[Execution], None]]): Callback to call when the execution was
                 submitted to the backend.
             optimized (bool, default=False): Use memory optimized accumulator if True; by default, the accumulator stores
@@ -351,6 +380,13 @@ class DataFrameFactory:
             grand_totals_position (Literal["pinnedBottom", "pinnedTop", "bottom", "top"], optional):
                 Position where grand totals should be placed. "pinnedBottom" and "bottom" append totals,
                 "pinnedTop" and "top" prepend totals. Defaults to "bottom".
+            streaming (bool, default=False): Use streaming accumulator if True; the result is written page by page
+                into a preallocated float64 block and headers are kept as integer codes, so the peak memory stays
+                close to the size of the resulting DataFrame. All metric columns are float64 in this mode.
+            fetch_parallelism (int, default=1): Maximum number of result pages read concurrently. The pages are
+                still assembled in order.
+            paging (Optional[PagingPolicy]): Optional policy adapting number of rows read at once to the observed
+                latency and payload size of the pages.
 
         Returns:
             Tuple[pandas.DataFrame, DataFrameMetadata]: Tuple holding DataFrame and DataFrame metadata.
@@ -373,8 +409,71 @@ class DataFrameFactory:
             page_size=page_size,
             optimized=optimized,
             grand_totals_position=grand_totals_position,
+            streaming=streaming,
+            fetch_parallelism=fetch_parallelism,
+            paging=paging,
         )
 
+    def for_exec_defs(
+        self,
+        exec_defs: list[ExecutionDefinition],
+        max_concurrency: int = 4,
+        label_overrides: Optional[LabelOverrides] = None,
+        result_size_dimensions_limits: ResultSizeDimensions = (),
+        result_size_bytes_limit: Optional[int] = None,
+        page_size: Optional[int] = _DEFAULT_PAGE_SIZE,
+        optimized: bool = False,
+        grand_totals_position: Optional[Literal["pinnedBottom", "pinnedTop", "bottom", "top"]] = "bottom",
+        streaming: bool = False,
+    ) -> list[tuple[pandas.DataFrame, DataFrameMetadata]]:
+        """
+        Creates data frames for multiple execution definitions. The computations are submitted together and the
+        results are read concurrently, at most `max_concurrency` requests at a time.
+
+        When creating any of the data frames fails, the computations that are still running are cancelled (if they
+        are cancellable) and the error is raised.
+
+        Args:
+            exec_defs (list[ExecutionDefinition]): Execution definitions.
+            max_concurrency (int, default=4): Maximum number of concurrent requests.
+            label_overrides (Optional[LabelOverrides]): Label overrides for metrics and attributes; shared by all
+                data frames.
+            result_size_dimensions_limits (ResultSizeDimensions): A tuple containing maximum size of result dimensions.
+            result_size_bytes_limit (Optional[int]): Maximum size of each result in bytes.
+            page_size (Optional[int]): Number of records per page in all dimensions. If None, shape of the pages
+                is derived from the size of the result in bytes.
+            optimized (bool, default=False): Use memory optimized accumulator if True.
+            grand_totals_position (Literal["pinnedBottom", "pinnedTop", "bottom", "top"], optional):
+                Position where grand totals should be placed. Defaults to "bottom".
+            streaming (bool, default=False): Use streaming accumulator if True.
+
+        Returns:
+            list[Tuple[pandas.DataFrame, DataFrameMetadata]]: Data frames and their metadata in the order of the
+            execution definitions.
+        """
+        if label_overrides is None:
+            label_overrides = {}
+
+        def _convert(execution: Execution) -> tuple[pandas.DataFrame, DataFrameMetadata]:
+            return convert_execution_response_to_dataframe(
+                execution_response=execution.bare_exec_response,
+                result_cache_metadata=self.result_cache_metadata_for_exec_result_id(execution.result_id),
+                label_overrides=label_overrides,
+                result_size_dimensions_limits=result_size_dimensions_limits,
+                result_size_bytes_limit=result_size_bytes_limit,
+                page_size=page_size,
+                optimized=optimized,
+                grand_totals_position=grand_totals_position,
+                streaming=streaming,
+            )
+
+        with self._sdk.compute.for_exec_defs(
+            workspace_id=self._workspace_id, exec_defs=exec_defs, max_concurrency=max_concurrency
+        ) as batch:
+            frames = dict(batch.map(_convert))
+
+        return [frames[index] for index in range(len(exec_defs))]
+
     def for_exec_result_id(
         self,
         result_id: str,
@@ -384,9 +483,12 @@ class DataFrameFactory:
         result_size_bytes_limit: Optional[int] = None,
         use_local_ids_in_headers: bool = False,
         use_primary_labels_in_attributes: bool = False,
-        page_size: int = _DEFAULT_PAGE_SIZE,
+        page_size: Optional[int] = _DEFAULT_PAGE_SIZE,
         optimized: bool = False,
         grand_totals_position: Optional[Literal["pinnedBottom", "pinnedTop", "bottom", "top"]] = "bottom",
+        streaming: bool = False,
+        fetch_parallelism: int = 1,
+        paging: Optional[PagingPolicy] = None,
     ) -> tuple[pandas.DataFrame, DataFrameMetadata]:
         """
             Retrieves a DataFrame and DataFrame metadata for a given execution result identifier.
@@ -416,7 +518,8 @@ class DataFrameFactory:
             result_size_bytes_limit (Optional[int]): Maximum size of the result in bytes.
             use_local_ids_in_headers (bool): Use local identifier in headers.
             use_primary_labels_in_attributes (bool): Use primary labels in attributes.
-            page_size (int): Number of records per page.
+            page_size (Optional[int]): Number of records per page in all dimensions. If None, shape of the pages
+                is derived from the size of the result in bytes.
             optimized (bool, default=False): Use memory optimized accumulator if True; by default, the accumulator stores
                 headers in memory as lists of dicts, which can consume a lot of memory for large results.
                 Optimized accumulator stores only unique values and story only reference to them in the list,
@@ -424,6 +527,13 @@ class DataFrameFactory:
             grand_totals_position (Literal["pinnedBottom", "pinnedTop", "bottom", "top"], optional):
                 Position where grand totals should be placed. "pinnedBottom" and "bottom" append totals,
                 "pinnedTop" and "top" prepend totals. Defaults to "bottom".
+            streaming (bool, default=False): Use streaming accumulator if True; the result is written page by page
+                into a preallocated float64 block and headers are kept as integer codes, so the peak memory stays
+                close to the size of the resulting DataFrame. All metric columns are float64 in this mode.
+            fetch_parallelism (int, default=1): Maximum number of result pages read concurrently. The pages are
+                still assembled in order.
+            paging (Optional[PagingPolicy]): Optional policy adapting number of rows read at once to the observed
+                latency and payload size of the pages.
 
         Returns:
             Tuple[pandas.DataFrame, DataFrameMetadata]: Tuple holding DataFrame and DataFrame metadata.
@@ -451,4 +561,7 @@ class DataFrameFactory:
             page_size=page_size,
             optimized=optimized,
             grand_totals_position=grand_totals_position,
+            streaming=streaming,
+            fetch_parallelism=fetch_parallelism,
+            paging=paging,
         )
@@ -1,14 +1,31 @@
 # (C) 2022 GoodData Corporation
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Iterator
-from functools import cached_property
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property, partial
+from itertools import islice
+from math import prod
 from typing import Any, Callable, Literal, Optional, Union, cast
 
+import numpy
 import pandas
 from attrs import define, field, frozen
-from gooddata_sdk import BareExecutionResponse, ExecutionResult, ResultCacheMetadata, ResultSizeDimensions
+from gooddata_sdk import (
+    BareExecutionResponse,
+    ExecutionResult,
+    PagingPolicy,
+    ResultCacheMetadata,
+    ResultSizeDimensions,
+)
 
 _DEFAULT_PAGE_SIZE = 100
+_TILE_TARGET_BYTES = 1024 * 1024
+"""
+Approximate size of a single result page (tile) that is targeted when the tile shape is derived from the result size.
+"""
+_MIN_TILE_EDGE = _DEFAULT_PAGE_SIZE
+_MAX_TILE_EDGE = 1000
 _DataHeaders = list[list[Any]]
 _DataArray = list[Union[int, None]]
 LabelOverrides = dict[str, dict[str, dict[str, str]]]
@@ -165,9 +182,73 @@ class _HeaderContainer:
 
 _DataHeaderContainers = list[_HeaderContainer]
 
-# Optimized version of _DataWithHeaders uses _HeaderContainer instead of list of headers
+
+@define
+class _CodedHeaders:
+    """
+    Headers of a single header level stored as integer codes pointing into a list of unique headers (categories).
+
+    Codes are preallocated for the whole dimension once its size is known and pages write into them by offset.
+    Unique headers are converted to labels just once, and the codes are then used to build the index directly,
+    without materializing per-row tuples.
+    """
+
+    codes: numpy.ndarray
+    categories: list[Optional[_Header]] = field(factory=list)
+    _category_codes: dict[Optional[_Header], int] = field(factory=dict)
+
+    @classmethod
+    def allocate(cls, size: int) -> "_CodedHeaders":
+        return cls(codes=numpy.full(size, -1, dtype=numpy.int32))
+
+    def _code(self, header_dict: dict) -> int:
+        header = _header_from_dict(header_dict)
+        code = self._category_codes.get(header)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(header)
+            self._category_codes[header] = code
+
+        return code
+
+    def write(self, offset: int, header_dicts: list[dict]) -> None:
+        """
+        Write headers into the level starting at the given offset.
+        """
+        self.codes[offset : offset + len(header_dicts)] = [self._code(header_dict) for header_dict in header_dicts]
+
+    def extend(self, header_dicts: list[dict]) -> None:
+        """
+        Append headers at the end of the level; this is used for the few grand total headers.
+        """
+        extension = numpy.array([self._code(header_dict) for header_dict in header_dicts], dtype=numpy.int32)
+        self.codes = numpy.concatenate([self.codes, extension])
+
+    def indexes_of(self, predicate: Callable[[Optional[_Header]], bool]) -> list[int]:
+        """
+        Returns positions of all headers in the level for which the predicate holds.
+        """
+        matching_codes = [code for code, header in enumerate(self.categories) if predicate(header)]
+        if not matching_codes:
+            return []
+
+        return numpy.flatnonzero(numpy.isin(self.codes, matching_codes)).tolist()
+
+    def __iter__(self) -> Iterator[Optional[_Header]]:
+        for code in self.codes:
+            yield self.categories[code]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+_DataCodedHeaders = list[_CodedHeaders]
+
+# Optimized version of _DataWithHeaders uses _HeaderContainer instead of list of headers,
+# streaming version uses _CodedHeaders
 _HeadersByAxis = tuple[
-    Union[_DataHeaders, _DataHeaderContainers], Union[Optional[_DataHeaders], Optional[_DataHeaderContainers]]
+    Union[_DataHeaders, _DataHeaderContainers, _DataCodedHeaders],
+    Union[Optional[_DataHeaders], Optional[_DataHeaderContainers], Optional[_DataCodedHeaders]],
 ]
 
 
@@ -176,8 +257,9 @@ class _DataWithHeaders:
     """Extracted data; either array of values for one-dimensional result or array of arrays of values.
 
     Attributes:
-        data (List[_DataArray]):
+        data (Union[List[_DataArray], numpy.ndarray]):
             Extracted data; either array of values for one-dimensional result or array of arrays of values.
+            The streaming accumulator returns the data as one- or two-dimensional float64 numpy array.
         data_headers (_HeadersByAxis):
             Per-dimension headers for the data.
         grand_totals (Tuple[Optional[List[_DataArray]], Optional[List[_DataArray]]]):
@@ -186,7 +268,7 @@ class _DataWithHeaders:
             Per-dimension grand total headers.
     """
 
-    data: list[_DataArray]
+    data: Union[list[_DataArray], numpy.ndarray]
     data_headers: _HeadersByAxis
     grand_totals: tuple[Optional[list[_DataArray]], Optional[list[_DataArray]]]
     grand_total_headers: tuple[Optional[list[dict[str, _DataHeaders]]], Optional[list[dict[str, _DataHeaders]]]]
@@ -419,6 +501,90 @@ class _OptimizedAccumulatedData(_AbstractAccumulatedData):
         )
 
 
+@define
+class _StreamingAccumulatedData(_AbstractAccumulatedData):
+    """
+    Implementation of _AbstractAccumulatedData that preallocates the whole result once the first page reveals
+    its size and then writes each page into place by its offset.
+
+    Data is stored in a float64 numpy block; headers are stored as _CodedHeaders. Peak memory is therefore close
+    to the size of the final DataFrame, regardless of how the result is paged. Note that all metric values are
+    represented as float64, missing values become NaN.
+    """
+
+    block: Optional[numpy.ndarray] = field(init=False, default=None)
+
+    def _write_page(self, from_result: ExecutionResult) -> None:
+        if self.block is None:
+            self.block = numpy.full(tuple(from_result.paging_total), numpy.nan, dtype=numpy.float64)
+
+        if not all(from_result.paging_count):
+            return
+
+        page_slice = tuple(
+            slice(offset, offset + count) for offset, count in zip(from_result.paging_offset, from_result.paging_count)
+        )
+        self.block[page_slice] = numpy.asarray(from_result.data, dtype=numpy.float64)
+
+    def accumulate_data(self, from_result: ExecutionResult) -> None:
+        """
+        Write data of the page into the preallocated block. The block is allocated when the first page arrives.
+
+        Args:
+            from_result (ExecutionResult): The result whose data will be written into the block.
+        """
+        self._write_page(from_result)
+
+    def extend_existing_row_data(self, from_result: ExecutionResult) -> None:
+        """
+        Write data of the page into the preallocated block; rows are not extended, the page lands directly
+        on its position given by the page offset.
+
+        Args:
+            from_result (ExecutionResult): The result whose data will be written into the block.
+        """
+        self._write_page(from_result)
+
+    def accumulate_headers(self, from_result: ExecutionResult, from_dim: int) -> None:
+        """
+        Write headers for a particular dimension of a result into the coded header levels at the index
+        matching the dimension index. The levels are allocated when headers for the dimension arrive for
+        the first time.
+
+        Args:
+            from_result (ExecutionResult): The result whose headers will be accumulated.
+            from_dim (int): The dimension index.
+        """
+        header_groups = from_result.get_all_headers(dim=from_dim)
+
+        if self.data_headers[from_dim] is None:
+            size = from_result.paging_total[from_dim]
+            self.data_headers[from_dim] = [_CodedHeaders.allocate(size) for _ in header_groups]
+
+        levels = cast(_DataCodedHeaders, self.data_headers[from_dim])
+        offset = from_result.paging_offset[from_dim]
+        for idx, headers in enumerate(header_groups):
+            levels[idx].write(offset, headers)
+
+    def result(self) -> _DataWithHeaders:
+        """
+        Returns the data with headers.
+
+        Returns:
+            _DataWithHeaders: The data, data headers, grand totals and grand total headers.
+        """
+        return _DataWithHeaders(
+            data=self.block if self.block is not None else numpy.empty(0, dtype=numpy.float64),
+            data_headers=(cast(_DataCodedHeaders, self.data_headers[0]), self.data_headers[1]),
+            grand_totals=(self.grand_totals[0], self.grand_totals[1]),
+            grand_total_headers=(self.grand_totals_headers[0], self.grand_totals_headers[1]),
+        )
+
+
+def _is_total_header(header: Optional[Any]) -> bool:
+    return header is not None and header.get("totalHeader") is not None
+
+
 @define
 class DataFrameMetadata:
     """
@@ -477,91 +643,349 @@ class DataFrameMetadata:
         if headers is None:
             return []
         return [
-            [idx for idx, hdr in enumerate(dim) if hdr is not None and hdr.get("totalHeader") is not None]
+            dim.indexes_of(_is_total_header)
+            if isinstance(dim, _CodedHeaders)
+            else [idx for idx, hdr in enumerate(dim) if _is_total_header(hdr)]
             for dim in headers
         ]
 
 
+@frozen
+class _Tile:
+    """
+    Single page of the result to read.
+
+    Attributes:
+        offset (List[int]): Offset of the page in each dimension.
+        limit (List[int]): Limit of the page in each dimension.
+        row_block (int): Index of the block of rows to which the page belongs; -1 for rows read to fill in
+            a gap left by a page that was shorter than requested.
+        starts_row_block (bool): True if this is the first (leftmost) page of the row block.
+    """
+
+    offset: list[int]
+    limit: list[int]
+    row_block: int
+    starts_row_block: bool
+
+
+def _tile_limit(result_cache_metadata: ResultCacheMetadata, paging_total: list[int]) -> list[int]:
+    """
+    Derives tile shape from the size of the result in bytes. The tile is as wide as possible (so that rows do not
+    have to be stitched from many pages) and as tall as fits into _TILE_TARGET_BYTES.
+
+    Args:
+        result_cache_metadata (ResultCacheMetadata): Metadata with the size of the result in bytes.
+        paging_total (List[int]): Total size of the result in each dimension.
+
+    Returns:
+        List[int]: Limit to use for each dimension when reading the tiles.
+    """
+    cells = prod(max(total, 1) for total in paging_total)
+    bytes_per_cell = max(result_cache_metadata.result_size / cells, 1.0)
+    target_cells = max(int(_TILE_TARGET_BYTES / bytes_per_cell), 1)
+
+    if len(paging_total) == 1:
+        return [min(max(target_cells, _MIN_TILE_EDGE), _MAX_TILE_EDGE)]
+
+    width = min(max(paging_total[1], 1), _MAX_TILE_EDGE)
+    height = min(max(target_cells // width, _MIN_TILE_EDGE), _MAX_TILE_EDGE)
+
+    return [height, width]
+
+
+def _first_page_limit(result_cache_metadata: ResultCacheMetadata, num_dims: int) -> list[int]:
+    # small results are read using one page; otherwise the first page just reveals the result size cheaply
+    if result_cache_metadata.result_size <= _TILE_TARGET_BYTES:
+        return [_MAX_TILE_EDGE] * num_dims
+
+    return [_DEFAULT_PAGE_SIZE] * num_dims
+
+
+def _plan_tiles(
+    first_page: ExecutionResult,
+    first_limit: list[int],
+    tile_limit: list[int],
+    paging: Optional[PagingPolicy] = None,
+) -> Iterator[_Tile]:
+    """
+    Plans all the remaining pages (tiles) of the result once the first page revealed total size of the result.
+
+    The tiles are returned in the same order in which the serial reader reads them: row block by row block, and
+    within each row block from left to right. All tiles of the same row block share the same row offset and limit.
+    The tiles are planned lazily so that, with paging policy, height of each row block reflects the pages read so far.
+
+    Args:
+        first_page (ExecutionResult): First page of the result; read using the `first_limit`.
+        first_limit (List[int]): Limit used to read the first page; used for all tiles of the first row block.
+        tile_limit (List[int]): Limit to use for all the other tiles.
+        paging (Optional[PagingPolicy]): Policy determining height of the row blocks other than the first one;
+            if None, the height is given by the `tile_limit`.
+
+    Returns:
+        Iterator[_Tile]: Tiles to read after the first page.
+    """
+    two_dim = len(first_page.paging_total) > 1
+    total_rows = first_page.paging_total[0]
+
+    if two_dim:
+        for col_offset in range(first_page.next_page_start(dim=1), first_page.paging_total[1], first_limit[1]):
+            yield _Tile(offset=[0, col_offset], limit=first_limit, row_block=0, starts_row_block=False)
+
+    row_offset = first_page.next_page_start(dim=0)
+    row_block = 1
+
+    while row_offset < total_rows:
+        row_limit = paging.limit if paging is not None else tile_limit[0]
+
+        if not two_dim:
+            yield _Tile(offset=[row_offset], limit=[row_limit], row_block=row_block, starts_row_block=True)
+        else:
+            limit = [row_limit, tile_limit[1]]
+            for col_offset in range(0, max(first_page.paging_total[1], 1), tile_limit[1]):
+                yield _Tile(
+                    offset=[row_offset, col_offset], limit=limit, row_block=row_block, starts_row_block=col_offset == 0
+                )
+
+        row_offset += row_limit
+        row_block += 1
+
+
+def _read_tiles(
+    read_result: Callable[..., ExecutionResult], tiles: Iterator[_Tile], fetch_parallelism: int
+) -> Iterator[tuple[_Tile, ExecutionResult]]:
+    """
+    Reads the tiles and yields them in the planned order. With `fetch_parallelism` greater than one, the tiles are
+    read on a bounded thread pool; at most twice as many tiles as there are workers are in flight, so the memory
+    needed for pages that wait for assembly stays bounded.
+
+    Args:
+        read_result (Callable[..., ExecutionResult]): Function to read a page of the result with.
+        tiles (Iterator[_Tile]): Tiles to read.
+        fetch_parallelism (int): Maximum number of tiles read concurrently.
+
+    Returns:
+        Iterator[Tuple[_Tile, ExecutionResult]]: Tiles along with their pages, in the order of `tiles`.
+    """
+    if fetch_parallelism <= 1:
+        for tile in tiles:
+            yield tile, read_result(offset=tile.offset, limit=tile.limit)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=fetch_parallelism, thread_name_prefix="gd-pandas-tiles")
+    in_flight: deque[tuple[_Tile, Future[ExecutionResult]]] = deque()
+
+    def _submit(tile: _Tile) -> None:
+        in_flight.append((tile, executor.submit(read_result, offset=tile.offset, limit=tile.limit)))
+
+    try:
+        for tile in islice(tiles, 2 * fetch_parallelism):
+            _submit(tile)
+
+        while in_flight:
+            tile, future = in_flight.popleft()
+            page = future.result()
+
+            next_tile = next(tiles, None)
+            if next_tile is not None:
+                _submit(next_tile)
+
+            yield tile, page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _read_row_gap(
+    read_result: Callable[..., ExecutionResult],
+    acc: _AbstractAccumulatedData,
+    execution_response: BareExecutionResponse,
+    first_row: int,
+    end_row: int,
+    tile_limit: list[int],
+) -> int:
+    """
+    Serially reads and accumulates rows which were skipped because the backend returned fewer rows than requested.
+
+    Returns:
+        int: Start of the next row that was not read yet.
+    """
+    two_dim = len(tile_limit) > 1
+
+    while first_row < end_row:
+        limit = [end_row - first_row, *tile_limit[1:]]
+        start_page = read_result(offset=[first_row, 0] if two_dim else [first_row], limit=limit)
+        if start_page.paging_count[0] == 0:
+            break
+
+        start_tile = _Tile(offset=start_page.paging_offset, limit=limit, row_block=-1, starts_row_block=True)
+        _accumulate_tile(acc, start_tile, start_page, execution_response)
+
+        col_offset = start_page.next_page_start(dim=1) if two_dim else 0
+        while two_dim and col_offset < start_page.paging_total[1]:
+            page = read_result(offset=[first_row, col_offset], limit=[start_page.paging_count[0], tile_limit[1]])
+            tile = _Tile(offset=page.paging_offset, limit=limit, row_block=-1, starts_row_block=False)
+            _accumulate_tile(acc, tile, page, execution_response)
+            col_offset = page.next_page_start(dim=1)
+
+        first_row = start_page.next_page_start(dim=0)
+
+    return first_row
+
+
+def _read_column_gap(
+    read_result: Callable[..., ExecutionResult],
+    acc: _AbstractAccumulatedData,
+    execution_response: BareExecutionResponse,
+    block: tuple[_Tile, ExecutionResult],
+    first_col: int,
+    end_col: int,
+) -> int:
+    """
+    Serially reads and accumulates columns of a row block which were skipped because the backend returned fewer
+    columns than requested.
+
+    Args:
+        block (Tuple[_Tile, ExecutionResult]): Tile that starts the row block along with its page.
+
+    Returns:
+        int: Start of the next column that was not read yet.
+    """
+    block_tile, block_page = block
+    block_rows = block_page.paging_count[0]
+
+    while block_rows > 0 and first_col < end_col:
+        limit = [block_rows, end_col - first_col]
+        page = read_result(offset=[block_page.paging_offset[0], first_col], limit=limit)
+        if page.paging_count[1] == 0:
+            break
+
+        tile = _Tile(offset=page.paging_offset, limit=limit, row_block=block_tile.row_block, starts_row_block=False)
+        _accumulate_tile(acc, tile, page, execution_response)
+        first_col = page.next_page_start(dim=1)
+
+    return first_col
+
+
+def _accumulate_tile(
+    acc: _AbstractAccumulatedData, tile: _Tile, page: ExecutionResult, execution_response: BareExecutionResponse
+) -> None:
+    """
+    Accumulates a single page of the result. Must be called for the pages in the planned order.
+    """
+    if tile.starts_row_block:
+        # if one-dimensional result, this is an array of data
+        # if two-dimensional result, this starts new block of table rows
+        acc.accumulate_data(from_result=page)
+        acc.accumulate_headers(from_result=page, from_dim=0)
+        acc.accumulate_grand_totals(from_result=page, paging_dim=0, response=execution_response)
+
+        # when result is two-dimensional make sure to read the column headers just once - from the first page
+        if len(page.paging_total) > 1 and acc.data_headers[1] is None:
+            acc.accumulate_headers(from_result=page, from_dim=1)
+        return
+
+    # page 'to the right' within the row block, extend existing rows with data from the other columns;
+    # column headers and column totals are collected only while scrolling 'to the right' for the first time
+    acc.extend_existing_row_data(from_result=page)
+
+    if tile.row_block == 0:
+        acc.accumulate_headers(from_result=page, from_dim=1)
+        acc.accumulate_grand_totals(from_result=page, paging_dim=1, response=execution_response)
+
+
 def _read_complete_execution_result(
     execution_response: BareExecutionResponse,
     result_cache_metadata: ResultCacheMetadata,
     result_size_dimensions_limits: ResultSizeDimensions,
     result_size_bytes_limit: Optional[int] = None,
-    page_size: int = _DEFAULT_PAGE_SIZE,
+    page_size: Optional[int] = _DEFAULT_PAGE_SIZE,
     optimized: bool = False,
+    streaming: bool = False,
+    fetch_parallelism: int = 1,
+    paging: Optional[PagingPolicy] = None,
 ) -> _DataWithHeaders:
     """
     Extracts all data and headers for an execution result. This does page around the execution result to extract
     everything from the paged API.
 
+    The first page reveals the total size of the result; all the other pages (tiles) are then known upfront and
+    are read either one after another or concurrently, depending on `fetch_parallelism`. Either way, the tiles are
+    assembled into the accumulator in order.
+
     Args:
         execution_response (BareExecutionResponse): Execution response to work with.
         result_cache_metadata (ResultCacheMetadata): Metadata for the result cache.
         result_size_dimensions_limits (ResultSizeDimensions): Limits for result size dimensions.
         result_size_bytes_limit (Optional[int], optional): Limit for result size in bytes. Defaults to None.
-        page_size (int, optional): Page size to use when reading data. Defaults to _DEFAULT_PAGE_SIZE.
+        page_size (Optional[int], optional): Page size to use in all dimensions when reading data. If None, shape
+            of the pages is derived from the size of the result in bytes. Defaults to _DEFAULT_PAGE_SIZE.
         optimized (bool, default=False): Use memory optimized accumulator if True; by default, the accumulator stores
             headers in memory as lists of dicts, which can consume a lot of memory for large results.
             Optimized accumulator stores only unique values and story only reference to them in the list,
             which can significantly reduce memory usage.
+        streaming (bool, default=False): Use streaming accumulator if True; it preallocates float64 data block and
+            header codes sized by the result size and writes each page into them by its offset. Takes precedence
+            over `optimized`.
+        fetch_parallelism (int, default=1): Maximum number of pages read concurrently.
+        paging (Optional[PagingPolicy], optional): Policy adapting number of rows read at once to the observed
+            latency and payload size of the pages. Defaults to None - rows are read as given by `page_size`.
 
     Returns:
         _DataWithHeaders: All the data and headers from the execution result.
     """
     num_dims = len(execution_response.dimensions)
-    offset = [0] * num_dims
-    limit = [page_size] * num_dims
-
-    acc = _OptimizedAccumulatedData() if optimized else _AccumulatedData()
-
-    result_size_limits_checked = False
-    while True:
-        # top-level loop pages through the first dimension;
-        #
-        # if one-dimensional result, it pages over an array of data
-        # if two-dimensional result, it pages over table rows
-        result = execution_response.read_result(offset=offset, limit=limit)
-
-        if not result_size_limits_checked:
-            result.check_dimensions_size_limits(result_size_dimensions_limits)
-            result_cache_metadata.check_bytes_size_limit(result_size_bytes_limit)
-            result_size_limits_checked = True
-
-        acc.accumulate_data(from_result=result)
-        acc.accumulate_headers(from_result=result, from_dim=0)
-        acc.accumulate_grand_totals(from_result=result, paging_dim=0, response=execution_response)
-
-        if num_dims > 1:
-            # when result is two-dimensional make sure to read the column headers and column totals
-            # just once - when scrolling 'to the right' for the first time;
-            load_headers_and_totals = False
-            if acc.data_headers[1] is None:
-                acc.accumulate_headers(from_result=result, from_dim=1)
-                load_headers_and_totals = True
-
-            if not result.is_complete(dim=1):
-                # have two-dimensional result (typical table) and the page does not contain
-                # all the columns.
-                #
-                # page 'to the right' to get data from all columns, extend existing rows with that data
-                offset = [offset[0], result.next_page_start(dim=1)]
-                while True:
-                    result = execution_response.read_result(offset=offset, limit=limit)
-                    acc.extend_existing_row_data(from_result=result)
-
-                    if load_headers_and_totals:
-                        acc.accumulate_headers(from_result=result, from_dim=1)
-                        acc.accumulate_grand_totals(from_result=result, paging_dim=1, response=execution_response)
-
-                    if result.is_complete(dim=1):
-                        break
-
-                    offset = [offset[0], result.next_page_start(dim=1)]
-
-        if result.is_complete(dim=0):
-            break
+    first_limit = (
+        [page_size] * num_dims if page_size is not None else _first_page_limit(result_cache_metadata, num_dims)
+    )
+    read_result: Callable[..., ExecutionResult] = execution_response.read_result
+    if paging is not None:
+        first_limit[0] = paging.limit
+        read_result = partial(paging.read, execution_response.read_result)
+
+    acc: _AbstractAccumulatedData
+    if streaming:
+        acc = _StreamingAccumulatedData()
+    elif optimized:
+        acc = _OptimizedAccumulatedData()
+    else:
+        acc = _AccumulatedData()
+
+    first_page = read_result(offset=[0] * num_dims, limit=first_limit)
+    first_page.check_dimensions_size_limits(result_size_dimensions_limits)
+    result_cache_metadata.check_bytes_size_limit(result_size_bytes_limit)
+
+    tile_limit = first_limit if page_size is not None else _tile_limit(result_cache_metadata, first_page.paging_total)
+    first_tile = _Tile(offset=[0] * num_dims, limit=first_limit, row_block=0, starts_row_block=True)
+    _accumulate_tile(acc, first_tile, first_page, execution_response)
+
+    two_dim = num_dims > 1
+    total_cols = first_page.paging_total[1] if two_dim else 0
+    next_row = first_page.next_page_start(dim=0)
+    block = (first_tile, first_page)
+    next_col = first_page.next_page_start(dim=1) if two_dim else 0
+
+    tiles = _plan_tiles(first_page, first_limit, tile_limit, paging)
+    for tile, page in _read_tiles(read_result, tiles, fetch_parallelism):
+        # backend may return fewer columns than requested; the skipped columns must be accumulated before this
+        # tile - or before the next row block, which starts a new set of rows
+        gap_end = total_cols if tile.starts_row_block else tile.offset[1]
+        if two_dim and next_col < gap_end:
+            _read_column_gap(read_result, acc, execution_response, block, next_col, gap_end)
+
+        if tile.starts_row_block:
+            # backend may return fewer rows than requested; the skipped rows must be accumulated before this block
+            _read_row_gap(read_result, acc, execution_response, next_row, tile.offset[0], tile_limit)
+            next_row = page.next_page_start(dim=0)
+            block = (tile, page)
+
+        _accumulate_tile(acc, tile, page, execution_response)
+        if two_dim:
+            next_col = page.next_page_start(dim=1)
+
+    if two_dim and next_col < total_cols:
+        _read_column_gap(read_result, acc, execution_response, block, next_col, total_cols)
+    _read_row_gap(read_result, acc, execution_response, next_row, first_page.paging_total[0], tile_limit)
 
-        offset = [result.next_page_start(dim=0), 0] if num_dims > 1 else [result.next_page_start(dim=0)]
     return acc.result()
 
 
@@ -689,19 +1113,55 @@ def _headers_to_index(
         primary_attribute_labels_mapping=primary_attribute_labels_mapping,
     )
 
+    names = [mapper(dim_header, None) for dim_header in (response.dimensions[dim_idx]["headers"])]
+    header_groups = cast(list, headers[dim_idx])
+
+    if header_groups and isinstance(header_groups[0], _CodedHeaders):
+        return _coded_headers_to_index(header_groups, mapper, names), primary_attribute_labels_mapping
+
     return pandas.MultiIndex.from_arrays(
         [
             tuple(mapper(header, header_idx) for header in header_group)
-            for header_idx, header_group in enumerate(cast(list, headers[dim_idx]))
+            for header_idx, header_group in enumerate(header_groups)
         ],
-        names=[mapper(dim_header, None) for dim_header in (response.dimensions[dim_idx]["headers"])],
+        names=names,
     ), primary_attribute_labels_mapping
 
 
+def _coded_headers_to_index(
+    header_groups: _DataCodedHeaders,
+    mapper: Callable[[Any, Optional[int]], Optional[str]],
+    names: list[Optional[str]],
+) -> pandas.MultiIndex:
+    """Builds a pandas MultiIndex from coded header levels.
+
+    Each unique header is mapped to its label just once. Labels are then factorized (different headers may map
+    to the same label) and the level codes are translated to the codes of the factorized labels in one vectorized
+    step.
+
+    Args:
+        header_groups (_DataCodedHeaders): Coded header levels of a dimension.
+        mapper (Callable[[Any, Optional[int]], Optional[str]]): Header mapper created by _create_header_mapper.
+        names (List[Optional[str]]): Names of the index levels.
+
+    Returns:
+        pandas.MultiIndex: Index equal to the one created from the per-row labels.
+    """
+    levels = []
+    codes = []
+    for header_idx, header_group in enumerate(header_groups):
+        labels = numpy.array([mapper(header, header_idx) for header in header_group.categories], dtype=object)
+        label_codes, level = pandas.factorize(labels, sort=True)
+        levels.append(level)
+        codes.append(label_codes[header_group.codes] if len(label_codes) else header_group.codes)
+
+    return pandas.MultiIndex(levels=levels, codes=codes, names=names, verify_integrity=False)
+
+
 def _merge_grand_totals_into_data(
     extract: _DataWithHeaders,
     grand_totals_position: Optional[Literal["pinnedBottom", "pinnedTop", "bottom", "top"]] = "bottom",
-) -> Union[_DataArray, list[_DataArray]]:
+) -> Union[_DataArray, list[_DataArray], numpy.ndarray]:
     """
     Merges grand totals into the extracted data. This function will mutate the extracted data,
     extending the rows and columns with grand totals. Going with mutation here so as not to copy arrays around.
@@ -713,15 +1173,20 @@ def _merge_grand_totals_into_data(
             "pinnedTop" and "top" prepend totals. Defaults to "bottom".
 
     Returns:
-        Union[_DataArray, List[_DataArray]]: Mutated data with rows and columns extended with grand totals.
+        Union[_DataArray, List[_DataArray], numpy.ndarray]: Mutated data with rows and columns extended with
+        grand totals.
     """
-    data: list[_DataArray] = extract.data
     # Treat None as "bottom" as a fallback
     if grand_totals_position is None:
         grand_totals_position = "bottom"
     # Determine if grand totals should be prepended or appended
     should_prepend = grand_totals_position in ("pinnedTop", "top")
 
+    if isinstance(extract.data, numpy.ndarray):
+        return _merge_grand_totals_into_block(extract.data, extract, should_prepend)
+
+    data: list[_DataArray] = extract.data
+
     if extract.grand_totals[0] is not None:
         # column totals are computed into extra rows, one row per column total
         # add those rows at the beginning or end of the data rows based on position
@@ -737,6 +1202,43 @@ def _merge_grand_totals_into_data(
             data[row_idx].extend(cols_to_append)
 
     return data
+
+
+def _grand_totals_to_block(grand_totals: list[_DataArray], width: int) -> numpy.ndarray:
+    block = numpy.full((len(grand_totals), width), numpy.nan, dtype=numpy.float64)
+    for row_idx, row in enumerate(grand_totals):
+        block[row_idx, : len(row)] = numpy.asarray(row, dtype=numpy.float64)
+
+    return block
+
+
+def _merge_grand_totals_into_block(
+    data: numpy.ndarray, extract: _DataWithHeaders, should_prepend: bool
+) -> numpy.ndarray:
+    """
+    Merges grand totals into data block produced by the streaming accumulator. Unlike the list-based variant, this
+    cannot extend the data in place; the block is copied once if (and only if) there are any grand totals.
+
+    Args:
+        data (numpy.ndarray): Data block.
+        extract (_DataWithHeaders): Extracted data with headers and grand totals.
+        should_prepend (bool): Whether column totals go before the data rows.
+
+    Returns:
+        numpy.ndarray: Data block with rows and columns extended with grand totals.
+    """
+    if data.ndim != 2:
+        return data
+
+    if extract.grand_totals[1] is not None:
+        # row totals are extra columns at the right 'edge' of the data
+        data = numpy.hstack([data, _grand_totals_to_block(extract.grand_totals[1], len(extract.grand_totals[1][0]))])
+
+    if extract.grand_totals[0] is not None:
+        # column totals are extra rows; these already contain total of totals if there are row totals as well
+        totals = _grand_totals_to_block(extract.grand_totals[0], data.shape[1])
+        data = numpy.vstack([totals, data] if should_prepend else [data, totals])
+
     return data
 
 
@@ -770,9 +1272,12 @@ def convert_execution_response_to_dataframe(
     result_size_bytes_limit: Optional[int] = None,
     use_local_ids_in_headers: bool = False,
     use_primary_labels_in_attributes: bool = False,
-    page_size: int = _DEFAULT_PAGE_SIZE,
+    page_size: Optional[int] = _DEFAULT_PAGE_SIZE,
     optimized: bool = False,
     grand_totals_position: Optional[Literal["pinnedBottom", "pinnedTop", "bottom", "top"]] = "bottom",
+    streaming: bool = False,
+    fetch_parallelism: int = 1,
+    paging: Optional[PagingPolicy] = None,
 ) -> tuple[pandas.DataFrame, DataFrameMetadata]:
     """
     Converts execution result to a pandas dataframe, maintaining the dimensionality of the result.
@@ -787,7 +1292,8 @@ def convert_execution_response_to_dataframe(
         use_local_ids_in_headers (bool, default=False): Use local ids in headers if True, else use default settings.
         use_primary_labels_in_attributes (bool, default=False): Use primary labels in attributes if True, else use
             default settings.
-        page_size (int, default=_DEFAULT_PAGE_SIZE): Size of the page.
+        page_size (Optional[int], default=_DEFAULT_PAGE_SIZE): Size of the page in all dimensions. If None, shape
+            of the pages is derived from the size of the result in bytes.
         optimized (bool, default=False): Use memory optimized accumulator if True; by default, the accumulator stores
             headers in memory as lists of dicts, which can consume a lot of memory for large results.
             Optimized accumulator stores only unique values and story only reference to them in the list,
@@ -795,6 +1301,13 @@ def convert_execution_response_to_dataframe(
         grand_totals_position (Literal["pinnedBottom", "pinnedTop", "bottom", "top"], optional):
             Position where grand totals should be placed. "pinnedBottom" and "bottom" append totals,
             "pinnedTop" and "top" prepend totals. Defaults to "bottom".
+        streaming (bool, default=False): Use streaming accumulator if True; the data is written page by page into
+            a preallocated float64 block and headers are kept as integer codes, so the peak memory stays close to
+            the size of the resulting dataframe. All metric columns are float64 in this mode.
+        fetch_parallelism (int, default=1): Maximum number of result pages read concurrently. The pages are
+            still assembled in order.
+        paging (Optional[PagingPolicy], default=None): Policy adapting number of rows read at once to the observed
+            latency and payload size of the pages; if None, rows are read as given by `page_size`.
 
     Returns:
         Tuple[pandas.DataFrame, DataFrameMetadata]: A tuple containing the created dataframe and its metadata.
@@ -806,6 +1319,9 @@ def convert_execution_response_to_dataframe(
         result_size_bytes_limit=result_size_bytes_limit,
         page_size=page_size,
         optimized=optimized,
+        streaming=streaming,
+        fetch_parallelism=fetch_parallelism,
+        paging=paging,
     )
 
     full_data = _merge_grand_totals_into_data(extract=extract, grand_totals_position=grand_totals_position)
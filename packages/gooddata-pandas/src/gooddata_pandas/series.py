@@ -4,7 +4,7 @@ from __future__ import annotations
 from typing import Callable, Optional, Union
 
 import pandas
-from gooddata_sdk import Attribute, Execution, Filter, GoodDataSdk, ObjId, SimpleMetric
+from gooddata_sdk import Attribute, Execution, Filter, GoodDataSdk, ObjId, PagingPolicy, SimpleMetric
 
 from gooddata_pandas.data_access import compute_and_extract
 from gooddata_pandas.utils import IndexDef, LabelItemDef, make_pandas_index
@@ -31,6 +31,7 @@ class SeriesFactory:
         on_execution_submitted: Optional[Callable[[Execution], None]] = None,
         is_cancellable: bool = False,
         result_page_len: Optional[int] = None,
+        paging: Optional[PagingPolicy] = None,
     ) -> pandas.Series:
         """Creates pandas Series from data points calculated from a single `data_by`.
 
@@ -71,6 +72,8 @@ class SeriesFactory:
 
             result_page_len (Optional[int]): Optional page size for result pagination.
                 Defaults to 1000. Larger values can improve performance for large result sets.
+            paging (Optional[PagingPolicy]): Optional policy adapting the page size to observed latency and
+                payload size of the pages. Takes precedence over `result_page_len`.
 
         Returns:
             pandas.Series: pandas series instance
@@ -85,6 +88,7 @@ class SeriesFactory:
             on_execution_submitted=on_execution_submitted,
             is_cancellable=is_cancellable,
             result_page_len=result_page_len,
+            paging=paging,
         )
 
         _idx = make_pandas_index(index)
@@ -99,6 +103,7 @@ class SeriesFactory:
         on_execution_submitted: Optional[Callable[[Execution], None]] = None,
         is_cancellable: bool = False,
         result_page_len: Optional[int] = None,
+        paging: Optional[PagingPolicy] = None,
     ) -> pandas.Series:
         """
         Creates a pandas.Series from data points calculated from a single `data_by` without constructing an index.
@@ -130,6 +135,8 @@ class SeriesFactory:
             is_cancellable (bool, optional): Whether the execution should be cancelled when the connection is interrupted.
             result_page_len (Optional[int]): Optional page size for result pagination.
                 Defaults to 1000. Larger values can improve performance for large result sets.
+            paging (Optional[PagingPolicy]): Optional policy adapting the page size to observed latency and
+                payload size of the pages. Takes precedence over `result_page_len`.
 
         Returns:
             pandas.Series: The resulting pandas Series instance.
@@ -149,6 +156,7 @@ class SeriesFactory:
             on_execution_submitted=on_execution_submitted,
             is_cancellable=is_cancellable,
             result_page_len=result_page_len,
+            paging=paging,
         )
 
         return pandas.Series(data=data["_series"])
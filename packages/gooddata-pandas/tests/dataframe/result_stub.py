@@ -0,0 +1,139 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional, Union
+
+from gooddata_sdk import ExecutionBatch, ExecutionResult
+
+
+class StubResultCacheMetadata:
+    def __init__(self, result_size: int) -> None:
+        self.result_size = result_size
+
+    def check_bytes_size_limit(self, result_size_bytes_limit: Optional[int] = None) -> None:
+        pass
+
+
+class StubPivotResponse:
+    """
+    Serves pivot-like result: two attributes in rows, one attribute and the measure group in columns. Records
+    offsets and limits of all the pages read. With `server_cap` and `column_cap`, the stub returns at most that many
+    rows and columns per page regardless of the requested limit.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        col_values: int,
+        metrics: int,
+        server_cap: Optional[int] = None,
+        column_cap: Optional[int] = None,
+    ) -> None:
+        self.rows = rows
+        self.server_cap = server_cap
+        self.column_cap = column_cap
+        self.cols = col_values * metrics
+        self._metrics = metrics
+        self._lock = threading.Lock()
+        self.requests: list[tuple[tuple[int, ...], tuple[int, ...]]] = []
+        self.dimensions = [
+            {
+                "localIdentifier": "dim_0",
+                "headers": [
+                    {"attributeHeader": {"labelName": "Row A", "localIdentifier": "a"}},
+                    {"attributeHeader": {"labelName": "Row B", "localIdentifier": "b"}},
+                ],
+            },
+            {
+                "localIdentifier": "dim_1",
+                "headers": [
+                    {"attributeHeader": {"labelName": "Col C", "localIdentifier": "c"}},
+                    {
+                        "measureGroupHeaders": [
+                            {"localIdentifier": f"m{idx}", "name": f"Metric {idx}"} for idx in range(metrics)
+                        ]
+                    },
+                ],
+            },
+        ]
+
+    @staticmethod
+    def _attribute_header(value: str) -> dict[str, Any]:
+        return {"attributeHeader": {"labelValue": value, "primaryLabelValue": value}}
+
+    def read_result(
+        self,
+        limit: Union[int, list[int]],
+        offset: Union[None, int, list[int]] = None,
+        timeout: Optional[Union[int, float, tuple]] = None,
+    ) -> ExecutionResult:
+        assert isinstance(offset, list) and isinstance(limit, list)
+        with self._lock:
+            self.requests.append((tuple(offset), tuple(limit)))
+
+        page_len = limit[0] if self.server_cap is None else min(limit[0], self.server_cap)
+        rows = range(offset[0], min(offset[0] + page_len, self.rows))
+        page_width = limit[1] if self.column_cap is None else min(limit[1], self.column_cap)
+        cols = range(offset[1], min(offset[1] + page_width, self.cols))
+
+        return ExecutionResult(
+            {
+                "data": [[float(row * self.cols + col) for col in cols] for row in rows],
+                "dimension_headers": [
+                    {
+                        "headerGroups": [
+                            {"headers": [self._attribute_header(f"a{row // 10:03}") for row in rows]},
+                            {"headers": [self._attribute_header(f"b{row % 10}") for row in rows]},
+                        ]
+                    },
+                    {
+                        "headerGroups": [
+                            {"headers": [self._attribute_header(f"c{col // self._metrics:03}") for col in cols]},
+                            {"headers": [{"measureHeader": {"measureIndex": col % self._metrics}} for col in cols]},
+                        ]
+                    },
+                ],
+                "grand_totals": [],
+                "paging": {
+                    "count": [len(rows), len(cols)],
+                    "offset": offset,
+                    "total": [self.rows, self.cols],
+                },
+                "metadata": {},
+            }
+        )
+
+
+class StubExecution:
+    def __init__(self, result_id: str, rows: int, cancel_token: Optional[str] = None) -> None:
+        self.result_id = result_id
+        self.cancel_token = cancel_token
+        self.bare_exec_response = StubPivotResponse(rows=rows, col_values=3, metrics=2)
+
+
+class StubCompute:
+    """
+    Mimics ComputeService; the "execution definitions" are numbers of rows of the pivot-like results to serve.
+    """
+
+    def __init__(self) -> None:
+        self.cancelled: dict[str, str] = {}
+
+    def for_exec_def(self, workspace_id: str, exec_def: int, timeout: Any = None) -> StubExecution:
+        return StubExecution(f"result{exec_def}", rows=exec_def, cancel_token=f"token{exec_def}")
+
+    def for_exec_defs(self, workspace_id: str, exec_defs: list[int], max_concurrency: int = 4) -> ExecutionBatch:
+        return ExecutionBatch(self, workspace_id, exec_defs, max_concurrency=max_concurrency)  # type: ignore[arg-type]
+
+    def retrieve_result_cache_metadata(self, workspace_id: str, result_id: str) -> StubResultCacheMetadata:
+        return StubResultCacheMetadata(result_size=1024)
+
+    def cancel_executions(self, executions: dict[str, dict[str, str]]) -> None:
+        for tokens in executions.values():
+            self.cancelled.update(tokens)
+
+
+class StubSdk:
+    def __init__(self) -> None:
+        self.compute = StubCompute()
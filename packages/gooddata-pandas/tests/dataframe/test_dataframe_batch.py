@@ -0,0 +1,33 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import pandas
+import pytest
+from gooddata_pandas import DataFrameFactory
+from gooddata_sdk import ResultSizeDimensionsLimitsExceeded
+
+from tests.dataframe.result_stub import StubPivotResponse, StubSdk
+from tests.dataframe.test_result_convertor_tiles import _convert
+
+
+def test_for_exec_defs_keeps_order():
+    sdk = StubSdk()
+    factory = DataFrameFactory(sdk, "demo")  # type: ignore[arg-type]
+
+    frames = factory.for_exec_defs([70, 30, 50], max_concurrency=2)  # type: ignore[list-item]
+
+    assert [df.shape[0] for df, _ in frames] == [70, 30, 50]
+    for rows, (df, _) in zip([70, 30, 50], frames):
+        expected = _convert(StubPivotResponse(rows=rows, col_values=3, metrics=2), 1024, 100, 1)
+        pandas.testing.assert_frame_equal(df, expected)
+    assert sdk.compute.cancelled == {}
+
+
+def test_for_exec_defs_cancels_batch_on_error():
+    sdk = StubSdk()
+    factory = DataFrameFactory(sdk, "demo")  # type: ignore[arg-type]
+
+    with pytest.raises(ResultSizeDimensionsLimitsExceeded):
+        factory.for_exec_defs([10, 20], result_size_dimensions_limits=(5,))  # type: ignore[list-item]
+
+    assert set(sdk.compute.cancelled) == {"result10", "result20"}
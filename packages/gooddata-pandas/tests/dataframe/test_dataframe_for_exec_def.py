@@ -2,6 +2,7 @@
 from pathlib import Path
 from typing import Literal, Optional
 
+import pandas
 import pytest
 from gooddata_pandas import DataFrameFactory
 from gooddata_sdk import (
@@ -22,6 +23,9 @@ gd_vcr = get_vcr()
 _current_dir = Path(__file__).parent.absolute()
 _fixtures_dir = _current_dir / "fixtures"
 
+# (optimized, streaming) combinations of accumulators used when reading the result
+_ACCUMULATORS = [(True, False), (False, False), (False, True)]
+
 
 def _run_and_validate_results(
     gdf: DataFrameFactory,
@@ -31,6 +35,7 @@ def _run_and_validate_results(
     expected_column_totals: Optional[list[list[int]]] = None,
     page_size: int = 100,
     optimized: bool = False,
+    streaming: bool = False,
     grand_totals_position: Optional[Literal["pinnedBottom", "pinnedTop", "bottom", "top"]] = "bottom",
 ) -> str:
     # generate dataframe from exec_def
@@ -41,7 +46,10 @@ def _run_and_validate_results(
 
     # use result ID from computation above and generate dataframe just from it
     result_from_result_id, result_metadata_from_result_id = gdf.for_exec_result_id(
-        result_id=result_metadata.execution_response.result_id, page_size=page_size, optimized=optimized
+        result_id=result_metadata.execution_response.result_id,
+        page_size=page_size,
+        optimized=optimized,
+        streaming=streaming,
     )
 
     if expected_row_totals is not None:
@@ -52,14 +60,18 @@ def _run_and_validate_results(
     assert result_from_result_id.values.shape == expected
 
     # compare dataframes generated using both methods above
-    assert result.to_string() == result_from_result_id.to_string()
+    if streaming:
+        # streaming accumulator always produces float64 columns
+        pandas.testing.assert_frame_equal(result, result_from_result_id, check_dtype=False)
+    else:
+        assert result.to_string() == result_from_result_id.to_string()
 
     return result_metadata.execution_response.result_id
 
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "dataframe_for_exec_def_two_dim1.yaml"))
-@pytest.mark.parametrize("optimized", [True, False])
-def test_dataframe_for_exec_def_two_dim1(test_config, gdf: DataFrameFactory, optimized: bool):
+@pytest.mark.parametrize("optimized, streaming", _ACCUMULATORS)
+def test_dataframe_for_exec_def_two_dim1(test_config, gdf: DataFrameFactory, optimized: bool, streaming: bool):
     exec_def = ExecutionDefinition(
         attributes=[
             Attribute(local_id="region", label="region"),
@@ -76,7 +88,9 @@ def test_dataframe_for_exec_def_two_dim1(test_config, gdf: DataFrameFactory, opt
             TableDimension(item_ids=["product_category", "measureGroup"]),
         ],
     )
-    exec_result_id = _run_and_validate_results(gdf=gdf, exec_def=exec_def, expected=(48, 8), optimized=optimized)
+    exec_result_id = _run_and_validate_results(
+        gdf=gdf, exec_def=exec_def, expected=(48, 8), optimized=optimized, streaming=streaming
+    )
 
     # check also label overrides
     overrides = {
@@ -87,7 +101,9 @@ def test_dataframe_for_exec_def_two_dim1(test_config, gdf: DataFrameFactory, opt
             "price": {"title": "PRICE LABEL"},
         },
     }
-    result, _ = gdf.for_exec_result_id(exec_result_id, label_overrides=overrides, optimized=optimized)
+    result, _ = gdf.for_exec_result_id(
+        exec_result_id, label_overrides=overrides, optimized=optimized, streaming=streaming
+    )
     assert result.to_string().find(overrides["labels"]["state"]["title"]) == 262
     assert result.to_string().find(overrides["metrics"]["price"]["title"]) == 162
 
@@ -154,8 +170,8 @@ def test_dataframe_for_exec_def_bytes_limits_failure(test_config, gdf: DataFrame
 
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "dataframe_for_exec_def_two_dim2.yaml"))
-@pytest.mark.parametrize("optimized", [True, False])
-def test_dataframe_for_exec_def_two_dim2(gdf: DataFrameFactory, optimized: bool):
+@pytest.mark.parametrize("optimized, streaming", _ACCUMULATORS)
+def test_dataframe_for_exec_def_two_dim2(gdf: DataFrameFactory, optimized: bool, streaming: bool):
     exec_def = ExecutionDefinition(
         attributes=[
             Attribute(local_id="region", label="region"),
@@ -172,12 +188,12 @@ def test_dataframe_for_exec_def_two_dim2(gdf: DataFrameFactory, optimized: bool)
             TableDimension(item_ids=["measureGroup"]),
         ],
     )
-    _run_and_validate_results(gdf=gdf, exec_def=exec_def, expected=(182, 2), optimized=optimized)
+    _run_and_validate_results(gdf=gdf, exec_def=exec_def, expected=(182, 2), optimized=optimized, streaming=streaming)
 
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "dataframe_for_exec_def_two_dim3.yaml"))
-@pytest.mark.parametrize("optimized", [True, False])
-def test_dataframe_for_exec_def_two_dim3(gdf: DataFrameFactory, optimized: bool):
+@pytest.mark.parametrize("optimized, streaming", _ACCUMULATORS)
+def test_dataframe_for_exec_def_two_dim3(gdf: DataFrameFactory, optimized: bool, streaming: bool):
     exec_def = ExecutionDefinition(
         attributes=[
             Attribute(local_id="region", label="region"),
@@ -194,12 +210,12 @@ def test_dataframe_for_exec_def_two_dim3(gdf: DataFrameFactory, optimized: bool)
             TableDimension(item_ids=["region", "state", "measureGroup"]),
         ],
     )
-    _run_and_validate_results(gdf=gdf, exec_def=exec_def, expected=(4, 96), optimized=optimized)
+    _run_and_validate_results(gdf=gdf, exec_def=exec_def, expected=(4, 96), optimized=optimized, streaming=streaming)
 
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "dataframe_for_exec_def_totals1.yaml"))
-@pytest.mark.parametrize("optimized", [True, False])
-def test_dataframe_for_exec_def_totals1(gdf: DataFrameFactory, optimized: bool):
+@pytest.mark.parametrize("optimized, streaming", _ACCUMULATORS)
+def test_dataframe_for_exec_def_totals1(gdf: DataFrameFactory, optimized: bool, streaming: bool):
     """
     Execution with column totals; the row dimension has single label
     """
@@ -234,13 +250,18 @@ def test_dataframe_for_exec_def_totals1(gdf: DataFrameFactory, optimized: bool):
         ],
     )
     _run_and_validate_results(
-        gdf=gdf, exec_def=exec_def, expected=(6, 96), expected_row_totals=[[4, 5]], optimized=optimized
+        gdf=gdf,
+        exec_def=exec_def,
+        expected=(6, 96),
+        expected_row_totals=[[4, 5]],
+        optimized=optimized,
+        streaming=streaming,
     )
 
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "dataframe_for_exec_def_totals2.yaml"))
-@pytest.mark.parametrize("optimized", [True, False])
-def test_dataframe_for_exec_def_totals2(gdf: DataFrameFactory, optimized: bool):
+@pytest.mark.parametrize("optimized, streaming", _ACCUMULATORS)
+def test_dataframe_for_exec_def_totals2(gdf: DataFrameFactory, optimized: bool, streaming: bool):
     """
     Execution with column totals; the row dimension have two labels; this exercises that the index is
     padded appropriately
@@ -276,13 +297,18 @@ def test_dataframe_for_exec_def_totals2(gdf: DataFrameFactory, optimized: bool):
         ],
     )
     _run_and_validate_results(
-        gdf=gdf, exec_def=exec_def, expected=(19, 96), expected_row_totals=[[17, 18], [17, 18]], optimized=optimized
+        gdf=gdf,
+        exec_def=exec_def,
+        expected=(19, 96),
+        expected_row_totals=[[17, 18], [17, 18]],
+        optimized=optimized,
+        streaming=streaming,
     )
 
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "dataframe_for_exec_def_totals3.yaml"))
-@pytest.mark.parametrize("optimized", [True, False])
-def test_dataframe_for_exec_def_totals3(gdf: DataFrameFactory, optimized: bool):
+@pytest.mark.parametrize("optimized, streaming", _ACCUMULATORS)
+def test_dataframe_for_exec_def_totals3(gdf: DataFrameFactory, optimized: bool, streaming: bool):
     """
     Execution with row totals; the column dimension has single label.
     """
@@ -316,12 +342,12 @@ def test_dataframe_for_exec_def_totals3(gdf: DataFrameFactory, optimized: bool):
             ),
         ],
     )
-    _run_and_validate_results(gdf=gdf, exec_def=exec_def, expected=(96, 6), optimized=optimized)
+    _run_and_validate_results(gdf=gdf, exec_def=exec_def, expected=(96, 6), optimized=optimized, streaming=streaming)
 
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "dataframe_for_exec_def_totals4.yaml"))
-@pytest.mark.parametrize("optimized", [True, False])
-def test_dataframe_for_exec_def_totals4(gdf: DataFrameFactory, optimized: bool):
+@pytest.mark.parametrize("optimized, streaming", _ACCUMULATORS)
+def test_dataframe_for_exec_def_totals4(gdf: DataFrameFactory, optimized: bool, streaming: bool):
     """
     Execution with row totals; the column dimension have two label.
     """
@@ -398,8 +424,8 @@ def test_dataframe_for_exec_def_totals4(gdf: DataFrameFactory, optimized: bool):
 
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "dataframe_for_exec_def_one_dim1.yaml"))
-@pytest.mark.parametrize("optimized", [True, False])
-def test_dataframe_for_exec_def_one_dim1(gdf: DataFrameFactory, optimized: bool):
+@pytest.mark.parametrize("optimized, streaming", _ACCUMULATORS)
+def test_dataframe_for_exec_def_one_dim1(gdf: DataFrameFactory, optimized: bool, streaming: bool):
     exec_def = ExecutionDefinition(
         attributes=[
             Attribute(local_id="region", label="region"),
@@ -414,12 +440,14 @@ def test_dataframe_for_exec_def_one_dim1(gdf: DataFrameFactory, optimized: bool)
         dimensions=[TableDimension(item_ids=["region", "state", "product_category", "measureGroup"])],
     )
     # TODO: remove page_size=500 once UNI-591 is resolved
-    _run_and_validate_results(gdf=gdf, exec_def=exec_def, expected=(364, 1), page_size=500, optimized=optimized)
+    _run_and_validate_results(
+        gdf=gdf, exec_def=exec_def, expected=(364, 1), page_size=500, optimized=optimized, streaming=streaming
+    )
 
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "dataframe_for_exec_def_one_dim2.yaml"))
-@pytest.mark.parametrize("optimized", [True, False])
-def test_dataframe_for_exec_def_one_dim2(gdf: DataFrameFactory, optimized: bool):
+@pytest.mark.parametrize("optimized, streaming", _ACCUMULATORS)
+def test_dataframe_for_exec_def_one_dim2(gdf: DataFrameFactory, optimized: bool, streaming: bool):
     exec_def = ExecutionDefinition(
         attributes=[
             Attribute(local_id="region", label="region"),
@@ -436,4 +464,4 @@ def test_dataframe_for_exec_def_one_dim2(gdf: DataFrameFactory, optimized: bool)
             TableDimension(item_ids=["region", "state", "product_category", "measureGroup"]),
         ],
     )
-    _run_and_validate_results(gdf=gdf, exec_def=exec_def, expected=(1, 364), optimized=optimized)
+    _run_and_validate_results(gdf=gdf, exec_def=exec_def, expected=(1, 364), optimized=optimized, streaming=streaming)
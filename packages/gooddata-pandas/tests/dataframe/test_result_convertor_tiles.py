@@ -0,0 +1,121 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+from typing import Optional
+
+import pandas
+import pytest
+from gooddata_pandas.result_convertor import (
+    _MAX_TILE_EDGE,
+    _MIN_TILE_EDGE,
+    _tile_limit,
+    convert_execution_response_to_dataframe,
+)
+from gooddata_sdk import PagingPolicy
+
+from tests.dataframe.result_stub import StubPivotResponse, StubResultCacheMetadata
+
+_ACCUMULATORS = [(False, False), (True, False), (False, True)]
+
+
+def _convert(
+    response: StubPivotResponse,
+    result_size: int,
+    page_size: Optional[int],
+    fetch_parallelism: int,
+    optimized: bool = False,
+    streaming: bool = False,
+    paging: Optional[PagingPolicy] = None,
+) -> pandas.DataFrame:
+    df, _ = convert_execution_response_to_dataframe(
+        execution_response=response,  # type: ignore[arg-type]
+        result_cache_metadata=StubResultCacheMetadata(result_size),  # type: ignore[arg-type]
+        label_overrides={},
+        result_size_dimensions_limits=(),
+        page_size=page_size,
+        optimized=optimized,
+        streaming=streaming,
+        fetch_parallelism=fetch_parallelism,
+        paging=paging,
+    )
+    return df
+
+
+@pytest.mark.parametrize("optimized, streaming", _ACCUMULATORS)
+def test_parallel_tiles_same_as_serial(optimized: bool, streaming: bool):
+    serial_response = StubPivotResponse(rows=250, col_values=23, metrics=10)
+    parallel_response = StubPivotResponse(rows=250, col_values=23, metrics=10)
+
+    serial = _convert(serial_response, 0, 100, 1, optimized, streaming)
+    parallel = _convert(parallel_response, 0, 100, 4, optimized, streaming)
+
+    pandas.testing.assert_frame_equal(serial, parallel)
+    assert serial.shape == (250, 230)
+    assert serial.iloc[249, 229] == 250 * 230 - 1
+    # 3 row blocks x 3 column blocks
+    assert len(serial_response.requests) == 9
+    assert sorted(serial_response.requests) == sorted(parallel_response.requests)
+
+
+def test_tiles_from_result_size():
+    sized_response = StubPivotResponse(rows=2500, col_values=23, metrics=10)
+    fixed_response = StubPivotResponse(rows=2500, col_values=23, metrics=10)
+    result_size = 2500 * 230 * 8
+
+    sized = _convert(sized_response, result_size, None, 4)
+    fixed = _convert(fixed_response, result_size, 100, 1)
+
+    pandas.testing.assert_frame_equal(sized, fixed)
+    # whole rows are read at once, so much fewer pages are needed than with fixed 100x100 pages
+    assert len(sized_response.requests) < len(fixed_response.requests) / 5
+    assert all(limit[1] == 230 for offset, limit in sized_response.requests if offset[0] > 0)
+
+
+def test_small_result_read_using_single_page():
+    response = StubPivotResponse(rows=250, col_values=23, metrics=10)
+
+    df = _convert(response, 1000, None, 4)
+
+    assert df.shape == (250, 230)
+    assert response.requests == [((0, 0), (_MAX_TILE_EDGE, _MAX_TILE_EDGE))]
+
+
+def test_tile_limit():
+    class _Metadata:
+        def __init__(self, result_size: int) -> None:
+            self.result_size = result_size
+
+    # 8 bytes per cell, 1 MiB per tile -> 131072 cells in 230 columns
+    assert _tile_limit(_Metadata(100_000 * 230 * 8), [100_000, 230]) == [569, 230]  # type: ignore[arg-type]
+    # very wide result with large cells is capped in both dimensions
+    assert _tile_limit(_Metadata(10 * 5000 * 80), [10, 5000]) == [_MIN_TILE_EDGE, _MAX_TILE_EDGE]  # type: ignore[arg-type]
+    assert _tile_limit(_Metadata(100_000 * 8), [100_000]) == [_MAX_TILE_EDGE]  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("optimized, streaming", _ACCUMULATORS)
+@pytest.mark.parametrize("fetch_parallelism", [1, 4])
+@pytest.mark.parametrize("server_cap", [None, 150])
+def test_adaptive_paging(optimized: bool, streaming: bool, fetch_parallelism: int, server_cap: Optional[int]):
+    fixed = _convert(StubPivotResponse(rows=2500, col_values=23, metrics=10), 0, 100, 1)
+    response = StubPivotResponse(rows=2500, col_values=23, metrics=10, server_cap=server_cap)
+    policy = PagingPolicy(initial_size=100, max_size=1000)
+
+    adaptive = _convert(response, 0, 100, fetch_parallelism, optimized, streaming, paging=policy)
+
+    pandas.testing.assert_frame_equal(adaptive, fixed, check_dtype=not streaming)
+    assert policy.limit == (server_cap or 1000)
+
+
+@pytest.mark.parametrize("optimized, streaming", _ACCUMULATORS)
+@pytest.mark.parametrize("fetch_parallelism", [1, 4])
+@pytest.mark.parametrize("server_cap", [None, 70])
+def test_server_column_cap(optimized: bool, streaming: bool, fetch_parallelism: int, server_cap: Optional[int]):
+    fixed = _convert(StubPivotResponse(rows=250, col_values=23, metrics=10), 0, 100, 1, optimized, streaming)
+    response = StubPivotResponse(rows=250, col_values=23, metrics=10, server_cap=server_cap, column_cap=40)
+
+    capped = _convert(response, 0, 100, fetch_parallelism, optimized, streaming)
+
+    pandas.testing.assert_frame_equal(capped, fixed)
+    assert capped.shape == (250, 230)
+    # the columns skipped by each capped tile are read serially right after it
+    assert ((0, 80), (server_cap or 100, 60)) in response.requests
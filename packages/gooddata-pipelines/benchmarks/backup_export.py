@@ -0,0 +1,172 @@
+# (C) 2026 GoodData Corporation
+"""
+Benchmark of workspace export with a growing number of concurrent workers.
+
+A local stub server answers the API endpoints used by the backup with a fixed
+latency, so the measured time is dominated by waiting for responses - the same
+as against a remote GoodData Cloud organization. The stub also counts TCP
+connections to show that the connections are kept alive and reused.
+
+Run with:
+
+    python benchmarks/backup_export.py --workspaces 40 --latency 0.05 --workers 1 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from gooddata_pipelines.api.gooddata_api_wrapper import GoodDataApi
+from gooddata_pipelines.backup_and_restore.backup_manager import BackupManager
+from gooddata_pipelines.backup_and_restore.models.storage import (
+    BackupRestoreConfig,
+    LocalStorageConfig,
+    StorageType,
+)
+
+_ORG_ID = "benchmark"
+_ORGANIZATION = {
+    "data": {
+        "id": _ORG_ID,
+        "type": "organization",
+        "attributes": {"name": "Benchmark", "hostname": "localhost"},
+    },
+    "links": {"self": "http://localhost/api/v1/entities/organization"},
+}
+_ROUTES = [
+    (re.compile(r"/api/v1/entities/organization$"), _ORGANIZATION),
+    (re.compile(r"/api/v1/layout/workspaces/[^/]+$"), {}),
+    (re.compile(r"/api/v1/layout/workspaces/[^/]+/filterViews$"), []),
+    (
+        re.compile(r"/api/v1/layout/workspaces/[^/]+/userDataFilters$"),
+        {"userDataFilters": []},
+    ),
+    (
+        re.compile(r"/api/v1/entities/workspaces/[^/]+/automations$"),
+        {"data": []},
+    ),
+]
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency: float) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _StubServer
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self) -> None:
+        with self.server.lock:
+            self.server.requests += 1
+
+        time.sleep(self.server.latency)
+
+        path = self.path.split("?", 1)[0]
+        payload = next(
+            (payload for route, payload in _ROUTES if route.match(path)), None
+        )
+        body = json.dumps(payload).encode() if payload is not None else b""
+
+        self.send_response(200 if payload is not None else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _bench(
+    server: _StubServer, workspaces: list[str], workers: int
+) -> tuple[float, int, int]:
+    host, port = server.server_address[:2]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = BackupRestoreConfig(
+            storage_type=StorageType.LOCAL,
+            storage=LocalStorageConfig(backup_path=tmpdir),
+            max_workers=workers,
+            max_connections_per_host=workers,
+        )
+        manager = BackupManager.create(
+            config, f"http://{host!s}:{port}", "token"
+        )
+
+        with server.lock:
+            server.requests = 0
+            server.connections = 0
+
+        started = time.perf_counter()
+        manager._get_workspace_export(workspaces)
+        elapsed = time.perf_counter() - started
+
+    return elapsed, server.requests, server.connections
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--workspaces", type=int, default=40, help="number of workspaces"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="response latency (s)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 4, 8],
+        help="number of concurrent workers",
+    )
+    args = parser.parse_args()
+
+    # the stub server speaks plain HTTP
+    GoodDataApi._get_clean_host = staticmethod(lambda host: host)  # type: ignore[method-assign]
+
+    server = _StubServer(args.latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    workspaces = [f"ws{i}" for i in range(args.workspaces)]
+
+    print(
+        f"{'workers':>8} {'seconds':>8} {'requests':>9} "
+        f"{'connections':>12} {'speedup':>8}"
+    )
+    baseline = None
+
+    for workers in args.workers:
+        elapsed, requests, connections = _bench(server, workspaces, workers)
+        baseline = baseline or elapsed
+        print(
+            f"{workers:>8} {elapsed:>8.2f} {requests:>9} "
+            f"{connections:>12} {baseline / elapsed:>7.1f}x"
+        )
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ from typing import Any
 
 import requests
 
+from gooddata_pipelines.api.pooled_session import PooledSession
+
 TIMEOUT = 60
 REQUEST_PAGE_SIZE = 250
 API_VERSION = "v1"
@@ -15,6 +17,7 @@ API_VERSION = "v1"
 class ApiMethods:
     headers: dict[str, str]
     base_url: str
+    _session: PooledSession
 
     @staticmethod
     def _get_base_url(domain: str) -> str:
@@ -245,7 +248,9 @@ class ApiMethods:
         url = self._get_url(endpoint)
         request_headers = headers if headers else self.headers
 
-        return requests.get(url, headers=request_headers, timeout=TIMEOUT)
+        return self._session.request(
+            "GET", url, headers=request_headers, timeout=TIMEOUT
+        )
 
     def _post(
         self,
@@ -267,8 +272,12 @@ class ApiMethods:
         request_headers = headers if headers else self.headers
         data_json = json.dumps(data)
 
-        return requests.post(
-            url, data=data_json, headers=request_headers, timeout=TIMEOUT
+        return self._session.request(
+            "POST",
+            url,
+            data=data_json,
+            headers=request_headers,
+            timeout=TIMEOUT,
         )
 
     def _put(
@@ -291,8 +300,8 @@ class ApiMethods:
         request_headers = headers if headers else self.headers
         data_json = json.dumps(data)
 
-        return requests.put(
-            url, data=data_json, headers=request_headers, timeout=TIMEOUT
+        return self._session.request(
+            "PUT", url, data=data_json, headers=request_headers, timeout=TIMEOUT
         )
 
     def _delete(
@@ -308,7 +317,9 @@ class ApiMethods:
         """
         url = self._get_url(endpoint)
 
-        return requests.delete(url, headers=self.headers, timeout=TIMEOUT)
+        return self._session.request(
+            "DELETE", url, headers=self.headers, timeout=TIMEOUT
+        )
 
     @staticmethod
     def raise_if_response_not_ok(*responses: requests.Response) -> None:
@@ -2,9 +2,19 @@
 
 """Wrapper for interaction with GoodData Cloud."""
 
+from typing import Callable, TypeVar
+
 from gooddata_sdk.sdk import GoodDataSdk
 
 from gooddata_pipelines.api.gooddata_api import ApiMethods
+from gooddata_pipelines.api.pooled_session import (
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BACKOFF,
+    PooledSession,
+)
+
+T = TypeVar("T")
 
 
 # TODO: Refactor the GoodDataApi class to use composition instead of inheritance.
@@ -15,12 +25,24 @@ class GoodDataApi(ApiMethods):
     calls.
     """
 
-    def __init__(self, host: str, token: str) -> None:
+    def __init__(
+        self,
+        host: str,
+        token: str,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+    ) -> None:
         """Initialize the GoodDataApi with host and token.
 
         Args:
             host (str): The GoodData Cloud host URL.
             token (str): The authentication token for the GoodData Cloud API.
+            max_connections_per_host (int): Maximum number of concurrent
+                requests to the host.
+            max_retries (int): Maximum number of retries of a failed request.
+            retry_backoff (float): Wait time before the first retry in
+                seconds; doubles with each subsequent retry.
         """
         self._domain: str = self._get_clean_host(host)
         self._token: str = token
@@ -28,13 +50,30 @@ class GoodDataApi(ApiMethods):
         # Initialize the GoodData SDK
         self._sdk = GoodDataSdk.create(self._domain, self._token)
 
-        # Set up utils for direct API interaction
+        # Set up utils for direct API interaction; the connections are kept
+        # alive and shared by all threads
+        self._session = PooledSession(
+            max_connections_per_host, max_retries, retry_backoff
+        )
         self.base_url = self._get_base_url(self._domain)
         self.headers: dict = {
             "Authorization": f"Bearer {self._token}",
             "Content-Type": "application/vnd.gooddata.api+json",
         }
 
+    def call_sdk(self, call: Callable[[], T]) -> T:
+        """Runs a call of the GoodData SDK.
+
+        The call counts against the same per-host limit as the direct API
+        calls and it is retried on transient errors.
+
+        Args:
+            call (Callable[[], T]): The call to run.
+        Returns:
+            T: Result of the call.
+        """
+        return self._session.call_with_retry(self._domain, call)
+
     @staticmethod
     def _get_clean_host(host: str) -> str:
         """Returns a clean URL of the GoodData Cloud host.
@@ -0,0 +1,174 @@
+# (C) 2026 GoodData Corporation
+
+"""Keep-alive HTTP session shared by concurrent API calls."""
+
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any, Callable, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+import urllib3
+from gooddata_api_client.exceptions import ApiException  # type: ignore
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 0.5  # seconds
+MAX_RETRY_BACKOFF = 30.0  # seconds
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_transient(error: Exception) -> bool:
+    """Checks whether the failed call may succeed when repeated."""
+    if isinstance(error, ApiException):
+        return error.status in RETRY_STATUS_CODES
+
+    return isinstance(
+        error,
+        (
+            requests.ConnectionError,
+            requests.Timeout,
+            urllib3.exceptions.HTTPError,
+        ),
+    )
+
+
+class PooledSession:
+    """HTTP session that reuses connections across threads.
+
+    Every host gets a pool of keep-alive connections and a limit on the
+    number of requests that run against it at once. Requests that fail on
+    connection errors or with a transient status code (429 and 5xx) are
+    retried one by one with exponential backoff - a failing request does
+    not make its callers repeat the requests that already succeeded.
+    Retries of the idempotent methods are handled by the connection pool;
+    non-idempotent requests are not retried.
+
+    Args:
+        max_connections_per_host (int): Maximum number of requests running
+            against one host at once; also the size of its connection pool.
+        max_retries (int): Maximum number of retries of a failed request.
+        retry_backoff (float): Wait time before the first retry in seconds;
+            doubles with each subsequent retry.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+    ) -> None:
+        if max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be at least 1")
+
+        if max_retries < 0 or retry_backoff < 0:
+            raise ValueError(
+                "max_retries and retry_backoff must not be negative"
+            )
+
+        self.max_connections_per_host = max_connections_per_host
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=retry_backoff,
+            backoff_max=MAX_RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUS_CODES,
+            respect_retry_after_header=True,
+            # the last response is returned so that callers can report it
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_maxsize=max_connections_per_host,
+            max_retries=retry,
+        )
+
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+
+    @contextmanager
+    def host_slot(self, url: str) -> Generator[None, None, None]:
+        """Waits until a request to the host of the URL may run.
+
+        Args:
+            url (str): URL of the request.
+        """
+        host = urlsplit(url).netloc
+
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_connections_per_host)
+                self._host_slots[host] = slot
+
+        with slot:
+            yield
+
+    def request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> requests.Response:
+        """Sends a request over a pooled connection.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL of the request.
+            **kwargs: Arguments of `requests.Session.request`.
+        Returns:
+            requests.Response: The response from the server.
+        """
+        with self.host_slot(url):
+            return self._session.request(method, url, **kwargs)
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self.retry_backoff * 2**attempt, MAX_RETRY_BACKOFF)
+
+    def _call_once(self, url: str, call: Callable[[], T]) -> tuple[bool, Any]:
+        try:
+            with self.host_slot(url):
+                return True, call()
+        except Exception as e:
+            if not _is_transient(e):
+                raise
+
+            return False, e
+
+    def call_with_retry(self, url: str, call: Callable[[], T]) -> T:
+        """Runs a call that sends requests to the host of the URL.
+
+        Useful for calls that go through other HTTP clients, such as the
+        GoodData SDK. The call counts against the host's limit and it is
+        retried on transient errors the same way as the session's requests.
+
+        Args:
+            url (str): URL of the host the call sends requests to.
+            call (Callable[[], T]): The call to run.
+        Returns:
+            T: Result of the call.
+        """
+        attempt = 0
+
+        while True:
+            succeeded, result = self._call_once(url, call)
+            if succeeded:
+                return result
+
+            if attempt >= self.max_retries:
+                raise result
+
+            time.sleep(self._backoff(attempt))
+            attempt += 1
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        self._session.close()
@@ -1,15 +1,17 @@
 # (C) 2025 GoodData Corporation
 
-import os
-import shutil
-import tempfile
 import time
 import traceback
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any
 
 import attrs
 import requests
+from gooddata_sdk.catalog.workspace.declarative_model.workspace.workspace import (
+    CatalogDeclarativeFilterView,
+    CatalogDeclarativeWorkspaceModel,
+)
 
 from gooddata_pipelines.backup_and_restore.backup_input_processor import (
     BackupInputProcessor,
@@ -19,7 +21,15 @@ from gooddata_pipelines.backup_and_restore.constants import (
     BackupSettings,
     DirNames,
 )
+from gooddata_pipelines.backup_and_restore.layout_archive import (
+    LayoutArchive,
+    WorkspaceLayout,
+)
 from gooddata_pipelines.backup_and_restore.models.input_type import InputType
+from gooddata_pipelines.backup_and_restore.models.manifest import (
+    MANIFEST_FILE,
+    BackupManifest,
+)
 from gooddata_pipelines.backup_and_restore.models.storage import (
     BackupRestoreConfig,
 )
@@ -44,8 +54,12 @@ class BackupManager(BaseManager):
 
         self.loader = BackupInputProcessor(self._api, self.config.api_page_size)
 
-        self._api_rate_limiter = RateLimiter(
-            calls_per_second=self.config.api_calls_per_second,
+        # concurrent requests are bounded per host by the pooled session; the
+        # shared rate limiter is only an optional ceiling on top of that
+        self._api_rate_limiter: AbstractContextManager[Any] = (
+            RateLimiter(calls_per_second=self.config.api_calls_per_second)
+            if self.config.api_calls_per_second is not None
+            else nullcontext()
         )
 
     def get_user_data_filters(self, ws_id: str) -> dict:
@@ -57,41 +71,6 @@ class BackupManager(BaseManager):
             else:
                 raise RuntimeError(f"{response.status_code}: {response.text}")
 
-    def _store_user_data_filters(
-        self,
-        user_data_filters: dict,
-        export_path: Path,
-        ws_id: str,
-    ) -> None:
-        """Stores the user data filters in the specified export path."""
-        os.mkdir(
-            os.path.join(
-                export_path,
-                "gooddata_layouts",
-                self.org_id,
-                "workspaces",
-                ws_id,
-                "user_data_filters",
-            )
-        )
-
-        for filter in user_data_filters["userDataFilters"]:
-            udf_file_path = os.path.join(
-                export_path,
-                "gooddata_layouts",
-                self.org_id,
-                "workspaces",
-                ws_id,
-                "user_data_filters",
-                filter["id"] + ".yaml",
-            )
-            self.yaml_utils.dump(udf_file_path, filter)
-
-    @staticmethod
-    def _move_folder(source: Path, destination: Path) -> None:
-        """Moves the source folder to the destination."""
-        shutil.move(source, destination)
-
     def _get_automations_from_api(self, workspace_id: str) -> Any:
         """Returns automations for the workspace as JSON."""
         with self._api_rate_limiter:
@@ -106,144 +85,168 @@ class BackupManager(BaseManager):
                     + f"{response.status_code}: {response.text}"
                 )
 
-    def _store_automations(self, export_path: Path, workspace_id: str) -> None:
-        """Stores the automations in the specified export path."""
-        # Get the automations from the API
-        automations: Any = self._get_automations_from_api(workspace_id)
-
-        automations_folder_path: Path = Path(
-            export_path,
-            "gooddata_layouts",
-            self.org_id,
-            "workspaces",
-            workspace_id,
-            "automations",
-        )
-
-        automations_file_path: Path = Path(
-            automations_folder_path, "automations.json"
-        )
-
-        os.mkdir(automations_folder_path)
-
-        # Store the automations in a JSON file
-        if len(automations["data"]) > 0:
-            self.json_utils.dump(automations_file_path, automations)
+    def _get_declarative_workspace(
+        self, workspace_id: str
+    ) -> CatalogDeclarativeWorkspaceModel:
+        """Returns the logical data model and analytics model of the workspace."""
+        with self._api_rate_limiter:
+            return self._api.call_sdk(
+                lambda: (
+                    self._api._sdk.catalog_workspace.get_declarative_workspace(
+                        workspace_id
+                    )
+                )
+            )
 
-    def store_declarative_filter_views(
-        self, export_path: Path, workspace_id: str
-    ) -> None:
-        """Stores the filter views in the specified export path."""
-        # Get the filter views YAML files from the API
+    def _get_declarative_filter_views(
+        self, workspace_id: str
+    ) -> list[CatalogDeclarativeFilterView]:
+        """Returns the filter views of the workspace."""
         with self._api_rate_limiter:
-            self._api._sdk.catalog_workspace.store_declarative_filter_views(
-                workspace_id, export_path
+            return self._api.call_sdk(
+                lambda: (
+                    self._api._sdk.catalog_workspace.get_declarative_filter_views(
+                        workspace_id
+                    )
+                )
             )
 
-        # Move filter views to the subfolder containing the analytics model
-        self._move_folder(
-            Path(export_path, "gooddata_layouts", self.org_id, "filter_views"),
-            Path(
-                export_path,
-                "gooddata_layouts",
-                self.org_id,
-                "workspaces",
-                workspace_id,
-                "filter_views",
-            ),
+    def _get_backup_path(self, workspace_id: str) -> str:
+        """Returns the path of the workspace backup relative to backup path."""
+        return f"{self.org_id}/{workspace_id}/{BackupSettings.TIMESTAMP_SDK_FOLDER}"
+
+    def _get_latest_manifest_path(self, workspace_id: str) -> str:
+        """Returns the path of the manifest of the latest workspace backup."""
+        return f"{self.org_id}/{workspace_id}/{MANIFEST_FILE}"
+
+    def _get_latest_manifest(self, workspace_id: str) -> BackupManifest | None:
+        """Returns the manifest of the latest backup of the workspace, if any."""
+        data = self.storage.read_file(
+            self._get_latest_manifest_path(workspace_id)
         )
+        if data is None:
+            return None
 
-    def _get_workspace_export(
-        self,
-        local_target_path: str,
-        workspaces_to_export: list[str],
-    ) -> None:
+        return BackupManifest.model_validate_json(data)
+
+    def _export_workspace(self, workspace_id: str) -> bool:
         """
-        Iterate over all workspaces in the workspaces_to_export list and store
-        their declarative_workspace and their respective user data filters.
+        Stores the layout of the workspace, its filter views, automations and
+        user data filters in the storage. Returns False if the workspace was
+        skipped.
+
+        The layouts are written straight into a zip archive that is uploaded
+        to the storage while it is being written. In the incremental mode,
+        unchanged workspaces are not stored at all and changed workspaces
+        store only the files that changed since the previous backup.
         """
-        exported = False
-        for workspace_id in workspaces_to_export:
-            workspace_start_time = time.time()
-            export_path = Path(
-                local_target_path,
-                self.org_id,
+        workspace_start_time = time.time()
+
+        try:
+            user_data_filters = self.get_user_data_filters(workspace_id)
+        except Exception as e:
+            self.logger.error(
+                f"Skipping backup of {workspace_id} - check if workspace exists."
+                + f"{e.__class__.__name__}: {e}"
+            )
+            return False
+
+        backup_path = self._get_backup_path(workspace_id)
+        archive_path = f"{backup_path}/{DirNames.LAYOUTS}.zip"
+
+        try:
+            layout = WorkspaceLayout.collect(
+                self._get_declarative_workspace(workspace_id),
+                self._get_declarative_filter_views(workspace_id),
+                self._get_automations_from_api(workspace_id),
+                user_data_filters,
+            )
+            previous = (
+                self._get_latest_manifest(workspace_id)
+                if self.config.incremental
+                else None
+            )
+            manifest = BackupManifest.create(
                 workspace_id,
-                BackupSettings.TIMESTAMP_SDK_FOLDER,
+                backup_path,
+                layout.object_hashes(),
+                previous,
+                self.config.max_delta_chain,
             )
 
-            try:
-                user_data_filters = self.get_user_data_filters(workspace_id)
-            except Exception as e:
-                self.logger.error(
-                    f"Skipping backup of {workspace_id} - check if workspace exists."
-                    + f"{e.__class__.__name__}: {e}"
+            if (
+                previous is not None
+                and previous.workspace_hash == manifest.workspace_hash
+            ):
+                self.logger.info(
+                    f"Skipping backup of {workspace_id} - unchanged since "
+                    f"{previous.path}"
                 )
-                continue
-
-            try:
-                # TODO: consider using the API to get JSON declarations in memory
-                # or check if there is a way to get YAML structures directly from
-                # the SDK. That way we could save and package all the declarations
-                # directly instead of reorganizing the folder structures. That should
-                # be more transparent/readable and possibly safer for threading
-                with self._api_rate_limiter:
-                    self._api._sdk.catalog_workspace.store_declarative_workspace(
-                        workspace_id, export_path
-                    )
-                self.store_declarative_filter_views(export_path, workspace_id)
-                self._store_automations(export_path, workspace_id)
+                return True
 
-                self._store_user_data_filters(
-                    user_data_filters, export_path, workspace_id
-                )
+            changed = (
+                manifest.changed_objects(previous)
+                if previous is not None and manifest.is_delta
+                else None
+            )
 
-                workspace_duration_ms = int(
-                    (time.time() - workspace_start_time) * 1000
+            with (
+                self.storage.open_archive(archive_path) as upload,
+                LayoutArchive(upload) as archive,
+            ):
+                archive.add_layout(layout, only=changed)
+                archive.add_manifest(manifest)
+
+            if self.config.incremental:
+                self.storage.write_file(
+                    self._get_latest_manifest_path(workspace_id),
+                    manifest.model_dump_json().encode("utf-8"),
                 )
-                zip_file_path = f"{self.org_id}/{workspace_id}.zip"
 
-                self.logger.info(
-                    f"Completed backup for workspace {workspace_id} "
-                    f"to {zip_file_path} in {workspace_duration_ms}ms"
-                )
-                exported = True
-            except Exception as e:
-                workspace_duration_ms = int(
-                    (time.time() - workspace_start_time) * 1000
-                )
-                self.logger.error(
-                    f"Skipping {workspace_id} after {workspace_duration_ms}ms. "
-                    f"{e.__class__.__name__} encountered: {e}"
-                )
+            workspace_duration_ms = int(
+                (time.time() - workspace_start_time) * 1000
+            )
+            backup_kind = (
+                f"delta of {len(changed)} files on top of {manifest.base}"
+                if changed is not None
+                else "full"
+            )
 
-        if not exported:
+            self.logger.info(
+                f"Completed backup for workspace {workspace_id} "
+                f"to {archive_path} ({backup_kind}, {upload.size} bytes) "
+                f"in {workspace_duration_ms}ms"
+            )
+            return True
+        except Exception as e:
+            workspace_duration_ms = int(
+                (time.time() - workspace_start_time) * 1000
+            )
+            self.logger.error(
+                f"Skipping {workspace_id} after {workspace_duration_ms}ms. "
+                f"{e.__class__.__name__} encountered: {e}"
+            )
+            return False
+
+    def _get_workspace_export(self, workspaces_to_export: list[str]) -> None:
+        """
+        Export all workspaces in the workspaces_to_export list. Up to
+        `config.max_workers` workspaces are exported at once.
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.config.max_workers,
+            thread_name_prefix="gd-backup",
+        ) as executor:
+            results = list(
+                executor.map(self._export_workspace, workspaces_to_export)
+            )
+
+        if not any(results):
             raise RuntimeError(
                 "None of the workspaces were exported. Check that the source file "
                 + "is correct and that the workspaces exist."
             )
 
-    def _archive_gooddata_layouts_to_zip(self, folder: str) -> None:
-        """Archives the gooddata_layouts directory to a zip file."""
-        try:
-            target_subdir = ""
-            for subdir, dirs, files in os.walk(folder):
-                if DirNames.LAYOUTS in dirs:
-                    target_subdir = os.path.join(subdir, dirs[0])
-                if DirNames.LDM in dirs:
-                    inner_layouts_dir = subdir + "/gooddata_layouts"
-                    os.mkdir(inner_layouts_dir)
-                    for dir in dirs:
-                        shutil.move(
-                            os.path.join(subdir, dir),
-                            os.path.join(inner_layouts_dir),
-                        )
-                    shutil.make_archive(target_subdir, "zip", subdir)
-                    shutil.rmtree(target_subdir)
-        except Exception as e:
-            self.logger.error(f"Error archiving {folder} to zip: {e}")
-            raise
-
     @staticmethod
     def _split_to_batches(
         workspaces_to_export: list[str], batch_size: int
@@ -260,50 +263,27 @@ class BackupManager(BaseManager):
 
         return list_of_batches
 
-    def _process_batch(
-        self,
-        batch: BackupBatch,
-        retry_count: int = 0,
-    ) -> None:
+    def _process_batch(self, batch: BackupBatch) -> None:
         """Processes a single batch of workspaces for backup.
-        If the batch processing fails, the function will wait
-        and retry with exponential backoff up to BackupSettings.MAX_RETRIES.
-        The base wait time is defined by BackupSettings.RETRY_DELAY.
+
+        The batch is not retried as a whole: failed API requests are retried
+        one by one by the API client and workspaces that still fail are
+        skipped, so repeating the batch would only export the already
+        exported workspaces again.
         """
         try:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                self._get_workspace_export(tmpdir, batch.list_of_ids)
-
-                self._archive_gooddata_layouts_to_zip(
-                    str(Path(tmpdir, self.org_id))
-                )
-
-                self.storage.export(tmpdir, self.org_id)
-
+            self._get_workspace_export(batch.list_of_ids)
         except Exception as e:
-            if retry_count < BackupSettings.MAX_RETRIES:
-                # Retry with exponential backoff until MAX_RETRIES
-                next_retry = retry_count + 1
-                wait_time = BackupSettings.RETRY_DELAY**next_retry
-                self.logger.info(
-                    f"{e.__class__.__name__} encountered while processing a batch. "
-                    + f"Retrying {next_retry}/{BackupSettings.MAX_RETRIES} "
-                    + f"in {wait_time} seconds..."
-                )
-
-                time.sleep(wait_time)
-                self._process_batch(batch, next_retry)
-            else:
-                # If the batch fails after MAX_RETRIES, raise the error
-                self.logger.error(f"Batch failed: {e.__class__.__name__}: {e}")
-                raise
+            self.logger.error(f"Batch failed: {e.__class__.__name__}: {e}")
+            raise
 
     def _process_batches(
         self,
         batches: list[BackupBatch],
     ) -> None:
         """
-        Processes batches sequentially to avoid overloading the API.
+        Processes batches sequentially to avoid overloading the API; the
+        workspaces within a batch are exported concurrently.
         If any batch fails, the processing will stop.
         """
         for i, batch in enumerate(batches, 1):
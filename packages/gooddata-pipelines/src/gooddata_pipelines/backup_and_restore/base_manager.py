@@ -35,7 +35,13 @@ class BaseManager(abc.ABC):
     def __init__(self, host: str, token: str, config: BackupRestoreConfig):
         self.config = config
 
-        self._api: GoodDataApi = GoodDataApi(host, token)
+        self._api: GoodDataApi = GoodDataApi(
+            host,
+            token,
+            max_connections_per_host=config.max_connections_per_host,
+            max_retries=config.request_retries,
+            retry_backoff=config.request_retry_backoff,
+        )
         self.logger: LogObserver = LogObserver()
 
         self.storage = self._get_storage(self.config)
@@ -25,14 +25,18 @@ class DirNames:
 class ApiDefaults:
     PAGE_SIZE = 100
     BATCH_SIZE = 100
-    CALLS_PER_SECOND = 1.0
+    MAX_WORKERS = 4
+    MAX_CONNECTIONS_PER_HOST = 8
+    REQUEST_RETRIES = 3
+    REQUEST_RETRY_BACKOFF = 0.5  # seconds
 
 
 @attrs.frozen
 class BackupSettings:
     API = ApiDefaults()
-    MAX_RETRIES = 3
-    RETRY_DELAY = 5  # seconds
+    UPLOAD_PART_SIZE = 8 * 1024 * 1024  # bytes
+    MAX_DELTA_CHAIN = 7
+    PREFETCH_SIZE = 8
     TIMESTAMP_SDK_FOLDER = (
         str(datetime.datetime.now().strftime("%Y%m%d-%H%M%S"))
         + "-"
@@ -0,0 +1,297 @@
+# (C) 2026 GoodData Corporation
+
+"""Writes workspace layouts straight into a zip archive."""
+
+import hashlib
+import io
+import json
+import time
+import zipfile
+from collections.abc import Collection
+from typing import Any, Callable
+
+import attrs
+import yaml
+from gooddata_sdk.catalog.workspace.declarative_model.workspace.analytics_model.analytics_model import (
+    ATTRIBUTE_HIERARCHY_OBJECTS_DIR,
+    EXPORT_DEFINITION_DIR,
+    LAYOUT_ANALYTICAL_DASHBOARD_EXTENSIONS_DIR,
+    LAYOUT_ANALYTICAL_DASHBOARDS_DIR,
+    LAYOUT_ANALYTICS_MODEL_DIR,
+    LAYOUT_DASHBOARD_PLUGINS_DIR,
+    LAYOUT_FILTER_CONTEXTS_DIR,
+    LAYOUT_METRICS_DIR,
+    LAYOUT_VISUALIZATION_OBJECTS_DIR,
+    MEMORY_ITEMS_DIR,
+    CatalogDeclarativeAnalyticsLayer,
+)
+from gooddata_sdk.catalog.workspace.declarative_model.workspace.logical_model.dataset.dataset import (
+    LAYOUT_DATASETS_DIR,
+)
+from gooddata_sdk.catalog.workspace.declarative_model.workspace.logical_model.dataset_extensions.dataset_extension import (
+    LAYOUT_DATASET_EXTENSIONS_DIR,
+)
+from gooddata_sdk.catalog.workspace.declarative_model.workspace.logical_model.date_dataset.date_dataset import (
+    LAYOUT_DATE_INSTANCES_DIR,
+)
+from gooddata_sdk.catalog.workspace.declarative_model.workspace.logical_model.ldm import (
+    LAYOUT_LDM_DIR,
+    CatalogDeclarativeLdm,
+)
+from gooddata_sdk.catalog.workspace.declarative_model.workspace.workspace import (
+    CatalogDeclarativeFilterView,
+    CatalogDeclarativeWorkspaceModel,
+)
+from gooddata_sdk.utils import IndentDumper, deep_sort
+
+from gooddata_pipelines.backup_and_restore.constants import DirNames
+from gooddata_pipelines.backup_and_restore.models.manifest import (
+    MANIFEST_FILE,
+    BackupManifest,
+)
+
+FILTER_VIEWS_DIR = "filter_views"
+AUTOMATIONS_DIR = "automations"
+AUTOMATIONS_FILE = "automations.json"
+
+
+def _dump_sdk_yaml(content: Any) -> bytes:
+    """Serializes the content the same way as the GoodData SDK."""
+    return yaml.dump(
+        content, indent=2, Dumper=IndentDumper, allow_unicode=True
+    ).encode("utf-8")
+
+
+def _dump_yaml(content: Any) -> bytes:
+    return yaml.dump(content).encode("utf-8")
+
+
+def _dump_json(content: Any) -> bytes:
+    return json.dumps(content).encode("utf-8")
+
+
+def content_hash(content: Any) -> str:
+    """Returns a hash of the content that does not depend on key order."""
+    normalized = json.dumps(
+        deep_sort(content),
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+@attrs.frozen
+class LayoutFile:
+    """Single file of a workspace layout.
+
+    Args:
+        path (str): Path of the file relative to the layouts folder.
+        content (Any): Content of the file.
+        dump (Callable[[Any], bytes]): Serializes the content.
+    """
+
+    path: str
+    content: Any
+    dump: Callable[[Any], bytes] = _dump_sdk_yaml
+
+    @property
+    def content_hash(self) -> str:
+        return content_hash(self.content)
+
+
+@attrs.define
+class WorkspaceLayout:
+    """Folders and files of a workspace layout, with the same structure as
+    the layouts stored by the GoodData SDK:
+
+        ldm/...
+        analytics_model/...
+        filter_views/...
+        automations/automations.json
+        user_data_filters/...
+
+    The files are serialized only when they are written.
+    """
+
+    directories: list[str] = attrs.field(factory=list)
+    files: list[LayoutFile] = attrs.field(factory=list)
+
+    @classmethod
+    def collect(
+        cls,
+        workspace_model: CatalogDeclarativeWorkspaceModel,
+        filter_views: list[CatalogDeclarativeFilterView],
+        automations: dict[str, Any],
+        user_data_filters: dict[str, Any],
+    ) -> "WorkspaceLayout":
+        """Collects the layout from the objects returned by the API."""
+        layout = cls()
+
+        if workspace_model.ldm is not None:
+            layout._add_ldm(workspace_model.ldm)
+        if workspace_model.analytics is not None:
+            layout._add_analytics(workspace_model.analytics)
+
+        layout._add_objects(FILTER_VIEWS_DIR, filter_views)
+
+        layout.directories.append(AUTOMATIONS_DIR)
+        # the file is omitted when the workspace has no automations
+        if automations["data"]:
+            layout.files.append(
+                LayoutFile(
+                    f"{AUTOMATIONS_DIR}/{AUTOMATIONS_FILE}",
+                    automations,
+                    _dump_json,
+                )
+            )
+
+        layout.directories.append(DirNames.UDF)
+        for user_data_filter in user_data_filters["userDataFilters"]:
+            layout.files.append(
+                LayoutFile(
+                    f"{DirNames.UDF}/{user_data_filter['id']}.yaml",
+                    user_data_filter,
+                    _dump_yaml,
+                )
+            )
+
+        return layout
+
+    def object_hashes(self) -> dict[str, str]:
+        """Returns content hashes of the files keyed by their paths."""
+        return {file.path: file.content_hash for file in self.files}
+
+    def _add_objects(self, folder: str, objects: list[Any]) -> None:
+        self.directories.append(folder)
+        for obj in objects:
+            self.files.append(
+                LayoutFile(
+                    f"{folder}/{obj.id}.yaml",
+                    obj.to_api().to_dict(camel_case=True),
+                )
+            )
+
+    def _add_ldm(self, ldm: CatalogDeclarativeLdm) -> None:
+        self.directories.append(LAYOUT_LDM_DIR)
+        self._add_objects(
+            f"{LAYOUT_LDM_DIR}/{LAYOUT_DATASETS_DIR}", ldm.datasets
+        )
+        self._add_objects(
+            f"{LAYOUT_LDM_DIR}/{LAYOUT_DATE_INSTANCES_DIR}", ldm.date_instances
+        )
+        if ldm.dataset_extensions:
+            self._add_objects(
+                f"{LAYOUT_LDM_DIR}/{LAYOUT_DATASET_EXTENSIONS_DIR}",
+                ldm.dataset_extensions,
+            )
+
+    def _add_analytics(
+        self, analytics: CatalogDeclarativeAnalyticsLayer
+    ) -> None:
+        folder = LAYOUT_ANALYTICS_MODEL_DIR
+        self.directories.append(folder)
+        self._add_objects(
+            f"{folder}/{LAYOUT_ANALYTICAL_DASHBOARDS_DIR}",
+            analytics.analytical_dashboards,
+        )
+        self._add_objects(
+            f"{folder}/{LAYOUT_ANALYTICAL_DASHBOARD_EXTENSIONS_DIR}",
+            analytics.analytical_dashboard_extensions,
+        )
+        self._add_objects(
+            f"{folder}/{LAYOUT_DASHBOARD_PLUGINS_DIR}",
+            analytics.dashboard_plugins,
+        )
+        self._add_objects(
+            f"{folder}/{LAYOUT_FILTER_CONTEXTS_DIR}", analytics.filter_contexts
+        )
+        self._add_objects(f"{folder}/{LAYOUT_METRICS_DIR}", analytics.metrics)
+        self._add_objects(
+            f"{folder}/{LAYOUT_VISUALIZATION_OBJECTS_DIR}",
+            analytics.visualization_objects,
+        )
+        self._add_objects(
+            f"{folder}/{ATTRIBUTE_HIERARCHY_OBJECTS_DIR}",
+            analytics.attribute_hierarchies,
+        )
+        # export definitions are nested in the dashboards folder
+        self._add_objects(
+            f"{folder}/{LAYOUT_ANALYTICAL_DASHBOARDS_DIR}/{EXPORT_DEFINITION_DIR}",
+            analytics.export_definitions,
+        )
+        self._add_objects(
+            f"{folder}/{MEMORY_ITEMS_DIR}", analytics.memory_items
+        )
+
+
+class LayoutArchive:
+    """Zip archive with the layout of a single workspace.
+
+    The layout files are serialized one by one and written to the stream as
+    compressed entries, so no files are created on the disk. The layout is
+    stored in the `gooddata_layouts` folder of the archive, the manifest of
+    the backup in the root of the archive.
+
+    The stream does not need to be seekable. The archive is complete once it
+    is closed.
+
+    Args:
+        stream (io.RawIOBase): Writable binary stream the archive is written
+            to.
+    """
+
+    def __init__(self, stream: io.RawIOBase) -> None:
+        self._zip = zipfile.ZipFile(
+            stream, "w", compression=zipfile.ZIP_DEFLATED
+        )
+        self._date_time = time.localtime()[:6]
+
+    def __enter__(self) -> "LayoutArchive":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Writes the central directory of the archive."""
+        self._zip.close()
+
+    def add_directory(self, path: str) -> None:
+        """Adds an empty directory to the layouts folder."""
+        info = zipfile.ZipInfo(
+            f"{DirNames.LAYOUTS}/{path}/", date_time=self._date_time
+        )
+        info.external_attr = (0o40755 << 16) | 0x10
+        self._zip.writestr(info, b"")
+
+    def add_file(self, path: str, content: bytes) -> None:
+        """Adds a file to the layouts folder."""
+        self._write(f"{DirNames.LAYOUTS}/{path}", content)
+
+    def add_layout(
+        self, layout: WorkspaceLayout, only: Collection[str] | None = None
+    ) -> None:
+        """Adds the layout to the archive.
+
+        Args:
+            layout (WorkspaceLayout): The layout to add.
+            only (Collection[str] | None): Paths of the files to add; all the
+                files are added if not specified. Folders are always added.
+        """
+        for directory in layout.directories:
+            self.add_directory(directory)
+
+        for file in layout.files:
+            if only is None or file.path in only:
+                self.add_file(file.path, file.dump(file.content))
+
+    def add_manifest(self, manifest: BackupManifest) -> None:
+        """Adds the manifest of the backup."""
+        self._write(MANIFEST_FILE, manifest.model_dump_json().encode("utf-8"))
+
+    def _write(self, name: str, content: bytes) -> None:
+        info = zipfile.ZipInfo(name, date_time=self._date_time)
+        info.external_attr = 0o644 << 16
+        info.compress_type = zipfile.ZIP_DEFLATED
+        self._zip.writestr(info, content)
@@ -0,0 +1,92 @@
+# (C) 2026 GoodData Corporation
+
+import hashlib
+
+from pydantic import BaseModel, ConfigDict
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def workspace_hash(objects: dict[str, str]) -> str:
+    """Returns a hash of the whole workspace layout from its object hashes."""
+    digest = hashlib.sha256()
+    for path in sorted(objects):
+        digest.update(f"{path}:{objects[path]}\n".encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+class BackupManifest(BaseModel):
+    """Content hashes of a workspace backup.
+
+    The manifest is stored in the root of each backup archive. A full backup
+    contains all the files of the layout; a delta backup contains only the
+    files that changed since its base backup, and the full layout is rebuilt
+    by applying the chain of delta backups on top of the full one.
+
+    Args:
+        workspace_id: The ID of the backed up workspace.
+        path: The path to the folder of the backup, relative to the backup
+            path of the storage - `organization_id/workspace_id/timestamp`.
+        base: The path to the folder of the backup this delta backup builds
+            on. None for full backups.
+        chain_length: The number of delta backups between this backup and the
+            full backup it builds on.
+        workspace_hash: Hash of the whole layout.
+        objects: Content hashes of all the files of the layout, keyed by their
+            paths relative to the `gooddata_layouts` folder. Lists also the
+            files that are not stored in a delta backup.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    version: int = MANIFEST_VERSION
+    workspace_id: str
+    path: str
+    base: str | None = None
+    chain_length: int = 0
+    workspace_hash: str
+    objects: dict[str, str]
+
+    @classmethod
+    def create(
+        cls,
+        workspace_id: str,
+        path: str,
+        objects: dict[str, str],
+        previous: "BackupManifest | None" = None,
+        max_delta_chain: int = 0,
+    ) -> "BackupManifest":
+        """Creates the manifest of a new backup.
+
+        The backup is a delta of the previous backup unless there is no
+        previous backup or the chain of delta backups is already
+        `max_delta_chain` long.
+        """
+        if previous is None or previous.chain_length >= max_delta_chain:
+            base, chain_length = None, 0
+        else:
+            base, chain_length = previous.path, previous.chain_length + 1
+
+        return cls(
+            workspace_id=workspace_id,
+            path=path,
+            base=base,
+            chain_length=chain_length,
+            workspace_hash=workspace_hash(objects),
+            objects=objects,
+        )
+
+    @property
+    def is_delta(self) -> bool:
+        return self.base is not None
+
+    def changed_objects(self, previous: "BackupManifest") -> set[str]:
+        """Returns paths of the files that are new or changed since the
+        previous backup."""
+        return {
+            path
+            for path, content_hash in self.objects.items()
+            if previous.objects.get(path) != content_hash
+        }
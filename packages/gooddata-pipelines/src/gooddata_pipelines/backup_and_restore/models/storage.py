@@ -202,7 +202,14 @@ class BackupRestoreConfig(BaseModel):
         storage: Storage configuration. Either `S3StorageConfig`, `AzureStorageConfig`, or `LocalStorageConfig`. Defaults to `LocalStorageConfig()`.
         api_page_size: The page size for fetching workspace relationships. Defaults to `BackupSettings.API.PAGE_SIZE`.
         batch_size: The batch size for fetching workspace relationships. Defaults to `BackupSettings.API.BATCH_SIZE`.
-        api_calls_per_second: The maximum API calls per second (rate limiting). Defaults to `BackupSettings.API.CALLS_PER_SECOND`.
+        api_calls_per_second: The maximum API calls per second across all workers during backup. Not limited by default; the number of concurrent requests is bounded by `max_connections_per_host`.
+        max_workers: The number of workspaces exported or restored at once. Defaults to `BackupSettings.API.MAX_WORKERS`.
+        max_connections_per_host: The maximum number of concurrent API requests. Defaults to `BackupSettings.API.MAX_CONNECTIONS_PER_HOST`.
+        request_retries: The maximum number of retries of a failed API request. Defaults to `BackupSettings.API.REQUEST_RETRIES`.
+        request_retry_backoff: The wait time in seconds before the first retry of a failed API request; doubles with each retry. Defaults to `BackupSettings.API.REQUEST_RETRY_BACKOFF`.
+        incremental: Whether to skip workspaces that did not change since their last backup and to store only the changed files of the rest. Defaults to False.
+        max_delta_chain: The maximum number of consecutive incremental backups of a workspace before a full backup is made. Defaults to `BackupSettings.MAX_DELTA_CHAIN`.
+        prefetch_size: The maximum number of backups downloaded ahead of their restore. Defaults to `BackupSettings.PREFETCH_SIZE`.
     """
 
     storage_type: StorageType = Field(default=StorageType.LOCAL)
@@ -224,12 +231,58 @@ class BackupRestoreConfig(BaseModel):
         ),
     ] = Field(default=BackupSettings.API.BATCH_SIZE)
     api_calls_per_second: Annotated[
-        float,
+        float | None,
         Field(
             gt=0,
             description="Maximum API calls per second (rate limiting)",
         ),
-    ] = Field(default=BackupSettings.API.CALLS_PER_SECOND)
+    ] = Field(default=None)
+    max_workers: Annotated[
+        int,
+        Field(
+            gt=0,
+            description="Number of workspaces exported or restored at once",
+        ),
+    ] = Field(default=BackupSettings.API.MAX_WORKERS)
+    max_connections_per_host: Annotated[
+        int,
+        Field(
+            gt=0,
+            description="Maximum number of concurrent API requests",
+        ),
+    ] = Field(default=BackupSettings.API.MAX_CONNECTIONS_PER_HOST)
+    request_retries: Annotated[
+        int,
+        Field(
+            ge=0,
+            description="Maximum number of retries of a failed API request",
+        ),
+    ] = Field(default=BackupSettings.API.REQUEST_RETRIES)
+    request_retry_backoff: Annotated[
+        float,
+        Field(
+            ge=0,
+            description="Wait time before the first retry in seconds",
+        ),
+    ] = Field(default=BackupSettings.API.REQUEST_RETRY_BACKOFF)
+    incremental: bool = Field(
+        default=False,
+        description="Store only workspaces and files that changed since the last backup",
+    )
+    max_delta_chain: Annotated[
+        int,
+        Field(
+            ge=0,
+            description="Maximum number of consecutive incremental backups",
+        ),
+    ] = Field(default=BackupSettings.MAX_DELTA_CHAIN)
+    prefetch_size: Annotated[
+        int,
+        Field(
+            gt=0,
+            description="Maximum number of backups downloaded ahead of restore",
+        ),
+    ] = Field(default=BackupSettings.PREFETCH_SIZE)
 
     @classmethod
     def from_yaml(cls, conf_path: str) -> "BackupRestoreConfig":
@@ -1,8 +1,14 @@
 # (C) 2025 GoodData Corporation
 
+import functools
+import json
 import os
+import shutil
 import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -23,6 +29,10 @@ from pydantic import BaseModel, ConfigDict
 
 from gooddata_pipelines.backup_and_restore.base_manager import BaseManager
 from gooddata_pipelines.backup_and_restore.constants import DirNames
+from gooddata_pipelines.backup_and_restore.models.manifest import (
+    MANIFEST_FILE,
+    BackupManifest,
+)
 from gooddata_pipelines.utils.decorators import log_and_reraise_exception
 
 
@@ -40,7 +50,8 @@ class WorkspaceToRestore(BaseModel):
         path: The path to the folder containing the `gooddata_layouts.zip` file
             to restore. Should be a continuation of the `backup_path` specified
             in the storage configuration. Typically, it would look something like
-            `organization_id/workspace_id/backup_timestamp`
+            `organization_id/workspace_id/backup_timestamp`. Incremental backups
+            are restored together with the backups they build on.
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -49,6 +60,58 @@ class WorkspaceToRestore(BaseModel):
     path: str
 
 
+@attrs.define
+class RestoreCheckpoint:
+    """Workspaces restored so far, stored in a JSON file after each restore.
+
+    A workspace is identified by its ID and the path of the restored backup,
+    so restoring a different backup of the same workspace is not skipped.
+    """
+
+    path: Path
+    restored: set[tuple[str, str]] = attrs.field(factory=set)
+    _lock: threading.Lock = attrs.field(factory=threading.Lock, init=False)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "RestoreCheckpoint":
+        """Loads the checkpoint from the file if it exists."""
+        path = Path(path)
+        if not path.exists():
+            return cls(path)
+
+        data = json.loads(path.read_text())
+        return cls(
+            path,
+            {(item["id"], item["path"]) for item in data["restored"]},
+        )
+
+    def is_restored(self, workspace_to_restore: WorkspaceToRestore) -> bool:
+        return (
+            workspace_to_restore.id,
+            workspace_to_restore.path,
+        ) in self.restored
+
+    def add(self, workspace_to_restore: WorkspaceToRestore) -> None:
+        """Records the restored workspace and saves the checkpoint."""
+        with self._lock:
+            self.restored.add(
+                (workspace_to_restore.id, workspace_to_restore.path)
+            )
+            content = json.dumps(
+                {
+                    "restored": [
+                        {"id": workspace_id, "path": path}
+                        for workspace_id, path in sorted(self.restored)
+                    ]
+                },
+                indent=2,
+            )
+            # replace the file at once so that it is never left half-written
+            partial_path = self.path.with_name(self.path.name + ".part")
+            partial_path.write_text(content)
+            os.replace(partial_path, self.path)
+
+
 class RestoreManager(BaseManager):
     """Restores previsouly created backups of workspace metadata."""
 
@@ -60,6 +123,73 @@ class RestoreManager(BaseManager):
         with zipfile.ZipFile(file_to_extract, "r") as zip_ref:
             zip_ref.extractall(destination)
 
+    def _read_manifest(self, tempdir_path: Path) -> BackupManifest | None:
+        """Reads and removes the manifest extracted from a backup archive.
+        Backups created before manifests were introduced have none."""
+        manifest_path = tempdir_path / MANIFEST_FILE
+        if not manifest_path.exists():
+            return None
+
+        manifest = BackupManifest.model_validate_json(
+            manifest_path.read_bytes()
+        )
+        manifest_path.unlink()
+        return manifest
+
+    @staticmethod
+    def _apply_delta(
+        layout_path: Path, delta_path: Path, manifest: BackupManifest
+    ) -> None:
+        """Applies files of a delta backup on top of the layout of its base."""
+        for file in [path for path in layout_path.rglob("*") if path.is_file()]:
+            if file.relative_to(layout_path).as_posix() not in manifest.objects:
+                # removed since the base backup
+                file.unlink()
+
+        shutil.copytree(delta_path, layout_path, dirs_exist_ok=True)
+
+        missing = [
+            path
+            for path in manifest.objects
+            if not (layout_path / path).is_file()
+        ]
+        if missing:
+            raise RuntimeError(
+                f"Backup {manifest.path} is incomplete, missing files: "
+                + ", ".join(sorted(missing))
+            )
+
+    def _fetch_backup(
+        self, path: str, tempdir_path: Path, applied: tuple[str, ...] = ()
+    ) -> None:
+        """Downloads the backup and extracts its layout to the temporary folder.
+
+        A delta backup contains only the files that changed since its base
+        backup. The base backup is fetched first (recursively, down to the
+        full backup) and the delta is applied on top of it.
+        """
+        zip_target = tempdir_path / f"{DirNames.LAYOUTS}.zip"
+        self.storage.get_ws_declaration(path, str(zip_target))
+        self._extract_zip_archive(zip_target, tempdir_path)
+        zip_target.unlink(missing_ok=True)
+
+        manifest = self._read_manifest(tempdir_path)
+        if manifest is None or manifest.base is None:
+            return
+
+        if manifest.base in applied:
+            raise RuntimeError(f"Backup {path} has a cyclic chain of bases.")
+
+        self.logger.info(f"Backup {path} is a delta of {manifest.base}.")
+
+        layout_path = tempdir_path / DirNames.LAYOUTS
+        delta_path = tempdir_path / f"delta_{len(applied)}"
+        shutil.move(layout_path, delta_path)
+
+        self._fetch_backup(manifest.base, tempdir_path, (*applied, path))
+        self._apply_delta(layout_path, delta_path, manifest)
+        shutil.rmtree(delta_path)
+
     def _check_workspace_is_valid(self, workspace_root_dir_path: Path) -> None:
         """Checks if the workspace layout is valid."""
         if (
@@ -221,46 +351,216 @@ class RestoreManager(BaseManager):
                 f"Failed to post automation ({response.status_code}): {response.text}"
             )
 
-    def _restore_backup(
+    def _prefetch_backup(
         self, workspace_to_restore: WorkspaceToRestore, tempdir_path: Path
-    ) -> None:
-        """Restores the backup of a workspace."""
+    ) -> tuple[Path, int]:
+        """Downloads and extracts the backup of a workspace ahead of its restore.
 
-        zip_target = tempdir_path / f"{DirNames.LAYOUTS}.zip"
+        Returns:
+            tuple[Path, int]: The path to the extracted layouts and the time
+                spent downloading them in milliseconds.
+        """
+        start_time = time.time()
         src_path = tempdir_path / DirNames.LAYOUTS
 
+        self._fetch_backup(workspace_to_restore.path, tempdir_path)
+        self._check_workspace_is_valid(src_path)
+
+        return src_path, int((time.time() - start_time) * 1000)
+
+    def _put_backup(self, workspace_id: str, src_path: Path) -> None:
+        """Puts the extracted backup into the GoodData workspace."""
+        workspace_model: WorkspaceModel = self._load_workspace_layout(src_path)
+        user_data_filters = self._load_user_data_filters(src_path)
+        self._put_workspace_layout(workspace_id, workspace_model)
+        self._put_user_data_filters(workspace_id, user_data_filters)
+        self._load_and_put_filter_views(workspace_id, src_path)
+        self._load_and_post_automations(workspace_id, src_path)
+
+    def _restore_backup(
+        self,
+        workspace_to_restore: WorkspaceToRestore,
+        prefetched: Future[tuple[Path, int]],
+        dependency: Future[bool] | None,
+    ) -> bool:
+        """Restores the prefetched backup of a workspace once the workspace it
+        depends on is restored. Returns False if the restore failed."""
         try:
-            self.storage.get_ws_declaration(
-                workspace_to_restore.path, str(zip_target)
-            )
-            self._extract_zip_archive(zip_target, tempdir_path)
-            self._check_workspace_is_valid(src_path)
-            workspace_model: WorkspaceModel = self._load_workspace_layout(
-                src_path
-            )
-            user_data_filters = self._load_user_data_filters(src_path)
-            self._put_workspace_layout(workspace_to_restore.id, workspace_model)
-            self._put_user_data_filters(
-                workspace_to_restore.id, user_data_filters
-            )
-            self._load_and_put_filter_views(workspace_to_restore.id, src_path)
-            self._load_and_post_automations(workspace_to_restore.id, src_path)
-            self.logger.info(
-                f"Finished backup restore of {workspace_to_restore.id} from {workspace_to_restore.path}."
-            )
+            src_path, download_ms = prefetched.result()
+            if dependency is not None:
+                dependency.result()
+
+            start_time = time.time()
+            self._put_backup(workspace_to_restore.id, src_path)
+            restore_ms = int((time.time() - start_time) * 1000)
         except Exception as e:
             self.logger.error(
                 f"Failed to restore backup of {workspace_to_restore.id} from {workspace_to_restore.path}. "
                 f"Error caused by {e.__class__.__name__}: {e}."
             )
+            return False
+
+        self.logger.info(
+            f"Finished backup restore of {workspace_to_restore.id} from {workspace_to_restore.path} "
+            f"in {download_ms + restore_ms}ms "
+            f"(download {download_ms}ms, restore {restore_ms}ms)."
+        )
+        return True
+
+    def _get_parents(self) -> dict[str, str | None]:
+        """Returns the parent IDs of the workspaces in the organization."""
+        workspaces = self._api.call_sdk(
+            self._api._sdk.catalog_workspace.list_workspaces
+        )
+        return {workspace.id: workspace.parent_id for workspace in workspaces}
+
+    @staticmethod
+    def _order_by_hierarchy(
+        workspaces_to_restore: list[WorkspaceToRestore],
+        parents: dict[str, str | None],
+    ) -> list[tuple[WorkspaceToRestore, int | None]]:
+        """Orders the workspaces so that parents are restored before their
+        children.
+
+        Returns:
+            list[tuple[WorkspaceToRestore, int | None]]: The workspaces paired
+                with the index of the workspace that must be restored first -
+                the closest restored ancestor or an earlier restore of the
+                same workspace. None for independent workspaces.
+        """
+
+        def ancestors(workspace_id: str) -> list[str]:
+            chain: list[str] = []
+            parent_id = parents.get(workspace_id)
+            while parent_id is not None and parent_id not in chain:
+                chain.append(parent_id)
+                parent_id = parents.get(parent_id)
+            return chain
+
+        restored_ids = {workspace.id for workspace in workspaces_to_restore}
+        depths = {
+            workspace_id: len(
+                [a for a in ancestors(workspace_id) if a in restored_ids]
+            )
+            for workspace_id in restored_ids
+        }
+        ordered = sorted(
+            workspaces_to_restore, key=lambda workspace: depths[workspace.id]
+        )
 
-    def restore(self, workspaces_to_restore: list[WorkspaceToRestore]) -> None:
+        result: list[tuple[WorkspaceToRestore, int | None]] = []
+        last_index: dict[str, int] = {}
+        for index, workspace in enumerate(ordered):
+            dependency = last_index.get(workspace.id)
+            if dependency is None:
+                dependency = next(
+                    (
+                        last_index[ancestor]
+                        for ancestor in ancestors(workspace.id)
+                        if ancestor in last_index
+                    ),
+                    None,
+                )
+            result.append((workspace, dependency))
+            last_index[workspace.id] = index
+
+        return result
+
+    def restore(
+        self,
+        workspaces_to_restore: list[WorkspaceToRestore],
+        checkpoint_path: str | Path | None = None,
+    ) -> None:
         """Restores the backups of workspaces.
 
+        The backups are downloaded ahead of time by `max_workers` threads,
+        holding at most `prefetch_size` extracted backups at once. Up to
+        `max_workers` workspaces are restored in parallel; parent workspaces
+        are restored before their children.
+
         Args:
             workspaces_to_restore: List of workspaces to restore.
+            checkpoint_path: Path to a file that records restored workspaces.
+                Workspaces already recorded in the file are skipped, so an
+                interrupted restore can be resumed by running it again with
+                the same file.
         """
-        for workspace_to_restore in workspaces_to_restore:
-            with tempfile.TemporaryDirectory() as tempdir:
-                tempdir_path = Path(tempdir)
-                self._restore_backup(workspace_to_restore, tempdir_path)
+        checkpoint = (
+            RestoreCheckpoint.load(checkpoint_path)
+            if checkpoint_path is not None
+            else None
+        )
+        pending = [
+            workspace
+            for workspace in workspaces_to_restore
+            if checkpoint is None or not checkpoint.is_restored(workspace)
+        ]
+        if len(pending) < len(workspaces_to_restore):
+            self.logger.info(
+                f"Skipping {len(workspaces_to_restore) - len(pending)} "
+                f"workspaces already restored according to {checkpoint_path}."
+            )
+        if not pending:
+            return
+
+        start_time = time.time()
+        ordered = self._order_by_hierarchy(pending, self._get_parents())
+        prefetch_slots = threading.BoundedSemaphore(self.config.prefetch_size)
+        restores: list[Future[bool]] = []
+
+        with (
+            ThreadPoolExecutor(
+                max_workers=self.config.max_workers,
+                thread_name_prefix="restore-download",
+            ) as download_executor,
+            ThreadPoolExecutor(
+                max_workers=self.config.max_workers,
+                thread_name_prefix="restore",
+            ) as restore_executor,
+        ):
+            # Workspaces are submitted parents first, so a restore only ever
+            # waits for restores that were submitted before it.
+            for workspace_to_restore, dependency in ordered:
+                prefetch_slots.acquire()
+                tempdir_path = Path(tempfile.mkdtemp())
+
+                prefetched = download_executor.submit(
+                    self._prefetch_backup, workspace_to_restore, tempdir_path
+                )
+                restored = restore_executor.submit(
+                    self._restore_backup,
+                    workspace_to_restore,
+                    prefetched,
+                    restores[dependency] if dependency is not None else None,
+                )
+                restored.add_done_callback(
+                    functools.partial(
+                        self._finish_restore,
+                        workspace_to_restore,
+                        tempdir_path,
+                        prefetch_slots,
+                        checkpoint,
+                    )
+                )
+                restores.append(restored)
+
+        restored_count = sum(restored.result() for restored in restores)
+        self.logger.info(
+            f"Restored {restored_count} of {len(restores)} workspaces "
+            f"in {int(time.time() - start_time)}s."
+        )
+
+    @staticmethod
+    def _finish_restore(
+        workspace_to_restore: WorkspaceToRestore,
+        tempdir_path: Path,
+        prefetch_slot: threading.BoundedSemaphore,
+        checkpoint: RestoreCheckpoint | None,
+        restored: Future[bool],
+    ) -> None:
+        """Records the restored workspace and frees its prefetch slot."""
+        shutil.rmtree(tempdir_path, ignore_errors=True)
+        prefetch_slot.release()
+
+        if checkpoint is not None and restored.result():
+            checkpoint.add(workspace_to_restore)
@@ -1,21 +1,52 @@
 # (C) 2025 GoodData Corporation
 
-import os
+import base64
 from typing import cast
 
 from azure.core.credentials import TokenCredential
+from azure.core.exceptions import ResourceNotFoundError
 from azure.identity import DefaultAzureCredential, ClientSecretCredential
-from azure.storage.blob import BlobServiceClient
+from azure.storage.blob import BlobBlock, BlobClient, BlobServiceClient
 
 from gooddata_pipelines.backup_and_restore.models.storage import (
     BackupRestoreConfig,
     AzureStorageConfig,
 )
 from gooddata_pipelines.backup_and_restore.storage.base_storage import (
+    ArchiveUpload,
     BackupStorage,
 )
 
 
+class AzureArchiveUpload(ArchiveUpload):
+    """Uploads the archive to Azure Blob Storage as a block blob. Parts are
+    staged as blocks and committed at once; smaller archives are uploaded
+    with a single call."""
+
+    def __init__(self, blob_client: BlobClient):
+        super().__init__()
+        self._blob_client = blob_client
+        self._block_ids: list[str] = []
+
+    def _upload_part(self, part_number: int, data: bytes) -> None:
+        # block IDs of one blob must have the same length
+        block_id = base64.b64encode(f"{part_number:08d}".encode()).decode()
+        self._blob_client.stage_block(block_id, data)
+        self._block_ids.append(block_id)
+
+    def _complete(self, part_count: int) -> None:
+        self._blob_client.commit_block_list(
+            [BlobBlock(block_id=block_id) for block_id in self._block_ids]
+        )
+
+    def _upload_whole(self, data: bytes) -> None:
+        self._blob_client.upload_blob(data, overwrite=True)
+
+    def _abort(self) -> None:
+        # uncommitted blocks are discarded by Azure Blob Storage
+        self._block_ids.clear()
+
+
 class AzureStorage(BackupStorage):
     def __init__(self, conf: BackupRestoreConfig):
         super().__init__(conf)
@@ -89,21 +120,19 @@ class AzureStorage(BackupStorage):
                 f"in storage account '{self._config.account_name}': {e}"
             )
 
-    def export(self, folder: str, org_id: str) -> None:
-        """Uploads the content of the folder to Azure Blob Storage as a backup."""
-        storage_path = f"{self._config.account_name}/{self._config.container}/{self._backup_path}"
-        self.logger.info(f"Uploading {org_id} to {storage_path}")
-        folder = f"{folder}/{org_id}"
-
-        for subdir, dirs, files in os.walk(folder):
-            for file in files:
-                full_path = os.path.join(subdir, file)
-                with open(full_path, "rb") as data:
-                    export_path = f"{self._backup_path}{org_id}/{full_path[len(folder) + 1 :]}"
-                    blob_client = self._container_client.get_blob_client(
-                        export_path
-                    )
-                    blob_client.upload_blob(data, overwrite=True)
+    def _create_upload(self, path: str) -> ArchiveUpload:
+        return AzureArchiveUpload(
+            self._container_client.get_blob_client(f"{self._backup_path}{path}")
+        )
+
+    def read_file(self, path: str) -> bytes | None:
+        blob_client = self._container_client.get_blob_client(
+            f"{self._backup_path}{path}"
+        )
+        try:
+            return blob_client.download_blob().readall()
+        except ResourceNotFoundError:
+            return None
 
     def get_ws_declaration(
         self, target_path: str, local_target_path: str
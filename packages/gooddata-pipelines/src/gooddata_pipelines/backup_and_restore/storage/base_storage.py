@@ -1,12 +1,126 @@
 # (C) 2025 GoodData Corporation
 
 import abc
+import io
+import os
+import shutil
+import warnings
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
 
+from gooddata_pipelines.backup_and_restore.constants import BackupSettings
 from gooddata_pipelines.backup_and_restore.models.storage import (
     BackupRestoreConfig,
 )
 from gooddata_pipelines.logger import LogObserver
 
+if TYPE_CHECKING:
+    from typing_extensions import Buffer
+
+
+class ArchiveUpload(io.RawIOBase):
+    """Write-only stream that stores a backup archive in parts.
+
+    Written data is buffered and handed over to the storage one part at a
+    time, so the memory used does not depend on the size of the archive.
+    Archives that fit into a single part are stored in one call.
+
+    The archive is stored only once `commit` is called; `abort` (or closing
+    the stream without a commit) discards the parts uploaded so far.
+
+    Args:
+        part_size (int): Size of the uploaded parts in bytes.
+    """
+
+    def __init__(self, part_size: int = BackupSettings.UPLOAD_PART_SIZE):
+        super().__init__()
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._part_count = 0
+        self._size = 0
+        self._finished = False
+
+    @property
+    def size(self) -> int:
+        """Number of bytes written to the stream."""
+        return self._size
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: "Buffer", /) -> int:
+        if self._finished:
+            raise ValueError("Write to a finished archive upload.")
+
+        size = memoryview(data).nbytes
+        self._buffer += data
+        self._size += size
+
+        while len(self._buffer) >= self._part_size:
+            part = bytes(self._buffer[: self._part_size])
+            del self._buffer[: self._part_size]
+            self._part_count += 1
+            self._upload_part(self._part_count, part)
+
+        return size
+
+    def commit(self) -> None:
+        """Uploads the rest of the data and stores the archive."""
+        if self._finished:
+            return
+
+        self._finished = True
+        rest = bytes(self._buffer)
+        self._buffer.clear()
+
+        if self._part_count == 0:
+            self._upload_whole(rest)
+            return
+
+        if rest:
+            self._part_count += 1
+            self._upload_part(self._part_count, rest)
+
+        self._complete(self._part_count)
+
+    def abort(self) -> None:
+        """Discards the archive."""
+        if self._finished:
+            return
+
+        self._finished = True
+        self._buffer.clear()
+
+        if self._part_count > 0:
+            self._abort()
+
+    def close(self) -> None:
+        if not self.closed:
+            self.abort()
+
+        super().close()
+
+    @abc.abstractmethod
+    def _upload_part(self, part_number: int, data: bytes) -> None:
+        """Uploads one part of the archive; parts are numbered from 1."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _complete(self, part_count: int) -> None:
+        """Stores the archive from the uploaded parts."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _upload_whole(self, data: bytes) -> None:
+        """Stores an archive that fits into a single part."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _abort(self) -> None:
+        """Discards the uploaded parts."""
+        raise NotImplementedError
+
 
 class BackupStorage(abc.ABC):
     def __init__(self, conf: BackupRestoreConfig):
@@ -15,9 +129,75 @@ class BackupStorage(abc.ABC):
         suffix = "/" if not conf.storage.backup_path.endswith("/") else ""
         self._backup_path = conf.storage.backup_path + suffix
 
-    @abc.abstractmethod
     def export(self, folder: str, org_id: str) -> None:
-        """Exports the content of the folder to the storage."""
+        """Exports the content of the folder to the storage.
+
+        Deprecated: backups are streamed to the storage with `open_archive`.
+        The files of `folder/org_id` are stored one by one under `org_id`.
+        """
+        warnings.warn(
+            "BackupStorage.export is deprecated, use open_archive instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        root = os.path.join(folder, org_id)
+
+        for subdir, _, files in os.walk(root):
+            for file in files:
+                full_path = os.path.join(subdir, file)
+                relative_path = os.path.relpath(full_path, root)
+                with (
+                    open(full_path, "rb") as data,
+                    self.open_archive(
+                        f"{org_id}/{relative_path.replace(os.sep, '/')}"
+                    ) as upload,
+                ):
+                    shutil.copyfileobj(data, upload)
+
+    @contextmanager
+    def open_archive(self, path: str) -> Generator[ArchiveUpload, None, None]:
+        """Opens a stream that stores a backup archive in the storage.
+
+        The archive is stored once the block exits; if the block raises, the
+        archive is discarded.
+
+        Args:
+            path (str): Path of the archive relative to the backup path.
+        """
+        upload = self._create_upload(path)
+
+        try:
+            yield upload
+        except BaseException:
+            upload.abort()
+            raise
+
+        upload.commit()
+
+    def write_file(self, path: str, data: bytes) -> None:
+        """Stores a file in the storage, replacing the existing one.
+
+        Args:
+            path (str): Path of the file relative to the backup path.
+            data (bytes): Content of the file.
+        """
+        with self.open_archive(path) as upload:
+            upload.write(data)
+
+    @abc.abstractmethod
+    def read_file(self, path: str) -> bytes | None:
+        """Returns the content of a file in the storage.
+
+        Args:
+            path (str): Path of the file relative to the backup path.
+        Returns:
+            bytes | None: Content of the file; None if it does not exist.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _create_upload(self, path: str) -> ArchiveUpload:
+        """Creates the upload of an archive at path relative to backup path."""
         raise NotImplementedError
 
     @abc.abstractmethod
@@ -1,17 +1,54 @@
 # (C) 2025 GoodData Corporation
 
+import os
 import shutil
 from pathlib import Path
+from typing import BinaryIO
 
 from gooddata_pipelines.backup_and_restore.models.storage import (
     BackupRestoreConfig,
     LocalStorageConfig,
 )
 from gooddata_pipelines.backup_and_restore.storage.base_storage import (
+    ArchiveUpload,
     BackupStorage,
 )
 
 
+class LocalArchiveUpload(ArchiveUpload):
+    """Writes the archive to a temporary file next to the target file and
+    renames it once the archive is complete."""
+
+    def __init__(self, target: Path):
+        super().__init__()
+        self._target = target
+        self._partial = target.with_name(target.name + ".part")
+        self._file: BinaryIO | None = None
+
+    def _open(self) -> BinaryIO:
+        if self._file is None:
+            self._target.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._partial, "wb")
+
+        return self._file
+
+    def _upload_part(self, part_number: int, data: bytes) -> None:
+        self._open().write(data)
+
+    def _complete(self, part_count: int) -> None:
+        self._open().close()
+        os.replace(self._partial, self._target)
+
+    def _upload_whole(self, data: bytes) -> None:
+        self._open().write(data)
+        self._complete(1)
+
+    def _abort(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._partial.unlink(missing_ok=True)
+
+
 class LocalStorage(BackupStorage):
     def __init__(self, conf: BackupRestoreConfig):
         super().__init__(conf)
@@ -19,23 +56,15 @@ class LocalStorage(BackupStorage):
             raise ValueError("Local storage config is required")
         self._config: LocalStorageConfig = conf.storage
 
-    def _export(self, folder: str, org_id: str, export_folder: str) -> None:
-        """Copies the content of the folder to local storage as backup."""
-
-        self.logger.info(f"Saving {org_id} to local storage")
-        shutil.copytree(
-            Path(folder), Path(Path.cwd(), export_folder), dirs_exist_ok=True
-        )
-
-    def export(self, folder: str, org_id: str) -> None:
-        """Copies the content of the folder to local storage as backup."""
-        try:
-            self._export(folder, org_id, self._config.backup_path)
-        except Exception as e:
-            self.logger.error(
-                f"Error exporting {folder} to {self._config.backup_path}: {e}"
-            )
-            raise
+    def _create_upload(self, path: str) -> ArchiveUpload:
+        return LocalArchiveUpload(Path(Path.cwd(), self._backup_path, path))
+
+    def read_file(self, path: str) -> bytes | None:
+        file_path = Path(Path.cwd(), self._backup_path, path)
+        if not file_path.is_file():
+            return None
+
+        return file_path.read_bytes()
 
     def get_ws_declaration(
         self, target_path: str, local_target_path: str
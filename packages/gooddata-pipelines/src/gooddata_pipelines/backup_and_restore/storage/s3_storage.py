@@ -1,6 +1,6 @@
 # (C) 2025 GoodData Corporation
 
-import os
+from typing import Any
 
 import boto3
 
@@ -9,10 +9,60 @@ from gooddata_pipelines.backup_and_restore.models.storage import (
     S3StorageConfig,
 )
 from gooddata_pipelines.backup_and_restore.storage.base_storage import (
+    ArchiveUpload,
     BackupStorage,
 )
 
 
+class S3ArchiveUpload(ArchiveUpload):
+    """Uploads the archive to S3 as a multipart upload. The multipart upload
+    is started with the first full part; smaller archives are uploaded with
+    a single put."""
+
+    def __init__(self, client: Any, bucket: str, key: str):
+        super().__init__()
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._upload_id: str | None = None
+        self._parts: list[dict[str, Any]] = []
+
+    def _upload_part(self, part_number: int, data: bytes) -> None:
+        if self._upload_id is None:
+            response = self._client.create_multipart_upload(
+                Bucket=self._bucket, Key=self._key
+            )
+            self._upload_id = response["UploadId"]
+
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        self._parts.append(
+            {"ETag": response["ETag"], "PartNumber": part_number}
+        )
+
+    def _complete(self, part_count: int) -> None:
+        self._client.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+
+    def _upload_whole(self, data: bytes) -> None:
+        self._client.put_object(Bucket=self._bucket, Key=self._key, Body=data)
+
+    def _abort(self) -> None:
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+
+
 class S3Storage(BackupStorage):
     def __init__(self, conf: BackupRestoreConfig):
         super().__init__(conf)
@@ -74,19 +124,20 @@ class S3Storage(BackupStorage):
                 f"Failed to connect to S3 bucket {self._config.bucket}: {e}"
             )
 
-    def export(self, folder: str, org_id: str) -> None:
-        """Uploads the content of the folder to S3 as a backup."""
-        storage_path = f"{self._config.bucket}/{self._backup_path}"
-        self.logger.info(f"Uploading {org_id} to {storage_path}")
-        folder = f"{folder}/{org_id}"
-        for subdir, dirs, files in os.walk(folder):
-            for file in files:
-                full_path = os.path.join(subdir, file)
-                with open(full_path, "rb") as data:
-                    export_path = f"{self._backup_path}{org_id}/{full_path[len(folder) + 1 :]}"
-                    self._client.put_object(
-                        Bucket=self._config.bucket, Key=export_path, Body=data
-                    )
+    def _create_upload(self, path: str) -> ArchiveUpload:
+        return S3ArchiveUpload(
+            self._client, self._config.bucket, f"{self._backup_path}{path}"
+        )
+
+    def read_file(self, path: str) -> bytes | None:
+        try:
+            response = self._client.get_object(
+                Bucket=self._config.bucket, Key=f"{self._backup_path}{path}"
+            )
+        except self._client.exceptions.NoSuchKey:
+            return None
+
+        return response["Body"].read()
 
     def get_ws_declaration(
         self, target_path: str, local_target_path: str
@@ -8,6 +8,11 @@ for creating, updating, and deleting user data filters in GoodData workspaces.
 
 import re
 
+from gooddata_sdk.catalog.identifier import CatalogUserIdentifier
+from gooddata_sdk.catalog.workspace.declarative_model.workspace.workspace import (
+    CatalogDeclarativeUserDataFilter,
+    CatalogDeclarativeUserDataFilters,
+)
 from gooddata_sdk.catalog.workspace.entity_model.user_data_filter import (
     CatalogEntityIdentifier,
     CatalogUserDataFilter,
@@ -23,6 +28,7 @@ from gooddata_pipelines.provisioning.entities.user_data_filters.models.udf_model
 )
 from gooddata_pipelines.provisioning.provisioning import Provisioning
 from gooddata_pipelines.provisioning.utils.exceptions import ContextException
+from gooddata_pipelines.provisioning.utils.utils import chunks
 
 
 class UserDataFilterProvisioner(
@@ -101,90 +107,154 @@ class UserDataFilterProvisioner(
         return [number.strip('"') for number in numbers]
 
     def _skip_user_data_filter_update(
-        self, existing_udf: list[CatalogUserDataFilter], udf_value: list[str]
+        self,
+        existing_udf: CatalogDeclarativeUserDataFilter | None,
+        udf_value: list[str],
     ) -> bool:
         """Check if the user data filter update can be skipped."""
         if not existing_udf:
             return False
-        existing_udfs = self._extract_numbers_from_maql(
-            existing_udf[0].attributes.maql
-        )
+        existing_udfs = self._extract_numbers_from_maql(existing_udf.maql)
         return set(udf_value) == set(existing_udfs)
 
-    def _create_user_data_filters(
-        self, user_data_filter_ids_to_create: list[WorkspaceUserDataFilters]
+    def _build_maql(self, udf_values: list[str]) -> str:
+        formatted_udf_values = '", "'.join(str(value) for value in udf_values)
+        return f'{self.maql_column_name} IN ("{formatted_udf_values}")'
+
+    def _create_user_data_filter(
+        self, workspace_id: str, udf_group: UserDataFilterGroup
     ) -> None:
-        """Create or update user data filters in GoodData workspaces."""
-        for workspace_user_data_filter in user_data_filter_ids_to_create:
-            workspace_id = workspace_user_data_filter.workspace_id
-            user_data_filters = workspace_user_data_filter.user_data_filters
-
-            gd_user_data_filters: list[CatalogUserDataFilter] = (
-                self._api._sdk.catalog_workspace.list_user_data_filters(
-                    workspace_id
-                )
+        """Create or update a single user data filter in GoodData workspace."""
+        udf_id: str = udf_group.udf_id
+
+        attributes = CatalogUserDataFilterAttributes(
+            maql=self._build_maql(udf_group.udf_values)
+        )
+        relationships = CatalogUserDataFilterRelationships(
+            labels={
+                "data": [
+                    CatalogEntityIdentifier(
+                        id=self.ldm_column_name, type="label"
+                    )
+                ]
+            },
+            user={"data": CatalogEntityIdentifier(id=udf_id, type="user")},
+        )
+        user_data_filter = CatalogUserDataFilter(
+            id=udf_id,
+            attributes=attributes,
+            relationships=relationships,
+        )
+
+        try:
+            self._api._sdk.catalog_workspace.create_or_update_user_data_filter(
+                workspace_id, user_data_filter
             )
+            self.logger.info(
+                "Created or updated user data filters for user with id "
+                + f"{udf_id} for client with id {workspace_id}"
+            )
+        except Exception as e:
+            raise ContextException(
+                f"Failed to create user data filters: {e}",
+                udf_group,
+                user_data_filter,
+            ) from e
 
-            gd_udf_ids = {
-                user.relationships.user["data"].id
-                for user in gd_user_data_filters
-                if user.relationships and user.relationships.user
-            }
+    def _provision_workspace_user_data_filters(
+        self, workspace_user_data_filter: WorkspaceUserDataFilters
+    ) -> None:
+        """Provision user data filters of a single workspace.
 
-            db_udf_ids = {udf.udf_id for udf in user_data_filters}
+        The user data filters layout of the workspace is modified in memory
+        and put back in one request. If the request is rejected, the changes
+        are applied one user data filter at a time.
+        """
+        workspace_id = workspace_user_data_filter.workspace_id
+        user_data_filters = workspace_user_data_filter.user_data_filters
 
-            udf_ids_to_delete: set[str] = gd_udf_ids.difference(db_udf_ids)
-            self._delete_user_data_filters(workspace_id, udf_ids_to_delete)
+        upstream: CatalogDeclarativeUserDataFilters = (
+            self._api._sdk.catalog_workspace.get_declarative_user_data_filters(
+                workspace_id
+            )
+        )
+        existing_udfs = {udf.id: udf for udf in upstream.user_data_filters}
+
+        gd_udf_ids = {
+            udf.user.id for udf in upstream.user_data_filters if udf.user
+        }
+        db_udf_ids = {udf.udf_id for udf in user_data_filters}
+        udf_ids_to_delete: set[str] = gd_udf_ids.difference(db_udf_ids)
+
+        udfs_to_update = [
+            udf_group
+            for udf_group in user_data_filters
+            if not self._skip_user_data_filter_update(
+                existing_udfs.get(udf_group.udf_id), udf_group.udf_values
+            )
+        ]
+        if not udfs_to_update and not udf_ids_to_delete:
+            return
+
+        layout = {
+            udf_id: udf
+            for udf_id, udf in existing_udfs.items()
+            if udf_id not in udf_ids_to_delete
+        }
+        for udf_group in udfs_to_update:
+            existing_udf = existing_udfs.get(udf_group.udf_id)
+            layout[udf_group.udf_id] = CatalogDeclarativeUserDataFilter(
+                id=udf_group.udf_id,
+                title=existing_udf.title if existing_udf else udf_group.udf_id,
+                description=existing_udf.description if existing_udf else None,
+                maql=self._build_maql(udf_group.udf_values),
+                user=CatalogUserIdentifier(id=udf_group.udf_id, type="user"),
+            )
 
-            udf_group: UserDataFilterGroup
-            for udf_group in user_data_filters:
-                udf_id: str = udf_group.udf_id
-                udf_values: list[str] = udf_group.udf_values
+        try:
+            self._api._sdk.catalog_workspace.put_declarative_user_data_filters(
+                workspace_id,
+                CatalogDeclarativeUserDataFilters(
+                    user_data_filters=list(layout.values())
+                ),
+            )
+        except Exception as e:
+            if not self._is_conflict(e):
+                raise ContextException(
+                    f"Failed to put user data filters: {e}"
+                ) from e
+            self.logger.warning(
+                "Bulk update of user data filters was rejected for client with "
+                + f"id {workspace_id}, updating them one by one. Error: {e}"
+            )
+            self._delete_user_data_filters(workspace_id, udf_ids_to_delete)
+            for udf_group in udfs_to_update:
+                self._create_user_data_filter(workspace_id, udf_group)
+            return
 
-                existing_udf: list[CatalogUserDataFilter] = [
-                    udf for udf in gd_user_data_filters if udf.id == udf_id
-                ]
-                if self._skip_user_data_filter_update(existing_udf, udf_values):
-                    continue
+        for udf_id in sorted(udf_ids_to_delete):
+            self.logger.info(
+                f"Deleted user data filters for user with id {udf_id}"
+            )
+        for udf_group in udfs_to_update:
+            self.logger.info(
+                "Created or updated user data filters for user with id "
+                + f"{udf_group.udf_id} for client with id {workspace_id}"
+            )
 
-                formatted_udf_values = '", "'.join(
-                    str(value) for value in udf_values
-                )
-                maql = f'{self.maql_column_name} IN ("{formatted_udf_values}")'
-
-                attributes = CatalogUserDataFilterAttributes(maql=maql)
-                relationships = CatalogUserDataFilterRelationships(
-                    labels={
-                        "data": [
-                            CatalogEntityIdentifier(
-                                id=self.ldm_column_name, type="label"
-                            )
-                        ]
-                    },
-                    user={
-                        "data": CatalogEntityIdentifier(id=udf_id, type="user")
-                    },
-                )
-                user_data_filter = CatalogUserDataFilter(
-                    id=udf_id,
-                    attributes=attributes,
-                    relationships=relationships,
-                )
+    def _create_user_data_filters(
+        self, user_data_filter_ids_to_create: list[WorkspaceUserDataFilters]
+    ) -> None:
+        """Create or update user data filters in GoodData workspaces.
 
-                try:
-                    self._api._sdk.catalog_workspace.create_or_update_user_data_filter(
-                        workspace_id, user_data_filter
-                    )
-                    self.logger.info(
-                        "Created or updated user data filters for user with id "
-                        + f"{udf_id} for client with id {workspace_id}"
-                    )
-                except Exception as e:
-                    raise ContextException(
-                        f"Failed to create user data filters: {e}",
-                        udf_group,
-                        user_data_filter,
-                    ) from e
+        The workspaces are processed concurrently, `CHUNK_SIZE` at a time.
+        """
+        for workspace_chunk in chunks(
+            user_data_filter_ids_to_create, self.CHUNK_SIZE
+        ):
+            self._map_concurrently(
+                self._provision_workspace_user_data_filters, workspace_chunk
+            )
 
     def _delete_user_data_filters(
         self, workspace_id: str, udf_ids_to_delete: set[str]
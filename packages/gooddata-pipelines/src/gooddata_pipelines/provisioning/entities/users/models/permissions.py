@@ -41,6 +41,27 @@ class PermissionIncrementalLoad(BasePermission):
     is_active: bool
 
 
+@attrs.define
+class ExistingEntityIds:
+    """IDs of the upstream entities that permissions can reference."""
+
+    users: set[str]
+    user_groups: set[str]
+    workspaces: set[str]
+
+    def contains(self, permission: BasePermission) -> bool:
+        """Checks that all entities referenced in the permission exist."""
+        entity_ids = (
+            self.users
+            if permission.entity_type == EntityType.user
+            else self.user_groups
+        )
+        return (
+            permission.entity_id in entity_ids
+            and permission.workspace_id in self.workspaces
+        )
+
+
 @attrs.define
 class PermissionDeclaration:
     users: TargetsPermissionDict
@@ -192,6 +213,20 @@ class PermissionDeclaration:
         if permission_value not in target_permissions:
             target_permissions[permission_value] = True
 
+    def active_permissions(self) -> set[tuple[EntityType, str, str]]:
+        """Returns the active permissions as (entity type, entity ID,
+        permission) tuples."""
+        return {
+            (entity_type, entity_id, permission)
+            for entity_type, targets in (
+                (EntityType.user, self.users),
+                (EntityType.user_group, self.user_groups),
+            )
+            for entity_id, permissions in targets.items()
+            for permission, is_active in permissions.items()
+            if is_active
+        }
+
     def upsert(self, other: "PermissionDeclaration") -> None:
         """
         Modifies the owner object by merging with the other.
@@ -2,6 +2,12 @@
 
 from typing import Any
 
+from gooddata_sdk.catalog.identifier import (
+    CatalogDeclarativeUserGroupIdentifier,
+)
+from gooddata_sdk.catalog.user.declarative_model.user import (
+    CatalogDeclarativeUser,
+)
 from gooddata_sdk.catalog.user.entity_model.user import CatalogUser
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -50,6 +56,42 @@ class BaseUser(BaseModel):
             "user_groups": [ug.id for ug in obj.user_groups],
         }
 
+    @classmethod
+    def _create_from_declarative_data(
+        cls, obj: CatalogDeclarativeUser
+    ) -> dict[str, Any]:
+        """Helper method to extract common data from declarative SDK object."""
+        return {
+            "user_id": obj.id,
+            "firstname": obj.firstname,
+            "lastname": obj.lastname,
+            "email": obj.email,
+            "auth_id": obj.auth_id,
+            "user_groups": [ug.id for ug in obj.user_groups],
+        }
+
+    def to_declarative_obj(
+        self, upstream_user: CatalogDeclarativeUser | None = None
+    ) -> CatalogDeclarativeUser:
+        """Converts to CatalogDeclarativeUser SDK object.
+
+        Settings and permissions are not part of the source data, they are
+        taken over from the upstream user if there is one.
+        """
+        return CatalogDeclarativeUser(
+            id=self.user_id,
+            firstname=self.firstname,
+            lastname=self.lastname,
+            email=self.email,
+            auth_id=self.auth_id,
+            user_groups=[
+                CatalogDeclarativeUserGroupIdentifier(id=ug, type="userGroup")
+                for ug in self.user_groups
+            ],
+            settings=upstream_user.settings if upstream_user else [],
+            permissions=upstream_user.permissions if upstream_user else [],
+        )
+
     def to_sdk_obj(self) -> CatalogUser:
         """Converts to CatalogUser SDK object."""
         return CatalogUser.init(
@@ -71,6 +113,14 @@ class UserFullLoad(BaseUser):
         base_data = cls._create_from_sdk_data(obj)
         return cls(**base_data)
 
+    @classmethod
+    def from_declarative_obj(
+        cls, obj: CatalogDeclarativeUser
+    ) -> "UserFullLoad":
+        """Creates GDUserTarget from CatalogDeclarativeUser SDK object."""
+        base_data = cls._create_from_declarative_data(obj)
+        return cls(**base_data)
+
 
 class UserIncrementalLoad(BaseUser):
     """Input validator for incremental load of user provisioning."""
@@ -83,3 +133,12 @@ class UserIncrementalLoad(BaseUser):
         base_data = cls._create_from_sdk_data(obj)
         base_data["is_active"] = True
         return cls(**base_data)
+
+    @classmethod
+    def from_declarative_obj(
+        cls, obj: CatalogDeclarativeUser
+    ) -> "UserIncrementalLoad":
+        """Creates GDUserTarget from CatalogDeclarativeUser SDK object."""
+        base_data = cls._create_from_declarative_data(obj)
+        base_data["is_active"] = True
+        return cls(**base_data)
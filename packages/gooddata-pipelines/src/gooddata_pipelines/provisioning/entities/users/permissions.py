@@ -2,12 +2,11 @@
 
 """Module for provisioning user permissions in GoodData workspaces."""
 
-from typing import TypeVar
-
-from gooddata_api_client.exceptions import NotFoundException  # type: ignore
+from typing import Sequence, TypeVar
 
 from gooddata_pipelines.provisioning.entities.users.models.permissions import (
     EntityType,
+    ExistingEntityIds,
     PermissionDeclaration,
     PermissionFullLoad,
     PermissionIncrementalLoad,
@@ -15,6 +14,7 @@ from gooddata_pipelines.provisioning.entities.users.models.permissions import (
     WSPermissionsDeclarations,
 )
 from gooddata_pipelines.provisioning.provisioning import Provisioning
+from gooddata_pipelines.provisioning.utils.utils import chunks
 
 # Type variable for permission models (PermissionIncrementalLoad or PermissionFullLoad)
 PermissionModel = TypeVar(
@@ -77,15 +77,37 @@ class PermissionProvisioner(
         return PermissionDeclaration.from_sdk_api(declaration)
 
     def _get_upstream_declarations(
-        self, input_ws_ids: list[str]
+        self, input_ws_ids: Sequence[str]
     ) -> WSPermissionsDeclarations:
-        """Retrieves upstream permission declarations for a list of workspaces."""
-        ws_dict: WSPermissionsDeclarations = {}
-        for ws_id in input_ws_ids:
-            declaration = self._get_upstream_declaration(ws_id)
-            if declaration:
-                ws_dict[ws_id] = declaration
-        return ws_dict
+        """Retrieves upstream permission declarations for a list of workspaces.
+
+        The declarations are retrieved concurrently.
+        """
+        declarations = self._map_concurrently(
+            self._get_upstream_declaration, input_ws_ids
+        )
+        return {
+            ws_id: declaration
+            for ws_id, declaration in zip(input_ws_ids, declarations)
+            if declaration
+        }
+
+    def _put_declaration(
+        self, ws_id: str, declaration: PermissionDeclaration
+    ) -> None:
+        """Puts the permission declaration of a workspace."""
+        self._api._sdk.catalog_permission.put_declarative_permissions(
+            ws_id, declaration.to_sdk_api()
+        )
+        self.logger.info(f"Updated permissions for workspace {ws_id}")
+
+    def _put_declarations(
+        self, declarations: WSPermissionsDeclarations
+    ) -> None:
+        """Puts the permission declarations of the workspaces concurrently."""
+        self._map_concurrently(
+            lambda item: self._put_declaration(*item), declarations.items()
+        )
 
     @staticmethod
     def _construct_declarations(
@@ -111,44 +133,39 @@ class PermissionProvisioner(
         """Checks if user group with provided ID exists."""
         self._api._sdk.catalog_user.get_user_group(ug_id)
 
-    def _validate_permission(
-        self, permission: PermissionFullLoad | PermissionIncrementalLoad
-    ) -> bool:
-        """Validates that all entities referenced in the permission exist.
+    def _get_existing_entity_ids(self) -> ExistingEntityIds:
+        """Retrieves IDs of all users, user groups and workspaces.
 
-        Raises:
-            RuntimeError: If an unexpected error is encountered.
+        The three lists are retrieved concurrently.
         """
-        all_entities_exist = True
-        try:
-            if permission.entity_type == EntityType.user:
-                self._api._sdk.catalog_user.get_user(permission.entity_id)
-            else:
-                self._api._sdk.catalog_user.get_user_group(permission.entity_id)
-
-            self._api._sdk.catalog_workspace.get_workspace(
-                permission.workspace_id
-            )
-
-        except NotFoundException:
-            all_entities_exist = False
-
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to validate permission: {e.__class__.__name__}: {e}"
-            )
-
-        return all_entities_exist
+        catalog_user = self._api._sdk.catalog_user
+        users, user_groups, workspaces = self._map_concurrently(
+            lambda list_entities: list_entities(),
+            [
+                catalog_user.list_users,
+                catalog_user.list_user_groups,
+                self._api._sdk.catalog_workspace.list_workspaces,
+            ],
+        )
+        return ExistingEntityIds(
+            users={user.id for user in users},
+            user_groups={user_group.id for user_group in user_groups},
+            workspaces={workspace.id for workspace in workspaces},
+        )
 
     def _filter_invalid_permissions(
         self,
         permissions: list[PermissionModel],
     ) -> list[PermissionModel]:
-        """Filters out invalid permissions from the input list."""
+        """Filters out permissions that reference non-existent entities."""
+        if not permissions:
+            return []
+
+        existing_ids = self._get_existing_entity_ids()
         valid_permissions: list[PermissionModel] = []
 
         for permission in permissions:
-            if not self._validate_permission(permission):
+            if not existing_ids.contains(permission):
                 self.logger.error(
                     f"Skipping {permission}. Error: Permission references non-existent entities."
                     + f"Context: {permission.__dict__}"
@@ -169,21 +186,22 @@ class PermissionProvisioner(
 
         input_declarations = self._construct_declarations(valid_permissions)
 
-        input_ws_ids = list(input_declarations.keys())
-        upstream_declarations = self._get_upstream_declarations(input_ws_ids)
+        for ws_ids in chunks(list(input_declarations), self.CHUNK_SIZE):
+            upstream_declarations = self._get_upstream_declarations(ws_ids)
 
-        for ws_id, declaration in input_declarations.items():
-            if ws_id not in upstream_declarations:
-                continue
+            changed_declarations: WSPermissionsDeclarations = {}
+            for ws_id in ws_ids:
+                if ws_id not in upstream_declarations:
+                    continue
 
-            upstream_declarations[ws_id].upsert(declaration)
+                declaration = upstream_declarations[ws_id]
+                upstream_permissions = declaration.active_permissions()
+                declaration.upsert(input_declarations[ws_id])
 
-            ws_permissions = upstream_declarations[ws_id].to_sdk_api()
+                if declaration.active_permissions() != upstream_permissions:
+                    changed_declarations[ws_id] = declaration
 
-            self._api._sdk.catalog_permission.put_declarative_permissions(
-                ws_id, ws_permissions
-            )
-            self.logger.info(f"Updated permissions for workspace {ws_id}")
+            self._put_declarations(changed_declarations)
 
     def _provision_full_load(self) -> None:
         """Provisions permissions for selected of workspaces.
@@ -198,10 +216,15 @@ class PermissionProvisioner(
 
         input_declarations = self._construct_declarations(valid_permissions)
 
-        for ws_id, declaration in input_declarations.items():
-            ws_permissions = declaration.to_sdk_api()
-
-            self._api._sdk.catalog_permission.put_declarative_permissions(
-                ws_id, ws_permissions
+        for ws_ids in chunks(list(input_declarations), self.CHUNK_SIZE):
+            upstream_declarations = self._get_upstream_declarations(ws_ids)
+
+            self._put_declarations(
+                {
+                    ws_id: input_declarations[ws_id]
+                    for ws_id in ws_ids
+                    if ws_id not in upstream_declarations
+                    or upstream_declarations[ws_id].active_permissions()
+                    != input_declarations[ws_id].active_permissions()
+                }
             )
-            self.logger.info(f"Updated permissions for workspace {ws_id}")
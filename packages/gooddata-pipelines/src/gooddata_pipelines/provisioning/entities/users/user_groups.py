@@ -4,6 +4,13 @@
 
 from typing import Sequence, TypeAlias
 
+from gooddata_sdk.catalog.identifier import (
+    CatalogDeclarativeUserGroupIdentifier,
+)
+from gooddata_sdk.catalog.user.declarative_model.user_group import (
+    CatalogDeclarativeUserGroup,
+    CatalogDeclarativeUserGroups,
+)
 from gooddata_sdk.catalog.user.entity_model.user_group import CatalogUserGroup
 
 from gooddata_pipelines.provisioning.entities.users.models.user_groups import (
@@ -23,11 +30,17 @@ class UserGroupProvisioner(
     This class handles the creation, update, and deletion of user groups
     based on the provided source data. Use the `full_load` or `incremental_load`
     methods to run the provisioning.
+
+    Full load replaces the user groups of the organization with the source
+    data in one request to the declarative layout API. The layout is read and
+    written back, so user groups created or changed by someone else while the
+    full load runs are deleted or reverted. Incremental load only touches the
+    user groups listed in the source data, with one API call per group.
     """
 
     source_group_incremental: list[UserGroupIncrementalLoad]
     source_group_full: list[UserGroupFullLoad]
-    upstream_user_groups: list[CatalogUserGroup]
+    upstream_user_groups: dict[str, CatalogDeclarativeUserGroup]
 
     FULL_LOAD_TYPE: type[UserGroupFullLoad] = UserGroupFullLoad
     INCREMENTAL_LOAD_TYPE: type[UserGroupIncrementalLoad] = (
@@ -36,14 +49,44 @@ class UserGroupProvisioner(
 
     @staticmethod
     def _is_changed(
-        group: UserGroupModel, existing_group: CatalogUserGroup
+        group: UserGroupModel, existing_group: CatalogDeclarativeUserGroup
     ) -> bool:
         """Checks if user group has some changes and needs to be updated."""
-        group.parent_user_groups.sort()
-        parents_changed = group.parent_user_groups != existing_group.get_parents
+        existing_parents = sorted(
+            parent.id for parent in existing_group.parents or []
+        )
+        parents_changed = sorted(group.parent_user_groups) != existing_parents
         name_changed = group.user_group_name != existing_group.name
         return parents_changed or name_changed
 
+    def _get_upstream_user_groups(
+        self,
+    ) -> dict[str, CatalogDeclarativeUserGroup]:
+        """Gets all upstream user groups in one request, indexed by their IDs."""
+        layout: CatalogDeclarativeUserGroups = (
+            self._api._sdk.catalog_user.get_declarative_user_groups()
+        )
+        return {group.id: group for group in layout.user_groups}
+
+    @staticmethod
+    def _to_declarative_obj(
+        group: UserGroupModel,
+        upstream_group: CatalogDeclarativeUserGroup | None,
+    ) -> CatalogDeclarativeUserGroup:
+        """Converts the group to declarative SDK object. Permissions are not
+        part of the source data, they are taken over from the upstream group."""
+        return CatalogDeclarativeUserGroup(
+            id=group.user_group_id,
+            name=group.user_group_name,
+            parents=[
+                CatalogDeclarativeUserGroupIdentifier(
+                    id=parent_id, type="userGroup"
+                )
+                for parent_id in group.parent_user_groups
+            ],
+            permissions=upstream_group.permissions if upstream_group else [],
+        )
+
     def _create_or_update_user_group(
         self,
         group_id: str,
@@ -73,39 +116,42 @@ class UserGroupProvisioner(
         self,
         groups_to_create: Sequence[UserGroupModel],
     ) -> None:
-        """Provisions user groups that don't exist."""
-        # Sort user groups to create those without parents first
-        sorted_groups = sorted(
-            groups_to_create, key=lambda x: 1 if x.parent_user_groups else 0
-        )
+        """Provisions user groups that don't exist.
 
-        for group in sorted_groups:
-            self._create_or_update_user_group(
-                group.user_group_id,
-                group.user_group_name,
-                group.parent_user_groups,
-            )
+        Groups are created concurrently, parents before their children.
+        """
+        pending = list(groups_to_create)
+
+        while pending:
+            pending_ids = {group.user_group_id for group in pending}
+            ready = [
+                group
+                for group in pending
+                if pending_ids.isdisjoint(group.parent_user_groups)
+            ]
+            # parents referencing each other cannot be ordered
+            ready = ready or pending
+
+            self._update_existing_user_groups(ready)
+            pending = [group for group in pending if group not in ready]
 
     def _update_existing_user_groups(
-        self,
-        groups_to_update: Sequence[UserGroupModel],
-        upstream_user_groups: list[CatalogUserGroup],
+        self, groups_to_update: Sequence[UserGroupModel]
     ) -> None:
-        """Update existing user groups and update ws_permissions."""
-        existing_groups = {group.id: group for group in upstream_user_groups}
-
-        for group in groups_to_update:
-            existing_group = existing_groups[group.user_group_id]
-            if self._is_changed(group, existing_group):
-                self._create_or_update_user_group(
-                    group.user_group_id,
-                    group.user_group_name,
-                    group.parent_user_groups,
-                )
+        """Update existing user groups that changed."""
+        self._map_concurrently(
+            lambda group: self._create_or_update_user_group(
+                group.user_group_id,
+                group.user_group_name,
+                group.parent_user_groups,
+            ),
+            groups_to_update,
+        )
 
     def _delete_user_group(self, group_ids_to_delete: set[str]) -> None:
         """Deletes user group from the project."""
-        for group_id in group_ids_to_delete:
+
+        def delete(group_id: str) -> None:
             try:
                 self._api._sdk.catalog_user.delete_user_group(group_id)
                 self.logger.info(f"Deleted user group: {group_id}")
@@ -115,17 +161,91 @@ class UserGroupProvisioner(
                     + f"Context: {{'user_group_id': {group_id}}}"
                 )
 
+        self._map_concurrently(delete, sorted(group_ids_to_delete))
+
+    def _apply_changes_one_by_one(
+        self,
+        groups_to_create: Sequence[UserGroupModel],
+        groups_to_update: Sequence[UserGroupModel],
+        group_ids_to_delete: set[str],
+    ) -> None:
+        """Applies the changes with one API call per user group."""
+        self._create_missing_user_groups(groups_to_create)
+        self._update_existing_user_groups(groups_to_update)
+        self._delete_user_group(group_ids_to_delete)
+
+    def _apply_changes(
+        self,
+        groups_to_create: Sequence[UserGroupModel],
+        groups_to_update: Sequence[UserGroupModel],
+        group_ids_to_delete: set[str],
+        in_bulk: bool,
+    ) -> None:
+        """Applies the changes to the upstream user groups.
+
+        In bulk, the user groups layout of the organization is modified in
+        memory and put back in one request. If the request is rejected, or if
+        the changes are not applied in bulk, they are applied one user group
+        at a time.
+        """
+        groups_to_update = [
+            group
+            for group in groups_to_update
+            if self._is_changed(
+                group, self.upstream_user_groups[group.user_group_id]
+            )
+        ]
+        if not (groups_to_create or groups_to_update or group_ids_to_delete):
+            self.logger.info("User groups are up to date.")
+            return
+
+        if not in_bulk:
+            self._apply_changes_one_by_one(
+                groups_to_create, groups_to_update, group_ids_to_delete
+            )
+            return
+
+        layout = {
+            group_id: group
+            for group_id, group in self.upstream_user_groups.items()
+            if group_id not in group_ids_to_delete
+        }
+        for group in [*groups_to_create, *groups_to_update]:
+            layout[group.user_group_id] = self._to_declarative_obj(
+                group, self.upstream_user_groups.get(group.user_group_id)
+            )
+
+        try:
+            self._api._sdk.catalog_user.put_declarative_user_groups(
+                CatalogDeclarativeUserGroups(user_groups=list(layout.values()))
+            )
+        except Exception as e:
+            if not self._is_conflict(e):
+                raise
+            self.logger.warning(
+                "Bulk update of user groups was rejected, updating user "
+                + f"groups one by one. Error: {e}"
+            )
+            self._apply_changes_one_by_one(
+                groups_to_create, groups_to_update, group_ids_to_delete
+            )
+            return
+
+        for group in [*groups_to_create, *groups_to_update]:
+            self.logger.info(
+                f"Created/Updated user group: {group.user_group_id} - "
+                + f"{group.user_group_name}"
+            )
+        for group_id in sorted(group_ids_to_delete):
+            self.logger.info(f"Deleted user group: {group_id}")
+
     def _provision_incremental_load(self) -> None:
         """Runs incremental provisioning of user groups."""
         # Get existing user groups from GoodData Cloud
-        self.upstream_user_groups = (
-            self._api._sdk.catalog_user.list_user_groups()
-        )
+        self.upstream_user_groups = self._get_upstream_user_groups()
 
         # Create a set of upstream user group IDs
-        upstream_group_ids: set[str] = {
-            group.id for group in self.upstream_user_groups
-        }
+        upstream_group_ids: set[str] = set(self.upstream_user_groups)
 
         # Create a set of active source user group IDs
         active_source_groups: set[str] = {
@@ -151,7 +271,7 @@ class UserGroupProvisioner(
         # Create a set of user group IDs to update as the intersection between active
         # source groups and upstream groups - i.e, we are updating groups marked
         # as active in the source data and which are present upstream in GoodData Cloud.
-        # The `_update_existing_user_groups` method will check if the upstream group
+        # The `_apply_changes` method will check if the upstream group
         # definition differs from the source and if so, it will update the group.
         group_ids_to_update: set[str] = active_source_groups.intersection(
             upstream_group_ids
@@ -175,23 +295,20 @@ class UserGroupProvisioner(
             elif group.user_group_id in group_ids_to_update:
                 groups_to_update.append(group)
 
-        self._create_missing_user_groups(groups_to_create)
-        self._update_existing_user_groups(
-            groups_to_update, self.upstream_user_groups
+        self._apply_changes(
+            groups_to_create,
+            groups_to_update,
+            group_ids_to_delete,
+            in_bulk=False,
         )
-        self._delete_user_group(group_ids_to_delete)
 
     def _provision_full_load(self) -> None:
         """Runs full load provisioning of user groups."""
         # Get upsream user groups
-        self.upstream_user_groups = (
-            self._api._sdk.catalog_user.list_user_groups()
-        )
+        self.upstream_user_groups = self._get_upstream_user_groups()
 
         # Create a set of upstream user group IDs
-        upstream_group_ids: set[str] = {
-            group.id for group in self.upstream_user_groups
-        }
+        upstream_group_ids: set[str] = set(self.upstream_user_groups)
 
         # Create a set of source user group IDs
         source_group_ids: set[str] = {
@@ -210,13 +327,10 @@ class UserGroupProvisioner(
             elif group.user_group_id in id_groups.ids_in_both_systems:
                 groups_to_update.append(group)
 
-        # Create user groups
-        self._create_missing_user_groups(groups_to_create)
-
-        # Update user groups
-        self._update_existing_user_groups(
-            groups_to_update, self.upstream_user_groups
+        # Create, update and delete user groups
+        self._apply_changes(
+            groups_to_create,
+            groups_to_update,
+            id_groups.ids_to_delete,
+            in_bulk=True,
         )
-
-        # Delete user groups
-        self._delete_user_group(id_groups.ids_to_delete)
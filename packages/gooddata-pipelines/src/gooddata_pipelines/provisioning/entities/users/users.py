@@ -5,7 +5,10 @@
 from typing import TypeAlias
 
 from gooddata_api_client.exceptions import NotFoundException  # type: ignore
-from gooddata_sdk.catalog.user.entity_model.user import CatalogUser
+from gooddata_sdk.catalog.user.declarative_model.user import (
+    CatalogDeclarativeUser,
+    CatalogDeclarativeUsers,
+)
 from gooddata_sdk.catalog.user.entity_model.user_group import CatalogUserGroup
 
 from gooddata_pipelines.provisioning.entities.users.models.users import (
@@ -25,6 +28,12 @@ class UserProvisioner(Provisioning[UserFullLoad, UserIncrementalLoad]):
 
     This class handles the creation, update, and deletion of users
     based on the provided source data.
+
+    Full load replaces the users of the organization with the source data in
+    one request to the declarative layout API. The layout is read and written
+    back, so users created or changed by someone else while the full load
+    runs are deleted or reverted. Incremental load only touches the users
+    listed in the source data, with one API call per user.
     """
 
     source_group_incremental: list[UserIncrementalLoad]
@@ -55,31 +64,29 @@ class UserProvisioner(Provisioning[UserFullLoad, UserIncrementalLoad]):
 
         return profile.user_id
 
-    def _try_get_user(
-        self, user: UserModel, model: type[UserModel]
-    ) -> UserModel | None:
-        try:
-            if user.user_id in self.upstream_user_cache:
-                return self.upstream_user_cache[user.user_id]
-
-            user_sdk_obj = self._api._sdk.catalog_user.get_user(user.user_id)
-            return model.from_sdk_obj(user_sdk_obj)
-        except NotFoundException:
-            return None
+    def _get_upstream_users(self) -> dict[UserId, CatalogDeclarativeUser]:
+        """Gets all upstream users in one request, indexed by their IDs."""
+        layout: CatalogDeclarativeUsers = (
+            self._api._sdk.catalog_user.get_declarative_users()
+        )
+        return {user.id: user for user in layout.users}
 
-    def _get_or_create_user_groups(self, groups: list[str]) -> None:
+    def _create_missing_user_groups(self, groups: set[str]) -> None:
         """Ensures that all user groups exist in the project."""
-        for group in groups:
-            try:
-                self._api._sdk.catalog_user.get_user_group(group)
-            except NotFoundException:
-                #  Create the user gtoup if it does not exist
-                self._api._sdk.catalog_user.create_or_update_user_group(
-                    CatalogUserGroup.init(
-                        user_group_id=group, user_group_name=group
-                    ),
-                )
-                self.logger.info(f"Created user group: {group}")
+        if not groups:
+            return
+
+        existing_groups = {
+            group.id for group in self._api._sdk.catalog_user.list_user_groups()
+        }
+        for group in sorted(groups - existing_groups):
+            #  Create the user group if it does not exist
+            self._api._sdk.catalog_user.create_or_update_user_group(
+                CatalogUserGroup.init(
+                    user_group_id=group, user_group_name=group
+                ),
+            )
+            self.logger.info(f"Created user group: {group}")
 
     def _user_is_equal_upstream(
         self,
@@ -106,72 +113,159 @@ class UserProvisioner(Provisioning[UserFullLoad, UserIncrementalLoad]):
                     return False
         return True
 
-    def _create_or_update_user(
-        self, user: UserModel, model: type[UserModel]
-    ) -> None:
-        """Creates or updates user in the project.
+    def _is_protected(self, user_id: str, action: str) -> bool:
+        """Checks if the user is protected and logs a warning if it is."""
+        if user_id not in self.protected_users:
+            return False
 
-        Determines if the user needs to be updated or created by getting the
-        upstream user from GoodData Cloud and comparing it with the source user.
-        If user is supposed to be placed in a User Group, the function will check
-        for its existence and create it if needed.
+        self.logger.warning(
+            f"Skipping {action} of protected user: {user_id}. "
+            + "Protected users should not be modified.",
+        )
+        return True
 
-        """
+    def _create_or_update_user(self, user: UserModel) -> None:
+        """Creates or updates user in the project."""
+        self._api._sdk.catalog_user.create_or_update_user(user.to_sdk_obj())
+        self.logger.info(f"User {user.user_id} created/updated successfully.")
 
-        if user.user_id in self.protected_users:
-            self.logger.warning(
-                f"Skipping creation/update of protected user: {user.user_id}. "
-                + "Protected users should not be modified.",
-            )
+    def _delete_user(self, user_id: str) -> None:
+        """Deletes user from the project."""
+        try:
+            self._api._sdk.catalog_user.delete_user(user_id)
+        except NotFoundException:
             return
 
-        upstream_user = self._try_get_user(user, model)
+        self.logger.info(f"Deleted user: {user_id}")
+
+    def _apply_changes_one_by_one(
+        self, users_to_update: list[UserModel], user_ids_to_delete: set[str]
+    ) -> None:
+        """Applies the changes with one API call per user.
+
+        Failures are logged and the rest of the users are processed.
+        """
+
+        def update(user: UserModel) -> None:
+            try:
+                self._create_or_update_user(user)
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to manage user {user.user_id}. Error: {e} Context: {user.__dict__}"
+                )
+
+        def delete(user_id: str) -> None:
+            try:
+                self._delete_user(user_id)
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to delete user {user_id}. Error: {e}"
+                )
+
+        self._map_concurrently(update, users_to_update)
+        self._map_concurrently(delete, sorted(user_ids_to_delete))
 
-        if self._user_is_equal_upstream(user, upstream_user):
+    def _apply_changes(
+        self,
+        upstream_users: dict[UserId, CatalogDeclarativeUser],
+        users_to_update: list[UserModel],
+        user_ids_to_delete: set[str],
+        in_bulk: bool,
+    ) -> None:
+        """Applies the changes to the upstream users.
+
+        In bulk, the users layout of the organization is modified in memory
+        and put back in one request. If the request is rejected, or if the
+        changes are not applied in bulk, they are applied one user at a time.
+        """
+        if not users_to_update and not user_ids_to_delete:
+            self.logger.info("Users are up to date.")
             return
 
-        self._get_or_create_user_groups(user.user_groups)
+        self._create_missing_user_groups(
+            {group for user in users_to_update for group in user.user_groups}
+        )
 
-        self._api._sdk.catalog_user.create_or_update_user(user.to_sdk_obj())
-        self.logger.info(f"User {user.user_id} created/updated successfully.")
+        if not in_bulk:
+            self._apply_changes_one_by_one(users_to_update, user_ids_to_delete)
+            return
 
-    def _delete_user(self, user_id: str) -> None:
-        """Deletes user from the project."""
-        if user_id in self.protected_users:
-            self.logger.warning(
-                f"Skipping deletion of protected user: {user_id}."
-                + " Protected users should not be deleted.",
+        layout = {
+            user_id: user
+            for user_id, user in upstream_users.items()
+            if user_id not in user_ids_to_delete
+        }
+        for user in users_to_update:
+            layout[user.user_id] = user.to_declarative_obj(
+                upstream_users.get(user.user_id)
             )
-            return
 
         try:
-            self._api._sdk.catalog_user.get_user(user_id)
-        except NotFoundException:
+            self._api._sdk.catalog_user.put_declarative_users(
+                CatalogDeclarativeUsers(users=list(layout.values()))
+            )
+        except Exception as e:
+            if not self._is_conflict(e):
+                raise
+            self.logger.warning(
+                "Bulk update of users was rejected, updating users one by one. "
+                + f"Error: {e}"
+            )
+            self._apply_changes_one_by_one(users_to_update, user_ids_to_delete)
             return
 
-        self._api._sdk.catalog_user.delete_user(user_id)
-        self.logger.info(f"Deleted user: {user_id}")
-
-    def _manage_user(self, user: UserIncrementalLoad) -> None:
-        """Manages user based on the provided GDUserTarget."""
-        if user.is_active:
-            self._create_or_update_user(user, UserIncrementalLoad)
-        else:
-            self._delete_user(user.user_id)
+        for user in users_to_update:
+            self.logger.info(
+                f"User {user.user_id} created/updated successfully."
+            )
+        for user_id in sorted(user_ids_to_delete):
+            self.logger.info(f"Deleted user: {user_id}")
 
     def _provision_incremental_load(self) -> None:
         """Runs the incremental provisioning logic."""
         # Set protected users
         self.protected_users.append(self._get_current_user_id())
 
+        upstream_users = self._get_upstream_users()
+        self.upstream_user_cache = {
+            user_id: UserIncrementalLoad.from_declarative_obj(user)
+            for user_id, user in upstream_users.items()
+        }
+
+        # Later records of the same user take precedence
+        users_to_update: dict[UserId, UserIncrementalLoad] = {}
+        user_ids_to_delete: set[str] = set()
+
         for user in self.source_group_incremental:
-            # Attempt to process each user. On failure, log the error and continue
-            try:
-                self._manage_user(user)
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to manage user {user.user_id}. Error: {e} Context: {user.__dict__}"
-                )
+            user_id = user.user_id
+
+            if user.is_active:
+                if self._is_protected(user_id, "creation/update"):
+                    continue
+
+                user_ids_to_delete.discard(user_id)
+                if self._user_is_equal_upstream(
+                    user, self.upstream_user_cache.get(user_id)
+                ):
+                    users_to_update.pop(user_id, None)
+                else:
+                    users_to_update[user_id] = user
+            else:
+                if self._is_protected(user_id, "deletion"):
+                    continue
+
+                users_to_update.pop(user_id, None)
+                if user_id in upstream_users:
+                    user_ids_to_delete.add(user_id)
+
+        # Users changed by someone else must not be overwritten by the layout
+        # of the whole organization, so the changes are applied user by user
+        self._apply_changes(
+            upstream_users,
+            list(users_to_update.values()),
+            user_ids_to_delete,
+            in_bulk=False,
+        )
 
     def _provision_full_load(self) -> None:
         """Runs the full load provisioning logic."""
@@ -180,38 +274,41 @@ class UserProvisioner(Provisioning[UserFullLoad, UserIncrementalLoad]):
         self.protected_users.append(self._get_current_user_id())
 
         # Get all upstream users
-        catalog_upstream_users: list[CatalogUser] = (
-            self._api._sdk.catalog_user.list_users()
-        )
+        upstream_users = self._get_upstream_users()
 
-        # Convert catalog users to user models
-        upstream_users: list[UserFullLoad] = [
-            UserFullLoad.from_sdk_obj(user) for user in catalog_upstream_users
-        ]
-
-        # Cache the upstream users in a dict. It will be reused in `_try_get_user`
+        # Cache the upstream users as user models to compare them with source
         self.upstream_user_cache = {
-            user.user_id: user for user in upstream_users
+            user_id: UserFullLoad.from_declarative_obj(user)
+            for user_id, user in upstream_users.items()
         }
+
         # Get source IDs
         source_ids: set[str] = {user.user_id for user in self.source_group_full}
 
-        # Get upstream IDs
-        upstream_ids: set[str] = {user.user_id for user in upstream_users}
-
         # Create groups of IDs to delete, create, and in both systems
-        id_groups = self._create_groups(source_ids, upstream_ids)
+        id_groups = self._create_groups(source_ids, set(upstream_users))
 
-        # Iterate over source users and create/update
+        # Source users that are missing or differ upstream
+        users_to_update: dict[UserId, UserFullLoad] = {}
         for user in self.source_group_full:
-            user_id = user.user_id
+            if self._is_protected(user.user_id, "creation/update"):
+                continue
 
-            if (
-                user_id in id_groups.ids_to_create
-                or user_id in id_groups.ids_in_both_systems
+            if not self._user_is_equal_upstream(
+                user, self.upstream_user_cache.get(user.user_id)
             ):
-                self._create_or_update_user(user, UserFullLoad)
+                users_to_update[user.user_id] = user
 
-        # Delete users marked for deletion
-        for user_id in id_groups.ids_to_delete:
-            self._delete_user(user_id)
+        # Upstream users missing in source, except for the protected ones
+        user_ids_to_delete = {
+            user_id
+            for user_id in id_groups.ids_to_delete
+            if not self._is_protected(user_id, "deletion")
+        }
+
+        self._apply_changes(
+            upstream_users,
+            list(users_to_update.values()),
+            user_ids_to_delete,
+            in_bulk=True,
+        )
@@ -2,9 +2,12 @@
 
 """Provisioning base class for GoodData Pipelines."""
 
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from pathlib import Path
-from typing import Generic, Type, TypeVar
+from typing import Callable, Generic, Iterable, Type, TypeVar
 
+from gooddata_api_client.exceptions import ApiException  # type: ignore
 from gooddata_sdk.utils import PROFILES_FILE_PATH, profile_content
 
 from gooddata_pipelines.api import GoodDataApi
@@ -15,6 +18,12 @@ from gooddata_pipelines.provisioning.utils.utils import EntityGroupIds
 
 TFullLoadSourceData = TypeVar("TFullLoadSourceData")
 TIncrementalSourceData = TypeVar("TIncrementalSourceData")
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Statuses of bulk (layout) requests rejected because of some of the entities
+# they contain. The changes are then applied one entity at a time.
+CONFLICT_STATUSES = {HTTPStatus.BAD_REQUEST, HTTPStatus.CONFLICT}
 
 
 class Provisioning(Generic[TFullLoadSourceData, TIncrementalSourceData]):
@@ -27,6 +36,11 @@ class Provisioning(Generic[TFullLoadSourceData, TIncrementalSourceData]):
     FULL_LOAD_TYPE: type[TFullLoadSourceData]
     INCREMENTAL_LOAD_TYPE: type[TIncrementalSourceData]
 
+    # Maximum number of API calls made at once
+    MAX_WORKERS: int = 8
+    # Number of workspaces whose upstream state is held in memory at once
+    CHUNK_SIZE: int = 100
+
     def __init__(self, host: str, token: str) -> None:
         self.source_id: set[str] = set()
         self.upstream_id: set[str] = set()
@@ -83,6 +97,22 @@ class Provisioning(Generic[TFullLoadSourceData, TIncrementalSourceData]):
             ids_to_create=ids_to_create,
         )
 
+    def _map_concurrently(
+        self, function: Callable[[T], R], items: Iterable[T]
+    ) -> list[R]:
+        """Calls the function for each item, at most `MAX_WORKERS` at once.
+
+        Returns the results in the order of the items. The first exception
+        raised by the function is re-raised once all the calls finish.
+        """
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            return list(executor.map(function, items))
+
+    @staticmethod
+    def _is_conflict(e: Exception) -> bool:
+        """Checks if a bulk request was rejected because of its content."""
+        return isinstance(e, ApiException) and e.status in CONFLICT_STATUSES
+
     def _validate_source_data_type(
         self,
         source_data: list[TFullLoadSourceData] | list[TIncrementalSourceData],
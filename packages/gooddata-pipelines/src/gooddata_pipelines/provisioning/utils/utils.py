@@ -2,11 +2,13 @@
 
 """Module for utilities used in GoodData Pipelines provisioning."""
 
-from typing import Any, cast
+from typing import Any, Iterator, Sequence, TypeVar, cast
 
 import attrs
 from requests import Response
 
+T = TypeVar("T")
+
 
 class AttributesMixin:
     """
@@ -79,3 +81,9 @@ class EntityGroupIds:
     ids_in_both_systems: set[str]
     ids_to_delete: set[str]
     ids_to_create: set[str]
+
+
+def chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Splits the items into consecutive chunks of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
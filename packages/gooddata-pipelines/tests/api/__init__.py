@@ -0,0 +1 @@
+# (C) 2026 GoodData Corporation
@@ -0,0 +1,139 @@
+# (C) 2026 GoodData Corporation
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from gooddata_api_client.exceptions import ApiException
+
+from gooddata_pipelines.api.pooled_session import PooledSession
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:  # type: ignore[attr-defined]
+            server.requests += 1  # type: ignore[attr-defined]
+            server.connections.add(self.client_address)  # type: ignore[attr-defined]
+            server.active += 1  # type: ignore[attr-defined]
+            server.max_active = max(server.max_active, server.active)  # type: ignore[attr-defined]
+            failing = server.failures > 0  # type: ignore[attr-defined]
+            if failing:
+                server.failures -= 1  # type: ignore[attr-defined]
+
+        time.sleep(server.latency)  # type: ignore[attr-defined]
+
+        with server.lock:  # type: ignore[attr-defined]
+            server.active -= 1  # type: ignore[attr-defined]
+
+        body = b"{}"
+        self.send_response(503 if failing else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()  # type: ignore[attr-defined]
+    server.requests = 0  # type: ignore[attr-defined]
+    server.connections = set()  # type: ignore[attr-defined]
+    server.active = 0  # type: ignore[attr-defined]
+    server.max_active = 0  # type: ignore[attr-defined]
+    server.failures = 0  # type: ignore[attr-defined]
+    server.latency = 0.0  # type: ignore[attr-defined]
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host!s}:{port}/api/v1/entities/workspaces"
+
+
+def test_request_retried_on_transient_status(stub_server):
+    stub_server.failures = 2
+    session = PooledSession(max_retries=3, retry_backoff=0)
+
+    response = session.request("GET", _url(stub_server))
+
+    assert response.status_code == 200
+    assert stub_server.requests == 3
+    session.close()
+
+
+def test_request_returns_last_response_after_retries(stub_server):
+    stub_server.failures = 5
+    session = PooledSession(max_retries=1, retry_backoff=0)
+
+    response = session.request("GET", _url(stub_server))
+
+    assert response.status_code == 503
+    assert stub_server.requests == 2
+    session.close()
+
+
+def test_requests_limited_per_host_and_connections_reused(stub_server):
+    stub_server.latency = 0.05
+    session = PooledSession(max_connections_per_host=2)
+    url = _url(stub_server)
+
+    threads = [
+        threading.Thread(target=lambda: session.request("GET", url))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert stub_server.requests == 8
+    assert stub_server.max_active == 2
+    assert len(stub_server.connections) <= 2
+    session.close()
+
+
+def test_call_with_retry_repeats_only_transient_errors():
+    session = PooledSession(max_retries=2, retry_backoff=0)
+    calls = {"count": 0}
+
+    def flaky() -> str:
+        calls["count"] += 1
+        if calls["count"] < 3:
+            raise ApiException(status=503)
+        return "ok"
+
+    assert session.call_with_retry("https://host", flaky) == "ok"
+    assert calls["count"] == 3
+
+    def not_found() -> None:
+        calls["count"] += 1
+        raise ApiException(status=404)
+
+    calls["count"] = 0
+    with pytest.raises(ApiException):
+        session.call_with_retry("https://host", not_found)
+    assert calls["count"] == 1
+
+
+def test_call_with_retry_raises_after_max_retries():
+    session = PooledSession(max_retries=1, retry_backoff=0)
+
+    def failing() -> None:
+        raise ApiException(status=502)
+
+    with pytest.raises(ApiException) as exc_info:
+        session.call_with_retry("https://host", failing)
+    assert exc_info.value.status == 502
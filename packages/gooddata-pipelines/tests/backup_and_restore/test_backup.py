@@ -1,13 +1,21 @@
 # (C) 2025 GoodData Corporation
 
+import io
 import os
 import shutil
 import tempfile
+import threading
+import time
+import zipfile
+from contextlib import nullcontext
 from pathlib import Path
 from unittest import mock
 
 import boto3
 import pytest
+from gooddata_sdk.catalog.workspace.declarative_model.workspace.workspace import (
+    CatalogDeclarativeWorkspaceModel,
+)
 from moto import mock_aws
 
 from gooddata_pipelines.backup_and_restore.backup_manager import (
@@ -46,6 +54,29 @@ S3_CONFIG = BackupRestoreConfig(
     ),
 )
 
+USER_DATA_FILTERS = {
+    "userDataFilters": [
+        {
+            "id": "datafilter2",
+            "maql": '{label/campaign_channels.category} = "1"',
+            "title": "Status filter",
+            "user": {
+                "id": "5c867a8a-12af-45bf-8d85-c7d16bedebd1",
+                "type": "user",
+            },
+        },
+        {
+            "id": "datafilter4",
+            "maql": '{label/campaign_channels.category} = "1"',
+            "title": "Status filter",
+            "user": {
+                "id": "5c867a8a-12af-45bf-8d85-c7d16bedebd1",
+                "type": "user",
+            },
+        },
+    ]
+}
+
 
 @pytest.fixture
 def backup_manager(mock_logger):
@@ -122,125 +153,52 @@ def test_get_local_storage(backup_manager):
     assert isinstance(local_storage, LocalStorage)
 
 
-# Test that zipping gooddata_layouts folder works
-def test_archive_gooddata_layouts_to_zip(backup_manager):
-    with tempfile.TemporaryDirectory() as tmpdir:
-        shutil.copytree(
-            Path(
-                f"{TEST_DATA_SUBDIR}/test_exports/services/",
-            ),
-            Path(tmpdir + "/services"),
-        )
-        backup_manager._archive_gooddata_layouts_to_zip(
-            str(Path(tmpdir, "services"))
-        )
-
-        zip_exists = os.path.isfile(
-            Path(
-                tmpdir,
-                "services/wsid1/20230713-132759-1_3_1_dev5/gooddata_layouts.zip",
-            )
-        )
-        gooddata_layouts_dir_exists = os.path.isdir(
-            Path(
-                tmpdir,
-                "services/wsid1/20230713-132759-1_3_1_dev5/gooddata_layouts",
-            )
-        )
-
-        assert gooddata_layouts_dir_exists is False
-        assert zip_exists
-
-        zip_exists = os.path.isfile(
-            Path(
-                tmpdir,
-                "services/wsid2/20230713-132759-1_3_1_dev5/gooddata_layouts.zip",
-            )
-        )
-        gooddata_layouts_dir_exists = os.path.isdir(
-            Path(
-                tmpdir,
-                "services/wsid2/20230713-132759-1_3_1_dev5/gooddata_layouts",
-            )
-        )
-
-        assert gooddata_layouts_dir_exists is False
-        assert zip_exists
-
-        zip_exists = os.path.isfile(
-            Path(
-                tmpdir,
-                "services/wsid3/20230713-132759-1_3_1_dev5/gooddata_layouts.zip",
-            )
-        )
-        gooddata_layouts_dir_exists = os.path.isdir(
-            Path(
-                tmpdir,
-                "services/wsid3/20230713-132759-1_3_1_dev5/gooddata_layouts",
-            )
-        )
-
-        assert gooddata_layouts_dir_exists is False
-        assert zip_exists
-
-
-def test_store_user_data_filters(backup_manager):
-    user_data_filters = {
-        "userDataFilters": [
-            {
-                "id": "datafilter2",
-                "maql": '{label/campaign_channels.category} = "1"',
-                "title": "Status filter",
-                "user": {
-                    "id": "5c867a8a-12af-45bf-8d85-c7d16bedebd1",
-                    "type": "user",
-                },
-            },
-            {
-                "id": "datafilter4",
-                "maql": '{label/campaign_channels.category} = "1"',
-                "title": "Status filter",
-                "user": {
-                    "id": "5c867a8a-12af-45bf-8d85-c7d16bedebd1",
-                    "type": "user",
-                },
-            },
-        ]
-    }
-    user_data_filter_folderlocation = f"{TEST_DATA_SUBDIR}/test_exports/services/wsid1/20230713-132759-1_3_1_dev5/gooddata_layouts/services/workspaces/wsid1/user_data_filters"
-    backup_manager._store_user_data_filters(
-        user_data_filters,
-        Path(
-            f"{TEST_DATA_SUBDIR}/test_exports/services/wsid1/20230713-132759-1_3_1_dev5",
+def test_export_workspace_streams_archive_to_storage(backup_manager):
+    backup_manager.storage = mock.Mock()
+    upload = io.BytesIO()
+    upload.size = 0  # type: ignore[attr-defined]
+    backup_manager.storage.open_archive.return_value = nullcontext(upload)
+    backup_manager._api._sdk.catalog_workspace.get_declarative_workspace.return_value = CatalogDeclarativeWorkspaceModel()
+    backup_manager._api._sdk.catalog_workspace.get_declarative_filter_views.return_value = []
+
+    with (
+        mock.patch.object(
+            backup_manager,
+            "get_user_data_filters",
+            return_value=USER_DATA_FILTERS,
         ),
-        "wsid1",
-    )
-    user_data_filter_folder = os.path.isdir(
-        Path(user_data_filter_folderlocation)
-    )
-    user_data_filter2 = os.path.isfile(
-        Path(f"{user_data_filter_folderlocation}/datafilter2.yaml")
-    )
-    user_data_filter4 = os.path.isfile(
-        Path(f"{user_data_filter_folderlocation}/datafilter4.yaml")
+        mock.patch.object(
+            backup_manager,
+            "_get_automations_from_api",
+            return_value={"data": []},
+        ),
+    ):
+        assert backup_manager._export_workspace("wsid1") is True
+
+    backup_manager.storage.open_archive.assert_called_once_with(
+        f"services/wsid1/{BackupSettings.TIMESTAMP_SDK_FOLDER}/gooddata_layouts.zip"
     )
-    assert user_data_filter_folder
-    assert user_data_filter2
-    assert user_data_filter4
+    with zipfile.ZipFile(io.BytesIO(upload.getvalue())) as archive:
+        names = archive.namelist()
 
-    count = 0
-    for path in os.listdir(user_data_filter_folderlocation):
-        if os.path.isfile(os.path.join(user_data_filter_folderlocation, path)):
-            count += 1
+    assert "gooddata_layouts/user_data_filters/datafilter2.yaml" in names
+    assert "gooddata_layouts/user_data_filters/datafilter4.yaml" in names
+    assert "gooddata_layouts/filter_views/" in names
+    assert "gooddata_layouts/automations/" in names
 
-    assert count == 2
 
-    shutil.rmtree(
-        Path(
-            f"{TEST_DATA_SUBDIR}/test_exports/services/wsid1/20230713-132759-1_3_1_dev5/gooddata_layouts/services/workspaces/wsid1/user_data_filters",
-        )
+def test_export_workspace_skips_failed_workspace(backup_manager):
+    backup_manager.storage = mock.Mock()
+    backup_manager.storage.open_archive.return_value = nullcontext(io.BytesIO())
+    backup_manager._api._sdk.catalog_workspace.get_declarative_workspace.side_effect = RuntimeError(
+        "fail"
     )
 
+    with mock.patch.object(
+        backup_manager, "get_user_data_filters", return_value=USER_DATA_FILTERS
+    ):
+        assert backup_manager._export_workspace("wsid1") is False
+
 
 def test_local_storage_export(backup_manager):
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -253,10 +211,11 @@ def test_local_storage_export(backup_manager):
         )
         local_storage = backup_manager._get_storage(LOCAL_CONFIG)
 
-        local_storage.export(
-            folder=tmpdir,
-            org_id="services",
-        )
+        with pytest.deprecated_call():
+            local_storage.export(
+                folder=tmpdir,
+                org_id="services",
+            )
 
         local_export_folder_exist = os.path.isdir(
             Path(
@@ -288,9 +247,10 @@ def test_local_storage_export(backup_manager):
 
 
 def test_file_upload(backup_manager, s3, s3_bucket):
-    backup_manager.storage.export(
-        f"{TEST_DATA_SUBDIR}/test_exports", "services"
-    )
+    with pytest.deprecated_call():
+        backup_manager.storage.export(
+            f"{TEST_DATA_SUBDIR}/test_exports", "services"
+        )
     s3.Object(
         S3_BUCKET,
         "some/s3/backup/path/org_id/services/wsid2/20230713-132759-1_3_1_dev5/gooddata_layouts/services/workspaces/wsid2/analytics_model/filter_contexts/id.yaml",
@@ -316,11 +276,7 @@ def test_split_to_batches(backup_manager):
 @mock.patch(
     "gooddata_pipelines.backup_and_restore.backup_manager.BackupManager._get_workspace_export"
 )
-@mock.patch(
-    "gooddata_pipelines.backup_and_restore.backup_manager.BackupManager._archive_gooddata_layouts_to_zip"
-)
 def test_process_batch_success(
-    archive_gooddata_layouts_to_zip_mock,
     get_workspace_export_mock,
     backup_manager,
 ):
@@ -328,75 +284,56 @@ def test_process_batch_success(
     backup_manager.storage = mock.Mock()
     batch = BackupBatch(["ws1", "ws2"])
 
-    backup_manager._process_batch(
-        batch=batch,
-        retry_count=0,
-    )
+    backup_manager._process_batch(batch=batch)
 
-    get_workspace_export_mock.assert_called_once()
-    archive_gooddata_layouts_to_zip_mock.assert_called_once()
-    backup_manager.storage.export.assert_called_once()
+    get_workspace_export_mock.assert_called_once_with(["ws1", "ws2"])
 
 
 @mock.patch(
     "gooddata_pipelines.backup_and_restore.backup_manager.BackupManager._get_workspace_export"
 )
-@mock.patch(
-    "gooddata_pipelines.backup_and_restore.backup_manager.BackupManager._archive_gooddata_layouts_to_zip"
-)
-def test_process_batch_retries_on_exception(
-    archive_gooddata_layouts_to_zip_mock,
+def test_process_batch_does_not_retry_the_batch(
     get_workspace_export_mock,
     backup_manager,
     capsys,
 ):
     backup_manager.storage = mock.Mock()
     batch = BackupBatch(["ws1"])
+    get_workspace_export_mock.side_effect = Exception("fail")
 
-    # Raise exception on first call, succeed on second
-    call_count = {"count": 0}
+    with pytest.raises(Exception) as exc_info:
+        backup_manager._process_batch(batch=batch)
+    assert str(exc_info.value) == "fail"
+    assert get_workspace_export_mock.call_count == 1
+    captured = capsys.readouterr()
+    assert captured.out.startswith("Batch failed:")
 
-    def fail_once(*args, **kwargs):
-        if call_count["count"] == 0:
-            call_count["count"] += 1
-            raise Exception("fail")
-        return None
 
-    get_workspace_export_mock.side_effect = fail_once
+def test_get_workspace_export_runs_workspaces_concurrently(backup_manager):
+    lock = threading.Lock()
+    state = {"active": 0, "max_active": 0}
 
-    backup_manager._process_batch(
-        batch=batch,
-    )
+    def export_workspace(workspace_id: str) -> bool:
+        with lock:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return workspace_id != "ws1"
 
-    assert get_workspace_export_mock.call_count == 2
-    captured = capsys.readouterr()
-    assert captured.out.startswith(
-        "Exception encountered while processing a batch. Retrying"
-    )
-    backup_manager.storage.export.assert_called_once()
+    with mock.patch.object(
+        backup_manager, "_export_workspace", side_effect=export_workspace
+    ) as export_mock:
+        backup_manager._get_workspace_export(["ws1", "ws2", "ws3"])
 
+    assert export_mock.call_count == 3
+    assert 1 < state["max_active"] <= backup_manager.config.max_workers
 
-@mock.patch(
-    "gooddata_pipelines.backup_and_restore.backup_manager.BackupManager._get_workspace_export"
-)
-@mock.patch(
-    "gooddata_pipelines.backup_and_restore.backup_manager.BackupManager._archive_gooddata_layouts_to_zip"
-)
-def test_process_batch_raises_after_max_retries(
-    archive_gooddata_layouts_to_zip_mock,
-    get_workspace_export_mock,
-    backup_manager,
-    capsys,
-):
-    backup_manager.storage = mock.Mock()
-    batch = BackupBatch(["ws1"])
-    get_workspace_export_mock.side_effect = Exception("fail")
 
-    with pytest.raises(Exception) as exc_info:
-        backup_manager._process_batch(
-            batch=batch,
-            retry_count=BackupSettings.MAX_RETRIES,
-        )
-    assert str(exc_info.value) == "fail"
-    captured = capsys.readouterr()
-    assert captured.out.startswith("Batch failed:")
+def test_get_workspace_export_raises_when_nothing_exported(backup_manager):
+    with mock.patch.object(
+        backup_manager, "_export_workspace", return_value=False
+    ):
+        with pytest.raises(RuntimeError):
+            backup_manager._get_workspace_export(["ws1", "ws2"])
@@ -0,0 +1,190 @@
+# (C) 2026 GoodData Corporation
+
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+import pytest
+import yaml
+from gooddata_sdk.catalog.workspace.declarative_model.workspace.workspace import (
+    CatalogDeclarativeWorkspaceModel,
+)
+
+from gooddata_pipelines.backup_and_restore.backup_manager import BackupManager
+from gooddata_pipelines.backup_and_restore.models.manifest import (
+    BackupManifest,
+)
+from gooddata_pipelines.backup_and_restore.models.storage import (
+    BackupRestoreConfig,
+    LocalStorageConfig,
+    StorageType,
+)
+from gooddata_pipelines.backup_and_restore.restore_manager import (
+    RestoreManager,
+)
+
+WORKSPACE_MODEL = CatalogDeclarativeWorkspaceModel.from_dict(
+    {
+        "analytics": {
+            "metrics": [
+                {
+                    "id": "revenue",
+                    "title": "Revenue",
+                    "content": {"format": "#,##0", "maql": "SELECT 1"},
+                }
+            ]
+        }
+    },
+    camel_case=True,
+)
+
+
+def _udfs(**maqls: str) -> dict:
+    return {
+        "userDataFilters": [
+            {"id": udf_id, "maql": maql} for udf_id, maql in maqls.items()
+        ]
+    }
+
+
+@pytest.fixture
+def config(tmp_path) -> BackupRestoreConfig:
+    return BackupRestoreConfig(
+        storage_type=StorageType.LOCAL,
+        storage=LocalStorageConfig(backup_path=str(tmp_path / "backups")),
+        incremental=True,
+        max_delta_chain=1,
+    )
+
+
+@pytest.fixture
+def sdk():
+    sdk = mock.Mock()
+    sdk.catalog_organization.organization_id = "org"
+    with mock.patch(
+        "gooddata_pipelines.api.gooddata_api_wrapper.GoodDataSdk.create",
+        return_value=sdk,
+    ):
+        yield sdk
+
+
+@pytest.fixture
+def backup(config, sdk):  # noqa: ARG001
+    manager = BackupManager.create(config, "host", "token")
+
+    def backup(timestamp: str, user_data_filters: dict) -> bool:
+        with (
+            mock.patch.object(
+                manager,
+                "_get_backup_path",
+                return_value=f"org/ws/{timestamp}",
+            ),
+            mock.patch.object(
+                manager,
+                "_get_declarative_workspace",
+                return_value=WORKSPACE_MODEL,
+            ),
+            mock.patch.object(
+                manager, "_get_declarative_filter_views", return_value=[]
+            ),
+            mock.patch.object(
+                manager,
+                "_get_automations_from_api",
+                return_value={"data": []},
+            ),
+            mock.patch.object(
+                manager,
+                "get_user_data_filters",
+                return_value=user_data_filters,
+            ),
+        ):
+            return manager._export_workspace("ws")
+
+    return backup
+
+
+def _archived_files(config: BackupRestoreConfig, timestamp: str) -> set[str]:
+    archive_path = Path(
+        config.storage.backup_path, "org/ws", timestamp, "gooddata_layouts.zip"
+    )
+    with zipfile.ZipFile(archive_path) as archive:
+        return {name for name in archive.namelist() if not name.endswith("/")}
+
+
+def test_manifest_chain_is_limited():
+    objects = {"a.yaml": "1"}
+    full = BackupManifest.create("ws", "org/ws/1", objects)
+    assert not full.is_delta
+
+    delta = BackupManifest.create("ws", "org/ws/2", objects, full, 2)
+    assert (delta.base, delta.chain_length) == ("org/ws/1", 1)
+
+    delta = BackupManifest.create("ws", "org/ws/3", objects, delta, 2)
+    assert (delta.base, delta.chain_length) == ("org/ws/2", 2)
+
+    full = BackupManifest.create("ws", "org/ws/4", objects, delta, 2)
+    assert (full.base, full.chain_length) == (None, 0)
+
+
+def test_manifest_hash_does_not_depend_on_order():
+    first = BackupManifest.create("ws", "p", {"a": "1", "b": "2"})
+    second = BackupManifest.create("ws", "p", {"b": "2", "a": "1"})
+    assert first.workspace_hash == second.workspace_hash
+
+    changed = BackupManifest.create("ws", "p", {"a": "1", "b": "3", "c": "4"})
+    assert changed.changed_objects(first) == {"b", "c"}
+
+
+def test_incremental_backup_stores_only_changes(config, backup):
+    assert backup("1", _udfs(a="1 = 1", b="2 = 2"))
+    assert _archived_files(config, "1") == {
+        "manifest.json",
+        "gooddata_layouts/analytics_model/metrics/revenue.yaml",
+        "gooddata_layouts/user_data_filters/a.yaml",
+        "gooddata_layouts/user_data_filters/b.yaml",
+    }
+
+    # unchanged workspace is not stored again
+    assert backup("2", _udfs(b="2 = 2", a="1 = 1"))
+    assert not Path(config.storage.backup_path, "org/ws/2").exists()
+
+    assert backup("3", _udfs(a="1 = 0", c="3 = 3"))
+    assert _archived_files(config, "3") == {
+        "manifest.json",
+        "gooddata_layouts/user_data_filters/a.yaml",
+        "gooddata_layouts/user_data_filters/c.yaml",
+    }
+
+    # the chain is limited to a single delta backup
+    assert backup("4", _udfs(a="1 = 0"))
+    assert "gooddata_layouts/analytics_model/metrics/revenue.yaml" in (
+        _archived_files(config, "4")
+    )
+
+    latest = BackupManifest.model_validate_json(
+        Path(config.storage.backup_path, "org/ws/manifest.json").read_bytes()
+    )
+    assert (latest.path, latest.base) == ("org/ws/4", None)
+
+
+def test_restore_applies_delta_on_base(config, backup, sdk, tmp_path):  # noqa: ARG001
+    backup("1", _udfs(a="1 = 1", b="2 = 2"))
+    backup("2", _udfs(a="1 = 0", c="3 = 3"))
+
+    restore_manager = RestoreManager.create(config, "host", "token")
+    restore_dir = tmp_path / "restore"
+    restore_dir.mkdir()
+    restore_manager._fetch_backup("org/ws/2", restore_dir)
+
+    layouts = restore_dir / "gooddata_layouts"
+    assert sorted(path.name for path in restore_dir.iterdir()) == [
+        "gooddata_layouts"
+    ]
+    assert (layouts / "analytics_model/metrics/revenue.yaml").is_file()
+    assert (layouts / "filter_views").is_dir()
+
+    udfs = {
+        path.stem: yaml.safe_load(path.read_text())["maql"]
+        for path in (layouts / "user_data_filters").iterdir()
+    }
+    assert udfs == {"a": "1 = 0", "c": "3 = 3"}
@@ -0,0 +1,238 @@
+# (C) 2026 GoodData Corporation
+
+import io
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+import boto3
+import pytest
+from gooddata_sdk.catalog.workspace.declarative_model.workspace.workspace import (
+    CatalogDeclarativeWorkspaceModel,
+)
+
+from gooddata_pipelines.backup_and_restore.layout_archive import (
+    LayoutArchive,
+    WorkspaceLayout,
+)
+from gooddata_pipelines.backup_and_restore.models.storage import (
+    BackupRestoreConfig,
+    LocalStorageConfig,
+    StorageType,
+)
+from gooddata_pipelines.backup_and_restore.storage.azure_storage import (
+    AzureArchiveUpload,
+)
+from gooddata_pipelines.backup_and_restore.storage.base_storage import (
+    ArchiveUpload,
+)
+from gooddata_pipelines.backup_and_restore.storage.local_storage import (
+    LocalStorage,
+)
+from gooddata_pipelines.backup_and_restore.storage.s3_storage import (
+    S3ArchiveUpload,
+)
+
+
+class _NonSeekableStream(io.RawIOBase):
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        self.data += data
+        return len(data)
+
+
+class _RecordingUpload(ArchiveUpload):
+    def __init__(self, part_size: int) -> None:
+        super().__init__(part_size)
+        self.parts: list[tuple[int, bytes]] = []
+        self.whole: bytes | None = None
+        self.completed = False
+        self.aborted = False
+
+    def _upload_part(self, part_number: int, data: bytes) -> None:
+        self.parts.append((part_number, data))
+
+    def _complete(self, part_count: int) -> None:
+        self.completed = True
+
+    def _upload_whole(self, data: bytes) -> None:
+        self.whole = data
+
+    def _abort(self) -> None:
+        self.aborted = True
+
+
+@pytest.fixture
+def workspace_model():
+    return CatalogDeclarativeWorkspaceModel.from_dict(
+        {
+            "ldm": {
+                "datasets": [],
+                "dateInstances": [
+                    {
+                        "id": "date",
+                        "title": "Date",
+                        "granularities": ["DAY"],
+                        "granularitiesFormatting": {
+                            "titleBase": "",
+                            "titlePattern": "%titleBase - %granularityTitle",
+                        },
+                    }
+                ],
+            },
+            "analytics": {
+                "metrics": [
+                    {
+                        "id": "revenue",
+                        "title": "Revenue",
+                        "content": {"format": "#,##0", "maql": "SELECT 1"},
+                    }
+                ],
+                "visualizationObjects": [
+                    {
+                        "id": "viz",
+                        "title": "Žluťoučký kůň",
+                        "content": {
+                            "buckets": [],
+                            "visualizationUrl": "local:table",
+                        },
+                    }
+                ],
+            },
+        },
+        camel_case=True,
+    )
+
+
+def test_archive_matches_sdk_layout(workspace_model, tmp_path):
+    stream = _NonSeekableStream()
+    with LayoutArchive(stream) as archive:  # type: ignore[arg-type]
+        archive.add_layout(
+            WorkspaceLayout.collect(
+                workspace_model,
+                [],
+                {"data": []},
+                {"userDataFilters": [{"id": "udf1", "maql": "1 = 1"}]},
+            )
+        )
+
+    with zipfile.ZipFile(io.BytesIO(stream.data)) as archive_file:
+        archive_file.extractall(tmp_path / "restored")
+
+    layouts_dir = tmp_path / "restored" / "gooddata_layouts"
+    restored = CatalogDeclarativeWorkspaceModel.load_from_disk(layouts_dir)
+    assert restored == workspace_model
+
+    sdk_dir = tmp_path / "sdk"
+    workspace_model.store_to_disk(sdk_dir)
+    sdk_files = {
+        path.relative_to(sdk_dir): path.read_bytes()
+        for path in sdk_dir.rglob("*.yaml")
+    }
+    archived_files = {
+        path.relative_to(layouts_dir): path.read_bytes()
+        for path in layouts_dir.rglob("*.yaml")
+        if path.parent.name != "user_data_filters"
+    }
+    assert sdk_files and archived_files == sdk_files
+
+    assert (layouts_dir / "filter_views").is_dir()
+    assert (layouts_dir / "automations").is_dir()
+    assert not (layouts_dir / "automations" / "automations.json").exists()
+    assert (layouts_dir / "user_data_filters" / "udf1.yaml").is_file()
+
+
+def test_upload_buffers_parts():
+    upload = _RecordingUpload(part_size=4)
+    upload.write(b"abcdefghij")
+    assert upload.parts == [(1, b"abcd"), (2, b"efgh")]
+
+    upload.commit()
+    assert upload.parts[-1] == (3, b"ij")
+    assert upload.completed
+    assert upload.whole is None
+    assert upload.size == 10
+
+
+def test_small_upload_is_stored_whole():
+    upload = _RecordingUpload(part_size=16)
+    upload.write(b"abc")
+    upload.commit()
+
+    assert upload.parts == []
+    assert upload.whole == b"abc"
+    assert not upload.completed
+
+
+def test_open_archive_discards_upload_on_error(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    storage = LocalStorage(
+        BackupRestoreConfig(
+            storage_type=StorageType.LOCAL,
+            storage=LocalStorageConfig(backup_path="backups"),
+        )
+    )
+
+    with pytest.raises(RuntimeError):
+        with storage.open_archive("org/ws/ts/gooddata_layouts.zip") as upload:
+            upload.write(b"x" * 10)
+            raise RuntimeError("fail")
+
+    assert list(Path(tmp_path, "backups").rglob("*.*")) == []
+
+    with storage.open_archive("org/ws/ts/gooddata_layouts.zip") as upload:
+        upload.write(b"archive")
+
+    target = Path(tmp_path, "backups/org/ws/ts/gooddata_layouts.zip")
+    assert target.read_bytes() == b"archive"
+    assert list(target.parent.iterdir()) == [target]
+
+
+def test_s3_upload_uses_multipart_for_large_archives():
+    # the default session is replaced by a mock in conftest
+    client = boto3.session.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name="us-east-1",
+    ).client("s3")
+    client.create_bucket(Bucket="bucket")
+
+    part_size = 5 * 1024 * 1024
+    upload = S3ArchiveUpload(client, "bucket", "org/ws.zip")
+    upload._part_size = part_size
+    upload.write(b"a" * part_size)
+    upload.write(b"b" * 10)
+    upload.commit()
+
+    body = client.get_object(Bucket="bucket", Key="org/ws.zip")["Body"].read()
+    assert body == b"a" * part_size + b"b" * 10
+
+    small = S3ArchiveUpload(client, "bucket", "org/small.zip")
+    small.write(b"small")
+    small.commit()
+
+    body = client.get_object(Bucket="bucket", Key="org/small.zip")["Body"]
+    assert body.read() == b"small"
+
+
+def test_azure_upload_stages_blocks():
+    blob_client = mock.Mock()
+    upload = AzureArchiveUpload(blob_client)
+    upload._part_size = 4
+    upload.write(b"abcdefghij")
+    upload.commit()
+
+    assert blob_client.stage_block.call_count == 3
+    block_ids = [
+        call.args[0] for call in blob_client.stage_block.call_args_list
+    ]
+    assert len(set(map(len, block_ids))) == 1
+
+    committed = blob_client.commit_block_list.call_args.args[0]
+    assert [block.id for block in committed] == block_ids
+    blob_client.upload_blob.assert_not_called()
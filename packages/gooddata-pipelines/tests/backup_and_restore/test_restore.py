@@ -4,6 +4,8 @@ import json
 import os
 import shutil
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -226,6 +228,8 @@ def test_restore_multiple_workspaces_with_partial_failure(
         WorkspaceToRestore(id="ws_id_1", path="ws_id_1"),
         WorkspaceToRestore(id="ws_id_2", path="ws_id_1"),
     ]
+    # restore one workspace at a time to keep the order of the loads
+    restore_manager.config.max_workers = 1
     restore_manager.restore(targets)
 
     ws_catalog.put_declarative_ldm.assert_any_call(
@@ -242,6 +246,140 @@ def test_restore_multiple_workspaces_with_partial_failure(
     )
 
 
+def _mock_valid_backups(restore_manager, mocker):
+    mocker.patch.object(
+        restore_manager.storage, "get_ws_declaration", return_value=None
+    )
+
+    def create_valid_ws(_, destination: Path):
+        for folder in (DirNames.LDM, DirNames.AM, DirNames.UDF):
+            os.makedirs(destination / DirNames.LAYOUTS / folder)
+
+    mocker.patch.object(
+        restore_manager, "_extract_zip_archive", side_effect=create_valid_ws
+    )
+
+
+def test_order_by_hierarchy_restores_parents_first():
+    parents = {"child": "parent", "parent": "root", "grandchild": "child"}
+    targets = [
+        WorkspaceToRestore(id="grandchild", path="p1"),
+        WorkspaceToRestore(id="other", path="p2"),
+        WorkspaceToRestore(id="child", path="p3"),
+        WorkspaceToRestore(id="root", path="p4"),
+        WorkspaceToRestore(id="root", path="p5"),
+    ]
+
+    ordered = RestoreManager._order_by_hierarchy(targets, parents)
+
+    assert [(ws.id, ws.path, dep) for ws, dep in ordered] == [
+        ("other", "p2", None),
+        ("root", "p4", None),
+        ("root", "p5", 1),
+        # the parent is not restored, so the child waits for the root
+        ("child", "p3", 2),
+        ("grandchild", "p1", 3),
+    ]
+
+
+def test_restore_waits_for_parent(restore_manager, gd_api_instance, mocker):
+    """RestoreManager: a child is put only after its parent is restored."""
+    gd_api_instance.call_sdk.return_value = [
+        mocker.Mock(id="parent", parent_id=None),
+        mocker.Mock(id="child", parent_id="parent"),
+    ]
+    _mock_valid_backups(restore_manager, mocker)
+
+    put_order: list[str] = []
+    parent_started = threading.Event()
+
+    def put_backup(workspace_id: str, _):
+        if workspace_id == "parent":
+            parent_started.set()
+            # give the child a chance to overtake its parent
+            time.sleep(0.05)
+        else:
+            assert parent_started.is_set()
+        put_order.append(workspace_id)
+
+    mocker.patch.object(restore_manager, "_put_backup", side_effect=put_backup)
+
+    restore_manager.restore(
+        [
+            WorkspaceToRestore(id="child", path="child"),
+            WorkspaceToRestore(id="parent", path="parent"),
+        ]
+    )
+
+    assert put_order == ["parent", "child"]
+
+
+def test_restore_resumes_from_checkpoint(restore_manager, mocker, tmp_path):
+    """RestoreManager: workspaces recorded in the checkpoint are skipped."""
+    _mock_valid_backups(restore_manager, mocker)
+
+    def put_backup(workspace_id: str, _):
+        if workspace_id == "ws_2":
+            raise RuntimeError("fail")
+
+    put_backup_mock = mocker.patch.object(
+        restore_manager, "_put_backup", side_effect=put_backup
+    )
+    checkpoint_path = tmp_path / "checkpoint.json"
+    targets = [
+        WorkspaceToRestore(id="ws_1", path="org/ws_1/1"),
+        WorkspaceToRestore(id="ws_2", path="org/ws_2/1"),
+    ]
+
+    restore_manager.restore(targets, checkpoint_path)
+
+    assert json.loads(checkpoint_path.read_text()) == {
+        "restored": [{"id": "ws_1", "path": "org/ws_1/1"}]
+    }
+
+    put_backup_mock.reset_mock(side_effect=True)
+    restore_manager.restore(targets, checkpoint_path)
+
+    put_backup_mock.assert_called_once_with("ws_2", mocker.ANY)
+    assert len(json.loads(checkpoint_path.read_text())["restored"]) == 2
+
+
+def test_restore_bounds_prefetched_backups(restore_manager, mocker):
+    """RestoreManager: at most prefetch_size backups are held at once."""
+    _mock_valid_backups(restore_manager, mocker)
+    restore_manager.config.prefetch_size = 2
+
+    lock = threading.Lock()
+    held = 0
+    max_held = 0
+    prefetch_backup = restore_manager._prefetch_backup
+
+    def count_prefetch(*args):
+        nonlocal held, max_held
+        with lock:
+            held += 1
+            max_held = max(max_held, held)
+        return prefetch_backup(*args)
+
+    def put_backup(*_):
+        nonlocal held
+        time.sleep(0.01)
+        with lock:
+            held -= 1
+
+    mocker.patch.object(
+        restore_manager, "_prefetch_backup", side_effect=count_prefetch
+    )
+    mocker.patch.object(restore_manager, "_put_backup", side_effect=put_backup)
+
+    restore_manager.restore(
+        [WorkspaceToRestore(id=f"ws_{i}", path=f"ws_{i}") for i in range(8)]
+    )
+
+    assert restore_manager._put_backup.call_count == 8
+    assert 0 < max_held <= 2
+
+
 def test_load_user_data_filters_reads_yaml(mocker):
     """RestoreManager: reads YAML UDFs into expected API body structure."""
     mocker.patch(
@@ -343,4 +481,10 @@ def test_manager_create_from_profile(mocker):
         storage=S3StorageConfig(backup_path=S3_BACKUP_PATH, bucket=S3_BUCKET),
     )
     RestoreManager.create_from_profile(config)
-    gd_api_cls.assert_called_once_with("h", "t")
+    gd_api_cls.assert_called_once_with(
+        "h",
+        "t",
+        max_connections_per_host=config.max_connections_per_host,
+        max_retries=config.request_retries,
+        retry_backoff=config.request_retry_backoff,
+    )
@@ -469,12 +469,23 @@ def test_permission_provisioner(
         )
 
     # Patch the get method to return existing upstream permissions
+    catalog_permission = permission_provisioner._api._sdk.catalog_permission
     mocker.patch.object(
-        permission_provisioner._api,
+        catalog_permission,
         "get_declarative_permissions",
         side_effect=mock_get_declarative_permissions,
     )
 
+    # Patch the lists of entities referenced by the permissions
+    permission_provisioner._api._sdk.catalog_user.list_users.return_value = [
+        mocker.Mock(id=f"user_{index}") for index in range(1, 5)
+    ]
+    permission_provisioner._api._sdk.catalog_user.list_user_groups.return_value = []
+    permission_provisioner._api._sdk.catalog_workspace.list_workspaces.return_value = [
+        mocker.Mock(id=workspace_id)
+        for workspace_id in existing_upstream_permissions
+    ]
+
     # Load source data
     with open(f"{TEST_DATA_SUBDIR}/{source_data_path}", "r") as f:
         source_data = orjson.loads(f.read())
@@ -503,8 +514,8 @@ def test_permission_provisioner(
         )
         assert actual_sorted_permissions == expected_sorted_permissions
 
-    mocker.patch.object(
-        permission_provisioner._api,
+    put_declarative_permissions = mocker.patch.object(
+        catalog_permission,
         "put_declarative_permissions",
         side_effect=compare_permissions,
     )
@@ -517,3 +528,64 @@ def test_permission_provisioner(
     else:
         full_load_data = [PermissionFullLoad(**row) for row in source_data]
         permission_provisioner.full_load(full_load_data)
+
+    assert put_declarative_permissions.call_count == len(expected_result)
+
+
+def test_permission_provisioner_skips_unchanged_and_invalid(
+    permission_provisioner: PermissionProvisioner,
+    mocker: MockerFixture,
+) -> None:
+    """Workspaces whose permissions do not change are not put and permissions
+    referencing non-existent entities are skipped."""
+    api = permission_provisioner._api
+    api._sdk.catalog_user.list_users.return_value = [
+        mocker.Mock(id="user_2"),
+        mocker.Mock(id="user_3"),
+    ]
+    api._sdk.catalog_user.list_user_groups.return_value = []
+    api._sdk.catalog_workspace.list_workspaces.return_value = [
+        mocker.Mock(id="ws_id_1"),
+        mocker.Mock(id="ws_id_2"),
+    ]
+    api._sdk.catalog_permission.get_declarative_permissions.side_effect = (
+        mock_upstream_perms
+    )
+
+    permission_provisioner.incremental_load(
+        [
+            # already granted upstream
+            PermissionIncrementalLoad(
+                permission="ANALYZE",
+                workspace_id="ws_id_1",
+                entity_id="user_3",
+                entity_type=EntityType.user,
+                is_active=True,
+            ),
+            PermissionIncrementalLoad(
+                permission="MANAGE",
+                workspace_id="ws_id_2",
+                entity_id="user_2",
+                entity_type=EntityType.user,
+                is_active=True,
+            ),
+            # the user does not exist
+            PermissionIncrementalLoad(
+                permission="MANAGE",
+                workspace_id="ws_id_1",
+                entity_id="user_5",
+                entity_type=EntityType.user,
+                is_active=True,
+            ),
+        ]
+    )
+
+    put = api._sdk.catalog_permission.put_declarative_permissions
+    put.assert_called_once()
+    assert put.call_args.args[0] == "ws_id_2"
+    assert (
+        CatalogDeclarativeSingleWorkspacePermission(
+            name="MANAGE", assignee=USER_2
+        )
+        in put.call_args.args[1].permissions
+    )
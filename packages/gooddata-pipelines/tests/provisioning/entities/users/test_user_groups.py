@@ -2,10 +2,52 @@
 
 
 import pytest
+from gooddata_sdk.catalog.user.declarative_model.user_group import (
+    CatalogDeclarativeUserGroup,
+    CatalogDeclarativeUserGroups,
+)
+from pytest_mock import MockerFixture
 
 from gooddata_pipelines.provisioning.entities.users.models.user_groups import (
+    UserGroupFullLoad,
     UserGroupIncrementalLoad,
 )
+from gooddata_pipelines.provisioning.entities.users.user_groups import (
+    UserGroupProvisioner,
+)
+
+UPSTREAM_USER_GROUPS = CatalogDeclarativeUserGroups(
+    user_groups=[
+        CatalogDeclarativeUserGroup(id="existing", name="Existing"),
+        CatalogDeclarativeUserGroup(id="obsolete", name="Obsolete"),
+    ]
+)
+
+
+def _mock_user_group_api(
+    user_group_provisioner: UserGroupProvisioner, mocker: MockerFixture
+) -> tuple[list[str], list[str]]:
+    """Mocks the user group API, returns lists of created/updated and
+    deleted user group IDs."""
+    created_or_updated: list[str] = []
+    deleted: list[str] = []
+    catalog_user = user_group_provisioner._api._sdk.catalog_user
+
+    mocker.patch.object(
+        catalog_user,
+        "get_declarative_user_groups",
+        return_value=UPSTREAM_USER_GROUPS,
+    )
+    mocker.patch.object(
+        catalog_user,
+        "create_or_update_user_group",
+        side_effect=lambda user_group: created_or_updated.append(user_group.id),
+    )
+    mocker.patch.object(
+        catalog_user, "delete_user_group", side_effect=deleted.append
+    )
+
+    return created_or_updated, deleted
 
 
 def test_missing_key_no_parent_groups() -> None:
@@ -72,3 +114,73 @@ def test_row_invalid_is_active() -> None:
             parent_user_groups=[],
             is_active="not_a_boolean",  # type: ignore
         )
+
+
+def test_incremental_load_applies_changes_one_by_one(
+    user_group_provisioner: UserGroupProvisioner, mocker: MockerFixture
+) -> None:
+    created_or_updated, deleted = _mock_user_group_api(
+        user_group_provisioner, mocker
+    )
+    catalog_user = user_group_provisioner._api._sdk.catalog_user
+
+    user_group_provisioner.incremental_load(
+        [
+            UserGroupIncrementalLoad(
+                user_group_id="child",
+                user_group_name="Child",
+                parent_user_groups=["parent"],
+                is_active=True,
+            ),
+            UserGroupIncrementalLoad(
+                user_group_id="parent",
+                user_group_name="Parent",
+                parent_user_groups=["existing"],
+                is_active=True,
+            ),
+            UserGroupIncrementalLoad(
+                user_group_id="existing",
+                user_group_name="Renamed",
+                is_active=True,
+            ),
+            UserGroupIncrementalLoad(
+                user_group_id="obsolete",
+                user_group_name="Obsolete",
+                is_active=False,
+            ),
+        ]
+    )
+
+    catalog_user.put_declarative_user_groups.assert_not_called()
+    assert sorted(created_or_updated) == ["child", "existing", "parent"]
+    assert created_or_updated.index("parent") < created_or_updated.index(
+        "child"
+    )
+    assert deleted == ["obsolete"]
+
+
+def test_full_load_puts_user_groups_layout(
+    user_group_provisioner: UserGroupProvisioner, mocker: MockerFixture
+) -> None:
+    created_or_updated, deleted = _mock_user_group_api(
+        user_group_provisioner, mocker
+    )
+    catalog_user = user_group_provisioner._api._sdk.catalog_user
+
+    user_group_provisioner.full_load(
+        [
+            UserGroupFullLoad(
+                user_group_id="existing", user_group_name="Existing"
+            ),
+            UserGroupFullLoad(user_group_id="new", user_group_name="New"),
+        ]
+    )
+
+    catalog_user.put_declarative_user_groups.assert_called_once()
+    layout = catalog_user.put_declarative_user_groups.call_args.args[0]
+    assert sorted(group.id for group in layout.user_groups) == [
+        "existing",
+        "new",
+    ]
+    assert created_or_updated == []
+    assert deleted == []
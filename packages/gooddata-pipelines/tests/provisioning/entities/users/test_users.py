@@ -4,7 +4,10 @@ from typing import Literal, Optional
 import attrs
 import orjson
 import pytest
-from gooddata_api_client.exceptions import NotFoundException  # type: ignore
+from gooddata_api_client.exceptions import ApiException  # type: ignore
+from gooddata_sdk.catalog.user.declarative_model.user import (
+    CatalogDeclarativeUsers,
+)
 from gooddata_sdk.catalog.user.entity_model.user import (
     CatalogUser,
     CatalogUserAttributes,
@@ -157,6 +160,18 @@ def user_provisioner(mocker: MockerFixture) -> UserProvisioner:
     return provisioner_instance
 
 
+def parse_declarative_user_data(
+    user_data: list[dict],
+) -> CatalogDeclarativeUsers:
+    """Parse json user metadata to a declarative users layout."""
+    return CatalogDeclarativeUsers(
+        users=[
+            UserFullLoad.from_sdk_obj(user).to_declarative_obj()
+            for user in parse_user_data(user_data)
+        ]
+    )
+
+
 def parse_user_data(user_data: list[dict]) -> list[CatalogUser]:
     """Parse json user metadata to CatalogUser objects."""
     users: list[CatalogUser] = []
@@ -183,6 +198,7 @@ def parse_user_data(user_data: list[dict]) -> list[CatalogUser]:
     return sorted(users, key=lambda x: x.id)
 
 
+@pytest.mark.parametrize("bulk_rejected", [False, True])
 @pytest.mark.parametrize(
     ("input_path", "expected_path", "load_method"),
     [
@@ -217,11 +233,17 @@ def test_user_provisioning(
     input_path: str,
     expected_path: str,
     load_method: Literal["full_load", "incremental_load"],
+    bulk_rejected: bool,
     user_provisioner: UserProvisioner,
     mocker: MockerFixture,
 ):
     """Test complete user provisioning workflow by checking that the script will
-    attempt to create, update or delete expected users for given input."""
+    attempt to create, update or delete expected users for given input.
+
+    Full load puts the changes as a single users layout; if the layout is
+    rejected, they are applied one user at a time. Incremental load always
+    applies them one user at a time.
+    """
 
     # Load input data
     with open(f"{TEST_DATA_SUBDIR}/{input_path}", "r") as f:
@@ -235,12 +257,12 @@ def test_user_provisioning(
     with open(f"{TEST_DATA_SUBDIR}/existing_upstream_users.json", "r") as f:
         raw_upstream_users = orjson.loads(f.read())
 
-    upstream_users = parse_user_data(raw_upstream_users)
+    upstream_layout = parse_declarative_user_data(raw_upstream_users)
 
     mocker.patch.object(
         user_provisioner._api._sdk.catalog_user,
-        "list_users",
-        return_value=upstream_users,
+        "get_declarative_users",
+        return_value=upstream_layout,
     )
 
     def mock_get_profile(*args, **kwargs) -> Response:
@@ -263,19 +285,6 @@ def test_user_provisioning(
         side_effect=mock_get_profile,
     )
 
-    upstream_user_cache = {user.id: user for user in upstream_users}
-
-    def patch_get_user(user_id: str):
-        if user_id in upstream_user_cache:
-            return upstream_user_cache[user_id]
-        raise NotFoundException(f"User {user_id} not found")
-
-    mocker.patch.object(
-        user_provisioner._api._sdk.catalog_user,
-        "get_user",
-        side_effect=patch_get_user,
-    )
-
     # Parse expected data
     expected_deleted_users = sorted(raw_expected_data["deleted_users"])
     raw_expected_modified_users = raw_expected_data["modified_users"]
@@ -302,6 +311,11 @@ def test_user_provisioning(
         "delete_user",
         side_effect=patch_delete_user,
     )
+    put_declarative_users = mocker.patch.object(
+        user_provisioner._api._sdk.catalog_user,
+        "put_declarative_users",
+        side_effect=ApiException(status=409) if bulk_rejected else None,
+    )
 
     # Run the provisioning
     if load_method == "incremental_load":
@@ -313,6 +327,24 @@ def test_user_provisioning(
         full_load_data = [UserFullLoad(**row) for row in input_data]
         user_provisioner.full_load(full_load_data)
 
+    if load_method == "incremental_load":
+        put_declarative_users.assert_not_called()
+    else:
+        put_declarative_users.assert_called_once()
+
+    if load_method == "full_load" and not bulk_rejected:
+        # Derive the changes from the layout put upstream
+        upstream_users = {user.id: user for user in upstream_layout.users}
+        layout_users = put_declarative_users.call_args.args[0].users
+        created_or_updated_users = [
+            UserFullLoad.from_declarative_obj(user).to_sdk_obj()
+            for user in layout_users
+            if upstream_users.get(user.id) != user
+        ]
+        deleted_users = sorted(
+            set(upstream_users) - {user.id for user in layout_users}
+        )
+
     # Compare list lengths
     assert len(created_or_updated_users) == len(expected_modified_users)
     assert len(deleted_users) == len(expected_deleted_users)
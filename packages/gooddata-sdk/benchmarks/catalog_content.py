@@ -0,0 +1,151 @@
+# (C) 2026 GoodData Corporation
+"""
+Benchmark of CatalogWorkspaceContent construction and lookups on a large synthetic catalog.
+
+The benchmark builds the catalog from synthetic paged entities shaped like the responses of the entities API, the
+same way CatalogWorkspaceContentService.get_full_catalog does, and then resolves every label to its attribute and
+every attribute and metric by its identifier. With the `--baseline` flag, it also builds the datasets the way they
+were built before the catalog got indexed - each dataset structuring all the side loads - and resolves the labels
+by scanning the attributes.
+
+The default sizes produce a catalog of roughly 50 thousand objects. Run with:
+
+    python benchmarks/catalog_content.py --datasets 1000 --attributes 10 --labels 2 --facts 10 --metrics 9000 --baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable, TypeVar
+
+from gooddata_sdk import CatalogDataset, CatalogWorkspaceContent, ObjId
+from gooddata_sdk.utils import AllPagedEntities
+
+T = TypeVar("T")
+
+
+def _ref(obj_type: str, obj_id: str) -> dict[str, str]:
+    return {"id": obj_id, "type": obj_type}
+
+
+def _entities(
+    datasets: int, attributes: int, labels: int, facts: int, metrics: int
+) -> tuple[AllPagedEntities, AllPagedEntities, AllPagedEntities]:
+    dataset_data: list[Any] = []
+    dataset_included: list[Any] = []
+    attribute_data: list[Any] = []
+    attribute_included: list[Any] = []
+
+    for d in range(datasets):
+        attribute_ids = [f"attr{d}_{a}" for a in range(attributes)]
+        fact_ids = [f"fact{d}_{f}" for f in range(facts)]
+        dataset_data.append(
+            {
+                "id": f"dataset{d}",
+                "type": "dataset",
+                "attributes": {"title": f"Dataset {d}", "type": "NORMAL"},
+                "relationships": {
+                    "attributes": {"data": [_ref("attribute", a) for a in attribute_ids]},
+                    "facts": {"data": [_ref("fact", f) for f in fact_ids]},
+                },
+            }
+        )
+        dataset_included.extend({**_ref("fact", f), "attributes": {"title": f}} for f in fact_ids)
+        dataset_included.extend({**_ref("attribute", a), "attributes": {"title": a}} for a in attribute_ids)
+        attribute_included.append({**_ref("dataset", f"dataset{d}"), "attributes": {"title": f"Dataset {d}"}})
+
+        for attribute_id in attribute_ids:
+            label_ids = [f"{attribute_id}_label{x}" for x in range(labels)]
+            attribute_data.append(
+                {
+                    "id": attribute_id,
+                    "type": "attribute",
+                    "attributes": {"title": attribute_id},
+                    "relationships": {
+                        "labels": {"data": [_ref("label", x) for x in label_ids]},
+                        "dataset": {"data": _ref("dataset", f"dataset{d}")},
+                    },
+                }
+            )
+            attribute_included.extend(
+                {**_ref("label", x), "attributes": {"title": x, "primary": i == 0}} for i, x in enumerate(label_ids)
+            )
+
+    metric_data = [
+        {"id": f"metric{m}", "type": "metric", "attributes": {"title": f"Metric {m}", "content": {"maql": "SELECT 1"}}}
+        for m in range(metrics)
+    ]
+
+    return (
+        AllPagedEntities(data=dataset_data, included=dataset_included),
+        AllPagedEntities(data=attribute_data, included=attribute_included),
+        AllPagedEntities(data=metric_data, included=[]),
+    )
+
+
+def _timed(fn: Callable[[], T]) -> tuple[T, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _baseline_label_attribute(datasets: list[CatalogDataset], label_id: ObjId) -> Any:
+    for dataset in datasets:
+        for attribute in dataset.attributes:
+            for label in attribute.labels:
+                if label.obj_id == label_id:
+                    return attribute
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--datasets", type=int, default=1000)
+    parser.add_argument("--attributes", type=int, default=10, help="attributes per dataset")
+    parser.add_argument("--labels", type=int, default=2, help="labels per attribute")
+    parser.add_argument("--facts", type=int, default=10, help="facts per dataset")
+    parser.add_argument("--metrics", type=int, default=9000)
+    parser.add_argument("--baseline", action="store_true", help="also measure the unindexed construction and lookup")
+    parser.add_argument(
+        "--baseline-lookups", type=int, default=1000, help="number of labels resolved by scanning in the baseline"
+    )
+    args = parser.parse_args()
+
+    datasets, attributes, metrics = _entities(args.datasets, args.attributes, args.labels, args.facts, args.metrics)
+    objects = len(datasets.data) + len(attributes.data) + len(attributes.included) + len(metrics.data)
+    objects += args.datasets * args.facts
+    label_ids = [ObjId(id=x["id"], type="label") for x in attributes.included if x["type"] == "label"]
+    print(f"objects={objects} datasets={args.datasets} attributes={len(attributes.data)} labels={len(label_ids)}")
+
+    catalog, build = _timed(
+        lambda: CatalogWorkspaceContent.create_workspace_content_catalog(None, datasets, attributes, metrics)
+    )
+    _, labels = _timed(lambda: [catalog.find_label_attribute(x) for x in label_ids])
+    _, by_id = _timed(
+        lambda: (
+            [catalog.get_attribute(a["id"]) for a in attributes.data],
+            [catalog.get_metric(m["id"]) for m in metrics.data],
+        )
+    )
+    print(f"{'variant':>10} {'build_s':>9} {'labels':>8} {'lookup_s':>9} {'us/lookup':>10}")
+    print(f"{'indexed':>10} {build:>9.3f} {len(label_ids):>8} {labels:>9.3f} {labels / len(label_ids) * 1e6:>10.2f}")
+    print(f"{'':>10} attributes and metrics by id: {by_id:.3f}s")
+
+    if args.baseline:
+        baseline, baseline_build = _timed(
+            lambda: [
+                CatalogDataset.from_api(d, side_loads=datasets.included, related_entities=attributes)
+                for d in datasets.data
+            ]
+        )
+        sample = label_ids[:: max(1, len(label_ids) // args.baseline_lookups)]
+        _, baseline_labels = _timed(lambda: [_baseline_label_attribute(baseline, x) for x in sample])
+        print(
+            f"{'baseline':>10} {baseline_build:>9.3f} {len(sample):>8} {baseline_labels:>9.3f} "
+            f"{baseline_labels / len(sample) * 1e6:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# (C) 2026 GoodData Corporation
+"""
+Benchmark of ExecutionTable.read_all with and without page prefetching.
+
+The benchmark drives the real Execution / ExecutionTable code against a local stub of ActionsApi.retrieve_result
+that simulates the round-trip latency of the backend. It prints the throughput (rows per second) for
+combinations of simulated latency and prefetch depth.
+
+Run with:
+
+    python benchmarks/table_prefetch.py --rows 200000 --latency-ms 0 5 20 --prefetch 0 2 4 8 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any
+
+from gooddata_sdk import Attribute, Execution, ObjId, SimpleMetric, table
+
+
+class _StubActionsApi:
+    def __init__(self, total_rows: int, latency: float) -> None:
+        self._total_rows = total_rows
+        self._latency = latency
+
+    def retrieve_result(self, workspace_id: str, result_id: str, offset: list[int], limit: list[int], **_: Any):
+        time.sleep(self._latency)
+
+        rows = range(offset[0], min(offset[0] + limit[0], self._total_rows))
+        result = {
+            "data": [[float(row), float(row) * 2] for row in rows],
+            "dimension_headers": [
+                {
+                    "headerGroups": [
+                        {"headers": [{"attributeHeader": {"labelValue": f"a{row}"}} for row in rows]},
+                        {"headers": [{"attributeHeader": {"labelValue": f"b{row % 100}"}} for row in rows]},
+                    ]
+                },
+                {"headerGroups": [{"headers": [{"measureHeader": {"measureIndex": i}} for i in range(2)]}]},
+            ],
+            "grand_totals": [],
+            "paging": {"count": [len(rows), 2], "offset": [offset[0], 0], "total": [self._total_rows, 2]},
+            "metadata": {},
+        }
+
+        return result, 200, {}
+
+
+class _StubApiClient:
+    def __init__(self, actions_api: _StubActionsApi) -> None:
+        self.actions_api = actions_api
+        self.custom_headers: dict[str, str] = {}
+
+
+def _create_execution(total_rows: int, latency: float) -> Execution:
+    exec_def = table._prepare_tabular_definition(
+        attributes=[Attribute(local_id="a", label="a"), Attribute(local_id="b", label="b")],
+        metrics=[
+            SimpleMetric(local_id="m1", item=ObjId(type="fact", id="m1")),
+            SimpleMetric(local_id="m2", item=ObjId(type="fact", id="m2")),
+        ],
+        filters=[],
+    )
+
+    return Execution(
+        api_client=_StubApiClient(_StubActionsApi(total_rows, latency)),  # type: ignore[arg-type]
+        workspace_id="benchmark",
+        exec_def=exec_def,
+        response={"execution_response": {"links": {"executionResult": "benchmark"}, "dimensions": []}},
+    )
+
+
+def _run(total_rows: int, latency: float, prefetch: int) -> float:
+    exec_table = table._as_table(_create_execution(total_rows, latency))
+
+    start = time.perf_counter()
+    count = sum(1 for _ in exec_table.read_all(prefetch=prefetch))
+    duration = time.perf_counter() - start
+
+    assert count == total_rows
+    return duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[0, 5, 20])
+    parser.add_argument("--prefetch", type=int, nargs="+", default=[0, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    print(f"rows={args.rows} page_size={table._TABLE_ROW_BATCH_SIZE}")
+    print(f"{'latency_ms':>10} {'prefetch':>8} {'seconds':>9} {'rows/s':>12} {'speedup':>8}")
+    for latency_ms in args.latency_ms:
+        baseline = None
+        for prefetch in args.prefetch:
+            duration = _run(args.rows, latency_ms / 1000, prefetch)
+            baseline = baseline or duration
+            print(
+                f"{latency_ms:>10.1f} {prefetch:>8} {duration:>9.3f} {args.rows / duration:>12,.0f} "
+                f"{baseline / duration:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
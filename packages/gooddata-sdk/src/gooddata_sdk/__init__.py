@@ -232,6 +232,13 @@ from gooddata_sdk.catalog.workspace.entity_model.user_data_filter import (
 )
 from gooddata_sdk.catalog.workspace.entity_model.workspace import CatalogWorkspace
 from gooddata_sdk.client import GoodDataApiClient
+from gooddata_sdk.compute.arrow_converter import (
+    execution_result_arrow_schema,
+    execution_result_to_record_batch,
+    record_batches_to_table,
+)
+from gooddata_sdk.compute.async_service import AsyncComputeService, AsyncExecution, AsyncTransport
+from gooddata_sdk.compute.batch import ExecutionBatch
 from gooddata_sdk.compute.compute_to_sdk_converter import ComputeToSdkConverter
 from gooddata_sdk.compute.model.attribute import Attribute
 from gooddata_sdk.compute.model.base import ExecModelEntity, ObjId
@@ -276,11 +283,14 @@ from gooddata_sdk.compute.model.metric import (
     PopDatesetMetric,
     SimpleMetric,
 )
+from gooddata_sdk.compute.paging import PagingPolicy, estimate_result_bytes
+from gooddata_sdk.compute.result_cache import ExecutionResultCache, ResultCacheMetrics, execution_fingerprint
 from gooddata_sdk.compute.service import ComputeService
 from gooddata_sdk.sdk import GoodDataSdk
-from gooddata_sdk.table import ExecutionTable, TableService
+from gooddata_sdk.table import AsyncExecutionTable, ExecutionTable, TableService, TableSortKey
 from gooddata_sdk.utils import SideLoads
 from gooddata_sdk.visualization import (
+    SortDirection,
     Visualization,
     VisualizationAttribute,
     VisualizationBucket,
@@ -12,6 +12,11 @@ from gooddata_sdk.utils import AllPagedEntities
 T = TypeVar("T", bound="Base")
 U = TypeVar("U", bound="JsonApiEntityBase")
 
+_ENTITY_FIELDS = ("id", "type", "attributes", "relationships", "meta", "links")
+"""
+Fields of JSON:API entity structured into JsonApiEntityBase.
+"""
+
 
 def value_in_allowed(
     instance: type[Base], attribute: attr.Attribute, value: str, client_class: Optional[Any] = None
@@ -93,11 +98,15 @@ class JsonApiEntityBase:
     ) -> JsonApiEntityBase:
         """
         Creates object from entity passed by client class, which represents it as dictionary.
+
+        The lists of side loads and related entities are typically shared by all entities created from the same
+        API response; they are referenced as they are, not copied.
         """
-        entity["side_loads"] = side_loads or []
-        entity["related_entities_data"] = related_entities.data if related_entities else []
-        entity["related_entities_side_loads"] = related_entities.included if related_entities else []
-        return structure(entity, cls)
+        json_api_entity = structure({name: entity[name] for name in _ENTITY_FIELDS if name in entity}, cls)
+        json_api_entity.side_loads = side_loads or []
+        json_api_entity.related_entities_data = related_entities.data if related_entities else []
+        json_api_entity.related_entities_side_loads = related_entities.included if related_entities else []
+        return json_api_entity
 
     @classmethod
     def from_dict(cls: builtins.type[U], data: dict[str, Any]) -> U:
@@ -85,8 +85,10 @@ class AttrCatalogEntity:
         return NotImplemented
 
     def _relation_entity_from_side_loads(self, entity: builtins.type[T], path: list[str]) -> list[T]:
-        related_fact_ids = [(x.get("id"), x.get("type")) for x in safeget_list(self.json_api_relationships, path)]
-        return [entity.from_api(sl) for sl in self.json_api_side_loads if (sl["id"], sl["type"]) in related_fact_ids]
+        related_ids = {(x.get("id"), x.get("type")) for x in safeget_list(self.json_api_relationships, path)}
+        if not related_ids:
+            return []
+        return [entity.from_api(sl) for sl in self.json_api_side_loads if (sl["id"], sl["type"]) in related_ids]
 
 
 class CatalogEntity:
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import copy
 import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal, Optional, Union, cast
 
@@ -38,7 +39,7 @@ from gooddata_sdk.compute.model.base import ObjId
 from gooddata_sdk.compute.model.execution import ExecutionDefinition, compute_model_to_api_model
 from gooddata_sdk.compute.model.filter import Filter
 from gooddata_sdk.compute.model.metric import Metric
-from gooddata_sdk.utils import load_all_entities
+from gooddata_sdk.utils import RelatedSideLoads, load_all_entities
 
 ValidObjectTypes = Union[Attribute, Metric, Filter, CatalogLabel, CatalogFact, CatalogMetric]
 
@@ -62,7 +63,9 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
 
     # Entities methods
 
-    def get_full_catalog(self, workspace_id: str, inject_valid_objects_func: bool = True) -> CatalogWorkspaceContent:
+    def get_full_catalog(
+        self, workspace_id: str, inject_valid_objects_func: bool = True, max_concurrency: int = 1
+    ) -> CatalogWorkspaceContent:
         """Retrieves catalog for a workspace. Catalog contains all data sets and metrics defined in that workspace.
 
         Args:
@@ -72,6 +75,10 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
                 Should valid_objects func be injected into the result container?
                 When turned off, it enables pickling of the result, which is useful e.g. in Streamlit caching
                 In such a case, developers must call compute_valid_objects in this service.
+            max_concurrency (int):
+                Number of pages of each entity type to load concurrently. When greater than one, attributes, data sets
+                and metrics are loaded in parallel as well. By default, everything is loaded one after another.
+                See load_all_entities.
 
         Returns:
             CatalogWorkspaceContent: Object containing all data sets and metrics.
@@ -94,9 +101,13 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
             self._entities_api.get_all_entities_metrics, workspace_id, _check_return_type=False
         )
 
-        attributes = load_all_entities(get_attributes)
-        datasets = load_all_entities(get_datasets)
-        metrics = load_all_entities(get_metrics)
+        get_funcs = (get_attributes, get_datasets, get_metrics)
+        if max_concurrency > 1:
+            with ThreadPoolExecutor(max_workers=len(get_funcs), thread_name_prefix="gooddata-catalog") as executor:
+                futures = [executor.submit(load_all_entities, f, max_concurrency=max_concurrency) for f in get_funcs]
+                attributes, datasets, metrics = (future.result() for future in futures)
+        else:
+            attributes, datasets, metrics = (load_all_entities(f) for f in get_funcs)
 
         valid_obj_fun = None
         if inject_valid_objects_func:
@@ -135,7 +146,10 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
         if rsql_filter is not None:
             get_attributes = functools.partial(get_attributes, filter=rsql_filter)
         attributes = load_all_entities(get_attributes)
-        catalog_attributes = [CatalogAttribute.from_api(a, side_loads=attributes.included) for a in attributes.data]
+        side_loads = RelatedSideLoads(attributes.included)
+        catalog_attributes = [
+            CatalogAttribute.from_api(a, side_loads=side_loads.for_entity(a)) for a in attributes.data
+        ]
         return catalog_attributes
 
     def get_labels_catalog(self, workspace_id: str) -> list[CatalogLabel]:
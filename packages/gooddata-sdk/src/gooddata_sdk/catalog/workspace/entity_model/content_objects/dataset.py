@@ -1,6 +1,7 @@
 # (C) 2022 GoodData Corporation
 from __future__ import annotations
 
+import functools
 from typing import Any, Optional, Union, cast
 
 import attr
@@ -56,9 +57,12 @@ class CatalogAttribute(AttrCatalogEntity):
     def client_class() -> Any:
         return JsonApiAttributeOut
 
-    @property
+    @functools.cached_property
     def labels(self) -> list[CatalogLabel]:
-        related_label_ids = [x.get("id") for x in (safeget_list(self.json_api_relationships, ["labels", "data"]))]
+        # labels are created once; the side loads may contain all labels of the workspace
+        related_label_ids = {x.get("id") for x in (safeget_list(self.json_api_relationships, ["labels", "data"]))}
+        if not related_label_ids:
+            return []
         return [
             CatalogLabel.from_api(sl)
             for sl in self.json_api_side_loads
@@ -92,9 +96,7 @@ class CatalogAttribute(AttrCatalogEntity):
     def find_label(self, id_obj: IdObjType) -> Union[CatalogLabel, None]:
         obj_key = id_obj_to_key(id_obj)
         # use cast as mypy is not applying next, it claims, type is filter[CatalogLabel]
-        return cast(
-            Union[CatalogLabel, None], next(filter(lambda x: id_obj_to_key(x.obj_id) == obj_key, self.labels), None)
-        )
+        return cast(Union[CatalogLabel, None], next(filter(lambda x: str(x.obj_id) == obj_key, self.labels), None))
 
     # TODO add missing properties
 
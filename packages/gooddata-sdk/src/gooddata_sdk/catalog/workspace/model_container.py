@@ -18,7 +18,7 @@ from gooddata_sdk.compute.model.base import ObjId
 from gooddata_sdk.compute.model.execution import ExecutionDefinition
 from gooddata_sdk.compute.model.filter import Filter
 from gooddata_sdk.compute.model.metric import Metric
-from gooddata_sdk.utils import AllPagedEntities, IdObjType
+from gooddata_sdk.utils import AllPagedEntities, IdObjType, RelatedSideLoads, id_obj_to_key, safeget_list
 
 ValidObjectTypes = Union[Attribute, Metric, Filter, CatalogLabel, CatalogFact, CatalogMetric]
 
@@ -26,7 +26,23 @@ ValidObjectTypes = Union[Attribute, Metric, Filter, CatalogLabel, CatalogFact, C
 ValidObjectsInputType = Union[ValidObjectTypes, list[ValidObjectTypes], ExecutionDefinition]
 
 
+def _obj_key(obj_id: Union[str, ObjId], obj_type: str) -> str:
+    if isinstance(obj_id, ObjId):
+        return str(obj_id)
+    elif not obj_id.startswith(f"{obj_type}/"):
+        return f"{obj_type}/{obj_id}"
+
+    return obj_id
+
+
 class CatalogWorkspaceContent:
+    """
+    Catalog of datasets (with their attributes, labels and facts) and metrics of a workspace.
+
+    The catalog indexes all its objects by their ids when it is created, so that the lookups take constant time
+    even in workspaces with tens of thousands of labels.
+    """
+
     def __init__(
         self,
         valid_obj_fun: Optional[functools.partial[dict[str, set[str]]]],
@@ -36,8 +52,28 @@ class CatalogWorkspaceContent:
         self._valid_obj_fun = valid_obj_fun
         self._datasets = datasets
         self._metrics = metrics
-        self._metric_idx = dict([(str(m.obj_id), m) for m in metrics])
-        self._datasets_idx = dict([(str(d.obj_id), d) for d in datasets])
+        self._metric_idx = {str(m.obj_id): m for m in metrics}
+        self._datasets_idx = {str(d.obj_id): d for d in datasets}
+
+        self._attributes = [a for d in datasets for a in d.attributes]
+        self._facts = [f for d in datasets for f in d.facts]
+        self._labels = [x for a in self._attributes for x in a.labels]
+        self._attribute_idx: dict[str, CatalogAttribute] = {}
+        self._attribute_dataset_idx: dict[str, CatalogDataset] = {}
+        self._fact_idx: dict[str, CatalogFact] = {}
+        self._label_idx: dict[str, CatalogLabel] = {}
+        self._label_attribute_idx: dict[str, CatalogAttribute] = {}
+
+        # the first object wins when ids repeat, the same way as when searching the lists
+        for dataset in datasets:
+            for fact in dataset.facts:
+                self._fact_idx.setdefault(str(fact.obj_id), fact)
+            for attribute in dataset.attributes:
+                self._attribute_idx.setdefault(str(attribute.obj_id), attribute)
+                self._attribute_dataset_idx.setdefault(str(attribute.obj_id), dataset)
+                for label in attribute.labels:
+                    self._label_idx.setdefault(str(label.obj_id), label)
+                    self._label_attribute_idx.setdefault(str(label.obj_id), attribute)
 
     @property
     def datasets(self) -> list[CatalogDataset]:
@@ -45,7 +81,7 @@ class CatalogWorkspaceContent:
 
     @property
     def facts(self) -> list[CatalogFact]:
-        return [f for d in self._datasets for f in d.facts]
+        return list(self._facts)
 
     @property
     def aggregated_facts(self) -> list[CatalogAggregatedFact]:
@@ -53,19 +89,19 @@ class CatalogWorkspaceContent:
 
     @property
     def attributes(self) -> list[CatalogAttribute]:
-        return [a for d in self._datasets for a in d.attributes]
+        return list(self._attributes)
 
     @property
     def date_attributes(self) -> list[CatalogAttribute]:
-        return [a for d in self._datasets for a in d.attributes if a.granularity]
+        return [a for a in self._attributes if a.granularity]
 
     @property
     def standard_attributes(self) -> list[CatalogAttribute]:
-        return [a for d in self._datasets for a in d.attributes if not a.granularity]
+        return [a for a in self._attributes if not a.granularity]
 
     @property
     def labels(self) -> list[CatalogLabel]:
-        return [x for d in self._datasets for a in d.attributes for x in a.labels]
+        return list(self._labels)
 
     @property
     def metrics(self) -> list[CatalogMetric]:
@@ -83,14 +119,7 @@ class CatalogWorkspaceContent:
             CatalogMetric: instance of CatalogMetric or None if no such metric in catalog
 
         """
-        if isinstance(metric_id, ObjId):
-            obj_id_str = str(metric_id)
-        elif not metric_id.startswith("metric/"):
-            obj_id_str = f"metric/{metric_id}"
-        else:
-            obj_id_str = metric_id
-
-        return self._metric_idx.get(obj_id_str)
+        return self._metric_idx.get(_obj_key(metric_id, "metric"))
 
     def get_dataset(self, dataset_id: Union[str, ObjId]) -> Union[CatalogDataset, None]:
         """
@@ -104,24 +133,54 @@ class CatalogWorkspaceContent:
             CatalogDataset: instance of CatalogDataset or None if no such dataset in catalog
 
         """
-        if isinstance(dataset_id, ObjId):
-            obj_id_str = str(dataset_id)
-        elif not dataset_id.startswith("dataset/"):
-            obj_id_str = f"dataset/{dataset_id}"
-        else:
-            obj_id_str = dataset_id
+        return self._datasets_idx.get(_obj_key(dataset_id, "dataset"))
 
-        return self._datasets_idx.get(obj_id_str)
+    def get_attribute(self, attribute_id: Union[str, ObjId]) -> Union[CatalogAttribute, None]:
+        """
+        Gets attribute by id. The id can be either an instance of ObjId or string containing serialized ObjId
+        ('attribute/some.attribute.id') or contain just the id part ('some.attribute.id').
+
+        Args:
+            attribute_id: fully qualified attribute entity id (type/id) or just the identifier of attribute entity
+
+        Returns:
+            CatalogAttribute: instance of CatalogAttribute or None if no such attribute in catalog
+        """
+        return self._attribute_idx.get(_obj_key(attribute_id, "attribute"))
+
+    def get_label(self, label_id: Union[str, ObjId]) -> Union[CatalogLabel, None]:
+        """
+        Gets label by id. The id can be either an instance of ObjId or string containing serialized ObjId
+        ('label/some.label.id') or contain just the id part ('some.label.id').
+
+        Args:
+            label_id: fully qualified label entity id (type/id) or just the identifier of label entity
+
+        Returns:
+            CatalogLabel: instance of CatalogLabel or None if no such label in catalog
+        """
+        return self._label_idx.get(_obj_key(label_id, "label"))
+
+    def get_fact(self, fact_id: Union[str, ObjId]) -> Union[CatalogFact, None]:
+        """
+        Gets fact by id. The id can be either an instance of ObjId or string containing serialized ObjId
+        ('fact/some.fact.id') or contain just the id part ('some.fact.id').
+
+        Args:
+            fact_id: fully qualified fact entity id (type/id) or just the identifier of fact entity
+
+        Returns:
+            CatalogFact: instance of CatalogFact or None if no such fact in catalog
+        """
+        return self._fact_idx.get(_obj_key(fact_id, "fact"))
 
     def find_label_attribute(self, id_obj: IdObjType) -> Union[CatalogAttribute, None]:
         """Get attribute by label id."""
-        for dataset in self._datasets:
-            res = dataset.find_label_attribute(id_obj)
-
-            if res is not None:
-                return res
+        return self._label_attribute_idx.get(id_obj_to_key(id_obj))
 
-        return None
+    def find_attribute_dataset(self, id_obj: IdObjType) -> Union[CatalogDataset, None]:
+        """Get dataset by attribute id."""
+        return self._attribute_dataset_idx.get(id_obj_to_key(id_obj))
 
     def _valid_objects(self, ctx: ValidObjectsInputType) -> ValidObjects:
         if self._valid_obj_fun:
@@ -171,15 +230,34 @@ class CatalogWorkspaceContent:
         attributes: AllPagedEntities,
         metrics: AllPagedEntities,
     ) -> CatalogWorkspaceContent:
-        catalog_datasets = [
-            CatalogDataset.from_api(d, side_loads=datasets.included, related_entities=attributes) for d in datasets.data
-        ]
+        # datasets get only the side loads and attributes they relate to; the side loads of all entities may
+        # contain every label of the workspace and scanning them and all the attributes for each dataset would be
+        # quadratic
+        dataset_side_loads = RelatedSideLoads(datasets.included)
+        attribute_side_loads = RelatedSideLoads(attributes.included)
+        attribute_positions = {a["id"]: pos for pos, a in enumerate(attributes.data)}
+
+        catalog_datasets = []
+        for d in datasets.data:
+            related_attribute_ids = {x["id"] for x in safeget_list(d, ["relationships", "attributes", "data"])}
+            related_attributes = [
+                attributes.data[pos]
+                for pos in sorted(attribute_positions[i] for i in related_attribute_ids if i in attribute_positions)
+            ]
+            related_entities = AllPagedEntities(
+                data=related_attributes, included=attribute_side_loads.for_entities(related_attributes)
+            )
+            catalog_datasets.append(
+                CatalogDataset.from_api(
+                    d, side_loads=dataset_side_loads.for_entity(d), related_entities=related_entities
+                )
+            )
 
         catalog_metrics = [CatalogMetric.from_api(metric) for metric in metrics.data]
 
         return cls(
             valid_obj_fun=valid_obj_fun,
-            datasets=list(catalog_datasets),
+            datasets=catalog_datasets,
             metrics=catalog_metrics,
         )
 
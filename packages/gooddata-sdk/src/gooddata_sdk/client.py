@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 from typing import Optional
 
@@ -134,6 +135,24 @@ class GoodDataApiClient:
         headers["X-Requested-With"] = "XMLHttpRequest"
         headers["X-GDC-VALIDATE-RELATIONS"] = "true"
 
+    @property
+    def hostname(self) -> str:
+        return self._hostname
+
+    @property
+    def token_digest(self) -> str:
+        """SHA-256 digest of the token; identifies the credentials without exposing the token."""
+        return hashlib.sha256(self._token.encode("utf-8")).hexdigest()
+
+    @property
+    def ssl_ca_cert(self) -> Optional[str]:
+        return self._api_config.ssl_ca_cert
+
+    @property
+    def request_headers(self) -> dict[str, str]:
+        """Headers sent with every API request, including authorization and user agent."""
+        return dict(self._api_client.default_headers)
+
     @property
     def custom_headers(self) -> dict[str, str]:
         return self._custom_headers
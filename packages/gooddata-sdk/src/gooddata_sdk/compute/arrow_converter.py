@@ -0,0 +1,113 @@
+# (C) 2026 GoodData Corporation
+"""
+Conversion of execution result pages into Apache Arrow record batches.
+
+The conversion works with results that follow the tabular convention used by ExecutionTable: all attributes are in
+the first dimension and all metrics are in the second dimension (or in the only dimension, if the execution has no
+attributes). Attribute columns are built as dictionary-encoded string arrays straight from the header groups;
+metric columns are built as float64 arrays from the result data. No per-row objects are created on the way.
+
+pyarrow is an optional dependency of gooddata-sdk; install it using the `arrow` extra.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from importlib.util import find_spec
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Optional
+
+from gooddata_sdk.compute.model.execution import ExecutionResult
+
+_PYARROW_AVAILABLE = find_spec("pyarrow") is not None
+
+if _PYARROW_AVAILABLE or TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def _check_pyarrow() -> None:
+    if not _PYARROW_AVAILABLE:
+        raise ImportError(
+            "The pyarrow package is required to read execution results as Arrow data. "
+            "Install it using 'pip install gooddata-sdk[arrow]'."
+        )
+
+
+def execution_result_arrow_schema(attribute_ids: list[str], metric_ids: list[str]) -> pa.Schema:
+    """
+    Creates Arrow schema of the record batches produced by `execution_result_to_record_batch`.
+
+    :param attribute_ids: local identifiers of attributes in the first dimension, in the order of header groups
+    :param metric_ids: local identifiers of metrics in the order in which they appear in the measure group
+    :return: schema with dictionary-encoded string column per attribute and float64 column per metric
+    """
+    _check_pyarrow()
+
+    return pa.schema(
+        [pa.field(attribute_id, pa.dictionary(pa.int32(), pa.string())) for attribute_id in attribute_ids]
+        + [pa.field(metric_id, pa.float64()) for metric_id in metric_ids]
+    )
+
+
+def _attribute_column(headers: list[dict[str, Any]]) -> pa.DictionaryArray:
+    codes: dict[str, int] = {}
+    indices: list[Optional[int]] = []
+
+    for header in headers:
+        value = header["attributeHeader"]["labelValue"]
+        indices.append(None if value is None else codes.setdefault(value, len(codes)))
+
+    return pa.DictionaryArray.from_arrays(
+        pa.array(indices, type=pa.int32()),
+        pa.array(list(codes), type=pa.string()),
+    )
+
+
+def _metric_columns(data: list[Any], num_metrics: int, two_dim: bool) -> list[pa.Array]:
+    if not two_dim:
+        # metric values of attribute-less execution form a single row
+        return [pa.array(data[idx : idx + 1], type=pa.float64()) for idx in range(num_metrics)]
+
+    # data comes as a list of rows; flatten it once and take the metric columns out of it with a stride
+    values = pa.array(list(chain.from_iterable(data)), type=pa.float64())
+
+    return [values[idx::num_metrics] for idx in range(num_metrics)]
+
+
+def execution_result_to_record_batch(
+    result: ExecutionResult, attribute_ids: list[str], metric_ids: list[str]
+) -> pa.RecordBatch:
+    """
+    Converts single page of execution result into an Arrow record batch.
+
+    :param result: page of execution result that follows the tabular convention
+    :param attribute_ids: local identifiers of attributes in the first dimension, in the order of header groups
+    :param metric_ids: local identifiers of metrics in the order in which they appear in the measure group
+    :return: record batch with one row per row of the page
+    """
+    _check_pyarrow()
+
+    schema = execution_result_arrow_schema(attribute_ids, metric_ids)
+    columns: list[pa.Array] = []
+
+    if attribute_ids:
+        header_groups = result.headers[0]["headerGroups"]
+        columns.extend(_attribute_column(header_group["headers"]) for header_group in header_groups)
+
+    if metric_ids:
+        columns.extend(_metric_columns(result.data, len(metric_ids), two_dim=bool(attribute_ids)))
+
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def record_batches_to_table(batches: Iterable[pa.RecordBatch], schema: pa.Schema) -> pa.Table:
+    """
+    Collects record batches produced by `execution_result_to_record_batch` into an Arrow table.
+
+    :param batches: record batches to collect
+    :param schema: schema of the batches; used also when there are no batches at all
+    :return: pyarrow.Table made of the batches
+    """
+    _check_pyarrow()
+
+    return pa.Table.from_batches(batches, schema=schema)
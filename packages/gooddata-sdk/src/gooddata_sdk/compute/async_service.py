@@ -0,0 +1,354 @@
+# (C) 2026 GoodData Corporation
+"""
+Non-blocking counterpart of the ComputeService.
+
+The AsyncComputeService starts computations and reads their results using asyncio; all requests go through a single
+aiohttp session with a shared, bounded connection pool. This way, an application can have many executions in flight
+without dedicating a thread to each of them.
+
+aiohttp is an optional dependency of gooddata-sdk; install it using the `async` extra.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import ssl
+from collections.abc import Mapping
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from gooddata_api_client import ApiClient, ApiException
+from gooddata_api_client.model.afm_cancel_tokens import AfmCancelTokens
+
+from gooddata_sdk.client import GoodDataApiClient
+from gooddata_sdk.compute.model.execution import ExecutionDefinition, ExecutionResult
+
+_AIOHTTP_AVAILABLE = find_spec("aiohttp") is not None
+
+if _AIOHTTP_AVAILABLE or TYPE_CHECKING:
+    import aiohttp
+
+if TYPE_CHECKING:
+    from gooddata_sdk.compute.paging import PagingPolicy
+    from gooddata_sdk.table import AsyncExecutionTable
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_CONNECTIONS = 100
+"""
+Default size of the connection pool shared by all requests of the AsyncComputeService.
+"""
+
+
+def _check_aiohttp() -> None:
+    if not _AIOHTTP_AVAILABLE:
+        raise ImportError(
+            "The aiohttp package is required to use the AsyncComputeService. "
+            "Install it using 'pip install gooddata-sdk[async]'."
+        )
+
+
+def _client_timeout(timeout: Optional[Union[int, float, tuple]]) -> Optional[aiohttp.ClientTimeout]:
+    if timeout is None:
+        return None
+
+    if isinstance(timeout, tuple):
+        connect_timeout, read_timeout = timeout
+        return aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+
+    return aiohttp.ClientTimeout(total=timeout)
+
+
+def _execution_result_from_json(payload: dict[str, Any]) -> ExecutionResult:
+    # the generated API client exposes top-level properties of the result in snake case; ExecutionResult relies on it
+    return ExecutionResult(
+        {
+            "data": payload["data"],
+            "dimension_headers": payload["dimensionHeaders"],
+            "grand_totals": payload["grandTotals"],
+            "paging": payload["paging"],
+            "metadata": payload["metadata"],
+        }
+    )
+
+
+class AsyncTransport:
+    """
+    Non-blocking HTTP transport to the GoodData API. Sends the same headers as the GoodDataApiClient it is created
+    from and keeps a single connection pool for all the requests.
+
+    The underlying session is created lazily in the event loop where the first request is made. Close the transport
+    once it is no longer needed.
+    """
+
+    def __init__(
+        self,
+        api_client: GoodDataApiClient,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int = 0,
+    ) -> None:
+        _check_aiohttp()
+
+        self._api_client = api_client
+        self._base_url = api_client.hostname.rstrip("/")
+        self._max_connections = max_connections
+        self._max_connections_per_host = max_connections_per_host
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def api_client(self) -> GoodDataApiClient:
+        return self._api_client
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            ssl_ca_cert = self._api_client.ssl_ca_cert
+            connector = aiohttp.TCPConnector(
+                limit=self._max_connections,
+                limit_per_host=self._max_connections_per_host,
+                ssl=ssl.create_default_context(cafile=ssl_ca_cert) if ssl_ca_cert is not None else True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, headers=self._api_client.request_headers)
+
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict[str, str]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[Union[int, float, tuple]] = None,
+    ) -> tuple[Any, Mapping[str, str]]:
+        """
+        Sends a request to the GoodData API.
+
+        Args:
+            method: HTTP method
+            path: path of the API endpoint, starting with slash
+            params: query parameters
+            body: JSON-serializable request body
+            headers: additional request headers
+            timeout: request timeout in seconds. If a tuple is provided, it is used as (connection timeout,
+                read timeout).
+        Returns:
+            tuple of the decoded JSON response (None if the response is empty) and the case-insensitive response
+            headers
+        Raises:
+            ApiException: when the API responds with an error status
+        """
+        session = self._get_session()
+        async with session.request(
+            method,
+            f"{self._base_url}{path}",
+            params=params,
+            data=json.dumps(body) if body is not None else None,
+            headers={"Content-Type": "application/json", **(headers or {})},
+            timeout=_client_timeout(timeout),
+        ) as response:
+            payload = await response.read()
+
+            if response.status >= 400:
+                exception = ApiException(status=response.status, reason=response.reason)
+                exception.body = payload.decode("utf-8", errors="replace")
+                exception.headers = response.headers
+                raise exception
+
+            return (json.loads(payload) if payload else None), response.headers
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncExecution:
+    """
+    Execution started using the AsyncComputeService; allows reading its result using non-blocking calls.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        workspace_id: str,
+        exec_def: ExecutionDefinition,
+        response: dict[str, Any],
+        cancel_token: Optional[str] = None,
+    ) -> None:
+        self._transport = transport
+        self._workspace_id = workspace_id
+        self._exec_def = exec_def
+        self._exec_response = response["executionResponse"]
+        self._cancel_token = cancel_token
+
+    @property
+    def workspace_id(self) -> str:
+        return self._workspace_id
+
+    @property
+    def exec_def(self) -> ExecutionDefinition:
+        return self._exec_def
+
+    @property
+    def result_id(self) -> str:
+        return self._exec_response["links"]["executionResult"]
+
+    @property
+    def dimensions(self) -> Any:
+        return self._exec_response["dimensions"]
+
+    @property
+    def cancel_token(self) -> Optional[str]:
+        return self._cancel_token
+
+    async def read_result(
+        self,
+        limit: Union[int, list[int]],
+        offset: Union[None, int, list[int]] = None,
+        timeout: Optional[Union[int, float, tuple]] = None,
+    ) -> ExecutionResult:
+        """
+        Reads from the execution result.
+        """
+        _limit: list[int] = limit if isinstance(limit, list) else [limit]
+        # if limit is specified but offset is not, server will ignore paging completely (bug)
+        # this makes sure that offset gets defaulted to start of result
+        _offset: list[int] = (
+            offset if isinstance(offset, list) else [offset] if offset is not None else [0 for _ in _limit]
+        )
+
+        execution_result, http_headers = await self._transport.request(
+            "GET",
+            f"/api/v1/actions/workspaces/{self._workspace_id}/execution/afm/execute/result/{self.result_id}",
+            params={"offset": ",".join(map(str, _offset)), "limit": ",".join(map(str, _limit))},
+            headers={"X-GDC-CANCEL-TOKEN": self.cancel_token} if self.cancel_token else None,
+            timeout=timeout,
+        )
+        custom_headers = self._transport.api_client.custom_headers
+        if "X-GDC-TRACE-ID" in custom_headers and "X-GDC-TRACE-ID" in http_headers:
+            logger.info(
+                "Received execution result from AFM.",
+                extra=dict(
+                    requestTraceId=custom_headers["X-GDC-TRACE-ID"],
+                    responseTraceId=http_headers["X-GDC-TRACE-ID"],
+                ),
+            )
+        return _execution_result_from_json(execution_result)
+
+    async def as_table(
+        self, timeout: Optional[Union[int, float, tuple]] = None, paging: Optional[PagingPolicy] = None
+    ) -> AsyncExecutionTable:
+        """
+        Reads the first page of the result and returns table that allows iterating over all rows of the result.
+
+        The execution must follow the tabular convention used by ExecutionTable: all attributes in the first
+        dimension and all metrics in the second dimension.
+
+        Args:
+            timeout: request timeout in seconds for reading the first page of the result
+            paging: policy determining the number of rows read at once; by default, the pages have a fixed size
+        Returns:
+            AsyncExecutionTable: table to iterate over using `async for`
+        """
+        # table module builds on top of the compute services; import here to prevent import cycle
+        from gooddata_sdk.table import _as_async_table
+
+        return await _as_async_table(self, timeout=timeout, paging=paging)
+
+    async def cancel(self) -> None:
+        """
+        Cancels the execution.
+        """
+        if self.cancel_token is not None:
+            await self._transport.request(
+                "POST",
+                f"/api/v1/actions/workspaces/{self._workspace_id}/execution/afm/cancel",
+                body=ApiClient.sanitize_for_serialization(AfmCancelTokens({self.result_id: self.cancel_token})),
+            )
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return (
+            f"AsyncExecution(workspace_id={self.workspace_id}, result_id={self.result_id}, "
+            f"cancel_token={self.cancel_token})"
+        )
+
+
+class AsyncComputeService:
+    """
+    Compute service that drives computations using non-blocking calls. It serializes the execution definitions the
+    same way as the ComputeService, but sends all requests through a single connection pool of an AsyncTransport.
+
+    Use the service as an async context manager or close it once it is no longer needed:
+
+    .. code-block:: python
+
+        async with AsyncComputeService(sdk.client) as compute:
+            execution = await compute.for_exec_def(workspace_id, exec_def)
+            table = await execution.as_table()
+            async for row in table:
+                ...
+    """
+
+    def __init__(
+        self,
+        api_client: GoodDataApiClient,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int = 0,
+    ) -> None:
+        """
+        Args:
+            api_client: client whose host, token, headers and certificates to use
+            max_connections: maximum number of connections in the shared pool
+            max_connections_per_host: maximum number of connections to a single host; 0 means no extra limit
+        """
+        self._api_client = api_client
+        self._transport = AsyncTransport(api_client, max_connections, max_connections_per_host)
+
+    @property
+    def transport(self) -> AsyncTransport:
+        return self._transport
+
+    async def for_exec_def(
+        self,
+        workspace_id: str,
+        exec_def: ExecutionDefinition,
+        timeout: Optional[Union[int, float, tuple]] = None,
+    ) -> AsyncExecution:
+        """
+        Starts computation in GoodData.CN workspace, using the provided execution definition.
+
+        Args:
+            workspace_id: workspace identifier
+            exec_def: execution definition - this prescribes what to calculate, how to place labels and metric values
+             into dimensions
+            timeout: request timeout in seconds. If a tuple is provided, it is used as (connection timeout, read timeout).
+        """
+        response, headers = await self._transport.request(
+            "POST",
+            f"/api/v1/actions/workspaces/{workspace_id}/execution/afm/execute",
+            body=ApiClient.sanitize_for_serialization(exec_def.as_api_model()),
+            timeout=timeout,
+        )
+
+        return AsyncExecution(
+            transport=self._transport,
+            workspace_id=workspace_id,
+            exec_def=exec_def,
+            response=response,
+            cancel_token=headers.get("X-Gdc-Cancel-Token")
+            if exec_def.is_cancellable or self._api_client.executions_cancellable
+            else None,
+        )
+
+    async def close(self) -> None:
+        await self._transport.close()
+
+    async def __aenter__(self) -> AsyncComputeService:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
@@ -0,0 +1,239 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, ThreadPoolExecutor, as_completed, wait
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
+
+from gooddata_sdk.compute.model.execution import Execution, ExecutionDefinition
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from gooddata_sdk.compute.paging import PagingPolicy
+    from gooddata_sdk.compute.service import ComputeService
+    from gooddata_sdk.table import ExecutionTable
+
+T = TypeVar("T")
+
+_DEFAULT_MAX_CONCURRENCY = 4
+"""
+Default number of requests that a batch of executions sends concurrently.
+"""
+
+
+class ExecutionBatch:
+    """
+    Computations of multiple execution definitions started together.
+
+    The batch submits the computations through a pool of at most `max_concurrency` threads as soon as it is created.
+    Iterate over the batch to get `(index, Execution)` tuples in the order in which the computations complete; the
+    index points to the execution definition the batch was created from. Use `map`, `as_tables` or `read_arrow` to
+    also read the results concurrently using the same pool.
+
+    Use the batch as a context manager. When the block exits with an exception, the whole batch is cancelled:
+
+    .. code-block:: python
+
+        with sdk.compute.for_exec_defs(workspace_id, exec_defs, max_concurrency=8) as batch:
+            for index, table in batch.read_arrow():
+                ...
+    """
+
+    def __init__(
+        self,
+        compute: ComputeService,
+        workspace_id: str,
+        exec_defs: list[ExecutionDefinition],
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        timeout: Optional[Union[int, float, tuple]] = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"Invalid max_concurrency value: {max_concurrency}. Expecting positive value.")
+
+        self._compute = compute
+        self._workspace_id = workspace_id
+        self._exec_defs = exec_defs
+        self._executions: dict[int, Execution] = {}
+        self._cancel_sent: set[int] = set()
+        self._cancelled = False
+        self._closed = False
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="gooddata-batch")
+        self._futures: dict[Future[Execution], int] = {}
+
+        for index, exec_def in enumerate(exec_defs):
+            future = self._executor.submit(self._start_execution, exec_def, timeout)
+            self._futures[future] = index
+            future.add_done_callback(self._on_computed)
+
+    @property
+    def workspace_id(self) -> str:
+        return self._workspace_id
+
+    @property
+    def exec_defs(self) -> list[ExecutionDefinition]:
+        return self._exec_defs
+
+    @property
+    def executions(self) -> dict[int, Execution]:
+        """
+        Executions whose computations were started so far, by index of their execution definition.
+        """
+        with self._lock:
+            return dict(self._executions)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def __len__(self) -> int:
+        return len(self._exec_defs)
+
+    def _guarded(self, fn: Callable[..., T], *args: Any) -> T:
+        # tasks of cancelled or closed batch finish right away instead of being cancelled in the executor; wait()
+        # does not consider futures cancelled by the executor shutdown as done
+        if self._cancelled or self._closed:
+            raise CancelledError()
+        return fn(*args)
+
+    def _start_execution(self, exec_def: ExecutionDefinition, timeout: Optional[Union[int, float, tuple]]) -> Execution:
+        return self._guarded(self._compute.for_exec_def, self._workspace_id, exec_def, timeout)
+
+    def _on_computed(self, future: Future[Execution]) -> None:
+        if future.exception() is not None:
+            return
+
+        index = self._futures[future]
+        execution = future.result()
+        with self._lock:
+            self._executions[index] = execution
+            if not self._cancelled:
+                return
+            self._cancel_sent.add(index)
+
+        # computation finished after the batch was cancelled; cancel it right away
+        if execution.cancel_token is not None:
+            self._compute.cancel_executions({self._workspace_id: {execution.result_id: execution.cancel_token}})
+
+    def __iter__(self) -> Iterator[tuple[int, Execution]]:
+        """
+        Yields tuples of index of the execution definition and the execution as the computations complete.
+
+        Raises:
+            CancelledError: when the batch is cancelled before all computations complete
+        """
+        for future in as_completed(self._futures):
+            yield self._futures[future], future.result()
+
+    def map(self, fn: Callable[[Execution], T]) -> Iterator[tuple[int, T]]:
+        """
+        Applies function to the executions as their computations complete, using the pool of the batch.
+
+        Args:
+            fn (Callable[[Execution], T]): Function to apply, typically reading the result of the execution.
+
+        Returns:
+            Iterator[tuple[int, T]]: Tuples of index of the execution definition and the value returned by the
+            function, in the order in which the values become available.
+
+        Raises:
+            CancelledError: when the batch is cancelled before all values are available
+        """
+        computing: set[Future[Any]] = set(self._futures)
+        mapping: dict[Future[Any], int] = {}
+
+        while computing or mapping:
+            done, _ = wait(computing | mapping.keys(), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in computing:
+                    computing.remove(future)
+                    execution = future.result()
+                    with self._lock:
+                        if self._cancelled:
+                            raise CancelledError()
+                        mapping[self._executor.submit(self._guarded, fn, execution)] = self._futures[future]
+                else:
+                    yield mapping.pop(future), future.result()
+
+    def as_tables(self, paging: Optional[PagingPolicy] = None) -> Iterator[tuple[int, ExecutionTable]]:
+        """
+        Reads first page of each result concurrently and returns tables that allow iterating over all rows.
+
+        The executions must follow the tabular convention used by ExecutionTable: all attributes in the first
+        dimension and all metrics in the second dimension.
+
+        Args:
+            paging (Optional[PagingPolicy]): Policy determining the number of rows read at once; by default, each
+                table reads pages of fixed size.
+
+        Returns:
+            Iterator[tuple[int, ExecutionTable]]: Tuples of index of the execution definition and the table, in the
+            order in which the tables become available.
+        """
+        # table module builds on top of the compute services; import here to prevent import cycle
+        from gooddata_sdk.table import _as_table
+
+        return self.map(lambda execution: _as_table(execution, paging=paging))
+
+    def read_arrow(
+        self, prefetch: int = 0, paging: Optional[PagingPolicy] = None
+    ) -> Iterator[tuple[int, pyarrow.Table]]:
+        """
+        Reads the whole results into Arrow tables concurrently. Requires pyarrow to be installed.
+
+        Args:
+            prefetch (int): Number of pages of each result to fetch concurrently on top of the concurrency of the
+                batch; 0 reads pages of each result one after another.
+            paging (Optional[PagingPolicy]): Policy determining the number of rows read at once; by default, each
+                result is read in pages of fixed size.
+
+        Returns:
+            Iterator[tuple[int, pyarrow.Table]]: Tuples of index of the execution definition and the Arrow table, in
+            the order in which the tables become available.
+        """
+        return self.map(lambda execution: execution.read_arrow(prefetch=prefetch, paging=paging))
+
+    def cancel(self) -> None:
+        """
+        Cancels the whole batch. Computations that have not started yet are not submitted at all and all started
+        cancellable executions are cancelled using a single call of `cancel_executions`.
+
+        Only the executions with cancel token can be cancelled on the server - see `is_cancellable` of the
+        ExecutionDefinition and `executions_cancellable` of the GoodDataApiClient.
+        """
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+
+        # computations that have not started yet finish right away; let the running ones finish so that their
+        # executions get cancelled as well
+        wait(self._futures)
+
+        with self._lock:
+            to_cancel = [e for i, e in self._executions.items() if i not in self._cancel_sent]
+            self._cancel_sent.update(self._executions)
+
+        tokens = {e.result_id: e.cancel_token for e in to_cancel if e.cancel_token is not None}
+        if tokens:
+            self._compute.cancel_executions({self._workspace_id: tokens})
+
+    def close(self) -> None:
+        """
+        Releases the pool of the batch. Computations that have not started yet are not submitted at all.
+        """
+        self._closed = True
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> ExecutionBatch:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if exc_type is not None:
+            self.cancel()
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ExecutionBatch(workspace_id={self.workspace_id}, size={len(self)}, cancelled={self.cancelled})"
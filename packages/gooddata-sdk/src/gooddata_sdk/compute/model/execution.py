@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from attr.setters import frozen as frozen_attr
 from attrs import define, field
@@ -16,6 +16,12 @@ from gooddata_sdk.compute.model.attribute import Attribute
 from gooddata_sdk.compute.model.filter import Filter
 from gooddata_sdk.compute.model.metric import Metric
 
+if TYPE_CHECKING:
+    import pyarrow
+
+    from gooddata_sdk.compute.paging import PagingPolicy
+    from gooddata_sdk.compute.result_cache import ExecutionResultCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -301,6 +307,9 @@ class ExecutionResult:
 class BareExecutionResponse:
     """
     Holds ExecutionResponse from triggered report computation and allows reading report's results.
+
+    When created with a result cache, the pages are served from the cache if possible and the pages read from the
+    server are stored in it under the `cache_key`.
     """
 
     def __init__(
@@ -309,6 +318,8 @@ class BareExecutionResponse:
         workspace_id: str,
         execution_response: models.AfmExecutionResponse,
         cancel_token: Optional[str] = None,
+        result_cache: Optional[ExecutionResultCache] = None,
+        cache_key: Optional[str] = None,
     ):
         self._api_client = api_client
         self._actions_api = self._api_client.actions_api
@@ -317,6 +328,8 @@ class BareExecutionResponse:
         self._exec_response: models.ExecutionResponse = execution_response["execution_response"]
         self._afm_exec_response = execution_response
         self._cancel_token = cancel_token
+        self._result_cache = result_cache if cache_key is not None else None
+        self._cache_key = cache_key
 
     @property
     def workspace_id(self) -> str:
@@ -351,6 +364,12 @@ class BareExecutionResponse:
         # this makes sure that offset gets defaulted to start of result
         _offset = [0 for _ in _limit] if _limit is not None and _offset is None else _offset
 
+        if self._result_cache is not None:
+            assert self._cache_key is not None
+            cached = self._result_cache.get_page(self._cache_key, _offset, _limit)
+            if cached is not None:
+                return cached
+
         execution_result, _, http_headers = self._actions_api.retrieve_result(
             workspace_id=self._workspace_id,
             result_id=self.result_id,
@@ -370,7 +389,12 @@ class BareExecutionResponse:
                     responseTraceId=http_headers["X-GDC-TRACE-ID"],
                 ),
             )
-        return ExecutionResult(execution_result)
+        result = ExecutionResult(execution_result)
+        if self._result_cache is not None:
+            assert self._cache_key is not None
+            self._result_cache.put_page(self._cache_key, _offset, _limit, result)
+
+        return result
 
     def cancel(self) -> None:
         """
@@ -403,10 +427,17 @@ class Execution:
         exec_def: ExecutionDefinition,
         response: models.AfmExecutionResponse,
         cancel_token: Optional[str] = None,
+        result_cache: Optional[ExecutionResultCache] = None,
+        cache_key: Optional[str] = None,
     ):
         self._exec_def = exec_def
         self._bare_exec_response = BareExecutionResponse(
-            api_client=api_client, workspace_id=workspace_id, execution_response=response, cancel_token=cancel_token
+            api_client=api_client,
+            workspace_id=workspace_id,
+            execution_response=response,
+            cancel_token=cancel_token,
+            result_cache=result_cache,
+            cache_key=cache_key,
         )
 
     @property
@@ -464,6 +495,31 @@ class Execution:
     ) -> ExecutionResult:
         return self.bare_exec_response.read_result(limit, offset, timeout)
 
+    def read_arrow(
+        self,
+        prefetch: int = 0,
+        timeout: Optional[Union[int, float, tuple]] = None,
+        paging: Optional[PagingPolicy] = None,
+    ) -> pyarrow.Table:
+        """
+        Reads the whole execution result into an Arrow table. Attribute columns are dictionary-encoded strings,
+        metric columns are float64.
+
+        The execution must follow the tabular convention used by ExecutionTable: all attributes in the first
+        dimension and all metrics in the second dimension. Requires pyarrow to be installed.
+
+        Args:
+            prefetch: number of result pages to fetch concurrently; 0 reads the pages one after another
+            timeout: request timeout in seconds for reading the first page of the result
+            paging: policy determining the number of rows read at once; by default, the pages have a fixed size
+        Returns:
+            pyarrow.Table: table with one column per attribute and metric, named by their local identifiers
+        """
+        # table module builds on top of execution model; import here to prevent import cycle
+        from gooddata_sdk.table import _as_table
+
+        return _as_table(self, timeout=timeout, paging=paging).read_arrow(prefetch=prefetch)
+
     def cancel(self) -> None:
         """
         Cancels the execution.
@@ -0,0 +1,166 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Callable, Optional
+
+from attrs import define, field
+
+from gooddata_sdk.compute.model.execution import ExecutionResult
+
+_APPROX_DATA_CELL_BYTES = 24
+"""
+Approximate size of a single data cell in the JSON payload of a result page.
+"""
+
+_APPROX_HEADER_BYTES = 96
+"""
+Approximate size of a single dimension header in the JSON payload of a result page.
+"""
+
+
+def estimate_result_bytes(result: ExecutionResult) -> int:
+    """
+    Estimates size of the payload of a single result page.
+
+    The API client does not expose the size of the payload after it is deserialized, so the estimate is derived from
+    the number of data cells and headers in the page.
+
+    Args:
+        result (ExecutionResult): Page of the execution result.
+
+    Returns:
+        int: Estimated size of the page payload in bytes.
+    """
+    cells = sum(len(row) if isinstance(row, list) else 1 for row in result.data)
+    headers = sum(len(group["headers"]) for dim in result.headers for group in dim["headerGroups"])
+
+    return cells * _APPROX_DATA_CELL_BYTES + headers * _APPROX_HEADER_BYTES
+
+
+@define
+class PagingPolicy:
+    """
+    Paging policy shared by the readers of execution results.
+
+    The policy determines the limit to use when reading next page of the result in the paged dimension. It starts
+    from `initial_size` and after each page adjusts the limit so that a page takes about `target_page_seconds` to
+    read and its payload is about `target_page_bytes` large. The limit grows at most by `max_growth` between two
+    pages and it always stays within `min_size` and `max_size`. When the backend returns fewer items than
+    requested even though more items are available, the policy treats that count as server cap and never
+    exceeds it again.
+
+    A single policy can be shared by concurrent readers; it is thread-safe.
+
+    Attributes:
+        initial_size (int): Limit to use for the first page.
+        min_size (int): Lower bound of the limit.
+        max_size (int): Upper bound of the limit.
+        target_page_seconds (float): Desired duration of reading one page.
+        target_page_bytes (int): Desired size of one page payload.
+        max_growth (float): Maximum factor by which the limit may grow between two pages.
+    """
+
+    initial_size: int = 100
+    min_size: int = 50
+    max_size: int = 5000
+    target_page_seconds: float = 1.0
+    target_page_bytes: int = 8 * 1024 * 1024
+    max_growth: float = 2.0
+    _size: int = field(init=False, default=0)
+    _server_cap: Optional[int] = field(init=False, default=None)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        if not 0 < self.min_size <= self.initial_size <= self.max_size:
+            raise ValueError(
+                f"Invalid paging bounds: min_size={self.min_size}, initial_size={self.initial_size}, "
+                f"max_size={self.max_size}. Expecting 0 < min_size <= initial_size <= max_size."
+            )
+
+        if self.max_growth < 1.0:
+            raise ValueError(f"Invalid max_growth value: {self.max_growth}. Expecting value of at least 1.0.")
+
+        self._size = self.initial_size
+
+    @classmethod
+    def fixed(cls, size: int) -> PagingPolicy:
+        """
+        Creates policy that always uses the same limit.
+
+        Args:
+            size (int): Limit to use for all pages.
+
+        Returns:
+            PagingPolicy: Policy that does not adapt.
+        """
+        return cls(initial_size=size, min_size=size, max_size=size)
+
+    @property
+    def limit(self) -> int:
+        """
+        Limit to use when reading next page in the paged dimension.
+        """
+        with self._lock:
+            return self._size
+
+    def observe(self, result: ExecutionResult, requested: int, elapsed: float, dim: int = 0) -> None:
+        """
+        Adjusts the limit based on a page that was just read.
+
+        Args:
+            result (ExecutionResult): Page of the result.
+            requested (int): Limit that was used to read the page in the paged dimension.
+            elapsed (float): Duration of reading the page in seconds.
+            dim (int): Paged dimension.
+        """
+        count = result.paging_count[dim]
+        if count == 0:
+            return
+
+        capped = count < requested and not result.is_complete(dim)
+        per_item_seconds = elapsed / count
+        per_item_bytes = estimate_result_bytes(result) / count
+
+        with self._lock:
+            if capped:
+                self._server_cap = count if self._server_cap is None else min(self._server_cap, count)
+
+            ideal = min(
+                self.target_page_seconds / per_item_seconds if per_item_seconds > 0 else math.inf,
+                self.target_page_bytes / per_item_bytes if per_item_bytes > 0 else math.inf,
+                self._size * self.max_growth,
+            )
+            upper = self.max_size if self._server_cap is None else min(self.max_size, self._server_cap)
+
+            self._size = max(min(int(ideal), upper), min(self.min_size, upper))
+
+    def read(
+        self,
+        read_result: Callable[..., ExecutionResult],
+        offset: list[int],
+        limit: list[int],
+        dim: int = 0,
+        **kwargs,
+    ) -> ExecutionResult:
+        """
+        Reads a page of the result and adjusts the limit based on it.
+
+        Args:
+            read_result (Callable[..., ExecutionResult]): Function reading the page; called with `offset`, `limit`
+                and the `kwargs`.
+            offset (list[int]): Offset of the page.
+            limit (list[int]): Limit of the page.
+            dim (int): Paged dimension.
+            **kwargs: Additional arguments for `read_result`, for instance timeout.
+
+        Returns:
+            ExecutionResult: Page of the result.
+        """
+        start = time.perf_counter()
+        result = read_result(offset=offset, limit=limit, **kwargs)
+        self.observe(result, limit[dim], time.perf_counter() - start, dim)
+
+        return result
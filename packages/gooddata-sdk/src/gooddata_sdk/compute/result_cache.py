@@ -0,0 +1,485 @@
+# (C) 2026 GoodData Corporation
+"""
+Client-side cache of execution results.
+
+Applications often run the same execution definition many times - dashboards refresh, notebooks get re-run and
+scripts export the same reports in loops. The ExecutionResultCache lets the ComputeService skip both the computation
+request and the result reads for an execution definition it has already seen: entries are keyed by a fingerprint of
+the server, the user, the workspace and the canonical JSON of the execution definition and hold the execution response
+together with the result pages that were read from it. Pages requested with a different offset or limit - as readers
+with adaptive paging do - are assembled from the cached pages that cover them.
+
+The cache is optional and disabled by default; pass an instance to the ComputeService or TableService to enable it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from attrs import define, field, fields, frozen
+from gooddata_api_client import ApiClient
+
+from gooddata_sdk.compute.model.execution import ExecutionDefinition, ExecutionResult
+
+PageKey = tuple[tuple[int, ...], tuple[int, ...]]
+"""
+Identifies a page of a result by its offset and limit.
+"""
+
+_KNOWN_RESULTS_FACTOR = 8
+"""
+Entries evicted from memory are remembered by their result id so that the result can be reused while the server still
+holds it. The cache remembers up to this many times `max_entries` of such entries.
+"""
+
+
+def execution_fingerprint(
+    workspace_id: str,
+    exec_def: ExecutionDefinition,
+    host: Optional[str] = None,
+    token_digest: Optional[str] = None,
+) -> str:
+    """
+    Computes fingerprint identifying result of an execution definition in a workspace.
+
+    The fingerprint is a SHA-256 hash of the server host, the digest of the token, the workspace and the canonical
+    JSON of the execution API model - that is the very payload sent to the server - so two definitions have the
+    same fingerprint exactly when the same server would compute the same result for the same user. A cache shared
+    by clients of different servers or users never serves results of one to another.
+
+    Args:
+        workspace_id (str): Workspace identifier.
+        exec_def (ExecutionDefinition): Execution definition.
+        host (Optional[str]): Host of the server computing the result.
+        token_digest (Optional[str]): Digest of the token used to access the server, see
+            `GoodDataApiClient.token_digest`.
+
+    Returns:
+        str: Hex digest of the fingerprint.
+    """
+    payload = ApiClient.sanitize_for_serialization(exec_def.as_api_model())
+    canonical = json.dumps(
+        [host, token_digest, workspace_id, payload], sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _page_key(offset: list[int], limit: list[int]) -> PageKey:
+    return tuple(offset), tuple(limit)
+
+
+def _concat_data(first: list[Any], second: list[Any], depth: int) -> list[Any]:
+    if depth == 0:
+        return first + second
+
+    return [_concat_data(a, b, depth - 1) for a, b in zip(first, second)]
+
+
+def _slice_data(data: list[Any], start: list[int], stop: list[int], depth: int = 0) -> list[Any]:
+    sliced = data[start[depth] : stop[depth]]
+    if depth == len(start) - 1:
+        return sliced
+
+    return [_slice_data(item, start, stop, depth + 1) for item in sliced]
+
+
+def _slice_page(page: ExecutionResult, offset: list[int], end: list[int]) -> tuple[list[Any], list[list[list[Any]]]]:
+    start = [max(o, po) - po for o, po in zip(offset, page.paging_offset)]
+    stop = [min(e, po + pc) - po for e, po, pc in zip(end, page.paging_offset, page.paging_count)]
+    headers = [
+        [group["headers"][start[dim] : stop[dim]] for group in page.headers[dim]["headerGroups"]]
+        for dim in range(len(offset))
+    ]
+
+    return _slice_data(page.data, start, stop), headers
+
+
+def _assemble_page(pages: list[ExecutionResult], offset: list[int], limit: list[int]) -> Optional[ExecutionResult]:
+    """
+    Assembles page of the result from cached pages that were read with different offsets and limits - readers
+    with adaptive paging rarely request the same pages twice.
+
+    The page is assembled when the cached pages that start at the requested offset in all dimensions but one cover
+    the requested range; the cached pages are sliced and concatenated along that one dimension. Pages with grand
+    totals are never assembled, they are served only to the very same request.
+    """
+    candidates = [page for page in pages if not page.grand_totals and len(page.paging_offset) == len(offset)]
+    if not candidates:
+        return None
+
+    total = candidates[0].paging_total
+    end = [min(o + lim, t) for o, lim, t in zip(offset, limit, total)]
+
+    for dim in range(len(offset)):
+        aligned = sorted(
+            (
+                page
+                for page in candidates
+                if all(
+                    page.paging_offset[d] == offset[d] and page.next_page_start(d) >= end[d]
+                    for d in range(len(offset))
+                    if d != dim
+                )
+            ),
+            key=lambda page: page.paging_offset[dim],
+        )
+
+        parts = []
+        position = offset[dim]
+        for page in aligned:
+            if position >= end[dim]:
+                break
+            if page.paging_offset[dim] <= position < page.next_page_start(dim):
+                parts.append(page)
+                position = page.next_page_start(dim)
+
+        if not parts or position < end[dim]:
+            continue
+
+        data, headers = _slice_page(parts[0], offset, end)
+        for part in parts[1:]:
+            part_data, part_headers = _slice_page(part, offset, end)
+            data = _concat_data(data, part_data, dim)
+            headers[dim] = [a + b for a, b in zip(headers[dim], part_headers[dim])]
+
+        return ExecutionResult(
+            {
+                "data": data,
+                "dimension_headers": [{"headerGroups": [{"headers": group} for group in groups]} for groups in headers],
+                "grand_totals": [],
+                "paging": {
+                    "count": [e - o for e, o in zip(end, offset)],
+                    "offset": list(offset),
+                    "total": list(total),
+                },
+                "metadata": parts[0].metadata,
+            }
+        )
+
+    return None
+
+
+def _page_to_json(page: ExecutionResult) -> dict[str, Any]:
+    return ApiClient.sanitize_for_serialization(
+        {
+            "data": page.data,
+            "dimension_headers": page.headers,
+            "grand_totals": page.grand_totals,
+            "paging": page.paging,
+            "metadata": page.metadata,
+        }
+    )
+
+
+@frozen
+class ResultCacheMetrics:
+    """
+    Snapshot of the ExecutionResultCache counters.
+
+    Attributes:
+        hits (int): Executions served from the cache without contacting the server.
+        misses (int): Executions that had to be computed by the server.
+        result_id_reuses (int): Executions whose pages were no longer cached but whose result was still held by the
+            server, so it was read again without re-computation.
+        page_hits (int): Result pages served from the cache.
+        page_misses (int): Result pages read from the server.
+        evictions (int): Entries whose pages were evicted from memory to honor the size limits.
+        expirations (int): Entries dropped because they outlived the time-to-live.
+        spills (int): Evicted entries whose pages were written to the spill directory.
+        disk_loads (int): Entries whose pages were loaded back from the spill directory.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    result_id_reuses: int = 0
+    page_hits: int = 0
+    page_misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    spills: int = 0
+    disk_loads: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Share of executions served from the cache, including the reused result ids.
+        """
+        total = self.hits + self.result_id_reuses + self.misses
+        return (self.hits + self.result_id_reuses) / total if total else 0.0
+
+
+@define
+class _CacheEntry:
+    workspace_id: str
+    result_id: str
+    response: Any
+    created_at: float
+    pages: dict[PageKey, ExecutionResult] = field(factory=dict)
+    spilled: bool = False
+    resident: bool = True
+
+
+class ExecutionResultCache:
+    """
+    In-memory cache of execution results with LRU and time-to-live eviction.
+
+    The cache holds up to `max_entries` results and up to `max_pages` result pages in memory. When any of the limits
+    is exceeded, pages of the least recently used results are evicted - written to `spill_dir` if it is set, dropped
+    otherwise. The result id of an evicted entry is still remembered; when the entry is needed again and its pages
+    are not available, the ComputeService checks whether the server still holds the result and reads it again
+    without re-computation.
+
+    With `ttl` set, entries older than `ttl` seconds are never served, so that changes in the underlying data
+    eventually show up.
+
+    The cache is thread-safe and can be shared by multiple services.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        max_pages: int = 4096,
+        ttl: Optional[float] = None,
+        spill_dir: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """
+        Args:
+            max_entries: maximum number of results whose pages are held in memory
+            max_pages: maximum number of result pages held in memory
+            ttl: time-to-live of the entries in seconds; entries never expire by default
+            spill_dir: directory to write pages of evicted entries to; pages of evicted entries are dropped by default
+        """
+        if max_entries < 1 or max_pages < 1:
+            raise ValueError(
+                f"Invalid cache limits: max_entries={max_entries}, max_pages={max_pages}. Expecting positive values."
+            )
+
+        self._max_entries = max_entries
+        self._max_pages = max_pages
+        self._ttl = ttl
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._resident_pages = 0
+        self._counters: dict[str, int] = {a.name: 0 for a in fields(ResultCacheMetrics)}
+        self._lock = threading.RLock()
+
+        if self._spill_dir is not None:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def metrics(self) -> ResultCacheMetrics:
+        with self._lock:
+            return ResultCacheMetrics(**self._counters)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def lookup(self, key: str) -> Optional[_CacheEntry]:
+        """
+        Finds entry for the given fingerprint.
+
+        Entry with pages in memory or in the spill directory counts as a hit. Entry with only the result id known is
+        returned without counting; the caller resolves it using `confirm_result_id`.
+
+        Args:
+            key (str): Fingerprint of the execution.
+
+        Returns:
+            Optional[_CacheEntry]: The entry or None if the cache does not know the execution.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                self._remove(key)
+                self._counters["expirations"] += 1
+                entry = None
+
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            if not entry.resident and entry.spilled:
+                self._load_spilled(key, entry)
+
+            if entry.resident:
+                self._counters["hits"] += 1
+
+            return entry
+
+    def confirm_result_id(self, key: str, available: bool) -> None:
+        """
+        Records whether the server still holds result of an entry whose pages are no longer cached.
+
+        Args:
+            key (str): Fingerprint of the execution.
+            available (bool): True if the result can be read again, False if it must be re-computed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+
+            if available:
+                entry.resident = True
+                self._counters["result_id_reuses"] += 1
+                self._enforce_limits(keep=key)
+            else:
+                self._remove(key)
+                self._counters["misses"] += 1
+
+    def store(self, key: str, workspace_id: str, result_id: str, response: Any) -> None:
+        """
+        Stores execution response of a freshly computed execution; replaces any previous entry.
+
+        Args:
+            key (str): Fingerprint of the execution.
+            workspace_id (str): Workspace identifier.
+            result_id (str): Identifier of the execution result.
+            response (Any): Execution response as returned by the API.
+        """
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _CacheEntry(
+                workspace_id=workspace_id, result_id=result_id, response=response, created_at=time.monotonic()
+            )
+            self._enforce_limits(keep=key)
+
+    def get_page(self, key: str, offset: list[int], limit: list[int]) -> Optional[ExecutionResult]:
+        """
+        Gets cached page of the result. Page that was not read with the very same offset and limit is assembled
+        from the cached pages that cover it, if possible.
+
+        Args:
+            key (str): Fingerprint of the execution.
+            offset (list[int]): Offset of the page.
+            limit (list[int]): Limit of the page.
+
+        Returns:
+            Optional[ExecutionResult]: The page or None if it is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.resident and not self._is_expired(entry):
+                page = entry.pages.get(_page_key(offset, limit)) or _assemble_page(
+                    list(entry.pages.values()), offset, limit
+                )
+                if page is not None:
+                    self._entries.move_to_end(key)
+                    self._counters["page_hits"] += 1
+                    return page
+
+            self._counters["page_misses"] += 1
+            return None
+
+    def put_page(self, key: str, offset: list[int], limit: list[int], page: ExecutionResult) -> None:
+        """
+        Caches page of the result. Does nothing if the cache no longer holds the entry.
+
+        Args:
+            key (str): Fingerprint of the execution.
+            offset (list[int]): Offset of the page.
+            limit (list[int]): Limit of the page.
+            page (ExecutionResult): The page.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.resident:
+                return
+
+            page_key = _page_key(offset, limit)
+            if page_key not in entry.pages:
+                self._resident_pages += 1
+            entry.pages[page_key] = page
+            self._enforce_limits(keep=key)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drops the entry for the given fingerprint or all entries if no fingerprint is given.
+
+        Args:
+            key (Optional[str]): Fingerprint of the execution.
+        """
+        with self._lock:
+            for k in [key] if key is not None else list(self._entries):
+                self._remove(k)
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        return self._ttl is not None and time.monotonic() - entry.created_at > self._ttl
+
+    def _spill_path(self, key: str) -> Path:
+        assert self._spill_dir is not None
+        return self._spill_dir / f"{key}.json"
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        if entry.resident:
+            self._resident_pages -= len(entry.pages)
+        if entry.spilled:
+            self._spill_path(key).unlink(missing_ok=True)
+
+    def _evict(self, key: str, entry: _CacheEntry) -> None:
+        if self._spill_dir is not None and entry.pages:
+            path = self._spill_path(key)
+            tmp_path = path.with_suffix(".tmp")
+            pages = [
+                {"offset": list(offset), "limit": list(limit), "result": _page_to_json(page)}
+                for (offset, limit), page in entry.pages.items()
+            ]
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(pages, f)
+            os.replace(tmp_path, path)
+            entry.spilled = True
+            self._counters["spills"] += 1
+
+        self._resident_pages -= len(entry.pages)
+        entry.pages = {}
+        entry.resident = False
+        self._counters["evictions"] += 1
+
+    def _load_spilled(self, key: str, entry: _CacheEntry) -> None:
+        path = self._spill_path(key)
+        entry.spilled = False
+        try:
+            with open(path, encoding="utf-8") as f:
+                pages = json.load(f)
+        except (OSError, ValueError):
+            # spill file is gone or damaged; only the result id is known now
+            return
+        path.unlink(missing_ok=True)
+
+        entry.pages = {_page_key(page["offset"], page["limit"]): ExecutionResult(page["result"]) for page in pages}
+        entry.resident = True
+        self._resident_pages += len(entry.pages)
+        self._counters["disk_loads"] += 1
+        self._enforce_limits(keep=key)
+
+    def _enforce_limits(self, keep: str) -> None:
+        resident = [k for k, e in self._entries.items() if e.resident]
+        resident_count = len(resident)
+        for k in resident:
+            if resident_count <= self._max_entries and self._resident_pages <= self._max_pages:
+                break
+            if k == keep:
+                continue
+            self._evict(k, self._entries[k])
+            resident_count -= 1
+
+        known = len(self._entries) - resident_count
+        for k in [k for k, e in self._entries.items() if not e.resident]:
+            if known <= self._max_entries * _KNOWN_RESULTS_FACTOR:
+                break
+            self._remove(k)
+            known -= 1
@@ -17,12 +17,14 @@ from gooddata_api_client.model.search_request import SearchRequest
 from gooddata_api_client.model.search_result import SearchResult
 
 from gooddata_sdk.client import GoodDataApiClient
+from gooddata_sdk.compute.batch import _DEFAULT_MAX_CONCURRENCY, ExecutionBatch
 from gooddata_sdk.compute.model.execution import (
     Execution,
     ExecutionDefinition,
     ResultCacheMetadata,
     TableDimension,
 )
+from gooddata_sdk.compute.result_cache import ExecutionResultCache, execution_fingerprint
 from gooddata_sdk.compute.visualization_to_sdk_converter import VisualizationToSdkConverter
 
 logger = logging.getLogger(__name__)
@@ -33,12 +35,21 @@ class ComputeService:
     Compute service drives computation of analytics for a GoodData.CN workspaces. The prescription of what to compute
     is encapsulated by the ExecutionDefinition which consists of attributes, metrics, filters and definition of
     dimensions that influence how to organize the data in the result.
+
+    Optionally, the service can use an ExecutionResultCache. Execution definitions that were already computed in
+    the workspace are then served from the cache - or from the result the server still holds - without starting
+    a new computation.
     """
 
-    def __init__(self, api_client: GoodDataApiClient):
+    def __init__(self, api_client: GoodDataApiClient, result_cache: Optional[ExecutionResultCache] = None):
         self._api_client = api_client
         self._actions_api = self._api_client.actions_api
         self._entities_api = self._api_client.entities_api
+        self._result_cache = result_cache
+
+    @property
+    def result_cache(self) -> Optional[ExecutionResultCache]:
+        return self._result_cache
 
     def for_exec_def(
         self,
@@ -55,6 +66,15 @@ class ComputeService:
             timeout: request timeout in seconds. If a tuple is provided, it is used as (connection timeout, read timeout).
          into dimensions
         """
+        cache_key = None
+        if self._result_cache is not None:
+            cache_key = execution_fingerprint(
+                workspace_id, exec_def, self._api_client.hostname, self._api_client.token_digest
+            )
+            cached = self._cached_execution(workspace_id, exec_def, cache_key)
+            if cached is not None:
+                return cached
+
         response, _, headers = self._actions_api.compute_report(
             workspace_id,
             exec_def.as_api_model(),
@@ -63,7 +83,7 @@ class ComputeService:
             _request_timeout=timeout,
         )
 
-        return Execution(
+        execution = Execution(
             api_client=self._api_client,
             workspace_id=workspace_id,
             exec_def=exec_def,
@@ -71,6 +91,65 @@ class ComputeService:
             cancel_token=headers.get("X-Gdc-Cancel-Token")
             if exec_def.is_cancellable or self._api_client.executions_cancellable
             else None,
+            result_cache=self._result_cache,
+            cache_key=cache_key,
+        )
+        if self._result_cache is not None and cache_key is not None:
+            self._result_cache.store(cache_key, workspace_id, execution.result_id, response)
+
+        return execution
+
+    def for_exec_defs(
+        self,
+        workspace_id: str,
+        exec_defs: list[ExecutionDefinition],
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        timeout: Optional[Union[int, float, tuple]] = None,
+    ) -> ExecutionBatch:
+        """
+        Starts computations of multiple execution definitions in GoodData.CN workspace, sending at most
+        `max_concurrency` requests at a time.
+
+        Iterate over the returned batch to get `(index, Execution)` tuples as the computations complete; the batch
+        can also read the results concurrently and cancel all the executions at once.
+
+        Args:
+            workspace_id: workspace identifier
+            exec_defs: execution definitions to compute
+            max_concurrency: maximum number of concurrent requests
+            timeout: request timeout in seconds. If a tuple is provided, it is used as (connection timeout, read timeout).
+        Returns:
+            ExecutionBatch: batch of the started computations; use it as a context manager
+        """
+        return ExecutionBatch(self, workspace_id, list(exec_defs), max_concurrency=max_concurrency, timeout=timeout)
+
+    def _cached_execution(
+        self, workspace_id: str, exec_def: ExecutionDefinition, cache_key: str
+    ) -> Optional[Execution]:
+        assert self._result_cache is not None
+        entry = self._result_cache.lookup(cache_key)
+        if entry is None:
+            return None
+
+        if not entry.resident:
+            # pages are no longer cached; the result can still be read if the server holds it
+            try:
+                self.retrieve_result_cache_metadata(workspace_id, entry.result_id)
+            except ApiException as e:
+                if e.status not in (404, 410):
+                    raise
+                self._result_cache.confirm_result_id(cache_key, available=False)
+                return None
+            self._result_cache.confirm_result_id(cache_key, available=True)
+
+        # computation of cached result cannot be cancelled anymore, so there is no cancel token
+        return Execution(
+            api_client=self._api_client,
+            workspace_id=workspace_id,
+            exec_def=exec_def,
+            response=entry.response,
+            result_cache=self._result_cache,
+            cache_key=cache_key,
         )
 
     def retrieve_result_cache_metadata(self, workspace_id: str, result_id: str) -> ResultCacheMetadata:
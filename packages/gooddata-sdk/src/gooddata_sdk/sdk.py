@@ -12,6 +12,7 @@ from gooddata_sdk.catalog.user.service import CatalogUserService
 from gooddata_sdk.catalog.workspace.content_service import CatalogWorkspaceContentService
 from gooddata_sdk.catalog.workspace.service import CatalogWorkspaceService
 from gooddata_sdk.client import GoodDataApiClient
+from gooddata_sdk.compute.result_cache import ExecutionResultCache
 from gooddata_sdk.compute.service import ComputeService
 from gooddata_sdk.support import SupportService
 from gooddata_sdk.table import TableService
@@ -69,11 +70,43 @@ class GoodDataSdk:
         )
         return cls(client)
 
-    def __init__(self, client: GoodDataApiClient) -> None:
+    @classmethod
+    def create_with_result_cache(
+        cls,
+        result_cache: ExecutionResultCache,
+        /,
+        host_: str,
+        token_: str,
+        extra_user_agent_: Optional[str] = None,
+        *,
+        ssl_ca_cert: Optional[str] = None,
+        executions_cancellable: bool = False,
+        **custom_headers_: Optional[str],
+    ) -> GoodDataSdk:
+        """
+        Same as `GoodDataSdk.create`; the compute and table services of the returned instance share the
+        `result_cache` to serve repeated executions without re-computation. The cache is a positional-only
+        argument, so that it does not collide with a custom header named `result_cache`.
+        """
+        filtered_headers = {key: value for key, value in custom_headers_.items() if value is not None}
+        client = GoodDataApiClient(
+            host_,
+            token_,
+            custom_headers=filtered_headers,
+            extra_user_agent=extra_user_agent_,
+            executions_cancellable=executions_cancellable,
+            ssl_ca_cert=ssl_ca_cert,
+        )
+        return cls(client, result_cache=result_cache)
+
+    def __init__(self, client: GoodDataApiClient, result_cache: Optional[ExecutionResultCache] = None) -> None:
         """Take instance of GoodDataApiClient and return new GoodDataSdk instance.
 
         Useful when customized GoodDataApiClient is needed. Usually users should use
         `GoodDataSdk.create` classmethod.
+
+        When `result_cache` is provided, compute and table services share it to serve repeated
+        executions without re-computation.
         """
         self._client = client
 
@@ -82,9 +115,9 @@ class GoodDataSdk:
         self._catalog_data_source = CatalogDataSourceService(self._client)
         self._catalog_organization = CatalogOrganizationService(self._client)
         self._catalog_user = CatalogUserService(self._client)
-        self._compute = ComputeService(self._client)
+        self._compute = ComputeService(self._client, result_cache=result_cache)
         self._visualizations = VisualizationService(self._client)
-        self._tables = TableService(self._client)
+        self._tables = TableService(self._client, result_cache=result_cache)
         self._support = SupportService(self._client)
         self._catalog_permission = CatalogPermissionService(self._client)
         self._export = ExportService(self._client)
@@ -1,15 +1,24 @@
 # (C) 2021 GoodData Corporation
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Generator
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from operator import attrgetter
-from typing import Any, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 from attrs import define, field, frozen
 from attrs.setters import frozen as frozen_attr
 
 from gooddata_sdk.client import GoodDataApiClient
+from gooddata_sdk.compute.arrow_converter import (
+    execution_result_arrow_schema,
+    execution_result_to_record_batch,
+    record_batches_to_table,
+)
 from gooddata_sdk.compute.model.attribute import Attribute
 from gooddata_sdk.compute.model.execution import (
     ExecutionDefinition,
@@ -21,6 +30,8 @@ from gooddata_sdk.compute.model.execution import (
 from gooddata_sdk.compute.model.execution import TableDimension as ExecTableDimension
 from gooddata_sdk.compute.model.filter import Filter
 from gooddata_sdk.compute.model.metric import Metric
+from gooddata_sdk.compute.paging import PagingPolicy
+from gooddata_sdk.compute.result_cache import ExecutionResultCache
 from gooddata_sdk.compute.service import ComputeService
 from gooddata_sdk.visualization import (
     AttributeSortType,
@@ -36,6 +47,11 @@ from gooddata_sdk.visualization import (
     VisualizationTotal,
 )
 
+if TYPE_CHECKING:
+    import pyarrow
+
+    from gooddata_sdk.compute.async_service import AsyncExecution
+
 logger = logging.getLogger(__name__)
 
 _MEASURE_GROUP_IDENTIFIER = "measureGroup"
@@ -43,7 +59,13 @@ _TOTAL_ORDER = ["SUM", "MAX", "MIN", "AVG", "MED", "NAT"]
 
 _TABLE_ROW_BATCH_SIZE = 512
 """
-Number of rows that the code reads from backed at once.
+Number of rows that the code reads from backed at once, unless the table uses explicit paging policy.
+"""
+
+_TABLE_PREFETCH_MAX_PAGES = 32
+"""
+Upper bound on the number of pages that the prefetching reader keeps in flight. Each page in flight holds up to
+one page worth of rows in memory, so this also caps the memory window of the reader.
 """
 
 _MAX_METRICS = 256
@@ -84,34 +106,23 @@ class TableDimension:
         )
 
 
-class ExecutionTable:
+class _BaseExecutionTable:
     """
-    Represents execution result as a table. This is a convenience wrapper for executions constructed using
-    the following convention:
-
-    -  all attributes are in the first dimension
-    -  all metrics are in the second dimension
-    -  if the execution is attribute- or metric-less, then there is always single dimension
-
-    The mapping to rows is then as follows:
-
-    -  both attributes + metrics are on the execution = iteration over first dimension; as many rows as total records
-       in the first dimension (paging.total[0])
-    -  just attributes = iteration over just headers in first dimension; as many rows as total records in the
-       first dimension (paging.total[0])
-    -  just metrics = single row, all metrics values returned in one row
-
+    Mapping of the pages of execution result to rows and record batches, shared by the tables that read the pages
+    using blocking and non-blocking calls.
     """
 
-    def __init__(self, response: ExecutionResponse, first_page: ExecutionResult) -> None:
-        self._exec_def = response.exec_def
-        self._response = response
+    def __init__(
+        self,
+        exec_def: ExecutionDefinition,
+        first_page: ExecutionResult,
+        paging: Optional[PagingPolicy] = None,
+        row_limit: Optional[int] = None,
+    ) -> None:
+        self._exec_def = exec_def
         self._first_page = first_page
-        self._pages = [first_page]
-
-    @property
-    def result_id(self) -> str:
-        return self._response.result_id
+        self._paging = paging if paging is not None else PagingPolicy.fixed(_TABLE_ROW_BATCH_SIZE)
+        self._row_limit = row_limit
 
     @property
     def attributes(self) -> list[Attribute]:
@@ -136,6 +147,98 @@ class ExecutionTable:
         """
         return {**{a.local_id: a for a in self.attributes}, **{m.local_id: m for m in self.metrics}}
 
+    def _total_rows(self) -> int:
+        # the table reads at most row_limit rows, even if the result has more of them
+        total = self._first_page.paging_total[0]
+
+        return total if self._row_limit is None else min(total, self._row_limit)
+
+    def _read_all_metrics_in_one_row(self) -> Generator[dict[str, Any], None, None]:
+        data = self._first_page.data
+        cols = self.column_ids
+
+        yield dict(zip(cols, data))
+
+    def _page_rows(self, page: ExecutionResult) -> Iterator[dict[str, Any]]:
+        cols = self.column_ids
+        attribute_headers = page.headers[0]["headerGroups"]
+        has_metrics = self._exec_def.has_metrics()
+        data = page.data
+
+        for page_row_idx in range(page.paging_count[0]):
+            headers = [header["headers"][page_row_idx]["attributeHeader"]["labelValue"] for header in attribute_headers]
+            metric_data = data[page_row_idx] if has_metrics else []
+
+            yield dict(zip(cols, headers + metric_data))
+
+    @property
+    def arrow_schema(self) -> pyarrow.Schema:
+        """
+        Returns Arrow schema of the record batches returned by `read_batches`. Attribute columns are
+        dictionary-encoded strings, metric columns are float64.
+
+        Requires pyarrow to be installed.
+        """
+        return execution_result_arrow_schema([a.local_id for a in self.attributes], [m.local_id for m in self.metrics])
+
+    def _page_batch(self, page: ExecutionResult) -> pyarrow.RecordBatch:
+        return execution_result_to_record_batch(
+            page, [a.local_id for a in self.attributes], [m.local_id for m in self.metrics]
+        )
+
+    def __len__(self) -> int:
+        if self._exec_def.has_attributes():
+            # if there are attributes in the result, then the sheet will be sliced with one row per
+            # attribute => whatever the paging says is total for the first dimension is the number of rows;
+            # unless the table reads just the first row_limit rows
+            return self._total_rows()
+        else:
+            # if there are no attributes in the result, then the sheet contains at most one row with all
+            # metric values in it; now due such result being single dim, code looks at number of computed metric
+            # values in that single dim. if there are any, then there will be one row
+            return 1 if self._first_page.paging_total[0] > 0 else 0
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
+class ExecutionTable(_BaseExecutionTable):
+    """
+    Represents execution result as a table. This is a convenience wrapper for executions constructed using
+    the following convention:
+
+    -  all attributes are in the first dimension
+    -  all metrics are in the second dimension
+    -  if the execution is attribute- or metric-less, then there is always single dimension
+
+    The mapping to rows is then as follows:
+
+    -  both attributes + metrics are on the execution = iteration over first dimension; as many rows as total records
+       in the first dimension (paging.total[0])
+    -  just attributes = iteration over just headers in first dimension; as many rows as total records in the
+       first dimension (paging.total[0])
+    -  just metrics = single row, all metrics values returned in one row
+
+    The number of rows read at once is determined by the paging policy; by default, the table reads
+    _TABLE_ROW_BATCH_SIZE rows at once. With `row_limit`, the table reads just the first `row_limit` rows of
+    the result.
+    """
+
+    def __init__(
+        self,
+        response: ExecutionResponse,
+        first_page: ExecutionResult,
+        paging: Optional[PagingPolicy] = None,
+        row_limit: Optional[int] = None,
+    ) -> None:
+        super().__init__(response.exec_def, first_page, paging, row_limit)
+        self._response = response
+        self._pages = [first_page]
+
+    @property
+    def result_id(self) -> str:
+        return self._response.result_id
+
     def _read_next_page(self) -> bool:
         if not self._exec_def.has_attributes():
             # result without attributes has just one row with all the metrics, there is no next page to load
@@ -144,49 +247,28 @@ class ExecutionTable:
         last_loaded = self._pages[-1]
         offset = last_loaded.paging_offset
         count = last_loaded.paging_count
-        total = last_loaded.paging_total
+        total = self._total_rows()
 
         # no more data on the backend, bail out
-        if offset[0] + count[0] >= total[0]:
+        if offset[0] + count[0] >= total:
             return False
 
         next_offset = [offset[0] + count[0]] + offset[1:]
-        # backend is smart enough to cap if the limit is greater than number of remaining rows
-        next_limit = [_TABLE_ROW_BATCH_SIZE] + count[1:]
+        # backend is smart enough to cap if the limit is greater than number of remaining rows; the row limit
+        # of the table is not known to the backend though
+        next_limit = [min(self._paging.limit, total - next_offset[0])] + count[1:]
 
-        next_page = self._response.read_result(offset=next_offset, limit=next_limit)
+        next_page = self._paging.read(self._response.read_result, offset=next_offset, limit=next_limit)
 
         self._pages.append(next_page)
 
         return True
 
-    def _read_all_metrics_in_one_row(self) -> Generator[dict[str, Any], None, None]:
-        data = self._first_page.data
-        cols = self.column_ids
-
-        yield dict(zip(cols, data))
-
-    def _read_all_paged(self) -> Generator[dict[str, Any], None, None]:
+    def _iter_pages_serial(self) -> Generator[ExecutionResult, None, None]:
         page_idx = 0
-        cols = self.column_ids
 
         while page_idx < len(self._pages):
-            page = self._pages[page_idx]
-            attribute_headers = page.headers[0]
-            data = page.data
-            paging = page.paging
-            page_row_idx = 0
-
-            # yield all data from current page
-            while page_row_idx < paging["count"][0]:
-                headers = [
-                    header["headers"][page_row_idx]["attributeHeader"]["labelValue"]
-                    for header in attribute_headers["headerGroups"]
-                ]
-                metric_data = data[page_row_idx] if self._exec_def.has_metrics() else []
-
-                yield dict(zip(cols, headers + metric_data))
-                page_row_idx += 1
+            yield self._pages[page_idx]
 
             # try to read next page of data. False means the end was reached so just bail out
             if not self._read_next_page():
@@ -195,42 +277,348 @@ class ExecutionTable:
             # otherwise the self._pages was updated so go on with next page
             page_idx += 1
 
-    def read_all(self) -> Generator[dict[str, Any], None, None]:
+    def _iter_pages_prefetched(self, prefetch: int) -> Generator[ExecutionResult, None, None]:
+        first_page = self._first_page
+        yield first_page
+
+        if not self._exec_def.has_attributes() or first_page.is_complete():
+            return
+
+        # first page reveals total number of rows, so the offsets of the remaining pages can be planned ahead
+        total = self._total_rows()
+        other_offsets = first_page.paging_offset[1:]
+        other_limits = first_page.paging_count[1:]
+        submit_row = first_page.next_page_start()
+        next_row = submit_row
+        executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="gd-table-prefetch")
+        in_flight: deque[Future[ExecutionResult]] = deque()
+
+        def _read(offset: list[int], limit: list[int]) -> ExecutionResult:
+            return self._paging.read(self._response.read_result, offset=offset, limit=limit)
+
+        def _submit() -> None:
+            nonlocal submit_row
+            limit = [min(self._paging.limit, total - submit_row)] + other_limits
+            in_flight.append(executor.submit(_read, [submit_row] + other_offsets, limit))
+            submit_row += limit[0]
+
+        try:
+            while submit_row < total and len(in_flight) < prefetch:
+                _submit()
+
+            while in_flight:
+                page = in_flight.popleft().result()
+
+                # backend may return fewer rows than requested; read whatever rows were skipped over in order
+                while next_row < page.paging_offset[0]:
+                    gap_page = _read([next_row] + other_offsets, [page.paging_offset[0] - next_row] + other_limits)
+                    if gap_page.paging_count[0] == 0:
+                        break
+
+                    next_row = gap_page.next_page_start()
+                    yield gap_page
+
+                # keep the window full while the consumer drains the current page
+                if submit_row < total:
+                    _submit()
+
+                next_row = page.next_page_start()
+                yield page
+
+            # the last page may have been short as well
+            while next_row < total:
+                gap_page = _read([next_row] + other_offsets, [total - next_row] + other_limits)
+                if gap_page.paging_count[0] == 0:
+                    break
+
+                next_row = gap_page.next_page_start()
+                yield gap_page
+        finally:
+            # consumer may stop iterating early; do not wait for pages nobody is going to read
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_pages(self, prefetch: int) -> Generator[ExecutionResult, None, None]:
+        if prefetch < 0:
+            raise ValueError(f"Invalid prefetch value: {prefetch}. Expecting non-negative integer.")
+
+        if prefetch > 0:
+            return self._iter_pages_prefetched(min(prefetch, _TABLE_PREFETCH_MAX_PAGES))
+
+        return self._iter_pages_serial()
+
+    def _read_all_paged(self, pages: Iterator[ExecutionResult]) -> Generator[dict[str, Any], None, None]:
+        for page in pages:
+            yield from self._page_rows(page)
+
+    def read_all(self, prefetch: int = 0) -> Generator[dict[str, Any], None, None]:
         """
         Returns a generator that will be yielding execution result as rows. Each row is a dict() mapping column
         identifier to value of that column.
 
+        By default, the pages of the result are read one after another - the next page is requested only after
+        all rows from the current page are consumed. With `prefetch` set, the reader keeps up to `prefetch` pages
+        in flight on a bounded thread pool while the rows from the current page are being consumed. Rows are still
+        yielded in order and at most `prefetch` + 1 pages are held in memory at any time. Pages read in
+        the prefetch mode are not retained by the table.
+
+        :param prefetch: number of pages to fetch concurrently ahead of the consumer; 0 disables prefetching,
+         values are capped at _TABLE_PREFETCH_MAX_PAGES
         :return: generator yielding dict() representing rows of the table
         """
+        pages = self._iter_pages(prefetch)
+
         if not self._exec_def.has_attributes():
             return self._read_all_metrics_in_one_row()
 
-        return self._read_all_paged()
+        return self._read_all_paged(pages)
 
-    def __len__(self) -> int:
-        if self._exec_def.has_attributes():
-            # if there are attributes in the result, then the sheet will be sliced with one row per
-            # attribute => whatever the paging says is total for the first dimension is the number of rows
-            return self._first_page.paging_total[0]
-        else:
-            # if there are no attributes in the result, then the sheet contains at most one row with all
-            # metric values in it; now due such result being single dim, code looks at number of computed metric
-            # values in that single dim. if there are any, then there will be one row
-            return 1 if self._first_page.paging_total[0] > 0 else 0
+    def read_batches(self, prefetch: int = 0) -> Generator[pyarrow.RecordBatch, None, None]:
+        """
+        Returns a generator that will be yielding execution result as Arrow record batches - one batch per page of
+        the result. The batches follow the `arrow_schema`.
 
-    def __str__(self) -> str:
-        return self.__repr__()
+        This is the columnar counterpart of `read_all`; it does not create any per-row objects. Requires pyarrow
+        to be installed.
+
+        :param prefetch: number of pages to fetch concurrently ahead of the consumer; same semantics as in `read_all`
+        :return: generator yielding pyarrow.RecordBatch per page of the result
+        """
+        pages = self._iter_pages(prefetch)
+
+        return (self._page_batch(page) for page in pages)
+
+    def read_arrow(self, prefetch: int = 0) -> pyarrow.Table:
+        """
+        Reads the whole execution result into an Arrow table. Requires pyarrow to be installed.
+
+        :param prefetch: number of pages to fetch concurrently ahead of the consumer; same semantics as in `read_all`
+        :return: pyarrow.Table with all rows of the result
+        """
+        return record_batches_to_table(self.read_batches(prefetch), self.arrow_schema)
 
     def __repr__(self) -> str:
         return f"ExecutionTable(response={self._response}, columns={self.column_ids}, rows={len(self)})"
 
 
+class AsyncExecutionTable(_BaseExecutionTable):
+    """
+    Represents execution result as a table, same as ExecutionTable, but reads the pages of the result using
+    non-blocking calls of the AsyncComputeService. Iterate over the rows using `async for`:
+
+    .. code-block:: python
+
+        table = await execution.as_table()
+        async for row in table:
+            ...
+    """
+
+    def __init__(
+        self,
+        execution: AsyncExecution,
+        first_page: ExecutionResult,
+        paging: Optional[PagingPolicy] = None,
+        row_limit: Optional[int] = None,
+    ) -> None:
+        super().__init__(execution.exec_def, first_page, paging, row_limit)
+        self._execution = execution
+
+    @property
+    def result_id(self) -> str:
+        return self._execution.result_id
+
+    async def _read_page(self, offset: list[int], limit: list[int]) -> ExecutionResult:
+        start = time.perf_counter()
+        page = await self._execution.read_result(offset=offset, limit=limit)
+        self._paging.observe(page, limit[0], time.perf_counter() - start)
+
+        return page
+
+    async def _iter_pages(self, prefetch: int) -> AsyncGenerator[ExecutionResult, None]:
+        if prefetch < 0:
+            raise ValueError(f"Invalid prefetch value: {prefetch}. Expecting non-negative integer.")
+
+        prefetch = min(prefetch, _TABLE_PREFETCH_MAX_PAGES)
+        first_page = self._first_page
+        yield first_page
+
+        if not self._exec_def.has_attributes() or first_page.is_complete():
+            return
+
+        total = self._total_rows()
+        other_offsets = first_page.paging_offset[1:]
+        other_limits = first_page.paging_count[1:]
+        submit_row = first_page.next_page_start()
+        next_row = submit_row
+        in_flight: deque[asyncio.Task[ExecutionResult]] = deque()
+
+        def _fill_window() -> None:
+            nonlocal submit_row
+            # without prefetching, the next page is requested only once the consumer asks for it
+            while submit_row < total and len(in_flight) < max(prefetch, 1):
+                limit = [min(self._paging.limit, total - submit_row)] + other_limits
+                in_flight.append(asyncio.ensure_future(self._read_page([submit_row] + other_offsets, limit)))
+                submit_row += limit[0]
+
+        try:
+            while True:
+                _fill_window()
+                if not in_flight:
+                    break
+
+                page = await in_flight.popleft()
+                if prefetch > 0:
+                    _fill_window()
+
+                # backend may return fewer rows than requested; read whatever rows were skipped over in order
+                while next_row < page.paging_offset[0]:
+                    gap_page = await self._read_page(
+                        [next_row] + other_offsets, [page.paging_offset[0] - next_row] + other_limits
+                    )
+                    if gap_page.paging_count[0] == 0:
+                        break
+
+                    next_row = gap_page.next_page_start()
+                    yield gap_page
+
+                next_row = page.next_page_start()
+                yield page
+
+            # the last page may have been short as well
+            while next_row < total:
+                gap_page = await self._read_page([next_row] + other_offsets, [total - next_row] + other_limits)
+                if gap_page.paging_count[0] == 0:
+                    break
+
+                next_row = gap_page.next_page_start()
+                yield gap_page
+        finally:
+            # consumer may stop iterating early; do not wait for pages nobody is going to read
+            for task in in_flight:
+                task.cancel()
+
+    async def read_all(self, prefetch: int = 0) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Returns an async generator that will be yielding execution result as rows. Each row is a dict() mapping
+        column identifier to value of that column.
+
+        :param prefetch: number of pages to fetch concurrently ahead of the consumer; same semantics as in
+         `ExecutionTable.read_all`
+        :return: async generator yielding dict() representing rows of the table
+        """
+        if not self._exec_def.has_attributes():
+            for row in self._read_all_metrics_in_one_row():
+                yield row
+            return
+
+        async for page in self._iter_pages(prefetch):
+            for row in self._page_rows(page):
+                yield row
+
+    def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        return self.read_all()
+
+    async def read_pages(self, prefetch: int = 0) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Returns an async generator that will be yielding execution result in batches of rows - one batch per page
+        of the result.
+
+        :param prefetch: number of pages to fetch concurrently ahead of the consumer; same semantics as in
+         `ExecutionTable.read_all`
+        :return: async generator yielding list of rows per page of the result
+        """
+        if not self._exec_def.has_attributes():
+            yield list(self._read_all_metrics_in_one_row())
+            return
+
+        async for page in self._iter_pages(prefetch):
+            yield list(self._page_rows(page))
+
+    async def read_batches(self, prefetch: int = 0) -> AsyncGenerator[pyarrow.RecordBatch, None]:
+        """
+        Returns an async generator that will be yielding execution result as Arrow record batches - one batch per
+        page of the result. The batches follow the `arrow_schema`. Requires pyarrow to be installed.
+
+        :param prefetch: number of pages to fetch concurrently ahead of the consumer; same semantics as in
+         `ExecutionTable.read_all`
+        :return: async generator yielding pyarrow.RecordBatch per page of the result
+        """
+        async for page in self._iter_pages(prefetch):
+            yield self._page_batch(page)
+
+    async def read_arrow(self, prefetch: int = 0) -> pyarrow.Table:
+        """
+        Reads the whole execution result into an Arrow table. Requires pyarrow to be installed.
+
+        :param prefetch: number of pages to fetch concurrently ahead of the consumer; same semantics as in
+         `ExecutionTable.read_all`
+        :return: pyarrow.Table with all rows of the result
+        """
+        return record_batches_to_table([batch async for batch in self.read_batches(prefetch)], self.arrow_schema)
+
+    def __repr__(self) -> str:
+        return f"AsyncExecutionTable(execution={self._execution}, columns={self.column_ids}, rows={len(self)})"
+
+
+@frozen
+class TableSortKey:
+    """
+    Sorts rows of the table created by `TableService.for_items` by one of its columns. Sorting by an attribute
+    column uses the default sort order of the attribute's elements, sorting by a metric column uses the
+    computed values.
+    """
+
+    local_id: str
+    """
+    Local identifier of the attribute or metric whose column to sort by.
+    """
+
+    direction: SortDirection = SortDirection.ASC
+
+
+def _tabular_sorting(attributes: list[Attribute], metrics: list[Metric], sort_by: list[TableSortKey]) -> list[dict]:
+    attribute_ids = {a.local_id for a in attributes}
+    metric_ids = {m.local_id for m in metrics}
+    sorting: list[SortKey] = []
+
+    for sort_key in sort_by:
+        if sort_key.local_id in attribute_ids:
+            sorting.append(
+                SortKeyAttribute(
+                    sort_type=SortType.ATTRIBUTE,
+                    direction=sort_key.direction,
+                    attribute_identifier=sort_key.local_id,
+                    attribute_sort_type=AttributeSortType.DEFAULT,
+                )
+            )
+        elif sort_key.local_id in metric_ids:
+            # rows are the elements of the first dimension; they are sorted by the metric's values that live
+            # in the second dimension
+            sorting.append(
+                SortKeyValue(
+                    sort_type=SortType.MEASURE,
+                    direction=sort_key.direction,
+                    measure_dim_identifier="dim_1",
+                    data_column_locators=[MeasureLocator(measure_identifier=sort_key.local_id)],
+                )
+            )
+        else:
+            raise ValueError(f"Invalid sort key: {sort_key}. There is no attribute or metric with such local id.")
+
+    return [key.to_dict() for key in sorting]
+
+
 def _prepare_tabular_definition(
-    attributes: list[Attribute], filters: list[Filter], metrics: list[Metric]
+    attributes: list[Attribute],
+    filters: list[Filter],
+    metrics: list[Metric],
+    sort_by: Optional[list[TableSortKey]] = None,
 ) -> ExecutionDefinition:
+    # there is at most one row if there are no attributes, so there is nothing to sort
+    sorting = _tabular_sorting(attributes, metrics, sort_by) if attributes and sort_by else []
     dims = [
         ExecTableDimension(
             item_ids=[a.local_id for a in attributes] if attributes else None,
+            sorting=sorting,
         ),
         ExecTableDimension(
             item_ids=[_MEASURE_GROUP_IDENTIFIER] if metrics else None,
@@ -240,29 +628,56 @@ def _prepare_tabular_definition(
     return ExecutionDefinition(attributes=attributes, metrics=metrics, filters=filters, dimensions=dims)
 
 
-def _as_table(
-    response: ExecutionResponse,
-    always_two_dimensional: bool = False,
-    timeout: Optional[Union[int, float, tuple]] = None,
-) -> ExecutionTable:
+def _first_page_request(
+    exec_def: ExecutionDefinition, paging: PagingPolicy, adjust_to_exec_def: bool, row_limit: Optional[int] = None
+) -> tuple[list[int], list[int]]:
     first_page_offset = [0, 0]
-    first_page_limit = [_TABLE_ROW_BATCH_SIZE, _MAX_METRICS]
+    first_page_limit = [paging.limit if row_limit is None else min(paging.limit, row_limit), _MAX_METRICS]
 
-    # always adjust paging based on presence of metrics/attrs if not always_two_dimensional
-    # (behavior expected in FDW), otherwise, adjust if response contains only one-dimensional data
-    if not always_two_dimensional or len(response.dimensions) == 1:
-        if not response.exec_def.has_attributes():
+    if adjust_to_exec_def:
+        if not exec_def.has_attributes():
             # there are no attributes, there shall be at most one row with the metrics, so get that as first page
             first_page_limit = [first_page_limit[1]]
             first_page_offset = [0]
-        elif not response.exec_def.has_metrics():
+        elif not exec_def.has_metrics():
             # there are no metrics; there may be many attribute headers
             first_page_limit = [first_page_limit[0]]
             first_page_offset = [0]
 
-    first_page = response.read_result(offset=first_page_offset, limit=first_page_limit, timeout=timeout)
+    return first_page_offset, first_page_limit
+
+
+def _as_table(
+    response: ExecutionResponse,
+    always_two_dimensional: bool = False,
+    timeout: Optional[Union[int, float, tuple]] = None,
+    paging: Optional[PagingPolicy] = None,
+    row_limit: Optional[int] = None,
+) -> ExecutionTable:
+    paging = paging if paging is not None else PagingPolicy.fixed(_TABLE_ROW_BATCH_SIZE)
+
+    # always adjust paging based on presence of metrics/attrs if not always_two_dimensional
+    # (behavior expected in FDW), otherwise, adjust if response contains only one-dimensional data
+    adjust_to_exec_def = not always_two_dimensional or len(response.dimensions) == 1
+    first_page_offset, first_page_limit = _first_page_request(response.exec_def, paging, adjust_to_exec_def, row_limit)
+    first_page = paging.read(response.read_result, offset=first_page_offset, limit=first_page_limit, timeout=timeout)
+
+    return ExecutionTable(response=response, first_page=first_page, paging=paging, row_limit=row_limit)
 
-    return ExecutionTable(response=response, first_page=first_page)
+
+async def _as_async_table(
+    execution: AsyncExecution,
+    timeout: Optional[Union[int, float, tuple]] = None,
+    paging: Optional[PagingPolicy] = None,
+) -> AsyncExecutionTable:
+    paging = paging if paging is not None else PagingPolicy.fixed(_TABLE_ROW_BATCH_SIZE)
+    first_page_offset, first_page_limit = _first_page_request(execution.exec_def, paging, True)
+
+    start = time.perf_counter()
+    first_page = await execution.read_result(offset=first_page_offset, limit=first_page_limit, timeout=timeout)
+    paging.observe(first_page, first_page_limit[0], time.perf_counter() - start)
+
+    return AsyncExecutionTable(execution=execution, first_page=first_page, paging=paging)
 
 
 @frozen
@@ -775,11 +1190,20 @@ class TableService:
     The ExecutionTable returned by the TableService allows you to iterate over the rows of the calculated data.
     """
 
-    def __init__(self, api_client: GoodDataApiClient) -> None:
-        self._compute = ComputeService(api_client)
+    def __init__(self, api_client: GoodDataApiClient, result_cache: Optional[ExecutionResultCache] = None) -> None:
+        """
+        :param api_client: client to use for the computations
+        :param result_cache: optional cache of execution results; when provided, repeated computations of the same
+         execution definitions are served from it
+        """
+        self._compute = ComputeService(api_client, result_cache=result_cache)
 
     def for_visualization(
-        self, workspace_id: str, visualization: Visualization, always_two_dimensional: bool = False
+        self,
+        workspace_id: str,
+        visualization: Visualization,
+        always_two_dimensional: bool = False,
+        paging: Optional[PagingPolicy] = None,
     ) -> ExecutionTable:
         # Assume the received visualization is a pivot table if:
         # - we can parse out "table" suffix from the attributes.contents.visualizationUrl
@@ -794,7 +1218,7 @@ class TableService:
             else get_exec_for_non_pivot(visualization)
         )
         response = self._compute.for_exec_def(workspace_id=workspace_id, exec_def=exec_def)
-        return _as_table(response, always_two_dimensional)
+        return _as_table(response, always_two_dimensional, paging=paging)
 
     def for_items(
         self,
@@ -802,10 +1226,30 @@ class TableService:
         items: list[Union[Attribute, Metric]],
         filters: Optional[list[Filter]] = None,
         timeout: Optional[Union[int, float, tuple]] = None,
+        paging: Optional[PagingPolicy] = None,
+        sort_by: Optional[list[TableSortKey]] = None,
+        limit: Optional[int] = None,
     ) -> ExecutionTable:
+        """
+        Computes the items and returns the result as a table - one column per item.
+
+        :param workspace_id: workspace in which to compute
+        :param items: attributes and metrics to compute
+        :param filters: optional filters to apply
+        :param timeout: optional timeout of the requests to the backend
+        :param paging: optional paging policy; determines how many rows are read from the backend at once
+        :param sort_by: optional sorting of the rows; the backend sorts the result so that only the rows
+         that are actually read need to be transferred
+        :param limit: optional maximum number of rows to read; the table reads just the first `limit` rows of
+         the result
+        :return: table with the computed data
+        """
         if filters is None:
             filters = []
 
+        if limit is not None and limit < 1:
+            raise ValueError(f"Invalid limit: {limit}. Expecting positive integer.")
+
         attributes: list[Attribute] = []
         metrics: list[Metric] = []
 
@@ -817,7 +1261,7 @@ class TableService:
             else:
                 raise ValueError(f"Invalid input item: {item}. Expecting instance of Attribute or Metric")
 
-        exec_def = _prepare_tabular_definition(attributes=attributes, metrics=metrics, filters=filters)
+        exec_def = _prepare_tabular_definition(attributes=attributes, metrics=metrics, filters=filters, sort_by=sort_by)
         response = self._compute.for_exec_def(workspace_id=workspace_id, exec_def=exec_def, timeout=timeout)
 
-        return _as_table(response, timeout=timeout)
+        return _as_table(response, timeout=timeout, paging=paging, row_limit=limit)
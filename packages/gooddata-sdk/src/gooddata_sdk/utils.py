@@ -6,10 +6,11 @@ import json
 import os
 import re
 from collections.abc import KeysView, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from pathlib import Path
 from shutil import rmtree
-from typing import Any, Callable, NamedTuple, Union, cast, no_type_check
+from typing import Any, Callable, NamedTuple, Optional, Union, cast, no_type_check
 from warnings import warn
 from xml.etree import ElementTree as ET
 
@@ -87,13 +88,47 @@ class AllPagedEntities(NamedTuple):
     included: list[Any]
 
 
+def _append_page(all_paged_entities: AllPagedEntities, result: Any) -> None:
+    all_paged_entities.data.extend(result.data)
+
+    try:
+        all_paged_entities.included.extend(result.included)
+    except ApiAttributeError:
+        pass
+
+
+def _total_pages(result: Any) -> Optional[int]:
+    """
+    Reads total number of pages from the page metadata of the response. The metadata is present only when the page
+    was requested with `meta_include=["page"]`.
+    """
+    try:
+        page = result["meta"]["page"]
+    except (KeyError, TypeError, ApiAttributeError):
+        return None
+
+    if isinstance(page, OpenApiModel):
+        page = page.to_dict()
+    total_pages = page.get("totalPages", page.get("total_pages"))
+
+    return int(total_pages) if total_pages is not None else None
+
+
 # Use functools.partial instead of Protocol because Protocol is available starting by py3.8
-def load_all_entities(get_page_func: functools.partial[Any], page_size: int = 500) -> AllPagedEntities:
+def load_all_entities(
+    get_page_func: functools.partial[Any], page_size: int = 500, max_concurrency: int = 1
+) -> AllPagedEntities:
     """
     Loads all entities from a paged resource. The primary input to this function is a partial function that is setup
     with all the fixed parameters. Given this the function will get entities page-by-page and merge them into a single
     'pseudo-response' containing data and included attributes.
 
+    By default, the pages are requested one after another until a page that is not full arrives. With
+    `max_concurrency` greater than one, the first page is requested together with the page metadata to learn the total
+    number of pages and the remaining pages are then requested concurrently using at most `max_concurrency` threads.
+    The resource must support the `meta_include` parameter in that case. The entities are merged in the page order
+    either way.
+
     An example usage:
 
     >>> import functools
@@ -106,19 +141,42 @@ def load_all_entities(get_page_func: functools.partial[Any], page_size: int = 50
 
     :param get_page_func: an API controller from the metadata client
     :param page_size: optionally specify page length, default is 500
+    :param max_concurrency: optionally specify number of pages requested concurrently, default is 1
     """
+    if max_concurrency < 1:
+        raise ValueError(f"Invalid max_concurrency value: {max_concurrency}. Expecting positive value.")
+
     all_paged_entities = AllPagedEntities(data=[], included=[])
     current_page = 0
 
+    if max_concurrency > 1:
+        result = get_page_func(page=0, size=page_size, meta_include=["page"])
+        _append_page(all_paged_entities, result)
+        total_pages = _total_pages(result)
+
+        if len(result.data) < page_size:
+            return all_paged_entities
+
+        current_page = 1
+        if total_pages is not None and total_pages > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_concurrency, total_pages - 1), thread_name_prefix="gooddata-paging"
+            ) as executor:
+                results = list(
+                    executor.map(lambda page: get_page_func(page=page, size=page_size), range(1, total_pages))
+                )
+            for result in results:
+                _append_page(all_paged_entities, result)
+
+            if len(results[-1].data) < page_size:
+                return all_paged_entities
+            # entities were added since the first page was read; continue with the remaining pages one by one
+            current_page = total_pages
+
     while True:
         result = get_page_func(page=current_page, size=page_size)
 
-        all_paged_entities.data.extend(result.data)
-
-        try:
-            all_paged_entities.included.extend(result.included)
-        except ApiAttributeError:
-            pass
+        _append_page(all_paged_entities, result)
 
         if len(result.data) < page_size:
             break
@@ -129,9 +187,9 @@ def load_all_entities(get_page_func: functools.partial[Any], page_size: int = 50
 
 
 def load_all_entities_dict(
-    get_page_func: functools.partial[Any], page_size: int = 500, camel_case: bool = False
+    get_page_func: functools.partial[Any], page_size: int = 500, camel_case: bool = False, max_concurrency: int = 1
 ) -> dict[str, Any]:
-    all_entities = load_all_entities(get_page_func, page_size)
+    all_entities = load_all_entities(get_page_func, page_size, max_concurrency)
     all_entities_dict = {"data": all_entities.data, "included": all_entities.included}
     return all_entities_dict if camel_case else change_case(all_entities_dict, camel_to_snake)
 
@@ -161,6 +219,42 @@ class SideLoads:
         return len(self._objects)
 
 
+class RelatedSideLoads:
+    """
+    Finds side loads related to entities of a single paged resource.
+
+    Side loads of a paged resource are shared by all of its entities. When an entity is created with only the side
+    loads it relates to, reading its relationships does not need to scan side loads of the whole workspace.
+    """
+
+    def __init__(self, side_loads: list[Any]) -> None:
+        self._side_loads = side_loads
+        self._positions = {(o["type"], o["id"]): pos for pos, o in enumerate(side_loads)}
+
+    def for_entity(self, entity: Any) -> list[Any]:
+        """
+        Returns side loads referenced by any relationship of the entity, in the order of the original side loads.
+        """
+        return self.for_entities([entity])
+
+    def for_entities(self, entities: list[Any]) -> list[Any]:
+        """
+        Returns side loads referenced by any relationship of any of the entities, in the order of the original
+        side loads.
+        """
+        positions = set()
+        for entity in entities:
+            relationships = safeget(entity, ["relationships"]) or {}
+            for name in relationships:
+                related = safeget(relationships, [name, "data"])
+                for item in related if isinstance(related, list) else [related] if related is not None else []:
+                    pos = self._positions.get((item["type"], item["id"]))
+                    if pos is not None:
+                        positions.add(pos)
+
+        return [self._side_loads[pos] for pos in sorted(positions)]
+
+
 def get_sorted_yaml_files(folder: Path) -> list[Path]:
     return sorted([p for p in folder.glob("*.yaml")], key=lambda x: x.stem)
 
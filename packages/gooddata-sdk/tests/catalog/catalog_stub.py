@@ -0,0 +1,129 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from gooddata_sdk.utils import AllPagedEntities
+
+
+def _ref(obj_type: str, obj_id: str) -> dict[str, str]:
+    return {"id": obj_id, "type": obj_type}
+
+
+def synthetic_catalog_entities(
+    datasets: int, attributes_per_dataset: int, labels_per_attribute: int, facts_per_dataset: int, metrics: int
+) -> tuple[AllPagedEntities, AllPagedEntities, AllPagedEntities]:
+    """
+    Creates paged entities of datasets, attributes and metrics as returned by the entities API when loading the
+    full catalog of a workspace. The first label of each attribute is its primary label.
+    """
+    dataset_data: list[Any] = []
+    dataset_included: list[Any] = []
+    attribute_data: list[Any] = []
+    attribute_included: list[Any] = []
+
+    for d in range(datasets):
+        dataset_id = f"dataset{d}"
+        attribute_ids = [f"attr{d}_{a}" for a in range(attributes_per_dataset)]
+        fact_ids = [f"fact{d}_{f}" for f in range(facts_per_dataset)]
+        dataset_data.append(
+            {
+                "id": dataset_id,
+                "type": "dataset",
+                "attributes": {"title": f"Dataset {d}", "type": "NORMAL"},
+                "relationships": {
+                    "attributes": {"data": [_ref("attribute", a) for a in attribute_ids]},
+                    "facts": {"data": [_ref("fact", f) for f in fact_ids]},
+                },
+            }
+        )
+        dataset_included.extend({**_ref("fact", f), "attributes": {"title": f}} for f in fact_ids)
+        dataset_included.extend({**_ref("attribute", a), "attributes": {"title": a}} for a in attribute_ids)
+        attribute_included.append({**_ref("dataset", dataset_id), "attributes": {"title": f"Dataset {d}"}})
+
+        for attribute_id in attribute_ids:
+            label_ids = [f"{attribute_id}_label{x}" for x in range(labels_per_attribute)]
+            attribute_data.append(
+                {
+                    "id": attribute_id,
+                    "type": "attribute",
+                    "attributes": {"title": attribute_id},
+                    "relationships": {
+                        "labels": {"data": [_ref("label", x) for x in label_ids]},
+                        "dataset": {"data": _ref("dataset", dataset_id)},
+                    },
+                }
+            )
+            attribute_included.extend(
+                {**_ref("label", x), "attributes": {"title": x, "primary": i == 0, "valueType": "TEXT"}}
+                for i, x in enumerate(label_ids)
+            )
+
+    metric_data = [
+        {"id": f"metric{m}", "type": "metric", "attributes": {"title": f"Metric {m}", "content": {"maql": "SELECT 1"}}}
+        for m in range(metrics)
+    ]
+
+    return (
+        AllPagedEntities(data=dataset_data, included=dataset_included),
+        AllPagedEntities(data=attribute_data, included=attribute_included),
+        AllPagedEntities(data=metric_data, included=[]),
+    )
+
+
+class _StubPage(dict):
+    @property
+    def data(self) -> list[Any]:
+        return self["data"]
+
+    @property
+    def included(self) -> list[Any]:
+        return self["included"]
+
+
+class StubEntitiesApi:
+    """
+    Serves the synthetic catalog entities page by page the way the entities API does. Side loads are returned with
+    the first page. Records the requested pages of each entity type.
+    """
+
+    def __init__(self, datasets: AllPagedEntities, attributes: AllPagedEntities, metrics: AllPagedEntities) -> None:
+        self._entities = {"datasets": datasets, "attributes": attributes, "metrics": metrics}
+        self.requests: list[tuple[str, int, bool]] = []
+        self._lock = threading.Lock()
+
+    def _get_page(self, entity_type: str, page: int = 0, size: int = 20, meta_include: Any = None) -> _StubPage:
+        with self._lock:
+            self.requests.append((entity_type, page, meta_include is not None))
+
+        entities = self._entities[entity_type]
+        result = _StubPage(
+            data=entities.data[page * size : (page + 1) * size], included=entities.included if page == 0 else []
+        )
+        if meta_include is not None:
+            total = len(entities.data)
+            result["meta"] = {"page": {"totalPages": -(-total // size), "totalElements": total, "number": page}}
+
+        return result
+
+    def get_all_entities_datasets(self, workspace_id: str, **kwargs: Any) -> _StubPage:
+        return self._get_page("datasets", kwargs["page"], kwargs["size"], kwargs.get("meta_include"))
+
+    def get_all_entities_attributes(self, workspace_id: str, **kwargs: Any) -> _StubPage:
+        return self._get_page("attributes", kwargs["page"], kwargs["size"], kwargs.get("meta_include"))
+
+    def get_all_entities_metrics(self, workspace_id: str, **kwargs: Any) -> _StubPage:
+        return self._get_page("metrics", kwargs["page"], kwargs["size"], kwargs.get("meta_include"))
+
+
+class StubApiClient:
+    """
+    Provides the parts of the GoodDataApiClient used by the catalog services.
+    """
+
+    def __init__(self, entities_api: StubEntitiesApi) -> None:
+        self.entities_api = entities_api
+        self.layout_api = None
+        self.actions_api = None
+        self.user_management_api = None
@@ -0,0 +1,48 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+from gooddata_sdk import CatalogWorkspaceContentService
+
+from tests.catalog.catalog_stub import StubApiClient, StubEntitiesApi, synthetic_catalog_entities
+
+
+def _service() -> tuple[StubEntitiesApi, CatalogWorkspaceContentService]:
+    # 1200 attributes and 2300 metrics span multiple pages of the default size
+    entities_api = StubEntitiesApi(
+        *synthetic_catalog_entities(
+            datasets=120, attributes_per_dataset=10, labels_per_attribute=1, facts_per_dataset=1, metrics=2300
+        )
+    )
+    return entities_api, CatalogWorkspaceContentService(StubApiClient(entities_api))  # type: ignore[arg-type]
+
+
+def test_concurrent_full_catalog_matches_sequential():
+    sequential_api, sequential_service = _service()
+    concurrent_api, concurrent_service = _service()
+
+    sequential = sequential_service.get_full_catalog("demo", inject_valid_objects_func=False)
+    concurrent = concurrent_service.get_full_catalog("demo", inject_valid_objects_func=False, max_concurrency=4)
+
+    assert concurrent.datasets == sequential.datasets
+    assert concurrent.metrics == sequential.metrics
+    assert len(concurrent.attributes) == 1200
+    assert len(concurrent.metrics) == 2300
+    assert not any(meta for _, _, meta in sequential_api.requests)
+
+
+def test_concurrent_full_catalog_requests_each_page_once():
+    entities_api, service = _service()
+    service.get_full_catalog("demo", inject_valid_objects_func=False, max_concurrency=4)
+
+    requested = sorted(entities_api.requests)
+    assert requested == [
+        ("attributes", 0, True),
+        ("attributes", 1, False),
+        ("attributes", 2, False),
+        ("datasets", 0, True),
+        ("metrics", 0, True),
+        ("metrics", 1, False),
+        ("metrics", 2, False),
+        ("metrics", 3, False),
+        ("metrics", 4, False),
+    ]
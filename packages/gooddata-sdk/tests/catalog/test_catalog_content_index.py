@@ -0,0 +1,73 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+from gooddata_sdk import CatalogDataset, CatalogWorkspaceContent, ObjId
+
+from tests.catalog.catalog_stub import synthetic_catalog_entities
+
+
+def _catalog() -> CatalogWorkspaceContent:
+    datasets, attributes, metrics = synthetic_catalog_entities(
+        datasets=4, attributes_per_dataset=3, labels_per_attribute=2, facts_per_dataset=2, metrics=5
+    )
+    return CatalogWorkspaceContent.create_workspace_content_catalog(None, datasets, attributes, metrics)
+
+
+def test_content_matches_unindexed_construction():
+    datasets, attributes, metrics = synthetic_catalog_entities(
+        datasets=4, attributes_per_dataset=3, labels_per_attribute=2, facts_per_dataset=2, metrics=5
+    )
+    catalog = CatalogWorkspaceContent.create_workspace_content_catalog(None, datasets, attributes, metrics)
+    unindexed = [
+        CatalogDataset.from_api(d, side_loads=datasets.included, related_entities=attributes) for d in datasets.data
+    ]
+
+    assert [d.id for d in catalog.datasets] == [d.id for d in unindexed]
+    assert [a.id for a in catalog.attributes] == [a.id for d in unindexed for a in d.attributes]
+    assert [f.id for f in catalog.facts] == [f.id for d in unindexed for f in d.facts]
+    assert [x.id for x in catalog.labels] == [x.id for d in unindexed for a in d.attributes for x in a.labels]
+    assert len(catalog.labels) == 24
+    assert catalog.get_attribute("attr1_2").dataset.id == "dataset1"
+
+    for dataset, unindexed_dataset in zip(catalog.datasets, unindexed):
+        # datasets keep the related attribute entities, so they are able to generate their attributes again
+        assert [a.id for a in dataset.generate_attributes_from_api()] == [a.id for a in unindexed_dataset.attributes]
+        assert [a["id"] for a in dataset.json_api_related_entities_data] == [a.id for a in dataset.attributes]
+
+
+def test_lookups():
+    catalog = _catalog()
+
+    assert catalog.get_attribute("attr2_1").id == "attr2_1"
+    assert catalog.get_attribute(ObjId(id="attr2_1", type="attribute")).id == "attr2_1"
+    assert catalog.get_label("label/attr3_0_label1").id == "attr3_0_label1"
+    assert catalog.get_fact("fact0_1").id == "fact0_1"
+    assert catalog.get_metric("metric4").id == "metric4"
+    assert catalog.get_dataset("dataset3").id == "dataset3"
+    assert catalog.get_attribute("missing") is None
+    assert catalog.get_label("attr2_1") is None
+
+
+def test_label_attribute_and_attribute_dataset():
+    catalog = _catalog()
+
+    assert catalog.find_label_attribute(ObjId(id="attr1_2_label1", type="label")).id == "attr1_2"
+    assert catalog.find_label_attribute("label/attr0_0_label0").id == "attr0_0"
+    assert catalog.find_label_attribute({"id": "attr3_1_label0", "type": "label"}).id == "attr3_1"
+    assert catalog.find_label_attribute(ObjId(id="missing", type="label")) is None
+    assert catalog.find_attribute_dataset(ObjId(id="attr2_0", type="attribute")).id == "dataset2"
+    assert catalog.get_attribute("attr2_0").primary_label().id == "attr2_0_label0"
+
+
+def test_indexes_follow_filtered_catalog():
+    catalog = _catalog()
+    datasets, metrics = catalog.filter_by_valid_objects(
+        {"attribute": {"attr0_0"}, "fact": {"fact1_0"}, "metric": {"metric0"}}
+    )
+    filtered = CatalogWorkspaceContent(None, datasets=datasets, metrics=metrics)
+
+    assert [a.id for a in filtered.attributes] == ["attr0_0"]
+    assert filtered.get_attribute("attr0_1") is None
+    assert filtered.find_label_attribute("label/attr0_0_label1").id == "attr0_0"
+    assert filtered.get_fact("fact1_0").id == "fact1_0"
+    assert filtered.get_metric("metric1") is None
@@ -0,0 +1,90 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+
+from aiohttp import web
+
+from tests.compute.result_stub import stub_dimensions, stub_result_page
+
+_EXECUTION_PATH = "/api/v1/actions/workspaces/{workspace_id}/execution/afm"
+
+
+class StubComputeServer:
+    """
+    Local HTTP server mimicking the compute endpoints of the GoodData API. Every execution creates a new stub
+    execution result.
+    """
+
+    def __init__(self, total_rows: int, latency: float = 0.0, server_cap: Optional[int] = None) -> None:
+        self.total_rows = total_rows
+        self.latency = latency
+        self.server_cap = server_cap
+        self.executions: list[dict[str, Any]] = []
+        self.result_requests: list[tuple[str, list[int], list[int]]] = []
+        self.cancelled: list[dict[str, Any]] = []
+        self.authorizations: set[str] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._runner: Optional[web.AppRunner] = None
+        self.host = ""
+
+    async def __aenter__(self) -> StubComputeServer:
+        app = web.Application()
+        app.router.add_post(_EXECUTION_PATH + "/execute", self._execute)
+        app.router.add_get(_EXECUTION_PATH + "/execute/result/{result_id}", self._result)
+        app.router.add_post(_EXECUTION_PATH + "/cancel", self._cancel)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.host = f"http://127.0.0.1:{port}"
+
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        assert self._runner is not None
+        await self._runner.cleanup()
+
+    async def _execute(self, request: web.Request) -> web.Response:
+        if request.match_info["workspace_id"] == "missing":
+            return web.json_response({"title": "Not Found"}, status=404)
+
+        self.authorizations.add(request.headers["Authorization"])
+        body = await request.json()
+        self.executions.append(body)
+        result_id = f"result-{len(self.executions)}"
+
+        return web.json_response(
+            {
+                "executionResponse": {
+                    "links": {"executionResult": result_id},
+                    "dimensions": stub_dimensions(),
+                }
+            },
+            headers={"X-Gdc-Cancel-Token": f"token-{result_id}"},
+        )
+
+    async def _result(self, request: web.Request) -> web.Response:
+        offset = [int(value) for value in request.query["offset"].split(",")]
+        limit = [int(value) for value in request.query["limit"].split(",")]
+        self.result_requests.append((request.match_info["result_id"], offset, limit))
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+        return web.json_response(
+            stub_result_page(self.total_rows, offset[0], limit[0], self.server_cap, camel_case=True)
+        )
+
+    async def _cancel(self, request: web.Request) -> web.Response:
+        self.cancelled.append(await request.json())
+
+        return web.json_response({})
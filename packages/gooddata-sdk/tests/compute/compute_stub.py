@@ -0,0 +1,85 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Optional
+
+from gooddata_api_client import ApiException
+
+from tests.compute.result_stub import stub_dimensions, stub_result_page
+
+
+class StubActionsApi:
+    """
+    Mimics the compute endpoints of the actions API. Every computation creates a new stub execution result. Results
+    listed in `expired` are reported as no longer held by the server. Each computation takes `latency` seconds.
+    """
+
+    def __init__(self, total_rows: int, latency: float = 0.0) -> None:
+        self.total_rows = total_rows
+        self.latency = latency
+        self.computations: list[str] = []
+        self.result_requests: list[tuple[str, int, int]] = []
+        self.metadata_requests: list[str] = []
+        self.cancelled: dict[str, str] = {}
+        self.expired: set[str] = set()
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def compute_report(self, workspace_id: str, afm_execution: Any, **kwargs: Any) -> tuple[Any, int, dict]:
+        with self._lock:
+            result_id = f"result{len(self.computations)}"
+            self.computations.append(result_id)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+        time.sleep(self.latency)
+        with self._lock:
+            self._in_flight -= 1
+
+        response = {"execution_response": {"links": {"executionResult": result_id}, "dimensions": stub_dimensions()}}
+        return response, 200, {"X-Gdc-Cancel-Token": f"token-{result_id}"}
+
+    def retrieve_result(
+        self, workspace_id: str, result_id: str, offset: list[int], limit: list[int], **kwargs: Any
+    ) -> tuple[Any, int, dict]:
+        with self._lock:
+            self.result_requests.append((result_id, offset[0], limit[0]))
+
+        result = stub_result_page(self.total_rows, offset[0], limit[0])
+        return result, 200, {}
+
+    def retrieve_execution_metadata(self, workspace_id: str, result_id: str, **kwargs: Any) -> tuple[Any, int, dict]:
+        with self._lock:
+            self.metadata_requests.append(result_id)
+
+        if result_id in self.expired:
+            raise ApiException(status=404, reason="Not Found")
+
+        return {"result_size": self.total_rows * 24}, 200, {}
+
+    def cancel_executions(self, workspace_id: str, afm_cancel_tokens: Any, **kwargs: Any) -> None:
+        with self._lock:
+            self.cancelled.update(afm_cancel_tokens.result_id_to_cancel_token_pairs)
+
+
+class StubApiClient:
+    """
+    Provides the parts of the GoodDataApiClient used by the ComputeService.
+    """
+
+    def __init__(
+        self,
+        total_rows: int,
+        latency: float = 0.0,
+        custom_headers: Optional[dict[str, str]] = None,
+        token_digest: str = "digest",
+    ) -> None:
+        self.actions_api = StubActionsApi(total_rows, latency)
+        self.entities_api = None
+        self.hostname = "http://localhost:3000"
+        self.token_digest = token_digest
+        self.custom_headers = custom_headers or {}
+        self.executions_cancellable = False
@@ -0,0 +1,73 @@
+# (C) 2026 GoodData Corporation
+"""
+Shape of the execution result served by the test stubs: a two-dimensional execution with one attribute and one
+metric in the tabular layout; the attribute value and the metric value of each row are derived from the row number.
+
+The stubs of the actions API, of the HTTP API and of the execution response build on these.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from gooddata_sdk import Attribute, ExecutionDefinition, ObjId, SimpleMetric, table
+
+STUB_ATTRIBUTE_ID = "attr1"
+STUB_METRIC_ID = "metric1"
+
+
+def stub_exec_def(metric_id: str = "order_amount", is_cancellable: bool = False) -> ExecutionDefinition:
+    exec_def = table._prepare_tabular_definition(
+        attributes=[Attribute(local_id=STUB_ATTRIBUTE_ID, label="region")],
+        metrics=[SimpleMetric(local_id=STUB_METRIC_ID, item=ObjId(type="metric", id=metric_id))],
+        filters=[],
+    )
+    if not is_cancellable:
+        return exec_def
+
+    return ExecutionDefinition(
+        attributes=exec_def.attributes,
+        metrics=exec_def.metrics,
+        filters=exec_def.filters,
+        dimensions=exec_def.dimensions,
+        is_cancellable=is_cancellable,
+    )
+
+
+def stub_dimensions() -> list[dict[str, Any]]:
+    """
+    Dimensions of the execution response.
+    """
+    return [
+        {"headers": [{"attributeHeader": {"localIdentifier": STUB_ATTRIBUTE_ID, "labelName": "Region"}}]},
+        {"headers": [{"measureGroupHeaders": [{"localIdentifier": STUB_METRIC_ID}]}]},
+    ]
+
+
+def stub_result_page(
+    total_rows: int, offset: int, limit: int, server_cap: Optional[int] = None, camel_case: bool = False
+) -> dict[str, Any]:
+    """
+    Page of the execution result starting at the `offset` row. With `server_cap`, the page has at most that many rows
+    regardless of the requested limit. `camel_case` names the keys as in the JSON payload of the HTTP API.
+    """
+    page_len = limit if server_cap is None else min(limit, server_cap)
+    rows = range(offset, min(offset + page_len, total_rows))
+
+    return {
+        "data": [[float(row)] for row in rows],
+        "dimensionHeaders" if camel_case else "dimension_headers": [
+            {"headerGroups": [{"headers": [{"attributeHeader": {"labelValue": f"v{row}"}} for row in rows]}]},
+            {"headerGroups": [{"headers": [{"measureHeader": {"measureIndex": 0}}]}]},
+        ],
+        "grandTotals" if camel_case else "grand_totals": [],
+        "paging": {"count": [len(rows), 1], "offset": [offset, 0], "total": [total_rows, 1]},
+        "metadata": {},
+    }
+
+
+def stub_rows(total_rows: int) -> list[dict[str, Any]]:
+    """
+    Rows of the execution result as read by the tabular readers.
+    """
+    return [{STUB_ATTRIBUTE_ID: f"v{row}", STUB_METRIC_ID: float(row)} for row in range(total_rows)]
@@ -0,0 +1,126 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from gooddata_api_client import ApiClient, ApiException
+from gooddata_sdk import AsyncComputeService, GoodDataApiClient, PagingPolicy
+
+from tests.compute.async_stub import StubComputeServer
+from tests.compute.result_stub import stub_exec_def, stub_rows
+
+_EXEC_DEF = stub_exec_def()
+
+
+def test_for_exec_def_serializes_exec_def():
+    async def scenario():
+        async with StubComputeServer(total_rows=10) as server:
+            api_client = GoodDataApiClient(host=server.host, token="secret", executions_cancellable=True)
+            async with AsyncComputeService(api_client) as compute:
+                execution = await compute.for_exec_def("demo", _EXEC_DEF)
+
+        assert server.executions == [ApiClient.sanitize_for_serialization(_EXEC_DEF.as_api_model())]
+        assert server.authorizations == {"Bearer secret"}
+        assert execution.result_id == "result-1"
+        assert execution.cancel_token == "token-result-1"
+        assert len(execution.dimensions) == 2
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("total_rows", [0, 1, 512, 513, 3000])
+@pytest.mark.parametrize("prefetch", [0, 4])
+def test_async_table_iteration(total_rows, prefetch):
+    async def scenario():
+        async with (
+            StubComputeServer(total_rows=total_rows) as server,
+            AsyncComputeService(GoodDataApiClient(host=server.host, token="secret")) as compute,
+        ):
+            execution = await compute.for_exec_def("demo", _EXEC_DEF)
+            exec_table = await execution.as_table()
+
+            if prefetch == 0:
+                rows = [row async for row in exec_table]
+            else:
+                rows = [row async for row in exec_table.read_all(prefetch=prefetch)]
+            pages = [page async for page in exec_table.read_pages(prefetch=prefetch)]
+
+        assert len(exec_table) == total_rows
+        assert rows == stub_rows(total_rows)
+        assert [row for page in pages for row in page] == rows
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("server_cap", [None, 300])
+def test_async_table_with_adaptive_paging(server_cap):
+    async def scenario():
+        async with (
+            StubComputeServer(total_rows=5000, server_cap=server_cap) as server,
+            AsyncComputeService(GoodDataApiClient(host=server.host, token="secret")) as compute,
+        ):
+            execution = await compute.for_exec_def("demo", _EXEC_DEF)
+            policy = PagingPolicy(initial_size=100, max_size=2000)
+            exec_table = await execution.as_table(paging=policy)
+
+            rows = [row async for row in exec_table.read_all(prefetch=2)]
+
+        assert rows == stub_rows(5000)
+        assert policy.limit == (server_cap or 2000)
+
+    asyncio.run(scenario())
+
+
+def test_async_table_read_arrow():
+    async def scenario():
+        async with (
+            StubComputeServer(total_rows=1000) as server,
+            AsyncComputeService(GoodDataApiClient(host=server.host, token="secret")) as compute,
+        ):
+            execution = await compute.for_exec_def("demo", _EXEC_DEF)
+            exec_table = await execution.as_table()
+
+            return await exec_table.read_arrow(prefetch=2)
+
+    arrow_table = asyncio.run(scenario())
+
+    assert arrow_table.num_rows == 1000
+    assert arrow_table.column("metric1").to_pylist() == [float(row) for row in range(1000)]
+
+
+def test_executions_share_bounded_connection_pool():
+    async def scenario():
+        async with StubComputeServer(total_rows=600, latency=0.01) as server:
+            api_client = GoodDataApiClient(host=server.host, token="secret")
+            async with AsyncComputeService(api_client, max_connections=8) as compute:
+
+                async def _compute() -> list[dict]:
+                    execution = await compute.for_exec_def("demo", _EXEC_DEF)
+                    exec_table = await execution.as_table()
+                    return [row async for row in exec_table]
+
+                results = await asyncio.gather(*[_compute() for _ in range(50)])
+
+        assert all(rows == stub_rows(600) for rows in results)
+        assert len({result_id for result_id, _, _ in server.result_requests}) == 50
+        assert 1 < server.max_in_flight <= 8
+
+    asyncio.run(scenario())
+
+
+def test_cancel_and_error_handling():
+    async def scenario():
+        async with StubComputeServer(total_rows=10) as server:
+            api_client = GoodDataApiClient(host=server.host, token="secret", executions_cancellable=True)
+            async with AsyncComputeService(api_client) as compute:
+                execution = await compute.for_exec_def("demo", _EXEC_DEF)
+                await execution.cancel()
+
+                with pytest.raises(ApiException) as e:
+                    await compute.for_exec_def("missing", _EXEC_DEF)
+
+        assert server.cancelled == [{"resultIdToCancelTokenPairs": {"result-1": "token-result-1"}}]
+        assert e.value.status == 404
+
+    asyncio.run(scenario())
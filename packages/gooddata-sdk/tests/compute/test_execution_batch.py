@@ -0,0 +1,92 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+from concurrent.futures import CancelledError
+
+import pytest
+from gooddata_sdk import ComputeService, ExecutionBatch
+
+from tests.compute.compute_stub import StubApiClient
+from tests.compute.result_stub import stub_exec_def
+
+_TOTAL_ROWS = 120
+
+
+def _compute_service(latency: float = 0.0) -> tuple[StubApiClient, ComputeService]:
+    api_client = StubApiClient(_TOTAL_ROWS, latency=latency)
+    return api_client, ComputeService(api_client)  # type: ignore[arg-type]
+
+
+def _exec_defs(count: int, is_cancellable: bool = False) -> list:
+    return [stub_exec_def(f"metric{i}", is_cancellable=is_cancellable) for i in range(count)]
+
+
+def test_batch_streams_all_executions():
+    api_client, compute = _compute_service(latency=0.02)
+    exec_defs = _exec_defs(10)
+
+    with compute.for_exec_defs("demo", exec_defs, max_concurrency=3) as batch:
+        completed = dict(batch)
+
+    assert isinstance(batch, ExecutionBatch)
+    assert sorted(completed) == list(range(10))
+    assert all(completed[i].exec_def is exec_defs[i] for i in range(10))
+    assert len({e.result_id for e in completed.values()}) == 10
+    assert api_client.actions_api.max_in_flight == 3
+
+
+def test_batch_reads_results_concurrently():
+    pytest.importorskip("pyarrow")
+    api_client, compute = _compute_service()
+
+    with compute.for_exec_defs("demo", _exec_defs(5), max_concurrency=2) as batch:
+        tables = dict(batch.read_arrow())
+
+    assert sorted(tables) == list(range(5))
+    assert all(t.num_rows == _TOTAL_ROWS for t in tables.values())
+    assert all(t.column("metric1").to_pylist() == [float(i) for i in range(_TOTAL_ROWS)] for t in tables.values())
+
+
+def test_batch_as_tables():
+    _, compute = _compute_service()
+
+    with compute.for_exec_defs("demo", _exec_defs(3)) as batch:
+        tables = dict(batch.as_tables())
+
+    assert sorted(tables) == [0, 1, 2]
+    assert all(len(list(t.read_all())) == _TOTAL_ROWS for t in tables.values())
+
+
+def test_batch_cancel():
+    api_client, compute = _compute_service(latency=0.05)
+
+    batch = compute.for_exec_defs("demo", _exec_defs(8, is_cancellable=True), max_concurrency=2)
+    next(iter(batch))
+    batch.cancel()
+    batch.close()
+
+    started = api_client.actions_api.computations
+    assert len(started) < 8
+    assert sorted(api_client.actions_api.cancelled) == sorted(started)
+    assert batch.cancelled
+    with pytest.raises(CancelledError):
+        list(batch.map(lambda execution: execution.result_id))
+
+
+def test_batch_cancelled_on_error():
+    api_client, compute = _compute_service(latency=0.02)
+
+    def _fail(execution):
+        raise RuntimeError("failed to read")
+
+    with pytest.raises(RuntimeError), compute.for_exec_defs("demo", _exec_defs(4, is_cancellable=True)) as batch:
+        list(batch.map(_fail))
+
+    assert sorted(api_client.actions_api.cancelled) == sorted(api_client.actions_api.computations)
+
+
+def test_invalid_concurrency():
+    _, compute = _compute_service()
+
+    with pytest.raises(ValueError):
+        compute.for_exec_defs("demo", _exec_defs(1), max_concurrency=0)
@@ -0,0 +1,221 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from gooddata_sdk import (
+    ComputeService,
+    ExecutionResultCache,
+    GoodDataSdk,
+    PagingPolicy,
+    execution_fingerprint,
+    table,
+)
+
+from tests.compute.compute_stub import StubApiClient
+from tests.compute.result_stub import stub_exec_def
+
+_TOTAL_ROWS = 250
+
+
+def _compute_service(cache: ExecutionResultCache, token_digest: str = "digest") -> tuple[StubApiClient, ComputeService]:
+    api_client = StubApiClient(_TOTAL_ROWS, token_digest=token_digest)
+    return api_client, ComputeService(api_client, result_cache=cache)  # type: ignore[arg-type]
+
+
+def _read_rows(
+    compute: ComputeService, metric_id: str = "order_amount", paging: Optional[PagingPolicy] = None
+) -> list[dict]:
+    execution = compute.for_exec_def("demo", stub_exec_def(metric_id))
+    return list(table._as_table(execution, paging=paging or PagingPolicy.fixed(100)).read_all())
+
+
+def test_fingerprint_is_canonical():
+    assert execution_fingerprint("demo", stub_exec_def()) == execution_fingerprint("demo", stub_exec_def())
+    assert execution_fingerprint("demo", stub_exec_def()) != execution_fingerprint("other", stub_exec_def())
+    assert execution_fingerprint("demo", stub_exec_def()) != execution_fingerprint("demo", stub_exec_def("price"))
+
+
+def test_fingerprint_includes_server_and_user():
+    fingerprint = execution_fingerprint("demo", stub_exec_def(), "http://host1", "digest1")
+
+    assert fingerprint == execution_fingerprint("demo", stub_exec_def(), "http://host1", "digest1")
+    assert fingerprint != execution_fingerprint("demo", stub_exec_def(), "http://host2", "digest1")
+    assert fingerprint != execution_fingerprint("demo", stub_exec_def(), "http://host1", "digest2")
+
+
+def test_cache_shared_by_different_users():
+    cache = ExecutionResultCache()
+    api_client1, compute1 = _compute_service(cache, token_digest="digest1")
+    api_client2, compute2 = _compute_service(cache, token_digest="digest2")
+
+    assert _read_rows(compute1) == _read_rows(compute2)
+    assert api_client1.actions_api.computations == ["result0"]
+    assert api_client2.actions_api.computations == ["result0"]
+    assert cache.metrics.misses == 2
+
+
+def test_repeated_execution_served_from_cache():
+    cache = ExecutionResultCache()
+    api_client, compute = _compute_service(cache)
+
+    first = _read_rows(compute)
+    requests_after_first = len(api_client.actions_api.result_requests)
+    second = _read_rows(compute)
+
+    assert second == first
+    assert len(first) == _TOTAL_ROWS
+    assert api_client.actions_api.computations == ["result0"]
+    assert len(api_client.actions_api.result_requests) == requests_after_first
+
+    metrics = cache.metrics
+    assert (metrics.hits, metrics.misses) == (1, 1)
+    assert metrics.page_hits == requests_after_first
+    assert metrics.hit_ratio == 0.5
+
+
+@pytest.mark.parametrize("paging", [PagingPolicy.fixed(70), PagingPolicy.fixed(250), PagingPolicy(min_size=10)])
+def test_pages_read_with_different_paging_served_from_cache(paging: PagingPolicy):
+    cache = ExecutionResultCache()
+    api_client, compute = _compute_service(cache)
+
+    first = _read_rows(compute)
+    requests_after_first = len(api_client.actions_api.result_requests)
+    second = _read_rows(compute, paging=paging)
+
+    assert second == first
+    assert len(api_client.actions_api.result_requests) == requests_after_first
+    assert cache.metrics.page_misses == requests_after_first
+
+
+def test_pages_not_covered_by_cache_read_from_server():
+    cache = ExecutionResultCache()
+    api_client, compute = _compute_service(cache)
+
+    # reads only the first page, rows 0-99
+    table._as_table(compute.for_exec_def("demo", stub_exec_def()), paging=PagingPolicy.fixed(100))
+    rows = _read_rows(compute, paging=PagingPolicy.fixed(70))
+
+    assert len(rows) == _TOTAL_ROWS
+    assert api_client.actions_api.result_requests == [
+        ("result0", 0, 100),
+        ("result0", 70, 70),
+        ("result0", 140, 70),
+        ("result0", 210, 40),
+    ]
+
+
+def test_cached_execution_is_not_cancellable():
+    cache = ExecutionResultCache()
+    _, compute = _compute_service(cache)
+
+    exec_def = stub_exec_def(is_cancellable=True)
+
+    assert compute.for_exec_def("demo", exec_def).cancel_token == "token-result0"
+    assert compute.for_exec_def("demo", exec_def).cancel_token is None
+
+
+def test_expired_entry_is_recomputed():
+    cache = ExecutionResultCache(ttl=0.05)
+    api_client, compute = _compute_service(cache)
+
+    _read_rows(compute)
+    time.sleep(0.1)
+    _read_rows(compute)
+
+    assert api_client.actions_api.computations == ["result0", "result1"]
+    assert cache.metrics.expirations == 1
+    assert cache.metrics.misses == 2
+
+
+def test_evicted_entry_reuses_result_id():
+    cache = ExecutionResultCache(max_entries=1)
+    api_client, compute = _compute_service(cache)
+
+    first = _read_rows(compute, "order_amount")
+    _read_rows(compute, "price")
+    again = _read_rows(compute, "order_amount")
+
+    assert again == first
+    assert api_client.actions_api.computations == ["result0", "result1"]
+    assert api_client.actions_api.metadata_requests == ["result0"]
+
+    metrics = cache.metrics
+    assert metrics.evictions == 2
+    assert metrics.result_id_reuses == 1
+    assert metrics.misses == 2
+
+
+def test_evicted_entry_recomputed_when_server_dropped_result():
+    cache = ExecutionResultCache(max_entries=1)
+    api_client, compute = _compute_service(cache)
+
+    _read_rows(compute, "order_amount")
+    _read_rows(compute, "price")
+    api_client.actions_api.expired.add("result0")
+    rows = _read_rows(compute, "order_amount")
+
+    assert len(rows) == _TOTAL_ROWS
+    assert api_client.actions_api.computations == ["result0", "result1", "result2"]
+    assert cache.metrics.result_id_reuses == 0
+    assert cache.metrics.misses == 3
+
+
+def test_evicted_pages_spill_to_disk(tmp_path: Path):
+    cache = ExecutionResultCache(max_entries=1, spill_dir=tmp_path)
+    api_client, compute = _compute_service(cache)
+
+    first = _read_rows(compute, "order_amount")
+    _read_rows(compute, "price")
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    requests_before = len(api_client.actions_api.result_requests)
+    again = _read_rows(compute, "order_amount")
+
+    assert again == first
+    assert len(api_client.actions_api.result_requests) == requests_before
+    assert api_client.actions_api.metadata_requests == []
+
+    metrics = cache.metrics
+    assert metrics.spills == 2
+    assert metrics.disk_loads == 1
+    assert metrics.hits == 1
+
+
+def test_page_limit_evicts_least_recently_used():
+    cache = ExecutionResultCache(max_pages=4)
+    _, compute = _compute_service(cache)
+
+    _read_rows(compute, "order_amount")
+    _read_rows(compute, "price")
+
+    assert cache.metrics.evictions == 1
+    assert len(cache) == 2
+
+
+def test_invalidate():
+    cache = ExecutionResultCache()
+    api_client, compute = _compute_service(cache)
+
+    _read_rows(compute)
+    cache.invalidate()
+    _read_rows(compute)
+
+    assert api_client.actions_api.computations == ["result0", "result1"]
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        ExecutionResultCache(max_entries=0)
+
+
+def test_sdk_created_with_result_cache():
+    cache = ExecutionResultCache()
+    sdk = GoodDataSdk.create_with_result_cache(cache, "http://localhost:3000", "token", result_cache="header")
+
+    assert sdk.compute.result_cache is cache
+    assert sdk._client.custom_headers == {"result_cache": "header"}
+    assert GoodDataSdk.create("http://localhost:3000", "token").compute.result_cache is None
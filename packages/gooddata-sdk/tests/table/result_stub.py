@@ -0,0 +1,47 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import threading
+from typing import Optional, Union
+
+from gooddata_sdk import ExecutionResult, ExecutionTable, PagingPolicy, table
+
+from tests.compute.result_stub import stub_exec_def, stub_result_page
+
+
+class StubResponse:
+    """
+    Mimics ExecutionResponse of the stub execution result. With `server_cap`, the stub returns at most that many
+    rows per page regardless of the requested limit.
+    """
+
+    def __init__(self, total_rows: int, server_cap: Optional[int] = None) -> None:
+        self.exec_def = stub_exec_def()
+        self.result_id = "stub"
+        self.total_rows = total_rows
+        self.server_cap = server_cap
+        self.requested_offsets: list[int] = []
+        self._lock = threading.Lock()
+
+    def read_result(
+        self,
+        limit: Union[int, list[int]],
+        offset: Union[None, int, list[int]] = None,
+        timeout: Optional[Union[int, float, tuple]] = None,
+    ) -> ExecutionResult:
+        assert isinstance(offset, list) and isinstance(limit, list)
+        with self._lock:
+            self.requested_offsets.append(offset[0])
+
+        return ExecutionResult(stub_result_page(self.total_rows, offset[0], limit[0], self.server_cap))
+
+
+def create_stub_table(
+    total_rows: int,
+    server_cap: Optional[int] = None,
+    paging: Optional[PagingPolicy] = None,
+    row_limit: Optional[int] = None,
+) -> tuple[StubResponse, ExecutionTable]:
+    response = StubResponse(total_rows, server_cap)
+
+    return response, table._as_table(response, paging=paging, row_limit=row_limit)  # type: ignore[arg-type]
@@ -0,0 +1,97 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import pytest
+from gooddata_sdk import ExecutionResult, PagingPolicy, estimate_result_bytes
+
+from tests.table.result_stub import StubResponse, create_stub_table
+
+
+def _page(count: int, offset: int = 0, total: int = 100_000) -> ExecutionResult:
+    return StubResponse(total).read_result(offset=[offset, 0], limit=[count, 1])
+
+
+def test_fixed_policy_does_not_adapt():
+    policy = PagingPolicy.fixed(512)
+
+    policy.observe(_page(512), requested=512, elapsed=10.0)
+    assert policy.limit == 512
+
+    policy.observe(_page(512), requested=512, elapsed=0.0001)
+    assert policy.limit == 512
+
+
+def test_policy_grows_gradually_up_to_max_size():
+    policy = PagingPolicy(initial_size=100, max_size=1000)
+
+    limits = []
+    for _ in range(6):
+        policy.observe(_page(policy.limit), requested=policy.limit, elapsed=0.001)
+        limits.append(policy.limit)
+
+    assert limits == [200, 400, 800, 1000, 1000, 1000]
+
+
+def test_policy_shrinks_on_slow_pages():
+    policy = PagingPolicy(initial_size=1000, min_size=50, target_page_seconds=1.0)
+
+    # 4 seconds per 1000 rows -> 250 rows per second
+    policy.observe(_page(1000), requested=1000, elapsed=4.0)
+    assert policy.limit == 250
+
+    policy.observe(_page(250), requested=250, elapsed=100.0)
+    assert policy.limit == 50
+
+
+def test_policy_shrinks_on_large_pages():
+    policy = PagingPolicy(initial_size=1000, target_page_bytes=10_000)
+    page = _page(1000)
+
+    policy.observe(page, requested=1000, elapsed=0.001)
+
+    assert policy.limit == int(10_000 / (estimate_result_bytes(page) / 1000))
+
+
+def test_policy_respects_server_cap():
+    policy = PagingPolicy(initial_size=400, max_size=5000)
+
+    # backend returned less than requested even though more rows are available
+    policy.observe(_page(300), requested=400, elapsed=0.001)
+    assert policy.limit == 300
+
+    for _ in range(5):
+        policy.observe(_page(300), requested=policy.limit, elapsed=0.001)
+    assert policy.limit == 300
+
+    # last page of the result is short just because there is no more data
+    policy = PagingPolicy(initial_size=400, max_size=5000)
+    policy.observe(_page(10, offset=99_990), requested=400, elapsed=0.001)
+    assert policy.limit == 800
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        dict(min_size=0),
+        dict(min_size=200, initial_size=100),
+        dict(initial_size=1000, max_size=500),
+        dict(max_growth=0.5),
+    ],
+)
+def test_policy_rejects_invalid_bounds(bounds):
+    with pytest.raises(ValueError):
+        PagingPolicy(**bounds)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 4])
+@pytest.mark.parametrize("server_cap", [None, 300])
+def test_table_with_adaptive_paging(prefetch, server_cap):
+    policy = PagingPolicy(initial_size=100, max_size=2000)
+    response, exec_table = create_stub_table(10_000, server_cap=server_cap, paging=policy)
+
+    rows = list(exec_table.read_all(prefetch=prefetch))
+
+    assert [row["attr1"] for row in rows] == [f"v{row}" for row in range(10_000)]
+    assert policy.limit == (server_cap or 2000)
+    # much fewer requests than with fixed pages of the initial size
+    assert len(response.requested_offsets) < 10_000 / 100 / 2
@@ -0,0 +1,103 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import pyarrow as pa
+import pytest
+from gooddata_sdk import ExecutionResult, execution_result_to_record_batch
+
+from tests.table.result_stub import create_stub_table
+
+
+def _two_dim_page() -> ExecutionResult:
+    return ExecutionResult(
+        {
+            "data": [[1.0, 10], [2.5, None], [None, 30]],
+            "dimension_headers": [
+                {
+                    "headerGroups": [
+                        {
+                            "headers": [
+                                {"attributeHeader": {"labelValue": "East"}},
+                                {"attributeHeader": {"labelValue": "West"}},
+                                {"attributeHeader": {"labelValue": "East"}},
+                            ]
+                        },
+                        {
+                            "headers": [
+                                {"attributeHeader": {"labelValue": "2024"}},
+                                {"attributeHeader": {"labelValue": None}},
+                                {"attributeHeader": {"labelValue": "2025"}},
+                            ]
+                        },
+                    ]
+                },
+                {"headerGroups": [{"headers": [{"measureHeader": {"measureIndex": i}} for i in range(2)]}]},
+            ],
+            "grand_totals": [],
+            "paging": {"count": [3, 2], "offset": [0, 0], "total": [3, 2]},
+            "metadata": {},
+        }
+    )
+
+
+def test_record_batch_from_two_dim_page():
+    batch = execution_result_to_record_batch(_two_dim_page(), ["region", "year"], ["m1", "m2"])
+
+    assert batch.num_rows == 3
+    assert batch.schema.field("region").type == pa.dictionary(pa.int32(), pa.string())
+    assert batch.schema.field("m1").type == pa.float64()
+    assert batch.column(0).dictionary.to_pylist() == ["East", "West"]
+    assert batch.to_pydict() == {
+        "region": ["East", "West", "East"],
+        "year": ["2024", None, "2025"],
+        "m1": [1.0, 2.5, None],
+        "m2": [10.0, None, 30.0],
+    }
+
+
+def test_record_batch_from_metrics_only_page():
+    page = ExecutionResult(
+        {
+            "data": [1.0, 2],
+            "dimension_headers": [
+                {"headerGroups": [{"headers": [{"measureHeader": {"measureIndex": i}} for i in range(2)]}]},
+            ],
+            "grand_totals": [],
+            "paging": {"count": [2], "offset": [0], "total": [2]},
+            "metadata": {},
+        }
+    )
+
+    batch = execution_result_to_record_batch(page, [], ["m1", "m2"])
+
+    assert batch.to_pydict() == {"m1": [1.0], "m2": [2.0]}
+
+
+def test_record_batch_from_attributes_only_page():
+    page = _two_dim_page()
+
+    batch = execution_result_to_record_batch(page, ["region", "year"], [])
+
+    assert batch.schema.names == ["region", "year"]
+    assert batch.num_rows == 3
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_read_batches_matches_read_all(prefetch):
+    _, rows_table = create_stub_table(1300)
+    _, batches_table = create_stub_table(1300)
+
+    batches = list(batches_table.read_batches(prefetch=prefetch))
+
+    assert [batch.num_rows for batch in batches] == [512, 512, 276]
+    assert all(batch.schema == batches_table.arrow_schema for batch in batches)
+    assert pa.Table.from_batches(batches).to_pylist() == list(rows_table.read_all())
+
+
+def test_read_arrow_empty_result():
+    _, exec_table = create_stub_table(0)
+
+    arrow_table = exec_table.read_arrow()
+
+    assert arrow_table.num_rows == 0
+    assert arrow_table.schema.names == ["attr1", "metric1"]
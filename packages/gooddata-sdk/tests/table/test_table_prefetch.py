@@ -0,0 +1,49 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import pytest
+from gooddata_sdk import table
+
+from tests.table.result_stub import create_stub_table
+
+
+@pytest.mark.parametrize("total_rows", [0, 1, 512, 513, 5000])
+@pytest.mark.parametrize("prefetch", [1, 4, 64])
+def test_prefetch_yields_same_rows_as_serial_read(total_rows, prefetch):
+    _, serial_table = create_stub_table(total_rows)
+    _, prefetch_table = create_stub_table(total_rows)
+
+    serial_rows = list(serial_table.read_all())
+    prefetched_rows = list(prefetch_table.read_all(prefetch=prefetch))
+
+    assert len(prefetched_rows) == total_rows
+    assert prefetched_rows == serial_rows
+    assert [row["attr1"] for row in prefetched_rows] == [f"v{row}" for row in range(total_rows)]
+
+
+def test_prefetch_does_not_retain_pages():
+    response, exec_table = create_stub_table(2000)
+
+    list(exec_table.read_all(prefetch=2))
+
+    assert sorted(response.requested_offsets) == [0, 512, 1024, 1536]
+    assert len(exec_table._pages) == 1
+
+
+def test_prefetch_stops_reading_when_consumer_stops():
+    response, exec_table = create_stub_table(100 * table._TABLE_ROW_BATCH_SIZE)
+
+    rows = exec_table.read_all(prefetch=2)
+    for _ in range(table._TABLE_ROW_BATCH_SIZE + 1):
+        next(rows)
+    rows.close()
+
+    # first page + at most the first page read by the prefetcher + two pages in flight
+    assert len(response.requested_offsets) <= 4
+
+
+def test_prefetch_rejects_negative_value():
+    _, exec_table = create_stub_table(10)
+
+    with pytest.raises(ValueError):
+        exec_table.read_all(prefetch=-1)
@@ -0,0 +1,65 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import pytest
+from gooddata_sdk import Attribute, ObjId, SimpleMetric, SortDirection, TableSortKey, table
+
+from tests.table.result_stub import create_stub_table
+
+_ATTRIBUTE = Attribute(local_id="attr1", label="region")
+_METRIC = SimpleMetric(local_id="metric1", item=ObjId(type="metric", id="order_amount"))
+
+
+def test_sort_keys_in_exec_def():
+    exec_def = table._prepare_tabular_definition(
+        attributes=[_ATTRIBUTE],
+        metrics=[_METRIC],
+        filters=[],
+        sort_by=[TableSortKey("metric1", SortDirection.DESC), TableSortKey("attr1")],
+    )
+
+    assert exec_def.dimensions[0].sorting == [
+        {"value": {"dataColumnLocators": {"dim_1": {"measureGroup": "metric1"}}, "direction": "DESC"}},
+        {"attribute": {"attributeIdentifier": "attr1", "direction": "ASC", "sortType": "DEFAULT"}},
+    ]
+    assert exec_def.dimensions[1].sorting == []
+
+    dims = exec_def.as_api_model().result_spec.dimensions
+    assert len(dims[0].sorting) == 2
+    assert "sorting" not in dims[1]
+
+
+def test_sort_keys_ignored_without_attributes():
+    exec_def = table._prepare_tabular_definition(
+        attributes=[], metrics=[_METRIC], filters=[], sort_by=[TableSortKey("metric1")]
+    )
+
+    assert exec_def.dimensions[0].sorting == []
+
+
+def test_sort_key_of_unknown_column():
+    with pytest.raises(ValueError):
+        table._prepare_tabular_definition(
+            attributes=[_ATTRIBUTE], metrics=[_METRIC], filters=[], sort_by=[TableSortKey("attr2")]
+        )
+
+
+@pytest.mark.parametrize("prefetch", [0, 4])
+@pytest.mark.parametrize("row_limit", [1, 10, 512, 513, 1300, 5000])
+def test_row_limit(prefetch, row_limit):
+    response, exec_table = create_stub_table(2000, row_limit=row_limit)
+
+    rows = list(exec_table.read_all(prefetch=prefetch))
+
+    expected_rows = min(row_limit, 2000)
+    assert len(exec_table) == expected_rows
+    assert [row["attr1"] for row in rows] == [f"v{row}" for row in range(expected_rows)]
+    # the table does not read pages past the limit
+    assert max(response.requested_offsets) < expected_rows
+
+
+def test_row_limit_caps_first_page():
+    response, exec_table = create_stub_table(2000, row_limit=10)
+
+    assert exec_table._first_page.paging_count[0] == 10
+    assert response.requested_offsets == [0]
@@ -0,0 +1,97 @@
+# (C) 2026 GoodData Corporation
+from __future__ import annotations
+
+import functools
+import threading
+from typing import Any, Optional
+
+import pytest
+from gooddata_sdk.utils import load_all_entities
+
+
+class _Page:
+    def __init__(self, data: list[Any], included: list[Any], meta: Optional[dict[str, Any]]) -> None:
+        self.data = data
+        self.included = included
+        self._meta = meta
+
+    def __getitem__(self, key: str) -> Any:
+        if key != "meta" or self._meta is None:
+            raise KeyError(key)
+        return self._meta
+
+
+class _PagedResource:
+    """
+    Mimics paged entities endpoint; the page metadata is returned when requested unless `supports_meta` is off.
+    Entities listed in `added` appear right after the first page is read.
+    """
+
+    def __init__(self, total: int, supports_meta: bool = True, added: int = 0) -> None:
+        self.total = total
+        self.supports_meta = supports_meta
+        self.added = added
+        self.requests: list[tuple[int, Optional[list[str]]]] = []
+        self._lock = threading.Lock()
+
+    def get_page(self, workspace_id: str, page: int, size: int, meta_include: Optional[list[str]] = None) -> _Page:
+        with self._lock:
+            self.requests.append((page, meta_include))
+            total = self.total
+            if self.added and len(self.requests) > 1:
+                total += self.added
+
+        ids = range(page * size, min((page + 1) * size, total))
+        meta = None
+        if meta_include is not None and self.supports_meta:
+            meta = {"page": {"totalPages": -(-total // size), "totalElements": total, "size": size, "number": page}}
+
+        return _Page(
+            data=[{"id": f"e{i}", "type": "entity"} for i in ids],
+            included=[{"id": f"i{i}", "type": "include"} for i in ids],
+            meta=meta,
+        )
+
+
+def _ids(entities: list[Any]) -> list[str]:
+    return [e["id"] for e in entities]
+
+
+@pytest.mark.parametrize("total", [0, 7, 10, 25])
+def test_concurrent_paging_matches_sequential(total):
+    sequential = load_all_entities(functools.partial(_PagedResource(total).get_page, "demo"), page_size=5)
+    resource = _PagedResource(total)
+    concurrent = load_all_entities(functools.partial(resource.get_page, "demo"), page_size=5, max_concurrency=3)
+
+    assert _ids(concurrent.data) == _ids(sequential.data) == [f"e{i}" for i in range(total)]
+    assert _ids(concurrent.included) == _ids(sequential.included)
+    assert resource.requests[0] == (0, ["page"])
+    assert all(meta_include is None for _, meta_include in resource.requests[1:])
+
+
+def test_concurrent_paging_requests_only_known_pages():
+    resource = _PagedResource(23)
+    load_all_entities(functools.partial(resource.get_page, "demo"), page_size=5, max_concurrency=4)
+
+    assert sorted(page for page, _ in resource.requests) == [0, 1, 2, 3, 4]
+
+
+def test_concurrent_paging_continues_when_entities_are_added():
+    resource = _PagedResource(10, added=3)
+    result = load_all_entities(functools.partial(resource.get_page, "demo"), page_size=5, max_concurrency=4)
+
+    assert _ids(result.data) == [f"e{i}" for i in range(13)]
+    assert sorted(page for page, _ in resource.requests) == [0, 1, 2]
+
+
+def test_concurrent_paging_without_page_metadata():
+    resource = _PagedResource(12, supports_meta=False)
+    result = load_all_entities(functools.partial(resource.get_page, "demo"), page_size=5, max_concurrency=4)
+
+    assert _ids(result.data) == [f"e{i}" for i in range(12)]
+    assert [page for page, _ in resource.requests] == [0, 1, 2]
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        load_all_entities(functools.partial(_PagedResource(1).get_page, "demo"), max_concurrency=0)